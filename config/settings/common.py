@@ -158,6 +158,7 @@ if set(EXTRA_DJANGO_APPS) & set(INSTALLED_APPS):
 INSTALLED_APPS += EXTRA_DJANGO_APPS
 
 MIDDLEWARE = [
+    'datahub.core.request_metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -359,6 +360,14 @@ OPENSEARCH_SEARCH_REQUEST_WARNING_THRESHOLD = env.int(
     'OPENSEARCH_SEARCH_REQUEST_WARNING_THRESHOLD',
     default=10,  # seconds
 )
+# Objects modified up to this long before the delta sync watermark are synced again, to pick up
+# objects from transactions that were committed after the watermark was recorded
+OPENSEARCH_DELTA_SYNC_OVERLAP_SECONDS = env.int(
+    'OPENSEARCH_DELTA_SYNC_OVERLAP_SECONDS',
+    default=300,
+)
+# How long responses are cached for by search views that cache results (0 disables caching)
+SEARCH_RESULT_CACHE_TIMEOUT = env.int('SEARCH_RESULT_CACHE_TIMEOUT', default=30)  # seconds
 SEARCH_EXPORT_MAX_RESULTS = 5000
 SEARCH_EXPORT_SCROLL_CHUNK_SIZE = 1000
 SEARCH_CONFIGURE_CONNECTION_ON_READY = True
@@ -400,6 +409,7 @@ if REDIS_BASE_URL:
     DAILY_HIERARCHY_ROLLOUT_LIMIT = env.int('DAILY_HIERARCHY_ROLLOUT_LIMIT', 10)
 
 ENABLE_DAILY_OPENSEARCH_SYNC = env.bool('ENABLE_DAILY_OPENSEARCH_SYNC', False)
+ENABLE_DATASET_SNAPSHOTS = env.bool('ENABLE_DATASET_SNAPSHOTS', False)
 ENABLE_EMAIL_INGESTION = env.bool('ENABLE_EMAIL_INGESTION', False)
 ENABLE_ESTIMATED_LAND_DATE_REMINDERS = env.bool('ENABLE_ESTIMATED_LAND_DATE_REMINDERS', False)
 ENABLE_ESTIMATED_LAND_DATE_REMINDERS_EMAIL_DELIVERY_STATUS = env.bool(
@@ -422,6 +432,25 @@ ENABLE_NO_RECENT_INTERACTION_EMAIL_DELIVERY_STATUS = env.bool(
     'ENABLE_NO_RECENT_INTERACTION_EMAIL_DELIVERY_STATUS', False
 )
 ENABLE_NO_RECENT_INTERACTION_REMINDERS = env.bool('ENABLE_NO_RECENT_INTERACTION_REMINDERS', False)
+ENABLE_OPENSEARCH_DELTA_SYNC = env.bool('ENABLE_OPENSEARCH_DELTA_SYNC', False)
+ENABLE_OPENSEARCH_RECONCILIATION = env.bool('ENABLE_OPENSEARCH_RECONCILIATION', False)
+
+# USER EVENT LOG
+
+# If enabled, user events are buffered in Redis once the request transaction has been committed
+# and saved in bulk by a background task, instead of being saved during the request
+USER_EVENT_LOG_BUFFERING_ENABLED = env.bool('USER_EVENT_LOG_BUFFERING_ENABLED', True)
+# The buffer is saved when it reaches this size, and otherwise every minute
+USER_EVENT_LOG_BUFFER_FLUSH_SIZE = env.int('USER_EVENT_LOG_BUFFER_FLUSH_SIZE', default=500)
+
+# REQUEST METRICS
+
+# If enabled, the number and duration of database queries, cache calls and OpenSearch requests
+# made by each request are logged and returned in a Server-Timing response header
+REQUEST_METRICS_ENABLED = env.bool('REQUEST_METRICS_ENABLED', False)
+# If enabled, requests to views that make more database queries than their query_budget raise
+# an error (instead of logging a warning)
+QUERY_BUDGETS_ENFORCED = env.bool('QUERY_BUDGETS_ENFORCED', False)
 
 # ADMIN CSV IMPORT
 
@@ -430,6 +459,20 @@ INTERACTION_ADMIN_CSV_IMPORT_MAX_SIZE = env.int(
     default=2 * 1024 * 1024,  # 2MB
 )
 
+# ADMIN REPORTS
+
+# Dotted path of the class used to store generated admin reports (see
+# datahub.admin_report.storage)
+ADMIN_REPORT_STORAGE_CLASS = env(
+    'ADMIN_REPORT_STORAGE_CLASS',
+    default='datahub.admin_report.storage.S3ReportStorage',
+)
+# Used by datahub.admin_report.storage.FileSystemReportStorage
+ADMIN_REPORT_DIRECTORY = env('ADMIN_REPORT_DIRECTORY', default=str(ROOT_DIR('admin-reports')))
+ADMIN_REPORT_COMPRESS = env.bool('ADMIN_REPORT_COMPRESS', default=False)
+# How long a generated admin report is reused for before it is generated again
+ADMIN_REPORT_FRESHNESS_WINDOW = env.int('ADMIN_REPORT_FRESHNESS_WINDOW', default=15 * 60)
+
 # FRONTEND
 DATAHUB_FRONTEND_BASE_URL = env('DATAHUB_FRONTEND_BASE_URL', default='http://localhost:3000')
 
@@ -463,6 +506,12 @@ OMIS_NOTIFICATION_OVERRIDE_RECIPIENT_EMAIL = env(
 OMIS_NOTIFICATION_ADMIN_EMAIL = env('OMIS_NOTIFICATION_ADMIN_EMAIL', default='')
 OMIS_NOTIFICATION_API_KEY = env('OMIS_NOTIFICATION_API_KEY', default='')
 OMIS_NOTIFICATION_TEST_API_KEY = env('OMIS_NOTIFICATION_TEST_API_KEY', default='')
+# the maximum number of OMIS notifications sent at the same time by each worker
+OMIS_NOTIFICATION_MAX_CONCURRENCY = env.int('OMIS_NOTIFICATION_MAX_CONCURRENCY', default=5)
+# the maximum number of OMIS notifications sent per second (across all workers)
+OMIS_NOTIFICATION_RATE_LIMIT = env.int('OMIS_NOTIFICATION_RATE_LIMIT', default=25)
+# the number of times an OMIS notification is attempted before it's marked as failed
+OMIS_NOTIFICATION_MAX_ATTEMPTS = env.int('OMIS_NOTIFICATION_MAX_ATTEMPTS', default=5)
 OMIS_PUBLIC_BASE_URL = env('OMIS_PUBLIC_BASE_URL', default='http://localhost:4000')
 OMIS_PUBLIC_ORDER_URL = f'{OMIS_PUBLIC_BASE_URL}/{{public_token}}'
 
@@ -561,6 +610,10 @@ MAILBOX_INGESTION_EMAIL = env(
     'MAILBOX_INGESTION_EMAIL',
     default='',
 )
+# Number of messages requested per page when listing the mailbox
+MAILBOX_INGESTION_PAGE_SIZE = env.int('MAILBOX_INGESTION_PAGE_SIZE', default=100)
+# Maximum number of concurrent requests made to Microsoft Graph when retrieving messages
+MAILBOX_INGESTION_MAX_WORKERS = env.int('MAILBOX_INGESTION_MAX_WORKERS', default=8)
 
 # GOV.UK PAY
 GOVUK_PAY_URL = env('GOVUK_PAY_URL', default='')
@@ -643,6 +696,13 @@ else:
     SLACK_MESSAGE_CHANNEL = None
 SLACK_TIMEOUT_SECONDS = 10  # seconds
 
+# If enabled, the activity stream endpoints return activities from the activity outbox (which
+# should be backfilled using the backfill_activity_outbox command first)
+ACTIVITY_STREAM_OUTBOX_ENABLED = env.bool('ACTIVITY_STREAM_OUTBOX_ENABLED', False)
+
+# How long successful activity feed responses are cached for (0 disables caching)
+ACTIVITY_FEED_CACHE_TIMEOUT = env.int('ACTIVITY_FEED_CACHE_TIMEOUT', default=30)  # seconds
+
 # To read data from Activity Stream
 ACTIVITY_STREAM_OUTGOING_URL = env('ACTIVITY_STREAM_OUTGOING_URL', default=None)
 ACTIVITY_STREAM_OUTGOING_ACCESS_KEY_ID = env(
@@ -758,6 +818,13 @@ CSP_INCLUDE_NONCE_IN = ("script-src",)
 CSP_REPORT_ONLY = False
 
 S3_LOCAL_ENDPOINT_URL = env("S3_LOCAL_ENDPOINT_URL", default='')
+
+# Pre-materialised dataset snapshots (see datahub.dataset.snapshot)
+DATASET_SNAPSHOT_BUCKET = env('DATASET_SNAPSHOT_BUCKET', default='')
+DATASET_SNAPSHOT_AWS_REGION = env('DATASET_SNAPSHOT_AWS_REGION', default='eu-west-2')
+DATASET_SNAPSHOT_PREFIX = env('DATASET_SNAPSHOT_PREFIX', default='dataset-snapshots/')
+DATASET_SNAPSHOT_PARTITION_SIZE = env.int('DATASET_SNAPSHOT_PARTITION_SIZE', default=50_000)
+DATASET_SNAPSHOT_URL_EXPIRY_SECONDS = env.int('DATASET_SNAPSHOT_URL_EXPIRY_SECONDS', default=3600)
 ENABLE_CONTACT_CONSENT_INGEST = env("ENABLE_CONTACT_CONSENT_INGEST", default=False)
 CONSENT_DATA_MANAGEMENT_URL = env("CONSENT_DATA_MANAGEMENT_URL", default='')
 
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 import environ
 
 environ.Env.read_env(env_file='./.env')  # reads the .env file
@@ -33,6 +36,7 @@ OPENSEARCH_INDEX_SETTINGS = {
     'refresh_interval': -1,  # Disables automatic index refreshing to avoid test flakiness
 }
 DOCUMENT_BUCKET = 'test-bucket'
+DATASET_SNAPSHOT_BUCKET = 'test-dataset-snapshot-bucket'
 AV_V2_SERVICE_URL = 'http://av-service/'
 
 OMIS_GENERIC_CONTACT_EMAIL = 'omis@example.com'
@@ -58,6 +62,20 @@ PASSWORD_HASHERS = [
 ]
 
 CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+# Search and activity feed responses are only cached in tests that enable this explicitly, as the
+# same search is often repeated in different tests with different data
+SEARCH_RESULT_CACHE_TIMEOUT = 0
+ACTIVITY_FEED_CACHE_TIMEOUT = 0
+
+# Generated admin reports are written to a temporary directory (see datahub/admin_report/test)
+ADMIN_REPORT_STORAGE_CLASS = 'datahub.admin_report.storage.FileSystemReportStorage'
+ADMIN_REPORT_DIRECTORY = os.path.join(tempfile.gettempdir(), 'datahub-admin-reports')
+
+# User events are saved immediately, except in tests of the user event buffer
+USER_EVENT_LOG_BUFFERING_ENABLED = False
+
+# Requests that exceed the query budgets of views fail in tests
+QUERY_BUDGETS_ENFORCED = True
 
 # Stop WhiteNoise emitting warnings when running tests without running collectstatic first
 WHITENOISE_AUTOREFRESH = True
@@ -14,6 +14,7 @@ from pytest_django.lazy_django import skip_if_no_django
 
 from datahub.core.constants import AdministrativeArea
 from datahub.core.queues.scheduler import DataHubScheduler
+from datahub.core.request_metrics import record_request_metrics
 from datahub.core.test_utils import HawkAPITestClient, create_test_user
 from datahub.dnb_api.utils import format_dnb_company
 from datahub.documents.utils import get_s3_client_for_bucket
@@ -174,6 +175,19 @@ def synchronous_thread_pool(monkeypatch):
     )
 
 
+@pytest.fixture
+def request_metrics():
+    """Records the number and duration of database queries, cache calls and OpenSearch requests
+    made by each request.
+
+    Usage:
+        response = api_client.get(url)
+        assert request_metrics[-1].db_queries == 3
+    """
+    with record_request_metrics() as recorded_metrics:
+        yield recorded_metrics
+
+
 @pytest.fixture
 def synchronous_on_commit(monkeypatch):
     """During a test run a transaction is never committed, so we have to improvise."""
@@ -184,7 +198,7 @@ def _synchronous_submit_to_thread_pool(fn, *args, **kwargs):
     fn(*args, **kwargs)
 
 
-def _synchronous_on_commit(fn):
+def _synchronous_on_commit(fn, using=None, robust=False):
     fn()
 
 
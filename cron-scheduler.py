@@ -26,6 +26,7 @@ from datahub.core.queues.constants import (
     EVERY_ELEVEN_PM,
     EVERY_HOUR,
     EVERY_MIDNIGHT,
+    EVERY_MINUTE,
     EVERY_NINE_THIRTY_AM_ON_FIRST_SECOND_THIRD_FOURTH_OF_EACH_MONTH,
     EVERY_ONE_AM,
     EVERY_SEVEN_PM,
@@ -42,6 +43,7 @@ from datahub.core.queues.constants import (
 from datahub.core.queues.health_check import queue_health_check
 from datahub.core.queues.job_scheduler import job_scheduler
 from datahub.core.queues.scheduler import LONG_RUNNING_QUEUE, DataHubScheduler
+from datahub.dataset.snapshot.tasks import schedule_build_dataset_snapshots
 from datahub.dnb_api.tasks.sync import schedule_sync_outdated_companies_with_dnb
 from datahub.dnb_api.tasks.update import schedule_get_company_updates
 from datahub.email_ingestion.tasks import process_mailbox_emails
@@ -58,6 +60,7 @@ from datahub.investment_lead.tasks.ingest_eyb_triage import eyb_triage_identific
 from datahub.metadata.tasks import (
     postcode_data_identification_task,
 )
+from datahub.omis.notification.tasks import send_pending_notifications
 from datahub.omis.payment.tasks import refresh_pending_payment_gateway_sessions
 from datahub.reminder.migration_tasks import run_ita_users_migration, run_post_users_migration
 from datahub.reminder.tasks import (
@@ -70,8 +73,9 @@ from datahub.reminder.tasks import (
     update_notify_email_delivery_status_for_no_recent_export_interaction,
     update_notify_email_delivery_status_for_no_recent_interaction,
 )
-from datahub.search.tasks import sync_all_models
+from datahub.search.tasks import delta_sync_all_models, reconcile_all_models, sync_all_models
 from datahub.task.tasks import schedule_reminders_tasks_overdue, schedule_reminders_upcoming_tasks
+from datahub.user_event_log.tasks import save_buffered_user_events
 
 env = environ.Env()
 logger = getLogger(__name__)
@@ -93,6 +97,11 @@ def schedule_jobs():
         cron=EVERY_HOUR,
         description='Refresh pending payment gateway sessions :0',
     )
+    job_scheduler(
+        function=send_pending_notifications,
+        cron=EVERY_MINUTE,
+        description='Send pending OMIS notifications (including retries)',
+    )
     job_scheduler(
         function=schedule_reminders_upcoming_tasks,
         cron=EVERY_EIGHT_AM,
@@ -196,6 +205,13 @@ def schedule_jobs():
             description='Daily OpenSearch sync',
         )
 
+    if settings.ENABLE_DATASET_SNAPSHOTS:
+        job_scheduler(
+            function=schedule_build_dataset_snapshots,
+            cron=EVERY_THREE_AM,
+            description='Build dataset snapshots',
+        )
+
     if settings.ENABLE_DAILY_HIERARCHY_ROLLOUT:
         dnb_modified_on_before = datetime(
             year=2019,
@@ -253,6 +269,8 @@ def schedule_jobs():
             description='Daily update of no recent export interaction reminder email status',
         )
     schedule_email_ingestion_tasks()
+    schedule_opensearch_consistency_jobs()
+    schedule_user_event_log_jobs()
     schedule_new_export_interaction_jobs()
     schedule_export_win_customer_response_token_jobs()
     schedule_export_win_auto_resend_client_email()
@@ -278,6 +296,31 @@ def schedule_email_ingestion_tasks():
         )
 
 
+def schedule_opensearch_consistency_jobs():
+    if settings.ENABLE_OPENSEARCH_DELTA_SYNC:
+        job_scheduler(
+            function=delta_sync_all_models,
+            cron=EVERY_TEN_MINUTES,
+            description='OpenSearch delta sync',
+        )
+
+    if settings.ENABLE_OPENSEARCH_RECONCILIATION:
+        job_scheduler(
+            function=reconcile_all_models,
+            cron=EVERY_TWO_AM,
+            description='Daily OpenSearch reconciliation',
+        )
+
+
+def schedule_user_event_log_jobs():
+    if settings.USER_EVENT_LOG_BUFFERING_ENABLED:
+        job_scheduler(
+            function=save_buffered_user_events,
+            cron=EVERY_MINUTE,
+            description='Save buffered user events',
+        )
+
+
 def schedule_new_export_interaction_jobs():
     """Schedule new export interaction jobs."""
     if settings.ENABLE_NEW_EXPORT_INTERACTION_REMINDERS:
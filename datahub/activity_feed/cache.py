@@ -0,0 +1,66 @@
+import json
+from hashlib import blake2b
+from time import monotonic, sleep
+
+from django.conf import settings
+from django.core.cache import cache
+
+ACTIVITY_FEED_CACHE_HEADER = 'X-Activity-Feed-Cache'
+# How often a request waiting for an identical request's upstream response checks the cache
+WAIT_POLL_INTERVAL = 0.05  # seconds
+
+
+def get_or_fetch_activity_feed_response(cache_scope, fetch_response):
+    """Gets a cached activity feed response, or fetches and caches it.
+
+    Concurrent requests with the same cache scope are coalesced: only one of them calls
+    `fetch_response`, and the others wait (for up to settings.DEFAULT_SERVICE_TIMEOUT seconds)
+    for its response to be cached. Only successful responses are cached.
+
+    :param cache_scope: the values that identify the response (e.g. the query and permissions)
+    :param fetch_response: callable that returns the upstream response as a dict with
+        status_code, content and content_type keys
+    :returns: tuple of (response dict, whether the response came from the cache)
+    """
+    cache_key = _cache_key(cache_scope)
+    cached_response = cache.get(cache_key)
+    if cached_response is not None:
+        return cached_response, True
+
+    lock_key = f'{cache_key}:fetching'
+    is_fetching = cache.add(lock_key, True, timeout=settings.DEFAULT_SERVICE_TIMEOUT)
+    if not is_fetching:
+        cached_response = _wait_for_cached_response(cache_key, lock_key)
+        if cached_response is not None:
+            return cached_response, True
+
+    try:
+        response = fetch_response()
+        if response['status_code'] == 200:
+            cache.set(cache_key, response, timeout=settings.ACTIVITY_FEED_CACHE_TIMEOUT)
+    finally:
+        if is_fetching:
+            cache.delete(lock_key)
+
+    return response, False
+
+
+def _wait_for_cached_response(cache_key, lock_key):
+    """Waits for another request fetching the same response to cache it.
+
+    :returns: the cached response, or None if it wasn't cached (e.g. as the upstream request
+        failed) before the other request finished or the wait timed out
+    """
+    deadline = monotonic() + settings.DEFAULT_SERVICE_TIMEOUT
+    while monotonic() < deadline:
+        sleep(WAIT_POLL_INTERVAL)
+        cached_response = cache.get(cache_key)
+        if cached_response is not None or not cache.get(lock_key):
+            return cached_response
+    return None
+
+
+def _cache_key(cache_scope):
+    serialised_scope = json.dumps(cache_scope, sort_keys=True).encode('utf-8')
+    scope_hash = blake2b(serialised_scope, digest_size=16).hexdigest()
+    return f'activity_feed_response:{scope_hash}'
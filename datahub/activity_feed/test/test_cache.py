@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from datahub.activity_feed.cache import get_or_fetch_activity_feed_response
+
+pytestmark = pytest.mark.usefixtures('local_memory_cache')
+
+SCOPE = {'query': {'size': 20}, 'permissions': ['order.view_order']}
+RESPONSE = {'status_code': 200, 'content': '{"took":27}', 'content_type': 'application/json'}
+
+
+@pytest.fixture(autouse=True)
+def _cache_timeout(settings):
+    settings.ACTIVITY_FEED_CACHE_TIMEOUT = 30
+    settings.DEFAULT_SERVICE_TIMEOUT = 5
+
+
+def test_concurrent_identical_requests_share_one_fetch():
+    """Test that requests waiting for an identical request's response get its cached response."""
+    fetch_started = Event()
+    release_fetch = Event()
+    num_fetches = 0
+
+    def fetch_response():
+        nonlocal num_fetches
+        num_fetches += 1
+        fetch_started.set()
+        release_fetch.wait(timeout=5)
+        return RESPONSE
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first_future = executor.submit(
+            get_or_fetch_activity_feed_response,
+            SCOPE,
+            fetch_response,
+        )
+        fetch_started.wait(timeout=5)
+        waiting_futures = [
+            executor.submit(get_or_fetch_activity_feed_response, dict(SCOPE), fetch_response)
+            for _ in range(2)
+        ]
+        release_fetch.set()
+
+        assert first_future.result() == (RESPONSE, False)
+        assert [future.result() for future in waiting_futures] == [(RESPONSE, True)] * 2
+
+    assert num_fetches == 1
+
+
+def test_waiting_request_fetches_if_identical_request_fails():
+    """Test that a waiting request fetches the response itself if it wasn't cached."""
+    error_response = {**RESPONSE, 'status_code': 502}
+    responses = iter([error_response, RESPONSE])
+    fetch_started = Event()
+    release_fetch = Event()
+
+    def fetch_response():
+        fetch_started.set()
+        release_fetch.wait(timeout=5)
+        return next(responses)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first_future = executor.submit(
+            get_or_fetch_activity_feed_response,
+            SCOPE,
+            fetch_response,
+        )
+        fetch_started.wait(timeout=5)
+        waiting_future = executor.submit(
+            get_or_fetch_activity_feed_response, SCOPE, fetch_response
+        )
+        release_fetch.set()
+
+        assert first_future.result() == (error_response, False)
+        assert waiting_future.result() == (RESPONSE, False)
+
+    assert get_or_fetch_activity_feed_response(SCOPE, fetch_response) == (RESPONSE, True)
@@ -1,8 +1,11 @@
+import json
+
 import pytest
 from django.conf import settings
 from rest_framework import status
 from rest_framework.reverse import reverse
 
+from datahub.activity_feed.cache import ACTIVITY_FEED_CACHE_HEADER
 from datahub.activity_feed.views import ActivityFeedView
 from datahub.core.test_utils import APITestMixin, create_test_user
 
@@ -93,26 +96,76 @@ class TestActivityFeedView(APITestMixin):
 
         assert response.status_code == expected_status_code
 
-    def test_returns_empty_list_without_all_required_perms(
+    def test_excludes_activities_without_permission(
         self,
+        requests_mock,
         insufficient_activity_permissions,
     ):
-        """Test that an empty list is returned if the authenticated user doesn't have permission
-        to view all activity models.
+        """Test that activities of models the user doesn't have permission to view are excluded
+        from the query.
         """
+        requests_mock.get(
+            settings.ACTIVITY_STREAM_OUTGOING_URL,
+            status_code=status.HTTP_200_OK,
+            content=b'{"took":27}',
+        )
         requester = create_test_user(
             permission_codenames=(
                 perm.rsplit('.', maxsplit=1)[1]  # get only the codename
                 for perm in insufficient_activity_permissions
             ),
         )
+        (excluded_permission,) = set(ActivityFeedView.ACTIVITY_MODELS_PERMISSIONS_REQUIRED) - set(
+            insufficient_activity_permissions,
+        )
+        query = {'size': 20, 'query': {'term': {'object.attributedTo.id': 'dit:DataHubCompany:1'}}}
 
         url = reverse('api-v4:activity-feed:index')
         api_client = self.create_api_client(user=requester)
         response = api_client.generic(
             'GET',
             url,
-            data={},
+            data=json.dumps(query),
+            content_type='application/json',
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == b'{"took":27}'
+        assert requests_mock.last_request.json() == {
+            'size': 20,
+            'query': {
+                'bool': {
+                    'must': [query['query']],
+                    'must_not': [
+                        {
+                            'terms': {
+                                'object.type': list(
+                                    ActivityFeedView.ACTIVITY_TYPES_BY_PERMISSION[
+                                        excluded_permission
+                                    ],
+                                ),
+                            },
+                        },
+                    ],
+                },
+            },
+        }
+
+    def test_returns_empty_list_without_all_required_perms_if_query_is_invalid(
+        self,
+        requests_mock,
+    ):
+        """Test that an empty list is returned if the query can't be filtered for a user who
+        doesn't have permission to view all activity models.
+        """
+        requester = create_test_user(permission_codenames=())
+
+        url = reverse('api-v4:activity-feed:index')
+        api_client = self.create_api_client(user=requester)
+        response = api_client.generic(
+            'GET',
+            url,
+            data=b'not json',
             content_type='application/json',
         )
 
@@ -123,3 +176,77 @@ class TestActivityFeedView(APITestMixin):
                 'hits': [],
             },
         }
+        assert not requests_mock.called
+
+    @pytest.mark.usefixtures('local_memory_cache')
+    def test_caches_successful_responses(self, requests_mock, settings):
+        """Test that responses are cached for identical queries (ignoring key order)."""
+        settings.ACTIVITY_FEED_CACHE_TIMEOUT = 30
+        requests_mock.get(
+            settings.ACTIVITY_STREAM_OUTGOING_URL,
+            status_code=status.HTTP_200_OK,
+            content=b'{"took":27}',
+            headers={'content-type': 'application/json'},
+        )
+        url = reverse('api-v4:activity-feed:index')
+
+        responses = [
+            self.api_client.generic('GET', url, data=data, content_type='application/json')
+            for data in (b'{"size": 20, "from": 0}', b'{"from": 0, "size": 20}')
+        ]
+
+        assert requests_mock.call_count == 1
+        assert [response[ACTIVITY_FEED_CACHE_HEADER] for response in responses] == [
+            'miss',
+            'hit',
+        ]
+        assert all(response.content == b'{"took":27}' for response in responses)
+        assert all(response['Content-Type'] == 'application/json' for response in responses)
+
+    @pytest.mark.usefixtures('local_memory_cache')
+    def test_does_not_share_cached_responses_between_permission_sets(
+        self,
+        requests_mock,
+        settings,
+    ):
+        """Test that users with different permissions don't share cached responses."""
+        settings.ACTIVITY_FEED_CACHE_TIMEOUT = 30
+        requests_mock.get(settings.ACTIVITY_STREAM_OUTGOING_URL, content=b'{"took":27}')
+        url = reverse('api-v4:activity-feed:index')
+        api_clients = [
+            self.api_client,
+            self.create_api_client(user=create_test_user(permission_codenames=())),
+        ]
+
+        responses = [
+            api_client.generic('GET', url, data=b'{}', content_type='application/json')
+            for api_client in api_clients
+        ]
+
+        assert requests_mock.call_count == 2
+        assert [response[ACTIVITY_FEED_CACHE_HEADER] for response in responses] == [
+            'miss',
+            'miss',
+        ]
+
+    @pytest.mark.usefixtures('local_memory_cache')
+    def test_does_not_cache_errors(self, requests_mock, settings):
+        """Test that unsuccessful responses are not cached."""
+        settings.ACTIVITY_FEED_CACHE_TIMEOUT = 30
+        requests_mock.get(
+            settings.ACTIVITY_STREAM_OUTGOING_URL,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=b'{"error":"msg"}',
+        )
+        url = reverse('api-v4:activity-feed:index')
+
+        for _ in range(2):
+            response = self.api_client.generic(
+                'GET',
+                url,
+                data=b'{}',
+                content_type='application/json',
+            )
+            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        assert requests_mock.call_count == 2
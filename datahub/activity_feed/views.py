@@ -1,3 +1,5 @@
+import json
+
 from django.conf import settings
 from django.http import HttpResponse, JsonResponse
 from django.utils.decorators import method_decorator
@@ -5,6 +7,10 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
+from datahub.activity_feed.cache import (
+    ACTIVITY_FEED_CACHE_HEADER,
+    get_or_fetch_activity_feed_response,
+)
 from datahub.core.api_client import APIClient, HawkAuth
 from datahub.core.view_utils import enforce_request_content_type
 
@@ -12,50 +18,90 @@ from datahub.core.view_utils import enforce_request_content_type
 class ActivityFeedView(APIView):
     """Activity Feed View.
 
-    At the moment it just authenticates the user using the default authentication
-    for the internal_front_end and acts as a proxy for reading from Activity Stream.
+    Authenticates the user using the default authentication for the internal_front_end and
+    acts as a proxy for reading from Activity Stream.
+
+    If the authenticated user doesn't have permission to view some activity models, the query
+    is changed to exclude activities of those models.
 
-    If the authenticated user doesn't have permissions on all activity models,
-    it returns an empty list.
+    If settings.ACTIVITY_FEED_CACHE_TIMEOUT is not 0, successful responses are cached for users
+    with the same permissions.
     """
 
     permission_classes = (IsAuthenticated,)
 
-    ACTIVITY_MODELS_PERMISSIONS_REQUIRED = (
-        'company_referral.view_companyreferral',
-        'interaction.view_all_interaction',
-        'investment.view_all_investmentproject',
-        'investor_profile.view_largecapitalinvestorprofile',
-        'order.view_order',
-    )
+    # The Activity Stream object types of the activities each permission is required to view
+    ACTIVITY_TYPES_BY_PERMISSION = {
+        'company_referral.view_companyreferral': ('dit:CompanyReferral',),
+        'interaction.view_all_interaction': ('dit:Interaction', 'dit:ServiceDelivery'),
+        'investment.view_all_investmentproject': ('dit:InvestmentProject',),
+        'investor_profile.view_largecapitalinvestorprofile': ('dit:LargeCapitalInvestorProfile',),
+        'order.view_order': ('dit:OMISOrder',),
+    }
+    ACTIVITY_MODELS_PERMISSIONS_REQUIRED = tuple(ACTIVITY_TYPES_BY_PERMISSION)
 
     @method_decorator(enforce_request_content_type('application/json'))
     def get(self, request):
         """Proxy for GET requests."""
         content_type = request.content_type or ''
-        # if the user doesn't have permissions on all activity models, return an empty list
-        # TODO: instead of returning an empty list, we need to filter out the
-        # activities that the user doesn't have access to
-        if not request.user.has_perms(self.ACTIVITY_MODELS_PERMISSIONS_REQUIRED):
-            return JsonResponse(
-                {
-                    'hits': {
-                        'total': 0,
-                        'hits': [],
+        permissions = sorted(
+            permission
+            for permission in self.ACTIVITY_MODELS_PERMISSIONS_REQUIRED
+            if request.user.has_perm(permission)
+        )
+        denied_activity_types = [
+            activity_type
+            for permission, activity_types in self.ACTIVITY_TYPES_BY_PERMISSION.items()
+            if permission not in permissions
+            for activity_type in activity_types
+        ]
+
+        try:
+            query = json.loads(request.body)
+        except ValueError:
+            query = None
+
+        if denied_activity_types:
+            if not isinstance(query, dict):
+                # The query can't be filtered, so no activities are returned
+                return JsonResponse(
+                    {
+                        'hits': {
+                            'total': 0,
+                            'hits': [],
+                        },
                     },
-                },
-                status=status.HTTP_200_OK,
-                content_type=content_type,
-            )
-
-        upstream_response = self._get_upstream_response(request)
-        return HttpResponse(
-            upstream_response.text,
-            status=upstream_response.status_code,
-            content_type=upstream_response.headers.get('content-type'),
+                    status=status.HTTP_200_OK,
+                    content_type=content_type,
+                )
+            upstream_body = json.dumps(_exclude_activity_types(query, denied_activity_types))
+        else:
+            upstream_body = request.body
+
+        def fetch_response():
+            upstream_response = self._get_upstream_response(request, upstream_body)
+            return {
+                'status_code': upstream_response.status_code,
+                'content': upstream_response.text,
+                'content_type': upstream_response.headers.get('content-type'),
+            }
+
+        if not settings.ACTIVITY_FEED_CACHE_TIMEOUT:
+            return _to_http_response(fetch_response())
+
+        cache_scope = {
+            'query': query if query is not None else request.body.decode(errors='replace'),
+            'permissions': permissions,
+        }
+        response_data, is_cached = get_or_fetch_activity_feed_response(
+            cache_scope,
+            fetch_response,
         )
+        response = _to_http_response(response_data)
+        response[ACTIVITY_FEED_CACHE_HEADER] = 'hit' if is_cached else 'miss'
+        return response
 
-    def _get_upstream_response(self, request=None):
+    def _get_upstream_response(self, request, body):
         hawk_auth = HawkAuth(
             settings.ACTIVITY_STREAM_OUTGOING_ACCESS_KEY_ID,
             settings.ACTIVITY_STREAM_OUTGOING_SECRET_ACCESS_KEY,
@@ -72,8 +118,31 @@ class ActivityFeedView(APIView):
         return api_client.request(
             request.method,
             '',
-            data=request.body,
+            data=body,
             headers={
                 'Content-Type': request.content_type,
             },
         )
+
+
+def _exclude_activity_types(query, activity_types):
+    """Adds a filter to an Elasticsearch query body that excludes activities of certain types."""
+    activity_type_filter = {'terms': {'object.type': activity_types}}
+    original_query = query.get('query')
+    return {
+        **query,
+        'query': {
+            'bool': {
+                **({'must': [original_query]} if original_query else {}),
+                'must_not': [activity_type_filter],
+            },
+        },
+    }
+
+
+def _to_http_response(response_data):
+    return HttpResponse(
+        response_data['content'],
+        status=response_data['status_code'],
+        content_type=response_data['content_type'],
+    )
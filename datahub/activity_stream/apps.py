@@ -5,3 +5,10 @@ class ActivityStreamConfig(AppConfig):
     """Required to register the ActivityStream as a Django app."""
 
     name = 'datahub.activity_stream'
+
+    def ready(self):
+        """Registers the signal receivers for this app.
+
+        This is the preferred way to register signal receivers in the Django documentation.
+        """
+        import datahub.activity_stream.signals  # noqa: F401
@@ -13,6 +13,7 @@ class CompanyReferralCursorPagination(ActivityCursorPagination):
 class CompanyReferralActivityViewSet(ActivityViewSet):
     """Interaction ViewSet for the activity stream."""
 
+    outbox_stream = 'company_referral'
     pagination_class = CompanyReferralCursorPagination
     serializer_class = CompanyReferralActivitySerializer
     queryset = CompanyReferral.objects.select_related(
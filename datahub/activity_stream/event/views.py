@@ -13,6 +13,7 @@ class EventCursorPagination(ActivityCursorPagination):
 class EventActivityViewSet(ActivityViewSet):
     """Events ViewSet for the activity stream."""
 
+    outbox_stream = 'event'
     pagination_class = EventCursorPagination
     serializer_class = EventActivitySerializer
     queryset = get_base_event_queryset()
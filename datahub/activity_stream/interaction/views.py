@@ -13,6 +13,7 @@ class InteractionCursorPagination(ActivityCursorPagination):
 class InteractionActivityViewSet(ActivityViewSet):
     """Interaction ViewSet for the activity stream."""
 
+    outbox_stream = 'interaction'
     pagination_class = InteractionCursorPagination
     serializer_class = InteractionActivitySerializer
     queryset = get_base_interaction_queryset()
@@ -16,6 +16,7 @@ class IProjectCreatedPagination(ActivityCursorPagination):
 class IProjectCreatedViewSet(ActivityViewSet):
     """Investment Project added ViewSet for activity stream."""
 
+    outbox_stream = 'investment_project_added'
     pagination_class = IProjectCreatedPagination
     serializer_class = IProjectCreatedSerializer
     queryset = InvestmentProject.objects.select_related(
@@ -15,6 +15,7 @@ class LargeCapitalInvestorProfileCursorPagination(ActivityCursorPagination):
 class LargeCapitalInvestorProfileActivityViewSet(ActivityViewSet):
     """Large Capital Investor Profile ViewSet for the activity stream."""
 
+    outbox_stream = 'large_capital_investor_profile'
     pagination_class = LargeCapitalInvestorProfileCursorPagination
     serializer_class = LargeCapitalInvestorProfileActivitySerializer
     queryset = LargeCapitalInvestorProfile.objects.select_related(
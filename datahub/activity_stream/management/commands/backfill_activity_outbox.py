@@ -0,0 +1,48 @@
+from logging import getLogger
+
+from django.core.management.base import BaseCommand, CommandError
+
+from datahub.activity_stream.outbox import (
+    ACTIVITY_VIEW_SETS,
+    DEFAULT_BACKFILL_BATCH_SIZE,
+    backfill_activities,
+)
+
+logger = getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Adds activities for existing objects to the activity outbox."""
+
+    help = (
+        'Adds activities to the activity outbox for objects that are not in it yet (oldest '
+        'first). This should be run before setting ACTIVITY_STREAM_OUTBOX_ENABLED, and can be '
+        're-run safely.'
+    )
+
+    def add_arguments(self, parser):
+        """Adds arguments to the command."""
+        parser.add_argument(
+            'streams',
+            nargs='*',
+            help=(
+                'Activity streams to backfill. All streams are backfilled if not specified. '
+                f'Available streams: {", ".join(ACTIVITY_VIEW_SETS)}.'
+            ),
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BACKFILL_BATCH_SIZE,
+            help='Number of activities rendered and inserted at a time.',
+        )
+
+    def handle(self, *args, **options):
+        """Backfills the activity streams."""
+        unknown_streams = set(options['streams']) - ACTIVITY_VIEW_SETS.keys()
+        if unknown_streams:
+            raise CommandError(f'Unknown activity streams: {", ".join(sorted(unknown_streams))}')
+
+        for stream in options['streams'] or ACTIVITY_VIEW_SETS:
+            num_written = backfill_activities(stream, batch_size=options['batch_size'])
+            logger.info(f'Backfilled {num_written} {stream} activities')
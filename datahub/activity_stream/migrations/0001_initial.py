@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-19 10:21
+
+import django.utils.timezone
+import rest_framework.utils.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityOutboxEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('stream', models.CharField(max_length=255)),
+                ('object_id', models.UUIDField()),
+                ('object_modified_on', models.DateTimeField(help_text='The modified_on value of the object when the activity was rendered')),
+                ('activity', models.JSONField(encoder=rest_framework.utils.encoders.JSONEncoder)),
+                ('created_on', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+            ],
+            options={
+                'verbose_name_plural': 'activity outbox entries',
+                'indexes': [models.Index(fields=['stream', 'id'], name='activity_st_stream_0a1baa_idx'), models.Index(fields=['stream', 'object_id'], name='activity_st_stream_a3cc2c_idx')],
+            },
+        ),
+    ]
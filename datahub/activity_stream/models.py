@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.db import models
+from django.utils.timezone import now
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ActivityOutboxEntry(models.Model):
+    """An activity that has been rendered for an activity stream endpoint.
+
+    Entries are written when the transaction that saved the object commits (see
+    datahub.activity_stream.outbox). The sequential ID is used as the cursor of the endpoints,
+    so that polling for new activities is a range scan of this table.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    stream = models.CharField(max_length=settings.CHAR_FIELD_MAX_LENGTH)
+    object_id = models.UUIDField()
+    object_modified_on = models.DateTimeField(
+        help_text='The modified_on value of the object when the activity was rendered',
+    )
+    # The same encoder as DRF's JSON renderer, so that activities are rendered identically
+    activity = models.JSONField(encoder=JSONEncoder)
+    created_on = models.DateTimeField(default=now, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['stream', 'id']),
+            models.Index(fields=['stream', 'object_id']),
+        ]
+        verbose_name_plural = 'activity outbox entries'
+
+    def __str__(self):
+        """Human-friendly string representation."""
+        return f'{self.stream} - {self.object_id} - {self.id}'
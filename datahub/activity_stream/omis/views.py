@@ -15,6 +15,7 @@ class OMISOrderAddedPagination(ActivityCursorPagination):
 class OMISOrderAddedViewSet(ActivityViewSet):
     """OMIS Order added ViewSet for activity stream."""
 
+    outbox_stream = 'omis_order_added'
     pagination_class = OMISOrderAddedPagination
     serializer_class = OMISOrderAddedSerializer
     queryset = Order.objects.select_related(
@@ -15,6 +15,7 @@ class LargeCapitalOpportunityPagination(ActivityCursorPagination):
 class LargeCapitalOpportunityActivityViewSet(ActivityViewSet):
     """Large Capital Opportunity ViewSet for the activity stream."""
 
+    outbox_stream = 'large_capital_opportunity'
     pagination_class = LargeCapitalOpportunityPagination
     serializer_class = LargeCapitalOpportunityActivitySerializer
     queryset = LargeCapitalOpportunity.objects.all()
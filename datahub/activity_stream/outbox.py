@@ -0,0 +1,109 @@
+"""Writes rendered activities to the activity outbox.
+
+When an object returned by an activity stream endpoint is saved, its activity is rendered once the
+transaction commits and added to the outbox with the next sequential ID. The endpoints page
+through the outbox by ID (if ACTIVITY_STREAM_OUTBOX_ENABLED is True), rather than querying and
+serialising the objects on every poll.
+
+Entries are inserted while holding an advisory lock, so IDs become visible in the order they are
+allocated. This means that, unlike when paging by modified_on, an activity can't be committed
+behind a cursor that has already been returned.
+"""
+
+from functools import partial
+from logging import getLogger
+
+from django.db import transaction
+from django_pglocks import advisory_lock
+
+from datahub.activity_stream.company_referral.views import CompanyReferralActivityViewSet
+from datahub.activity_stream.event.views import EventActivityViewSet
+from datahub.activity_stream.interaction.views import InteractionActivityViewSet
+from datahub.activity_stream.investment.views import IProjectCreatedViewSet
+from datahub.activity_stream.investor_profile.views import (
+    LargeCapitalInvestorProfileActivityViewSet,
+)
+from datahub.activity_stream.models import ActivityOutboxEntry
+from datahub.activity_stream.omis.views import OMISOrderAddedViewSet
+from datahub.activity_stream.opportunity.views import LargeCapitalOpportunityActivityViewSet
+from datahub.core.utils import slice_iterable_into_chunks
+
+logger = getLogger(__name__)
+
+OUTBOX_LOCK_NAME = 'activity_stream_outbox'
+DEFAULT_BACKFILL_BATCH_SIZE = 1000
+
+ACTIVITY_VIEW_SETS = {
+    view_set.outbox_stream: view_set
+    for view_set in (
+        CompanyReferralActivityViewSet,
+        EventActivityViewSet,
+        InteractionActivityViewSet,
+        IProjectCreatedViewSet,
+        LargeCapitalInvestorProfileActivityViewSet,
+        LargeCapitalOpportunityActivityViewSet,
+        OMISOrderAddedViewSet,
+    )
+}
+
+
+def schedule_activity_write(stream, object_id):
+    """Schedules the activity of an object to be written to the outbox on commit.
+
+    Errors are logged rather than raised, as the object has already been saved by then.
+    """
+    transaction.on_commit(partial(write_activities, stream, [object_id]), robust=True)
+
+
+def write_activities(stream, object_ids):
+    """Renders the activities of objects and adds them to the outbox.
+
+    Objects that no longer exist are ignored.
+
+    :returns: the number of activities written
+    """
+    view_set = ACTIVITY_VIEW_SETS[stream]
+    instances = list(
+        view_set.queryset.filter(pk__in=object_ids).order_by('modified_on', 'pk'),
+    )
+    activities = view_set.serializer_class(instances, many=True).data
+    entries = [
+        ActivityOutboxEntry(
+            stream=stream,
+            object_id=instance.pk,
+            object_modified_on=instance.modified_on,
+            activity=activity,
+        )
+        for instance, activity in zip(instances, activities, strict=True)
+    ]
+
+    if not entries:
+        return 0
+
+    # The lock is held until the insert is committed so that IDs are committed in order
+    with advisory_lock(OUTBOX_LOCK_NAME), transaction.atomic():
+        ActivityOutboxEntry.objects.bulk_create(entries)
+
+    return len(entries)
+
+
+def backfill_activities(stream, batch_size=DEFAULT_BACKFILL_BATCH_SIZE):
+    """Adds activities for existing objects that aren't in the outbox yet, oldest first.
+
+    :returns: the number of activities written
+    """
+    view_set = ACTIVITY_VIEW_SETS[stream]
+    object_ids_in_outbox = ActivityOutboxEntry.objects.filter(stream=stream).values('object_id')
+    object_ids = (
+        view_set.queryset.model.objects.exclude(pk__in=object_ids_in_outbox)
+        .order_by('modified_on', 'pk')
+        .values_list('pk', flat=True)
+        .iterator(chunk_size=batch_size)
+    )
+
+    num_written = 0
+    for batch in slice_iterable_into_chunks(object_ids, batch_size):
+        num_written += write_activities(stream, batch)
+        logger.info(f'{num_written} {stream} activities written to the outbox')
+
+    return num_written
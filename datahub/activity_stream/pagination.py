@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse, urlunparse
 
 from django.core.exceptions import ImproperlyConfigured
-from django.db.models import F, Func, TextField
+from django.db.models import F, Func, Max, TextField
 from rest_framework.pagination import BasePagination
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
@@ -62,14 +62,12 @@ class ActivityCursorPagination(BasePagination):
             ),
         )
 
-    def paginate_queryset(self, queryset, request, view=None):
-        """Returns a page of results based on the cursor query string parameter. Designed to make the
-        last page empty.
-        """
-        # Extract cursor from query string. Inclues partial support for DRF's base64-encoded cursor
-        # of timestamp + offset, the previous pagination mechanism. This is so that at the time
-        # of deployment the Activity Stream can carry on from at most a few pages before where it
-        # was. Once this is live and working, the DRF support can be removed
+    def _get_after_ts_and_id(self, request):
+        """Extracts the (modified_on, id) cursor from the query string."""
+        # Inclues partial support for DRF's base64-encoded cursor of timestamp + offset, the
+        # previous pagination mechanism. This is so that at the time of deployment the Activity
+        # Stream can carry on from at most a few pages before where it was. Once this is live and
+        # working, the DRF support can be removed
         try:
             after_ts_str = parse_qs(b64decode(request.GET.getlist('cursor')[0]))[b'p'][0].decode()
             after_id_str = '00000000-0000-0000-0000-000000000000'
@@ -79,8 +77,13 @@ class ActivityCursorPagination(BasePagination):
                 ('0001-01-01 00:00:00.000000+00:00', '00000000-0000-0000-0000-000000000000'),
             )
 
-        after_ts = datetime.fromisoformat(after_ts_str)
-        after_id = uuid.UUID(after_id_str)
+        return datetime.fromisoformat(after_ts_str), uuid.UUID(after_id_str)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Returns a page of results based on the cursor query string parameter. Designed to make the
+        last page empty.
+        """
+        after_ts, after_id = self._get_after_ts_and_id(request)
 
         # Filter queryset to be after cursor.
         #
@@ -133,3 +136,50 @@ class ActivityCursorPagination(BasePagination):
                 'next': self.next_link,
             },
         )
+
+
+class ActivityOutboxPagination(ActivityCursorPagination):
+    """Cursor pagination for activities in the activity outbox.
+
+    The cursor is the ID of the last outbox entry returned. As IDs are committed in order (see
+    datahub.activity_stream.outbox), activities aren't held back to allow for timestamps
+    being committed out of order.
+    """
+
+    def _get_after_sequence(self, queryset, request):
+        cursor = request.GET.getlist('cursor')
+        if not cursor:
+            return 0
+        if len(cursor) == 1 and cursor[0].isdigit():
+            return int(cursor[0])
+
+        # The cursor is from before the outbox was used, so carry on from the first entry for an
+        # object modified after it. (Some activities may be returned again, which is harmless.)
+        after_ts, _ = self._get_after_ts_and_id(request)
+        first_sequence = (
+            queryset.filter(object_modified_on__gt=after_ts)
+            .order_by('pk')
+            .values_list('pk', flat=True)
+            .first()
+        )
+        if first_sequence is None:
+            return queryset.aggregate(max_sequence=Max('pk'))['max_sequence'] or 0
+        return first_sequence - 1
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Returns a page of outbox entries after the cursor. Designed to make the last page
+        empty.
+        """
+        after_sequence = self._get_after_sequence(queryset, request)
+        page = list(queryset.filter(pk__gt=after_sequence).order_by('pk')[: self.page_size])
+
+        if not page:
+            self.next_link = None
+        else:
+            self.next_link = self._replace_query_param(
+                request.build_absolute_uri(),
+                'cursor',
+                (str(page[-1].pk),),
+            )
+
+        return page
@@ -0,0 +1,21 @@
+from functools import partial
+
+from django.db.models.signals import post_save
+
+from datahub.activity_stream.outbox import ACTIVITY_VIEW_SETS, schedule_activity_write
+
+
+def write_activity_on_commit(sender, instance, stream, raw=False, **kwargs):
+    """Writes the activity of a saved object to the outbox once the transaction commits."""
+    if raw:
+        return
+    schedule_activity_write(stream, instance.pk)
+
+
+for stream, view_set in ACTIVITY_VIEW_SETS.items():
+    post_save.connect(
+        partial(write_activity_on_commit, stream=stream),
+        sender=view_set.queryset.model,
+        weak=False,
+        dispatch_uid=f'write_{stream}_activity_on_commit',
+    )
@@ -0,0 +1,185 @@
+import datetime
+from uuid import uuid4
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from django.utils.timezone import now
+from freezegun import freeze_time
+from rest_framework import status
+
+from datahub.activity_stream.models import ActivityOutboxEntry
+from datahub.activity_stream.outbox import write_activities
+from datahub.activity_stream.test import hawk
+from datahub.activity_stream.test.utils import get_url
+from datahub.company_referral.test.factories import CompanyReferralFactory
+from datahub.event.test.factories import EventFactory
+from datahub.interaction.test.factories import CompanyInteractionFactory
+from datahub.investment.investor_profile.test.factories import LargeCapitalInvestorProfileFactory
+from datahub.investment.opportunity.test.factories import LargeCapitalOpportunityFactory
+from datahub.investment.project.test.factories import InvestmentProjectFactory
+from datahub.omis.order.test.factories import OrderFactory
+
+pytestmark = pytest.mark.django_db
+
+INTERACTIONS_URL_NAME = 'api-v3:activity-stream:interactions'
+
+
+def _create_entries(num_entries, stream='interaction', start=None):
+    start = start or now()
+    return [
+        ActivityOutboxEntry.objects.create(
+            stream=stream,
+            object_id=uuid4(),
+            object_modified_on=start + datetime.timedelta(seconds=index),
+            activity={'id': f'activity-{index}'},
+        )
+        for index in range(num_entries)
+    ]
+
+
+@pytest.mark.parametrize(
+    ('factory', 'stream', 'url_name'),
+    [
+        (CompanyReferralFactory, 'company_referral', 'api-v3:activity-stream:company-referrals'),
+        (EventFactory, 'event', 'api-v3:activity-stream:events'),
+        (CompanyInteractionFactory, 'interaction', INTERACTIONS_URL_NAME),
+        (
+            InvestmentProjectFactory,
+            'investment_project_added',
+            'api-v3:activity-stream:investment-project-added',
+        ),
+        (
+            LargeCapitalInvestorProfileFactory,
+            'large_capital_investor_profile',
+            'api-v3:activity-stream:large-capital-investor-profiles',
+        ),
+        (
+            LargeCapitalOpportunityFactory,
+            'large_capital_opportunity',
+            'api-v3:activity-stream:large-capital-opportunity',
+        ),
+        (OrderFactory, 'omis_order_added', 'api-v3:activity-stream:omis-order-added'),
+    ],
+)
+def test_saved_objects_are_added_to_outbox_on_commit(
+    api_client,
+    django_capture_on_commit_callbacks,
+    factory,
+    stream,
+    url_name,
+):
+    """Test that saving an object adds its activity to the outbox, rendered as it would be without
+    the outbox.
+    """
+    start = datetime.datetime(year=2012, month=7, day=12, hour=15, minute=6, second=3)
+    with freeze_time(start) as frozen_datetime:
+        with django_capture_on_commit_callbacks(execute=True):
+            obj = factory()
+
+        frozen_datetime.tick(datetime.timedelta(seconds=1, microseconds=1))
+        response = hawk.get(api_client, get_url(url_name))
+        with override_settings(ACTIVITY_STREAM_OUTBOX_ENABLED=True):
+            outbox_response = hawk.get(api_client, get_url(url_name))
+
+    entry = ActivityOutboxEntry.objects.filter(stream=stream).latest('pk')
+    assert entry.object_id == obj.pk
+    assert response.status_code == outbox_response.status_code == status.HTTP_200_OK
+    assert outbox_response.json()['orderedItems'][-1] == response.json()['orderedItems'][0]
+
+
+@override_settings(ACTIVITY_STREAM_OUTBOX_ENABLED=True)
+def test_outbox_pagination(api_client, monkeypatch):
+    """Test that activities are paged by outbox entry ID, with an empty last page."""
+    monkeypatch.setattr(
+        'datahub.activity_stream.pagination.ActivityCursorPagination.page_size',
+        2,
+    )
+    _create_entries(3)
+    _create_entries(1, stream='event')
+
+    response = hawk.get(api_client, get_url(INTERACTIONS_URL_NAME))
+    page_1_data = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert page_1_data['summary'] == 'Interaction Activities'
+    assert page_1_data['orderedItems'] == [{'id': 'activity-0'}, {'id': 'activity-1'}]
+
+    page_2_data = hawk.get(api_client, page_1_data['next']).json()
+    assert page_2_data['orderedItems'] == [{'id': 'activity-2'}]
+
+    page_3_url = page_2_data['next']
+    page_3_data = hawk.get(api_client, page_3_url).json()
+    assert page_3_data['orderedItems'] == []
+    assert page_3_data['next'] is None
+
+    # New activities are returned immediately (without waiting for a second to pass)
+    _create_entries(1)
+    page_3_data = hawk.get(api_client, page_3_url).json()
+    assert page_3_data['orderedItems'] == [{'id': 'activity-0'}]
+
+
+@override_settings(ACTIVITY_STREAM_OUTBOX_ENABLED=True)
+@pytest.mark.parametrize(
+    ('cursor_index', 'expected_ids'),
+    [
+        (0, ['activity-1', 'activity-2']),
+        (2, []),
+    ],
+)
+def test_outbox_pagination_with_cursor_from_before_outbox(api_client, cursor_index, expected_ids):
+    """Test that (modified_on, id) cursors carry on from activities modified after the cursor."""
+    entries = _create_entries(3)
+    cursor_entry = entries[cursor_index]
+    modified_on_cursor = cursor_entry.object_modified_on.isoformat(timespec='microseconds')
+
+    response = hawk.get(
+        api_client,
+        get_url(INTERACTIONS_URL_NAME)
+        + f'?cursor={modified_on_cursor.replace("+", "%2B")}&cursor={cursor_entry.object_id}',
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.json()['orderedItems']] == expected_ids
+
+
+def test_write_activities_ignores_objects_that_do_not_exist():
+    """Test that activities are only written for objects that exist."""
+    interaction = CompanyInteractionFactory()
+
+    assert write_activities('interaction', [interaction.pk, uuid4()]) == 1
+    assert list(ActivityOutboxEntry.objects.values_list('object_id', flat=True)) == [
+        interaction.pk,
+    ]
+
+
+class TestBackfillActivityOutboxCommand:
+    """Tests for the backfill_activity_outbox management command."""
+
+    def test_backfills_activities_in_modified_on_order(self):
+        """Test that activities are added for objects not in the outbox, oldest first."""
+        start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        with freeze_time(start) as frozen_datetime:
+            interactions = []
+            for _ in range(3):
+                interactions.append(CompanyInteractionFactory())
+                frozen_datetime.tick()
+        interactions[1].save()
+        write_activities('interaction', [interactions[0].pk])
+
+        call_command('backfill_activity_outbox', 'interaction', batch_size=1)
+        call_command('backfill_activity_outbox', 'interaction')
+
+        entries = ActivityOutboxEntry.objects.filter(stream='interaction').order_by('pk')
+        assert [entry.object_id for entry in entries] == [
+            interactions[0].pk,
+            interactions[2].pk,
+            interactions[1].pk,
+        ]
+        assert (
+            entries[1].activity['object']['id'] == f'dit:DataHubInteraction:{interactions[2].pk}'
+        )
+
+    def test_raises_error_for_unknown_streams(self):
+        """Test that an error is raised if an unknown stream is specified."""
+        with pytest.raises(CommandError, match='Unknown activity streams: unknown'):
+            call_command('backfill_activity_outbox', 'unknown')
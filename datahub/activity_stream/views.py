@@ -1,4 +1,8 @@
+from django.conf import settings
+
 from config.settings.types import HawkScope
+from datahub.activity_stream.models import ActivityOutboxEntry
+from datahub.activity_stream.pagination import ActivityOutboxPagination
 from datahub.core.auth import PaaSIPAuthentication
 from datahub.core.hawk_receiver import (
     HawkAuthentication,
@@ -12,8 +16,26 @@ class ActivityViewSet(HawkResponseSigningMixin, CoreViewSet):
     """Generic view for activities.
 
     Sets up authentication, permission and scope.
+
+    If ACTIVITY_STREAM_OUTBOX_ENABLED is True, activities are returned from the activity outbox
+    entries for `outbox_stream` rather than by serialising `queryset`.
     """
 
     authentication_classes = (PaaSIPAuthentication, HawkAuthentication)
     permission_classes = (HawkScopePermission,)
     required_hawk_scope = HawkScope.activity_stream
+    outbox_stream = None
+
+    def list(self, request, *args, **kwargs):
+        """Returns a page of activities."""
+        if not settings.ACTIVITY_STREAM_OUTBOX_ENABLED:
+            return super().list(request, *args, **kwargs)
+
+        paginator = ActivityOutboxPagination()
+        paginator.summary = self.paginator._get_summary()
+        entries = paginator.paginate_queryset(
+            ActivityOutboxEntry.objects.filter(stream=self.outbox_stream).only('activity'),
+            request,
+            view=self,
+        )
+        return paginator.get_paginated_response([entry.activity for entry in entries])
@@ -0,0 +1,76 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+from django.utils.timezone import now
+
+from datahub.core.models import BaseModel
+
+MAX_LENGTH = settings.CHAR_FIELD_MAX_LENGTH
+
+
+class ReportRun(BaseModel):
+    """A run of an admin report, generated in the background as a CSV file.
+
+    Runs are created by datahub.admin_report.tasks.schedule_report_run, which reuses any run of
+    the same report that is in progress or was completed recently.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = ('pending', 'Pending')
+        RUNNING = ('running', 'Running')
+        COMPLETE = ('complete', 'Complete')
+        FAILED = ('failed', 'Failed')
+
+    ACTIVE_STATUSES = (Status.PENDING, Status.RUNNING)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    report_id = models.CharField(max_length=MAX_LENGTH)
+    status = models.CharField(max_length=MAX_LENGTH, choices=Status, default=Status.PENDING)
+    started_on = models.DateTimeField(null=True, blank=True)
+    finished_on = models.DateTimeField(null=True, blank=True)
+    row_count = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text='The number of rows written so far (while running) or in total',
+    )
+    filename = models.CharField(max_length=MAX_LENGTH, blank=True)
+    file_path = models.CharField(max_length=MAX_LENGTH, blank=True)
+    is_compressed = models.BooleanField(default=False)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        constraints = [
+            # Only one run of each report can be in progress at a time
+            models.UniqueConstraint(
+                fields=['report_id'],
+                condition=Q(status__in=('pending', 'running')),
+                name='admin_report_unique_active_run',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['report_id', 'status', 'finished_on']),
+        ]
+        default_permissions = ()
+
+    def __str__(self):
+        """Human-friendly string representation."""
+        return f'{self.report_id} - {self.created_on} - {self.get_status_display()}'
+
+    @property
+    def is_active(self):
+        """Whether the run is pending or running."""
+        return self.status in self.ACTIVE_STATUSES
+
+    @property
+    def duration(self):
+        """The time the run took (or has taken so far) once started."""
+        if not self.started_on:
+            return None
+        return (self.finished_on or now()) - self.started_on
+
+    @property
+    def download_filename(self):
+        """The filename, with extension, to download the report as."""
+        return f'{self.filename}.csv.gz' if self.is_compressed else f'{self.filename}.csv'
@@ -99,12 +99,17 @@ def report_exists(report_id):
     return report_id in _registry
 
 
+def get_report(report_id):
+    """Gets a report instance using its ID, without checking permissions (e.g. in tasks)."""
+    return _registry[report_id]
+
+
 def get_report_by_id(report_id, user):
     """Gets a report instance for using its ID.
 
     If the user does not have the correct permission for the report, PermissionDenied is raised.
     """
-    report = _registry[report_id]
+    report = get_report(report_id)
     if not report.check_permission(user):
         raise PermissionDenied
     return report
@@ -0,0 +1,63 @@
+import shutil
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponseRedirect
+from django.utils.module_loading import import_string
+
+from datahub.documents.utils import get_bucket_name, get_s3_client_for_bucket
+
+# How long download links to reports stored in S3 are valid for
+S3_DOWNLOAD_URL_EXPIRY = 60  # seconds
+
+
+class S3ReportStorage:
+    """Stores generated reports in the report S3 bucket (see settings.DOCUMENT_BUCKETS)."""
+
+    bucket_id = 'report'
+
+    def save(self, path, file):
+        """Uploads a file object to the bucket."""
+        client = get_s3_client_for_bucket(self.bucket_id)
+        client.upload_fileobj(file, get_bucket_name(self.bucket_id), path)
+
+    def get_download_response(self, path, filename):
+        """Returns a redirect to a pre-signed URL that downloads the report as an attachment."""
+        client = get_s3_client_for_bucket(self.bucket_id)
+        url = client.generate_presigned_url(
+            ClientMethod='get_object',
+            Params={
+                'Bucket': get_bucket_name(self.bucket_id),
+                'Key': path,
+                'ResponseContentDisposition': f'attachment; filename="{filename}"',
+            },
+            ExpiresIn=S3_DOWNLOAD_URL_EXPIRY,
+        )
+        return HttpResponseRedirect(url)
+
+
+class FileSystemReportStorage:
+    """Stores generated reports in settings.ADMIN_REPORT_DIRECTORY (e.g. for local development)."""
+
+    def save(self, path, file):
+        """Writes a file object to the reports directory."""
+        full_path = self._get_full_path(path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        with full_path.open('wb') as destination:
+            shutil.copyfileobj(file, destination)
+
+    def get_download_response(self, path, filename):
+        """Returns a response that downloads the report as an attachment."""
+        return FileResponse(
+            self._get_full_path(path).open('rb'),
+            as_attachment=True,
+            filename=filename,
+        )
+
+    def _get_full_path(self, path):
+        return Path(settings.ADMIN_REPORT_DIRECTORY, path)
+
+
+def get_report_storage():
+    """Returns an instance of the storage class in settings.ADMIN_REPORT_STORAGE_CLASS."""
+    return import_string(settings.ADMIN_REPORT_STORAGE_CLASS)()
@@ -0,0 +1,156 @@
+import gzip
+import logging
+from datetime import timedelta
+from functools import partial
+from tempfile import TemporaryFile
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils.timezone import now
+
+from datahub.admin_report.models import ReportRun
+from datahub.admin_report.report import get_report
+from datahub.admin_report.storage import get_report_storage
+from datahub.core.csv import csv_iterator
+from datahub.core.queues.constants import ONE_HOUR_IN_SECONDS
+from datahub.core.queues.job_scheduler import job_scheduler
+from datahub.core.queues.scheduler import LONG_RUNNING_QUEUE
+
+logger = logging.getLogger(__name__)
+
+REPORT_RUN_TIMEOUT = ONE_HOUR_IN_SECONDS
+# How often the row count of a running report is saved, so that its progress can be displayed
+PROGRESS_UPDATE_INTERVAL = 10000  # rows
+
+
+def schedule_report_run(report, user):
+    """Gets a run of a report to show to a user, scheduling a new run if required.
+
+    A run that is already in progress, or that completed within
+    settings.ADMIN_REPORT_FRESHNESS_WINDOW seconds, is reused. This means that identical
+    concurrent requests only generate the report once.
+
+    :returns: tuple of (report run, whether a new run was scheduled)
+    """
+    _fail_timed_out_runs(report.id)
+
+    run = _get_reusable_run(report.id)
+    if run:
+        return run, False
+
+    try:
+        with transaction.atomic():
+            run = ReportRun.objects.create(report_id=report.id, created_by=user, modified_by=user)
+    except IntegrityError:
+        # Another request started a run of the report concurrently
+        return _get_reusable_run(report.id), False
+
+    transaction.on_commit(partial(_schedule_run_report_task, run))
+    return run, True
+
+
+def run_report(run_id):
+    """Generates the CSV file for a report run and saves it to the report storage.
+
+    The status, row count and timing of the run are recorded on the run.
+    """
+    run = ReportRun.objects.get(pk=run_id)
+    if run.status != ReportRun.Status.PENDING:
+        logger.info(f'Report run {run_id} has already been started, skipping')
+        return
+
+    report = get_report(run.report_id)
+    run.status = ReportRun.Status.RUNNING
+    run.started_on = now()
+    run.filename = report.get_filename()
+    run.is_compressed = settings.ADMIN_REPORT_COMPRESS
+    run.file_path = f'admin-reports/{report.id}/{run.pk}.csv'
+    if run.is_compressed:
+        run.file_path += '.gz'
+    run.save(update_fields=('status', 'started_on', 'filename', 'is_compressed', 'file_path'))
+
+    try:
+        with TemporaryFile() as file:
+            run.row_count = _write_csv(run, report, file)
+            file.seek(0)
+            get_report_storage().save(run.file_path, file)
+    except Exception as exc:
+        run.status = ReportRun.Status.FAILED
+        run.error = repr(exc)
+        run.finished_on = now()
+        run.save(update_fields=('status', 'error', 'finished_on'))
+        raise
+
+    run.status = ReportRun.Status.COMPLETE
+    run.finished_on = now()
+    run.save(update_fields=('status', 'row_count', 'finished_on'))
+    logger.info(
+        f'Report {report.id} run {run.pk} completed with {run.row_count} rows in '
+        f'{run.duration.total_seconds():.1f} seconds',
+    )
+
+
+def _schedule_run_report_task(run):
+    job = job_scheduler(
+        function=run_report,
+        function_args=(str(run.pk),),
+        max_retries=None,
+        queue_name=LONG_RUNNING_QUEUE,
+        job_timeout=REPORT_RUN_TIMEOUT,
+    )
+    logger.info(f'Task {job.id} run_report scheduled for report {run.report_id} run {run.pk}')
+
+
+def _fail_timed_out_runs(report_id):
+    """Marks runs that can no longer finish (e.g. as the worker was stopped) as failed."""
+    ReportRun.objects.filter(
+        report_id=report_id,
+        status__in=ReportRun.ACTIVE_STATUSES,
+        created_on__lt=now() - timedelta(seconds=REPORT_RUN_TIMEOUT),
+    ).update(status=ReportRun.Status.FAILED, error='Timed out', finished_on=now())
+
+
+def _get_reusable_run(report_id):
+    fresh_after = now() - timedelta(seconds=settings.ADMIN_REPORT_FRESHNESS_WINDOW)
+    active_run = ReportRun.objects.filter(
+        report_id=report_id,
+        status__in=ReportRun.ACTIVE_STATUSES,
+    ).first()
+    if active_run:
+        return active_run
+
+    return (
+        ReportRun.objects.filter(
+            report_id=report_id,
+            status=ReportRun.Status.COMPLETE,
+            finished_on__gte=fresh_after,
+        )
+        .order_by('-finished_on')
+        .first()
+    )
+
+
+def _write_csv(run, report, file):
+    """Writes the rows of a report to a file (compressing them if required).
+
+    :returns: the number of rows written
+    """
+    row_count = 0
+
+    def _counted_rows():
+        nonlocal row_count
+        for row in report.rows():
+            yield row
+            row_count += 1
+            if row_count % PROGRESS_UPDATE_INTERVAL == 0:
+                ReportRun.objects.filter(pk=run.pk).update(row_count=row_count)
+
+    destination = gzip.GzipFile(fileobj=file, mode='wb') if run.is_compressed else file
+    try:
+        for chunk in csv_iterator(_counted_rows(), report.field_titles):
+            destination.write(chunk)
+    finally:
+        if run.is_compressed:
+            destination.close()
+
+    return row_count
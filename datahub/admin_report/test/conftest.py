@@ -1,3 +1,5 @@
+import pytest
+
 from datahub.admin_report.report import QuerySetReport
 from datahub.core.test.support.models import MetadataModel
 
@@ -14,3 +16,10 @@ class MetadataReport(QuerySetReport):
         'id': 'Test ID',
         'name': 'Name',
     }
+
+
+@pytest.fixture(autouse=True)
+def report_directory(settings, tmp_path):
+    """Writes reports generated by tests to a temporary directory."""
+    settings.ADMIN_REPORT_DIRECTORY = str(tmp_path)
+    return tmp_path
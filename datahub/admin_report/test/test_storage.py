@@ -0,0 +1,31 @@
+from io import BytesIO
+from unittest import mock
+
+import boto3
+from moto import mock_aws
+
+from datahub.admin_report.storage import S3ReportStorage
+
+
+@mock_aws
+def test_s3_report_storage():
+    """Test that reports can be saved to and downloaded from S3."""
+    s3_client = boto3.client('s3', region_name='eu-west-2')
+    s3_client.create_bucket(
+        Bucket='foo',
+        CreateBucketConfiguration={'LocationConstraint': 'eu-west-2'},
+    )
+    storage = S3ReportStorage()
+
+    with mock.patch(
+        'datahub.admin_report.storage.get_s3_client_for_bucket', return_value=s3_client
+    ):
+        storage.save('admin-reports/test.csv', BytesIO(b'Name\r\n'))
+        response = storage.get_download_response('admin-reports/test.csv', 'Test report.csv')
+
+    assert s3_client.get_object(Bucket='foo', Key='admin-reports/test.csv')['Body'].read() == (
+        b'Name\r\n'
+    )
+    assert response.status_code == 302
+    assert 'admin-reports/test.csv' in response['Location']
+    assert 'response-content-disposition=attachment' in response['Location']
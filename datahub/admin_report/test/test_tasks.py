@@ -0,0 +1,121 @@
+import gzip
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils.timezone import now
+from freezegun import freeze_time
+
+from datahub.admin_report.models import ReportRun
+from datahub.admin_report.report import get_report
+from datahub.admin_report.tasks import run_report, schedule_report_run
+from datahub.core.test.support.factories import MetadataModelFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def report():
+    return get_report('test-report')
+
+
+class TestScheduleReportRun:
+    """Tests for schedule_report_run()."""
+
+    def test_schedules_new_run(self, django_capture_on_commit_callbacks, report, report_directory):
+        """Test that a run is created and the report generated once the transaction commits."""
+        MetadataModelFactory.create_batch(2)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            run, is_new = schedule_report_run(report, None)
+
+        run.refresh_from_db()
+        assert is_new
+        assert run.status == ReportRun.Status.COMPLETE
+        assert run.row_count == 2
+        assert run.started_on <= run.finished_on
+        assert (report_directory / run.file_path).read_bytes().count(b'\r\n') == 3
+
+    def test_reuses_recently_completed_run(self, report, settings):
+        """Test that a run completed within the freshness window is reused."""
+        settings.ADMIN_REPORT_FRESHNESS_WINDOW = 60
+        completed_run = ReportRun.objects.create(
+            report_id=report.id,
+            status=ReportRun.Status.COMPLETE,
+            finished_on=now() - timedelta(seconds=30),
+        )
+
+        assert schedule_report_run(report, None) == (completed_run, False)
+
+    def test_does_not_reuse_stale_run(self, report, settings):
+        """Test that a new run is scheduled if the last run completed outside the window."""
+        settings.ADMIN_REPORT_FRESHNESS_WINDOW = 60
+        stale_run = ReportRun.objects.create(
+            report_id=report.id,
+            status=ReportRun.Status.COMPLETE,
+            finished_on=now() - timedelta(seconds=90),
+        )
+
+        run, is_new = schedule_report_run(report, None)
+
+        assert is_new
+        assert run != stale_run
+
+    def test_fails_timed_out_runs(self, report):
+        """Test that a run that has been in progress for longer than the timeout is failed and
+        replaced by a new run.
+        """
+        with freeze_time(now() - timedelta(hours=2)):
+            timed_out_run = ReportRun.objects.create(report_id=report.id)
+
+        run, is_new = schedule_report_run(report, None)
+
+        timed_out_run.refresh_from_db()
+        assert is_new
+        assert run != timed_out_run
+        assert timed_out_run.status == ReportRun.Status.FAILED
+        assert timed_out_run.error == 'Timed out'
+
+
+class TestRunReport:
+    """Tests for run_report()."""
+
+    def test_compresses_report(self, report, report_directory, settings):
+        """Test that the report is gzipped if settings.ADMIN_REPORT_COMPRESS is set."""
+        settings.ADMIN_REPORT_COMPRESS = True
+        obj = MetadataModelFactory()
+        run = ReportRun.objects.create(report_id=report.id)
+
+        run_report(run.pk)
+
+        run.refresh_from_db()
+        assert run.is_compressed
+        assert run.file_path.endswith('.csv.gz')
+        assert run.download_filename.endswith('.csv.gz')
+        contents = gzip.decompress((report_directory / run.file_path).read_bytes())
+        assert contents.decode('utf-8-sig') == f'Test ID,Name\r\n{obj.pk},{obj.name}\r\n'
+
+    def test_records_failure(self, report):
+        """Test that the run is marked as failed if an error occurs."""
+        run = ReportRun.objects.create(report_id=report.id)
+
+        with (
+            mock.patch.object(type(report), 'rows', side_effect=ValueError('error')),
+            pytest.raises(ValueError, match='error'),
+        ):
+            run_report(run.pk)
+
+        run.refresh_from_db()
+        assert run.status == ReportRun.Status.FAILED
+        assert run.error == "ValueError('error')"
+        assert run.finished_on
+
+    def test_skips_runs_that_have_started(self, report):
+        """Test that a run isn't generated again (e.g. if its job is enqueued twice)."""
+        run = ReportRun.objects.create(report_id=report.id, status=ReportRun.Status.RUNNING)
+
+        run_report(run.pk)
+
+        run.refresh_from_db()
+        assert run.status == ReportRun.Status.RUNNING
+        assert not run.started_on
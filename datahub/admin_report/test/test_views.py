@@ -1,4 +1,5 @@
 from cgi import parse_header
+from uuid import uuid4
 
 import pytest
 from django.test import Client
@@ -6,6 +7,7 @@ from django.urls import reverse
 from freezegun import freeze_time
 from rest_framework import status
 
+from datahub.admin_report.models import ReportRun
 from datahub.core.test.support.factories import MetadataModelFactory
 from datahub.core.test_utils import AdminTestMixin, create_test_user
 
@@ -18,6 +20,8 @@ class TestReportAdmin(AdminTestMixin):
         [
             reverse('admin_report:index'),
             reverse('admin_report:download-report', kwargs={'report_id': 'test-report'}),
+            reverse('admin_report:report-run', kwargs={'run_id': uuid4()}),
+            reverse('admin_report:download-report-run', kwargs={'run_id': uuid4()}),
         ],
     )
     def test_redirects_to_login_page_if_not_logged_in(self, url):
@@ -34,6 +38,8 @@ class TestReportAdmin(AdminTestMixin):
         [
             reverse('admin_report:index'),
             reverse('admin_report:download-report', kwargs={'report_id': 'test-report'}),
+            reverse('admin_report:report-run', kwargs={'run_id': uuid4()}),
+            reverse('admin_report:download-report-run', kwargs={'run_id': uuid4()}),
         ],
     )
     def test_redirects_to_login_page_if_not_staff(self, url):
@@ -78,8 +84,8 @@ class TestReportAdmin(AdminTestMixin):
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     @freeze_time('2018-01-01 11:12:13')
-    def test_report_download(self):
-        """Test the download of a report."""
+    def test_report_download(self, django_capture_on_commit_callbacks):
+        """Test that a report is generated in the background, and can then be downloaded."""
         obj = MetadataModelFactory()
         url = reverse('admin_report:download-report', kwargs={'report_id': 'test-report'})
 
@@ -90,16 +96,91 @@ class TestReportAdmin(AdminTestMixin):
         )
 
         client = self.create_client(user=user)
-        response = client.get(url)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.get(url)
+
+        run = ReportRun.objects.get()
+        assert response.status_code == status.HTTP_302_FOUND
+        assert response['Location'] == reverse(
+            'admin_report:report-run',
+            kwargs={'run_id': run.pk},
+        )
+        assert run.status == ReportRun.Status.COMPLETE
+        assert run.row_count == 1
+        assert run.created_by == user
+
+        run_page_response = client.get(response['Location'])
+        download_url = reverse('admin_report:download-report-run', kwargs={'run_id': run.pk})
+        assert run_page_response.status_code == status.HTTP_200_OK
+        assert download_url in run_page_response.rendered_content
+
+        response = client.get(download_url)
         assert response.status_code == status.HTTP_200_OK
-        assert parse_header(response.get('Content-Type')) == ('text/csv', {'charset': 'utf-8'})
+        assert parse_header(response.get('Content-Type'))[0] == 'text/csv'
         assert parse_header(response.get('Content-Disposition')) == (
             'attachment',
             {'filename': 'Test report - 2018-01-01-11-12-13.csv'},
         )
         assert (
-            response.getvalue().decode('utf-8-sig')
+            b''.join(response.streaming_content).decode('utf-8-sig')
             == f"""Test ID,Name\r
 {str(obj.pk)},{obj.name}\r
 """
         )
+
+    def test_report_download_reuses_active_run(self):
+        """Test that a report isn't generated again while it is already being generated."""
+        run = ReportRun.objects.create(report_id='test-report')
+        url = reverse('admin_report:download-report', kwargs={'report_id': 'test-report'})
+        user = create_test_user(
+            permission_codenames=('change_metadatamodel',),
+            is_staff=True,
+            password=self.PASSWORD,
+        )
+
+        client = self.create_client(user=user)
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_302_FOUND
+        assert response['Location'] == reverse(
+            'admin_report:report-run', kwargs={'run_id': run.pk}
+        )
+        assert ReportRun.objects.count() == 1
+
+        run_page_response = client.get(response['Location'])
+        assert run_page_response.status_code == status.HTTP_200_OK
+        assert '<meta http-equiv="refresh"' in run_page_response.rendered_content
+
+    @pytest.mark.parametrize(
+        'url_name',
+        [
+            'admin_report:report-run',
+            'admin_report:download-report-run',
+        ],
+    )
+    def test_report_run_without_permission(self, url_name):
+        """Test that report runs can't be viewed or downloaded without the report permission."""
+        run = ReportRun.objects.create(
+            report_id='test-report',
+            status=ReportRun.Status.COMPLETE,
+        )
+        url = reverse(url_name, kwargs={'run_id': run.pk})
+        user = create_test_user(permission_codenames=(), is_staff=True, password=self.PASSWORD)
+
+        client = self.create_client(user=user)
+        response = client.get(url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_download_incomplete_report_run(self):
+        """Test that a 404 is returned when downloading a report run that isn't complete."""
+        run = ReportRun.objects.create(report_id='test-report')
+        url = reverse('admin_report:download-report-run', kwargs={'run_id': run.pk})
+        user = create_test_user(
+            permission_codenames=('change_metadatamodel',),
+            is_staff=True,
+            password=self.PASSWORD,
+        )
+
+        client = self.create_client(user=user)
+        response = client.get(url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,7 +1,12 @@
 from django.contrib.admin import site
 from django.urls import path
 
-from datahub.admin_report.views import download_report, list_reports
+from datahub.admin_report.views import (
+    download_report,
+    download_report_run,
+    list_reports,
+    report_run,
+)
 
 app_name = 'admin_report'
 
@@ -16,4 +21,14 @@ urlpatterns = [
         site.admin_view(download_report),
         name='download-report',
     ),
+    path(
+        'admin/reports/runs/<uuid:run_id>',
+        site.admin_view(report_run),
+        name='report-run',
+    ),
+    path(
+        'admin/reports/runs/<uuid:run_id>/download',
+        site.admin_view(download_report_run),
+        name='download-report-run',
+    ),
 ]
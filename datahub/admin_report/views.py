@@ -1,11 +1,17 @@
 from django.contrib.admin import site
 from django.http import Http404
+from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
 
+from datahub.admin_report.models import ReportRun
 from datahub.admin_report.report import get_report_by_id, get_reports_by_model, report_exists
-from datahub.core.csv import create_csv_response
+from datahub.admin_report.storage import get_report_storage
+from datahub.admin_report.tasks import schedule_report_run
 
 REPORT_INDEX_TEMPLATE = 'admin/reports/index.html'
+REPORT_RUN_TEMPLATE = 'admin/reports/run.html'
+# How often the report run page is refreshed while the report is being generated
+REPORT_RUN_REFRESH_INTERVAL = 5  # seconds
 
 
 def list_reports(request):
@@ -27,10 +33,47 @@ def list_reports(request):
 
 
 def download_report(request, report_id=None):
-    """Downloads a report."""
+    """Starts generating a report in the background and redirects to the report run page.
+
+    A run of the report that is in progress or was completed recently is reused instead.
+    """
     if not report_exists(report_id):
         raise Http404
 
     report = get_report_by_id(report_id, request.user)
+    run, _ = schedule_report_run(report, request.user)
+
+    return redirect('admin_report:report-run', run_id=run.pk)
+
+
+def report_run(request, run_id):
+    """View that displays the progress of a report run, and a download link once complete."""
+    run = get_object_or_404(ReportRun, pk=run_id)
+    report = _get_report_for_run(run, request.user)
+
+    context = {
+        **site.each_context(request),
+        'title': report.name,
+        'report': report,
+        'run': run,
+        'refresh_interval': REPORT_RUN_REFRESH_INTERVAL if run.is_active else None,
+    }
+
+    request.current_app = site.name
+
+    return TemplateResponse(request, REPORT_RUN_TEMPLATE, context)
+
+
+def download_report_run(request, run_id):
+    """Downloads the file generated by a completed report run."""
+    run = get_object_or_404(ReportRun, pk=run_id, status=ReportRun.Status.COMPLETE)
+    _get_report_for_run(run, request.user)
+
+    return get_report_storage().get_download_response(run.file_path, run.download_filename)
+
+
+def _get_report_for_run(run, user):
+    if not report_exists(run.report_id):
+        raise Http404
 
-    return create_csv_response(report.rows(), report.field_titles, report.get_filename())
+    return get_report_by_id(run.report_id, user)
@@ -1,7 +1,9 @@
+from collections import Counter
 from contextlib import ExitStack
 from functools import reduce
 from logging import getLogger
 from operator import and_
+from time import monotonic, sleep
 
 from django.apps import apps
 from django.core.management import BaseCommand
@@ -9,7 +11,11 @@ from django.db.models import Q, Subquery
 from django.db.transaction import atomic
 from django.template.defaultfilters import capfirst
 
-from datahub.cleanup.query_utils import get_relations_to_delete, get_unreferenced_objects_query
+from datahub.cleanup.query_utils import (
+    get_relations_to_delete,
+    get_relations_without_supporting_indexes,
+    get_unreferenced_objects_query,
+)
 from datahub.core.exceptions import SimulationRollbackError
 from datahub.search.deletion import update_opensearch_after_deletions
 
@@ -45,9 +51,36 @@ class BaseCleanupCommand(BaseCommand):
         simulation_group.add_argument(
             '--only-print-queries',
             action='store_true',
-            help='Only prints the SQL query and number of matching records. Does not delete '
+            help='Only prints the SQL query and number of matching records, and the relations '
+            'that are checked for references without a supporting index. Does not delete '
             'records or simulate deletions.',
         )
+        batch_group = parser.add_argument_group(
+            'batching',
+            'Options for deleting records in batches, each in its own transaction, instead of '
+            'in a single transaction.',
+        )
+        batch_group.add_argument(
+            '--batch-size',
+            type=int,
+            help='Deletes records in batches of this size (in primary key order).',
+        )
+        batch_group.add_argument(
+            '--resume-from-pk',
+            help='Only deletes records with a primary key greater than this value (e.g. the last '
+            'primary key logged by a previous run).',
+        )
+        batch_group.add_argument(
+            '--max-duration',
+            type=float,
+            help='Stops after the batch that exceeds this number of seconds.',
+        )
+        batch_group.add_argument(
+            '--batch-delay',
+            type=float,
+            default=0,
+            help='Number of seconds to wait between batches (e.g. to limit replication lag).',
+        )
 
     def handle(self, *args, **options):
         """Main logic for the actual command."""
@@ -62,6 +95,17 @@ class BaseCleanupCommand(BaseCommand):
             self._print_queries(model, qs)
             return
 
+        if options['batch_size']:
+            self._delete_in_batches(
+                qs,
+                is_simulation,
+                batch_size=options['batch_size'],
+                resume_from_pk=options['resume_from_pk'],
+                max_duration=options['max_duration'],
+                batch_delay=options['batch_delay'],
+            )
+            return
+
         try:
             with ExitStack() as stack:
                 if not is_simulation:
@@ -80,6 +124,75 @@ class BaseCleanupCommand(BaseCommand):
         except SimulationRollbackError:
             logger.info('Deletions rolled back')
 
+    def _delete_in_batches(  # noqa: PLR0913
+        self,
+        qs,
+        is_simulation,
+        batch_size,
+        resume_from_pk,
+        max_duration,
+        batch_delay,
+    ):
+        """Deletes the records matched by qs in primary key order, a batch at a time.
+
+        Each batch is deleted in its own transaction (and removed from OpenSearch when that
+        transaction is committed), so that locks are only held on a batch of records at a time
+        and the command can be stopped and resumed using the last primary key logged.
+        """
+        model_verbose_name = qs.model._meta.verbose_name_plural
+        pk_qs = qs.order_by('pk').values_list('pk', flat=True)
+        deadline = monotonic() + max_duration if max_duration is not None else None
+        last_pk = resume_from_pk
+        deletions_by_model = Counter()
+
+        while True:
+            batch_pk_qs = pk_qs.filter(pk__gt=last_pk) if last_pk is not None else pk_qs
+            batch_pks = list(batch_pk_qs[:batch_size])
+            if not batch_pks:
+                break
+
+            try:
+                with ExitStack() as stack:
+                    if not is_simulation:
+                        stack.enter_context(update_opensearch_after_deletions())
+
+                    stack.enter_context(atomic())
+                    # The batch is re-filtered using qs so that records that have been referenced
+                    # since the primary keys were fetched are not deleted
+                    _, batch_deletions_by_model = qs.filter(pk__in=batch_pks).delete()
+                    deletions_by_model.update(batch_deletions_by_model)
+
+                    if is_simulation:
+                        raise SimulationRollbackError()
+            except SimulationRollbackError:
+                pass
+
+            last_pk = batch_pks[-1]
+            logger.info(
+                f'{deletions_by_model[qs.model._meta.label]} {model_verbose_name} '
+                f'{"deleted (simulated)" if is_simulation else "deleted"} so far '
+                f'(last primary key: {last_pk})',
+            )
+
+            if len(batch_pks) < batch_size:
+                break
+
+            if deadline is not None and monotonic() >= deadline:
+                logger.info(
+                    f'Time budget of {max_duration} seconds reached. Run the command with '
+                    f'--resume-from-pk={last_pk} to continue.',
+                )
+                break
+
+            sleep(batch_delay)
+
+        logger.info(f'{sum(deletions_by_model.values())} records deleted. Breakdown by model:')
+        for deletion_model, model_deletion_count in deletions_by_model.items():
+            logger.info(f'{deletion_model}: {model_deletion_count}')
+
+        if is_simulation:
+            logger.info('Deletions rolled back')
+
     def _print_queries(self, model, qs):
         # relationships that would get deleted in cascade
         for related in get_relations_to_delete(model):
@@ -92,6 +205,20 @@ class BaseCleanupCommand(BaseCommand):
         # main model
         _print_query(model, qs)
 
+        config = self.CONFIGS[model._meta.label]
+        unindexed_relations = get_relations_without_supporting_indexes(
+            model,
+            excluded_relations=config.excluded_relations,
+        )
+        if not unindexed_relations:
+            logger.info('All relations checked for references have a supporting index.')
+            return
+
+        logger.info('Relations checked for references without a supporting index:')
+        for relation in unindexed_relations:
+            related_field = relation.field
+            logger.info(f'{related_field.model._meta.label}.{related_field.name}')
+
     def _get_query(self, model):
         config = self.CONFIGS[model._meta.label]
         relation_filter_mapping = config.relation_filter_mapping or {}
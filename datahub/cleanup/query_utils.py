@@ -1,3 +1,4 @@
+from django.db import connection
 from django.db.models import Exists, OuterRef, Q
 from django.db.models.deletion import CASCADE, get_candidate_relations_to_delete
 
@@ -69,3 +70,38 @@ def get_relations_to_delete(model):
     """
     candidates = get_candidate_relations_to_delete(model._meta)
     return [field for field in candidates if field.field.remote_field.on_delete == CASCADE]
+
+
+def get_relations_without_supporting_indexes(model, excluded_relations=()):
+    """Returns the relations checked by get_unreferenced_objects_query() that don't have a
+    database index that can be used for the check.
+
+    Each check is a NOT EXISTS subquery on the column referencing `model`, so without an index
+    starting with that column, the whole referencing table is scanned for each object.
+
+    :param model: model class
+    :param excluded_relations: related fields on model that are not checked
+    :returns: list of related fields of `model` without a supporting index
+    """
+    fields = [field for field in get_related_fields(model) if field not in set(excluded_relations)]
+    unindexed_fields = []
+
+    with connection.cursor() as cursor:
+        for field in fields:
+            related_field = field.field
+            if related_field.many_to_many:
+                table = related_field.remote_field.through._meta.db_table
+                column = related_field.m2m_reverse_name()
+            else:
+                table = related_field.model._meta.db_table
+                column = related_field.column
+
+            constraints = connection.introspection.get_constraints(cursor, table)
+            if not any(
+                constraint['columns'] and constraint['columns'][0] == column
+                for constraint in constraints.values()
+                if constraint['index'] or constraint['unique'] or constraint['primary_key']
+            ):
+                unindexed_fields.append(field)
+
+    return unindexed_fields
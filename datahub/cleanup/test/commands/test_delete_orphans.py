@@ -408,3 +408,103 @@ def test_with_opensearch_exception(mocked_bulk):
 
     model = apps.get_model(model_name)
     assert model.objects.count() == 0
+
+
+@pytest.mark.usefixtures('synchronous_on_commit')
+@pytest.mark.django_db
+class TestBatchedRun:
+    """Tests for running the command with --batch-size."""
+
+    model_name = 'company.Contact'
+
+    @pytest.fixture(autouse=True)
+    def mocked_bulk(self):
+        """Mocks the OpenSearch bulk deletion of records."""
+        with mock.patch('datahub.search.deletion.bulk', return_value=(None, [])) as mocked_bulk:
+            yield mocked_bulk
+
+    def _create_orphans(self, num_orphans):
+        filter_config = delete_orphans.Command.CONFIGS[self.model_name].filters[0]
+        datetime_older_than_threshold = filter_config.cut_off_date - relativedelta(days=1)
+        # this orphan should NOT get deleted because not old enough
+        create_orphanable_model(ContactFactory, filter_config, FROZEN_TIME)
+        orphans = [
+            create_orphanable_model(ContactFactory, filter_config, datetime_older_than_threshold)
+            for _ in range(num_orphans)
+        ]
+        return sorted(orphans, key=lambda orphan: orphan.pk)
+
+    @freeze_time(FROZEN_TIME)
+    def test_deletes_in_batches(self, mocked_bulk, track_return_values, caplog):
+        """Test that records are deleted a batch at a time in primary key order, with the
+        OpenSearch deletions and a delay after each batch.
+        """
+        caplog.set_level('INFO')
+        delete_return_value_tracker = track_return_values(QuerySet, 'delete')
+        orphans = self._create_orphans(5)
+
+        with mock.patch(
+            'datahub.cleanup.management.commands._base_command.sleep',
+        ) as mocked_sleep:
+            management.call_command(
+                delete_orphans.Command(),
+                self.model_name,
+                batch_size=2,
+                batch_delay=0.5,
+            )
+
+        model = apps.get_model(self.model_name)
+        assert model.objects.count() == 1
+        assert [
+            deletions_by_model[self.model_name]
+            for _, deletions_by_model in delete_return_value_tracker.return_values
+        ] == [2, 2, 1]
+        assert mocked_bulk.call_count == 3
+        assert mocked_sleep.call_args_list == [mock.call(0.5)] * 2
+        assert f'5 contacts deleted so far (last primary key: {orphans[-1].pk})' in caplog.text
+
+    @freeze_time(FROZEN_TIME)
+    def test_stops_at_max_duration_and_resumes(self, caplog):
+        """Test that the command stops once the time budget is exceeded, and can be resumed from
+        the last primary key deleted.
+        """
+        caplog.set_level('INFO')
+        orphans = self._create_orphans(3)
+        model = apps.get_model(self.model_name)
+
+        management.call_command(
+            delete_orphans.Command(),
+            self.model_name,
+            batch_size=2,
+            max_duration=0,
+        )
+
+        assert model.objects.filter(pk=orphans[2].pk).exists()
+        assert model.objects.count() == 2
+        assert f'--resume-from-pk={orphans[1].pk}' in caplog.text
+
+        management.call_command(
+            delete_orphans.Command(),
+            self.model_name,
+            batch_size=2,
+            resume_from_pk=str(orphans[1].pk),
+        )
+
+        assert model.objects.count() == 1
+
+    @freeze_time(FROZEN_TIME)
+    def test_simulate(self, mocked_bulk, caplog):
+        """Test that batched deletions are rolled back if --simulate is passed in."""
+        caplog.set_level('INFO')
+        self._create_orphans(3)
+
+        management.call_command(
+            delete_orphans.Command(),
+            self.model_name,
+            batch_size=2,
+            simulate=True,
+        )
+
+        assert apps.get_model(self.model_name).objects.count() == 4
+        assert not mocked_bulk.called
+        assert '3 contacts deleted (simulated) so far' in caplog.text
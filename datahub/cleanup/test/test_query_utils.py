@@ -1,9 +1,14 @@
 from unittest.mock import Mock
 
 import pytest
+from django.db import connection
 from django.db.models import Q
 
-from datahub.cleanup.query_utils import get_unreferenced_objects_query
+from datahub.cleanup.query_utils import (
+    get_relations_without_supporting_indexes,
+    get_unreferenced_objects_query,
+)
+from datahub.core.model_helpers import get_related_fields
 from datahub.core.test.support.factories import BookFactory, PersonFactory
 from datahub.core.test.support.models import Person
 
@@ -44,3 +49,25 @@ class TestGetUnreferencedObjectsQuery:
         BookFactory()
         queryset = get_unreferenced_objects_query(Person)
         assert list(queryset) == [unreferenced_person]
+
+
+@pytest.mark.django_db
+class TestGetRelationsWithoutSupportingIndexes:
+    """Tests get_relations_without_supporting_indexes()."""
+
+    def test_returns_no_relations_if_all_are_indexed(self):
+        """Test that no relations are returned if all referencing columns are indexed."""
+        assert get_relations_without_supporting_indexes(Person) == []
+
+    def test_returns_unindexed_relations(self, monkeypatch):
+        """Test that relations are returned if their referencing columns aren't indexed."""
+        monkeypatch.setattr(connection.introspection, 'get_constraints', lambda *args: {})
+        excluded_relation = Person._meta.get_field('proofread_books')
+
+        relations = get_relations_without_supporting_indexes(
+            Person,
+            excluded_relations=(excluded_relation,),
+        )
+
+        assert relations
+        assert set(relations) == set(get_related_fields(Person)) - {excluded_relation}
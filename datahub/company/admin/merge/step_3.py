@@ -18,15 +18,10 @@ from datahub.company.merge import (
 from datahub.company.merge_company import (
     MERGE_CONFIGURATION as COMPANY_MERGE_CONFIGURATION,
 )
-from datahub.company.merge_company import (
-    merge_companies,
-)
 from datahub.company.merge_contact import (
     MERGE_CONFIGURATION as CONTACT_MERGE_CONFIGURATION,
 )
-from datahub.company.merge_contact import (
-    merge_contacts,
-)
+from datahub.company.tasks.merge import schedule_merge_companies, schedule_merge_contacts
 from datahub.core.templatetags.datahub_extras import verbose_name_for_count
 
 COMPANY_REVERSION_REVISION_COMMENT = """
@@ -41,9 +36,9 @@ MERGE_ENTRY_MSG_FRAGMENT = gettext_lazy(
     '{0} {1}{2}',
 )
 MERGE_SUCCESS_MSG = gettext_lazy(
-    'Merge complete – {merge_entries} moved from'
+    'Merge scheduled – {merge_entries} will be moved from'
     ' <a href="{source_url}" target="_blank">{source}</a> to'
-    ' <a href="{target_url}" target="_blank">{target}</a>.',
+    ' <a href="{target_url}" target="_blank">{target}</a> in the background.',
 )
 MERGE_FAILURE_MSG = gettext_lazy(
     'Merging failed – merging {source} into {target} is not allowed.',
@@ -52,7 +47,7 @@ MERGE_FAILURE_MSG = gettext_lazy(
 
 def confirm_merge_contacts(model_admin, request):
     dict = {
-        'merge_fn': merge_contacts,
+        'merge_fn': schedule_merge_contacts,
         'template_name': 'admin/company/contact/merge/step_3_confirm_selection.html',
         'reversion_revision_comment': CONTACT_REVERSION_REVISION_COMMENT,
         'merge_configuration': CONTACT_MERGE_CONFIGURATION,
@@ -62,7 +57,7 @@ def confirm_merge_contacts(model_admin, request):
 
 def confirm_merge_companies(model_admin, request):
     dict = {
-        'merge_fn': merge_companies,
+        'merge_fn': schedule_merge_companies,
         'template_name': 'admin/company/company/merge/step_3_confirm_selection.html',
         'reversion_revision_comment': COMPANY_REVERSION_REVISION_COMMENT,
         'merge_configuration': COMPANY_MERGE_CONFIGURATION,
@@ -119,9 +114,14 @@ def confirm_merge(model_admin, request, dict):
 
 
 def _perform_merge(request, source, target, model_admin, dict):
+    """Schedules the merge to be performed in the background.
+
+    The related records that will be moved are counted up front for the success message.
+    """
+    merge_results, _ = get_planned_changes(source, dict['merge_configuration'])
     try:
         merge_fn = dict['merge_fn']
-        merge_results = merge_fn(source, target, request.user)
+        merge_fn(source, target, request.user)
     except MergeNotAllowedError:
         failure_msg = MERGE_FAILURE_MSG.format(
             source=source,
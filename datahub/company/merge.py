@@ -1,12 +1,18 @@
 import logging
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from typing import Callable, NamedTuple, Sequence, Type, Union
 
-from django.db import models
+import reversion
+from django.db import models, transaction
+from django.utils.timezone import now
 
 from datahub.company.models import Company, Contact
 from datahub.core.exceptions import DataHubError
 from datahub.core.model_helpers import get_related_fields, get_self_referential_relations
+from datahub.core.utils import slice_iterable_into_chunks
+from datahub.search.apps import get_search_apps
+from datahub.search.sync_object import sync_objects_async
+from datahub.search.utils import db_model_has_field
 
 FIELD_TO_DESCRIPTION_MAPPING = {
     'companies': ' as one of participating companies',
@@ -17,6 +23,9 @@ FIELD_TO_DESCRIPTION_MAPPING = {
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of objects moved using a single set of UPDATE statements
+MERGE_BATCH_SIZE = 1000
+
 MergeEntrySummary = namedtuple(
     'MergeEntrySummary',
     [
@@ -27,23 +36,45 @@ MergeEntrySummary = namedtuple(
 )
 
 
-def _default_object_updater(obj, field, target, source):
-    item = getattr(obj, field)
-    # if the field is m2m, replace the source with a target
-    if isinstance(item, models.Manager):
-        item.remove(source)
-        item.add(target)
+def _default_object_updater(model, field, object_ids, source, target):
+    """Moves the given objects from the source to the target using set-based queries.
+
+    For foreign keys, the objects are updated using a single UPDATE (which also sets
+    modified_on, if the model has it). For many-to-many fields, the rows in the through table
+    are updated instead (and rows that would become duplicates are deleted).
+    """
+    model_field = model._meta.get_field(field)
+    if model_field.many_to_many:
+        _move_many_to_many_relations(model_field, object_ids, source, target)
         return
 
-    setattr(obj, field, target)
+    update_kwargs = {field: target}
+    # Not all models have modified_on field.
+    if db_model_has_field(model, 'modified_on'):
+        update_kwargs['modified_on'] = now()
 
-    update_fields = (field,)
+    model.objects.filter(pk__in=object_ids).update(**update_kwargs)
 
-    # Not all models have modified_on field.
-    if hasattr(obj, 'modified_on'):
-        update_fields = (field, 'modified_on')
 
-    obj.save(update_fields=update_fields)
+def _move_many_to_many_relations(model_field, object_ids, source, target):
+    through_model = model_field.remote_field.through
+    object_field_name = model_field.m2m_field_name()
+    related_field_name = model_field.m2m_reverse_field_name()
+
+    source_relations = through_model.objects.filter(
+        **{
+            f'{object_field_name}__in': object_ids,
+            related_field_name: source,
+        },
+    )
+    objects_already_related_to_target = through_model.objects.filter(
+        **{related_field_name: target},
+    ).values(object_field_name)
+
+    source_relations.filter(
+        **{f'{object_field_name}__in': objects_already_related_to_target},
+    ).delete()
+    source_relations.update(**{related_field_name: target})
 
 
 class MergeConfiguration(NamedTuple):
@@ -52,15 +83,22 @@ class MergeConfiguration(NamedTuple):
     :param model: The model related to the `source_model` model. i.e. `Interaction`.
     :param fields: The field/s in the given `model` which relates to the company.
     :param source_model: The model to merge into.
-    :param object_updater: A function to update the related field/s. If the default function is
+    :param object_updater: A function to move a batch of objects (given as a list of primary
+        keys) from the source to the target using set-based queries. If the default function is
         not suitable you can pass your own. For example if you need have unique constraints you
         need to handle.
+    :param revision_select_related: Related objects (other than those in `fields`) to fetch
+        when recording versions of the moved objects, such as those used in `__str__()`.
     """
 
     model: Type[models.Model]
     fields: Sequence[str]
     source_model: Type[models.Model]
-    object_updater: Callable[[models.Model, str, models.Model], None] = _default_object_updater
+    object_updater: Callable[
+        [Type[models.Model], str, Sequence, models.Model, models.Model],
+        None,
+    ] = _default_object_updater
+    revision_select_related: Sequence[str] = ()
 
 
 class MergeNotAllowedError(DataHubError):
@@ -152,16 +190,120 @@ def is_model_a_valid_merge_target(model: Union[Contact, Company]):
     return not model.archived
 
 
-def update_objects(configuration: MergeConfiguration, source, target):
-    """Update fields of objects from given model with the target value."""
-    logger.info(f'Updating from {configuration.model.__name__} to source contact {source.id}.')
+def update_objects(
+    configuration: MergeConfiguration,
+    source,
+    target,
+    batch_size=None,
+    progress_callback=None,
+):
+    """Move objects of the given model from the source to the target in batches.
+
+    Each batch is moved using set-based queries, and the moved objects are added to the
+    active revision (if there is one).
+
+    :param progress_callback: optional function called with the number of objects moved
+        after each batch
+    :returns: the number of objects moved per field, and the primary keys of the objects
+        that were moved (and still exist)
+    """
+    logger.info(f'Updating from {configuration.model.__name__} to source {source.id}.')
+    model = configuration.model
+    batch_size = batch_size or MERGE_BATCH_SIZE
     objects_updated = {field: 0 for field in configuration.fields}
+    updated_object_ids = set()
 
     for field, filtered_objects in _get_objects_from_configuration(configuration, source):
-        for obj in filtered_objects.iterator():
+        object_ids = list(filtered_objects.order_by('pk').values_list('pk', flat=True))
+
+        for batch in slice_iterable_into_chunks(object_ids, batch_size):
             try:
-                configuration.object_updater(obj, field, target, source)
-                objects_updated[field] += 1
+                configuration.object_updater(model, field, batch, source, target)
             except Exception as e:
-                logger.exception(f'Failed {configuration.model.__name__} object {obj.pk}: {e}')
-    return objects_updated
+                logger.exception(f'Failed to update {model.__name__} objects: {e}')
+                raise
+
+            moved_object_ids = _add_objects_to_revision(configuration, batch)
+            updated_object_ids.update(moved_object_ids)
+            objects_updated[field] += len(batch)
+
+            if progress_callback:
+                progress_callback(len(batch))
+
+    return objects_updated, updated_object_ids
+
+
+def merge_objects(merge_configuration, source, target, progress_callback=None):
+    """Move all objects related to the source to the target, as specified by a merge
+    configuration.
+
+    As the objects are updated using set-based queries, model save() methods and signal
+    receivers are not called. Instead, the moved objects are recorded in the active revision,
+    and are synced to OpenSearch using one batched task per search app once the transaction
+    has been committed.
+
+    :param progress_callback: optional function called with the number of objects moved so
+        far and the total number of objects to move after each batch
+    :returns: the number of objects moved per model and field
+    """
+    batch_progress_callback = None
+    if progress_callback:
+        planned_changes, _ = get_planned_changes(source, merge_configuration)
+        total = sum(sum(fields.values()) for fields in planned_changes.values())
+        num_processed = 0
+
+        def batch_progress_callback(batch_size):
+            nonlocal num_processed
+            num_processed += batch_size
+            progress_callback(num_processed, total)
+
+    results = {}
+    updated_object_ids_by_model = defaultdict(set)
+    for configuration in merge_configuration:
+        objects_updated, updated_object_ids = update_objects(
+            configuration,
+            source,
+            target,
+            progress_callback=batch_progress_callback,
+        )
+        results[configuration.model] = objects_updated
+        updated_object_ids_by_model[configuration.model].update(updated_object_ids)
+
+    transaction.on_commit(
+        lambda: _sync_objects_to_search(updated_object_ids_by_model),
+    )
+    return results
+
+
+def _add_objects_to_revision(configuration: MergeConfiguration, object_ids):
+    """Add objects to the active revision.
+
+    Related objects used when serialising the objects are fetched up front so that the
+    number of queries doesn't depend on the number of objects.
+
+    :returns: the primary keys of the objects that still exist
+    """
+    model = configuration.model
+    objects = model.objects.filter(pk__in=object_ids)
+    if not (reversion.is_active() and reversion.is_registered(model)):
+        return set(objects.values_list('pk', flat=True))
+
+    foreign_key_fields = [
+        field for field in configuration.fields if not model._meta.get_field(field).many_to_many
+    ]
+    objects = objects.select_related(
+        *foreign_key_fields,
+        *configuration.revision_select_related,
+    ).prefetch_related(*(field.name for field in model._meta.many_to_many))
+    existing_object_ids = set()
+    for obj in objects:
+        reversion.add_to_revision(obj)
+        existing_object_ids.add(obj.pk)
+    return existing_object_ids
+
+
+def _sync_objects_to_search(object_ids_by_model):
+    for search_app in get_search_apps():
+        object_ids = object_ids_by_model.get(search_app.queryset.model)
+        if object_ids:
+            sync_objects_async(search_app, object_ids)
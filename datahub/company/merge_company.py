@@ -8,7 +8,7 @@ from datahub.company.merge import (
     get_planned_changes,
     is_model_a_valid_merge_source,
     is_model_a_valid_merge_target,
-    update_objects,
+    merge_objects,
 )
 from datahub.company.merge_utils.merge_relations import (
     company_list_item_updater,
@@ -130,7 +130,13 @@ MERGE_CONFIGURATION = [
     MergeConfiguration(StovaAttendee, ('company',), Company),
     MergeConfiguration(KingsAwardRecipient, ('company',), Company),
     MergeConfiguration(Task, ('company',), Company),
-    MergeConfiguration(CompanyListItem, ('company',), Company, company_list_item_updater),
+    MergeConfiguration(
+        CompanyListItem,
+        ('company',),
+        Company,
+        company_list_item_updater,
+        ('list__adviser',),
+    ),
     MergeConfiguration(PipelineItem, ('company',), Company, pipeline_item_updater),
     MergeConfiguration(Objective, ('company',), Company),
     MergeConfiguration(
@@ -142,8 +148,9 @@ MERGE_CONFIGURATION = [
 ]
 
 
-def merge_companies(source_company: Company, target_company: Company, user):
-    """Merges the source company into the target company.
+def validate_company_merge(source_company: Company, target_company: Company):
+    """Checks that the source company can be merged into the target company.
+
     MergeNotAllowedError will be raised if the merge is not allowed.
     """
     is_source_valid, invalid_obj = is_model_a_valid_merge_source(
@@ -161,8 +168,27 @@ def merge_companies(source_company: Company, target_company: Company, user):
         )
         raise MergeNotAllowedError()
 
+
+def merge_companies(
+    source_company: Company,
+    target_company: Company,
+    user,
+    progress_callback=None,
+):
+    """Merges the source company into the target company.
+    MergeNotAllowedError will be raised if the merge is not allowed.
+
+    Related objects are moved using set-based queries (see merge_objects()).
+
+    :param progress_callback: optional function called with the number of objects moved so
+        far and the total number of objects to move
+    """
+    validate_company_merge(source_company, target_company)
+
     with reversion.create_revision():
         reversion.set_comment('Company merged')
+        if user:
+            reversion.set_user(user)
         try:
             target_changes, _ = get_planned_changes(target_company, MERGE_CONFIGURATION)
             source_changes, _ = get_planned_changes(source_company, MERGE_CONFIGURATION)
@@ -174,23 +200,16 @@ def merge_companies(source_company: Company, target_company: Company, user):
                 f'Source company with id: {source_company.id} relations before merge: \n'
                 f'{source_changes}',
             )
-            results = {
-                configuration.model: update_objects(configuration, source_company, target_company)
-                for configuration in MERGE_CONFIGURATION
-            }
+            results = merge_objects(
+                MERGE_CONFIGURATION,
+                source_company,
+                target_company,
+                progress_callback=progress_callback,
+            )
         except Exception as e:
             logger.exception(f'An error occurred while merging companies: {e}')
             raise
 
-        # As CompanyActivities are saved when an Interaction or Referral
-        # automatically saved add them to the updated count.
-        results[CompanyActivity] = {
-            'company': results[Interaction]['company']
-            + results[InvestmentProject]['investor_company']
-            + results[CompanyReferral]['company']
-            + results[Order]['company'],
-        }
-
         source_company.mark_as_transferred(
             target_company,
             Company.TransferReason.DUPLICATE,
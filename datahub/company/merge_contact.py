@@ -7,7 +7,7 @@ from datahub.company.merge import (
     MergeNotAllowedError,
     is_model_a_valid_merge_source,
     is_model_a_valid_merge_target,
-    update_objects,
+    merge_objects,
 )
 from datahub.company.models import CompanyExport, Contact
 from datahub.company_referral.models import CompanyReferral
@@ -42,8 +42,8 @@ MERGE_CONFIGURATION = [
 ]
 
 
-def merge_contacts(source_contact: Contact, target_contact: Contact, user):
-    """Merges the source contact into the target contact.
+def validate_contact_merge(source_contact: Contact, target_contact: Contact):
+    """Checks that the source contact can be merged into the target contact.
 
     MergeNotAllowedError will be raised if the merge is not allowed.
     """
@@ -62,15 +62,32 @@ def merge_contacts(source_contact: Contact, target_contact: Contact, user):
         )
         raise MergeNotAllowedError()
 
+
+def merge_contacts(source_contact: Contact, target_contact: Contact, user, progress_callback=None):
+    """Merges the source contact into the target contact.
+
+    MergeNotAllowedError will be raised if the merge is not allowed.
+
+    Related objects are moved using set-based queries (see merge_objects()).
+
+    :param progress_callback: optional function called with the number of objects moved so
+        far and the total number of objects to move
+    """
+    validate_contact_merge(source_contact, target_contact)
+
     with reversion.create_revision():
         reversion.set_comment('contact merged')
+        if user:
+            reversion.set_user(user)
         try:
-            results = {
-                configuration.model: update_objects(configuration, source_contact, target_contact)
-                for configuration in MERGE_CONFIGURATION
-            }
+            results = merge_objects(
+                MERGE_CONFIGURATION,
+                source_contact,
+                target_contact,
+                progress_callback=progress_callback,
+            )
         except Exception as e:
-            logger.exception(f'An error occurred while merging companies: {e}')
+            logger.exception(f'An error occurred while merging contacts: {e}')
             raise
 
         target_contact.merge_contact_fields(source_contact)
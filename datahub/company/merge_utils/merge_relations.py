@@ -9,45 +9,59 @@ from datahub.investment.opportunity.models import LargeCapitalOpportunity
 from datahub.user.company_list.models import CompanyListItem, PipelineItem
 
 
-def company_list_item_updater(list_item, field, target_company, source_company):
+def company_list_item_updater(model, field, object_ids, source_company, target_company):
     # If there is already a list item for the target company, delete this list item instead
     # as duplicates are not allowed
-    if CompanyListItem.objects.filter(list_id=list_item.list_id, company=target_company).exists():
-        list_item.delete()
-    else:
-        _default_object_updater(list_item, field, target_company, source_company)
+    CompanyListItem.objects.filter(
+        pk__in=object_ids,
+        list_id__in=CompanyListItem.objects.filter(company=target_company).values('list_id'),
+    ).delete()
+    _default_object_updater(model, field, object_ids, source_company, target_company)
 
 
-def one_list_core_team_member_updater(one_list_item, field, target_company, source_company):
+def one_list_core_team_member_updater(model, field, object_ids, source_company, target_company):
     """The OneListCoreTeamMember model has a unique together contraint for company and adviser.
 
     Before copying, if the target company already contains the adviser from the source company,
     ignore it.
     """
-    if OneListCoreTeamMember.objects.filter(
-        adviser_id=one_list_item.adviser_id,
-        company=target_company,
-    ).exists():
-        return
-    else:
-        _default_object_updater(one_list_item, field, target_company, source_company)
+    object_ids_to_move = OneListCoreTeamMember.objects.filter(
+        pk__in=object_ids,
+    ).exclude(
+        adviser_id__in=OneListCoreTeamMember.objects.filter(
+            company=target_company,
+        ).values('adviser_id'),
+    )
+    _default_object_updater(
+        model,
+        field,
+        list(object_ids_to_move.values_list('pk', flat=True)),
+        source_company,
+        target_company,
+    )
 
 
-def large_capital_opportunity_updater(large_capital_opp, field, target_company, source_company):
+def large_capital_opportunity_updater(model, field, object_ids, source_company, target_company):
     """If the LargeCapitalOpportunity already exists in the target, ignore it. Otherwise add it."""
-    if LargeCapitalOpportunity.objects.filter(
-        id=large_capital_opp.id,
+    object_ids_to_move = LargeCapitalOpportunity.objects.filter(
+        pk__in=object_ids,
+    ).exclude(
         promoters__id=target_company.id,
-    ).exists():
-        return
-    else:
-        _default_object_updater(large_capital_opp, field, target_company, source_company)
+    )
+    _default_object_updater(
+        model,
+        field,
+        list(object_ids_to_move.values_list('pk', flat=True)),
+        source_company,
+        target_company,
+    )
 
 
-def pipeline_item_updater(pipeline_item, field, target_company, source_company):
+def pipeline_item_updater(model, field, object_ids, source_company, target_company):
     # If there is already a pipeline item for the adviser for the target company
     # delete this item instead as the same company can't be added for the same adviser again
-    if PipelineItem.objects.filter(adviser=pipeline_item.adviser, company=target_company).exists():
-        pipeline_item.delete()
-    else:
-        _default_object_updater(pipeline_item, field, target_company, source_company)
+    PipelineItem.objects.filter(
+        pk__in=object_ids,
+        adviser_id__in=PipelineItem.objects.filter(company=target_company).values('adviser_id'),
+    ).delete()
+    _default_object_updater(model, field, object_ids, source_company, target_company)
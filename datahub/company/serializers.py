@@ -412,7 +412,17 @@ class CompanySerializer(PermittedFieldsModelSerializer):
         super().__init__(*args, **kwargs)
         if self.instance and not isinstance(self.instance, list) and self.instance.duns_number:
             for field in self.Meta.dnb_read_only_fields:
-                self.fields[field].read_only = True
+                if field in self.fields:
+                    self.fields[field].read_only = True
+
+    def get_fields(self):
+        """Gets the fields, limited to the requested fields if the view specifies them."""
+        fields = super().get_fields()
+        requested_fields = self.context.get('requested_fields')
+        if requested_fields is None:
+            return fields
+
+        return {name: field for name, field in fields.items() if name in requested_fields}
 
     def validate(self, data):
         """Performs cross-field validation and adds extra fields to data."""
@@ -1,7 +1,9 @@
 import logging
 
+import reversion
 from dateutil.relativedelta import relativedelta
-from django.db.models import FilteredRelation, OuterRef, Q, Subquery
+from django.db import transaction
+from django.db.models import Exists, FilteredRelation, OuterRef, Q, Subquery
 from django.utils import timezone
 from django_pglocks import advisory_lock
 
@@ -11,14 +13,20 @@ from datahub.core.queues.constants import HALF_DAY_IN_SECONDS
 from datahub.core.queues.job_scheduler import job_scheduler
 from datahub.core.queues.scheduler import LONG_RUNNING_QUEUE
 from datahub.core.realtime_messaging import send_realtime_message
+from datahub.core.utils import slice_iterable_into_chunks
 from datahub.feature_flag.utils import is_feature_flag_active
 from datahub.interaction.models import Interaction
 from datahub.investment.project.models import InvestmentProject
+from datahub.search.company import CompanySearchApp
+from datahub.search.sync_object import sync_objects_async
 
 logger = logging.getLogger(__name__)
 
+# Number of companies archived using a single UPDATE statement and revision
+ARCHIVE_CHUNK_SIZE = 1000
 
-def _automatic_company_archive(limit, simulate):
+
+def _get_companies_to_be_archived():
     _5y_ago = timezone.now() - relativedelta(years=5)
     _3m_ago = timezone.now() - relativedelta(months=3)
 
@@ -26,53 +34,77 @@ def _automatic_company_archive(limit, simulate):
         company=OuterRef('pk'),
     ).order_by('-date')
 
-    candidate_companies_to_be_archived = list(
-        Company.objects.annotate(
-            latest_interaction_date=Subquery(
-                latest_interaction.values('date')[:1],
-            ),
-            active_investment_projects=FilteredRelation(
-                'investor_investment_projects',
-                condition=Q(investor_investment_projects__status=InvestmentProject.Status.ONGOING),
-            ),
-        ).filter(
-            Q(latest_interaction_date__date__lt=_5y_ago) | Q(latest_interaction_date__isnull=True),
-            archived=False,
-            orders__isnull=True,
-            investor_profiles__isnull=True,
-            active_investment_projects__isnull=True,
-            created_on__lt=_3m_ago,
-            modified_on__lt=_3m_ago,
+    candidate_companies_to_be_archived = Company.objects.annotate(
+        latest_interaction_date=Subquery(
+            latest_interaction.values('date')[:1],
         ),
+        active_investment_projects=FilteredRelation(
+            'investor_investment_projects',
+            condition=Q(investor_investment_projects__status=InvestmentProject.Status.ONGOING),
+        ),
+    ).filter(
+        Q(latest_interaction_date__date__lt=_5y_ago) | Q(latest_interaction_date__isnull=True),
+        archived=False,
+        orders__isnull=True,
+        investor_profiles__isnull=True,
+        active_investment_projects__isnull=True,
+        created_on__lt=_3m_ago,
+        modified_on__lt=_3m_ago,
     )
 
-    companies_to_be_archived = [
-        company
-        for company in candidate_companies_to_be_archived
-        if not any(
-            not (related_company.archived or related_company in candidate_companies_to_be_archived)
-            for related_company in company.related_companies
+    # A company can only be archived if all companies sharing its global ultimate
+    # duns number are either already archived or are also candidates to be archived
+    active_related_companies = (
+        Company.objects.filter(
+            global_ultimate_duns_number=OuterRef('global_ultimate_duns_number'),
+            archived=False,
         )
-    ][:limit]
+        .exclude(global_ultimate_duns_number='')
+        .exclude(pk__in=candidate_companies_to_be_archived.values('pk'))
+    )
+
+    return candidate_companies_to_be_archived.filter(
+        ~Exists(active_related_companies),
+    ).order_by('pk')
 
-    for company in companies_to_be_archived:
-        message = f'Automatically archived company: {company.id}'
+
+def _automatic_company_archive(limit, simulate):
+    company_ids = list(
+        _get_companies_to_be_archived().values_list('pk', flat=True)[:limit],
+    )
+
+    for chunk in slice_iterable_into_chunks(company_ids, ARCHIVE_CHUNK_SIZE):
         if simulate:
-            logger.info(f'[SIMULATION] {message}')
+            for company_id in chunk:
+                logger.info(f'[SIMULATION] Automatically archived company: {company_id}')
             continue
-        company.archived = True
-        company.archived_reason = 'This record was automatically archived due to inactivity'
-        company.archived_on = timezone.now()
-        company.save(
-            update_fields=[
-                'archived',
-                'archived_reason',
-                'archived_on',
-            ],
+
+        _archive_companies(chunk)
+        for company_id in chunk:
+            logger.info(f'Automatically archived company: {company_id}')
+
+    return len(company_ids)
+
+
+def _archive_companies(company_ids):
+    """Archives a chunk of companies using a single UPDATE.
+
+    A revision is recorded for the archived companies, and they're synced to OpenSearch in
+    a single batch once the transaction has been committed.
+    """
+    with transaction.atomic(), reversion.create_revision():
+        Company.objects.filter(pk__in=company_ids).update(
+            archived=True,
+            archived_reason='This record was automatically archived due to inactivity',
+            archived_on=timezone.now(),
         )
-        logger.info(message)
+        for company in Company.objects.filter(pk__in=company_ids):
+            reversion.add_to_revision(company)
+        reversion.set_comment('Automated company archive.')
 
-    return len(companies_to_be_archived)
+        transaction.on_commit(
+            lambda: sync_objects_async(CompanySearchApp, company_ids),
+        )
 
 
 def schedule_automatic_company_archive(limit=1000, simulate=True):
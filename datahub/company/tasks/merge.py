@@ -0,0 +1,118 @@
+import logging
+
+from django_pglocks import advisory_lock
+from rq import get_current_job
+
+from datahub.company.merge import MergeNotAllowedError
+from datahub.company.merge_company import merge_companies, validate_company_merge
+from datahub.company.merge_contact import merge_contacts, validate_contact_merge
+from datahub.company.models import Advisor, Company, Contact
+from datahub.core.queues.constants import ONE_HOUR_IN_SECONDS
+from datahub.core.queues.job_scheduler import job_scheduler
+from datahub.core.queues.scheduler import LONG_RUNNING_QUEUE
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_merge_companies(source_company, target_company, user):
+    """Checks that the merge is allowed and schedules merge_companies_task with RQ.
+
+    MergeNotAllowedError will be raised if the merge is not allowed.
+    """
+    validate_company_merge(source_company, target_company)
+
+    job = job_scheduler(
+        function=merge_companies_task,
+        function_args=(
+            str(source_company.pk),
+            str(target_company.pk),
+            str(user.pk) if user else None,
+        ),
+        max_retries=3,
+        queue_name=LONG_RUNNING_QUEUE,
+        job_timeout=ONE_HOUR_IN_SECONDS,
+    )
+    logger.info(
+        f'Task {job.id} merge_companies_task scheduled to merge company {source_company.pk} '
+        f'into company {target_company.pk}',
+    )
+    return job
+
+
+def merge_companies_task(source_company_id, target_company_id, user_id):
+    """Merges the source company into the target company.
+
+    Progress is recorded in the meta of the RQ job.
+    """
+    lock_name = f'merge_companies_{source_company_id}'
+    with advisory_lock(lock_name, wait=False) as acquired:
+        if not acquired:
+            logger.info(f'Company {source_company_id} is already being merged.')
+            return
+
+        source_company = Company.objects.get(pk=source_company_id)
+        target_company = Company.objects.get(pk=target_company_id)
+        user = Advisor.objects.get(pk=user_id) if user_id else None
+
+        _run_merge(merge_companies, source_company, target_company, user)
+
+
+def schedule_merge_contacts(source_contact, target_contact, user):
+    """Checks that the merge is allowed and schedules merge_contacts_task with RQ.
+
+    MergeNotAllowedError will be raised if the merge is not allowed.
+    """
+    validate_contact_merge(source_contact, target_contact)
+
+    job = job_scheduler(
+        function=merge_contacts_task,
+        function_args=(
+            str(source_contact.pk),
+            str(target_contact.pk),
+            str(user.pk) if user else None,
+        ),
+        max_retries=3,
+        queue_name=LONG_RUNNING_QUEUE,
+        job_timeout=ONE_HOUR_IN_SECONDS,
+    )
+    logger.info(
+        f'Task {job.id} merge_contacts_task scheduled to merge contact {source_contact.pk} '
+        f'into contact {target_contact.pk}',
+    )
+    return job
+
+
+def merge_contacts_task(source_contact_id, target_contact_id, user_id):
+    """Merges the source contact into the target contact.
+
+    Progress is recorded in the meta of the RQ job.
+    """
+    lock_name = f'merge_contacts_{source_contact_id}'
+    with advisory_lock(lock_name, wait=False) as acquired:
+        if not acquired:
+            logger.info(f'Contact {source_contact_id} is already being merged.')
+            return
+
+        source_contact = Contact.objects.get(pk=source_contact_id)
+        target_contact = Contact.objects.get(pk=target_contact_id)
+        user = Advisor.objects.get(pk=user_id) if user_id else None
+
+        _run_merge(merge_contacts, source_contact, target_contact, user)
+
+
+def _run_merge(merge_fn, source, target, user):
+    job = get_current_job()
+
+    def record_progress(num_processed, total):
+        logger.info(f'Merging {source.pk} into {target.pk}: {num_processed}/{total} objects moved')
+        if job is not None:
+            job.meta['progress'] = {'processed': num_processed, 'total': total}
+            job.save_meta()
+
+    try:
+        merge_fn(source, target, user, progress_callback=record_progress)
+    except MergeNotAllowedError:
+        # The records have changed since the merge was scheduled, so retrying won't help
+        if job is not None:
+            job.retries_left = 0
+        raise
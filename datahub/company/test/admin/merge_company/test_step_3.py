@@ -205,12 +205,12 @@ class TestConfirmMergeViewPost(AdminTestMixin):
         merge_entries = ', '.join(merge_entries)
 
         match = re.match(
-            r'^Merge complete – (?P<merge_entries>.*)'
-            r' moved from'
+            r'^Merge scheduled – (?P<merge_entries>.*)'
+            r' will be moved from'
             r' <a href="(?P<source_company_url>.*)" target="_blank">(?P<source_company>.*)</a>'
             r' to'
             r' <a href="(?P<target_company_url>.*)" target="_blank">(?P<target_company>.*)</a>'
-            r'\.$',
+            r' in the background\.$',
             messages[0].message,
         )
         assert match
@@ -155,12 +155,12 @@ class TestConfirmMergeViewPost(AdminTestMixin):
         merge_entries = ', '.join(merge_entries)
 
         match = re.match(
-            r'^Merge complete – (?P<merge_entries>.*)'
-            r' moved from'
+            r'^Merge scheduled – (?P<merge_entries>.*)'
+            r' will be moved from'
             r' <a href="(?P<source_contact_url>.*)" target="_blank">(?P<source_contact>.*)</a>'
             r' to'
             r' <a href="(?P<target_contact_url>.*)" target="_blank">(?P<target_contact>.*)</a>'
-            r'\.$',
+            r' in the background\.$',
             messages[0].message,
         )
 
@@ -3,12 +3,18 @@ from unittest import mock
 
 import pytest
 from dateutil.relativedelta import relativedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from freezegun import freeze_time
+from reversion.models import Version
 
 from datahub.company.constants import AUTOMATIC_COMPANY_ARCHIVE_FEATURE_FLAG
 from datahub.company.models import Company
-from datahub.company.tasks.company import schedule_automatic_company_archive
+from datahub.company.tasks.company import (
+    _automatic_company_archive,
+    schedule_automatic_company_archive,
+)
 from datahub.company.test.factories import CompanyFactory
 from datahub.feature_flag.test.factories import FeatureFlagFactory
 from datahub.interaction.test.factories import CompanyInteractionFactory
@@ -16,6 +22,7 @@ from datahub.investment.investor_profile.test.factories import LargeCapitalInves
 from datahub.investment.project.models import InvestmentProject
 from datahub.investment.project.test.factories import InvestmentProjectFactory
 from datahub.omis.order.test.factories import OrderFactory
+from datahub.search.company import CompanySearchApp
 
 
 @pytest.fixture
@@ -406,3 +413,92 @@ class TestAutomaticCompanyArchive:
         assert company_global_ultimate.archived
         assert company_1.archived
         assert company_2.archived
+
+    @freeze_time('2020-01-01-12:00:00')
+    def test_related_company_already_archived(
+        self,
+        automatic_company_archive_feature_flag,
+    ):
+        """Test that a company is archived if the only companies sharing its
+        global_ultimate_duns_number that are not candidates are already archived.
+        """
+        gt_3m_ago = timezone.now() - relativedelta(months=3, days=1)
+        global_ultimate_duns_number = '123456789'
+        with freeze_time(gt_3m_ago):
+            company = CompanyFactory(global_ultimate_duns_number=global_ultimate_duns_number)
+        archived_company = CompanyFactory(
+            global_ultimate_duns_number=global_ultimate_duns_number,
+            archived=True,
+        )
+
+        schedule_automatic_company_archive(simulate=False)
+        company.refresh_from_db()
+        archived_company.refresh_from_db()
+
+        assert company.archived
+        assert archived_company.archived
+
+    @freeze_time('2020-01-01-12:00:00')
+    def test_creates_revisions(
+        self,
+        automatic_company_archive_feature_flag,
+    ):
+        """Test that a revision is recorded for each archived company."""
+        gt_3m_ago = timezone.now() - relativedelta(months=3, days=1)
+        with freeze_time(gt_3m_ago):
+            companies = CompanyFactory.create_batch(2)
+
+        schedule_automatic_company_archive(simulate=False)
+
+        for company in companies:
+            versions = Version.objects.get_for_object(company)
+            assert versions.count() == 1
+            assert versions[0].field_dict['archived'] is True
+            assert versions[0].revision.get_comment() == 'Automated company archive.'
+
+    @freeze_time('2020-01-01-12:00:00')
+    def test_archives_in_chunks_and_syncs_each_chunk_to_search(
+        self,
+        monkeypatch,
+        synchronous_on_commit,
+    ):
+        """Test that companies are archived in chunks, and that each chunk is synced to
+        OpenSearch using a single task.
+        """
+        monkeypatch.setattr('datahub.company.tasks.company.ARCHIVE_CHUNK_SIZE', 2)
+        mock_sync_objects_async = mock.Mock()
+        monkeypatch.setattr(
+            'datahub.company.tasks.company.sync_objects_async',
+            mock_sync_objects_async,
+        )
+        gt_3m_ago = timezone.now() - relativedelta(months=3, days=1)
+        with freeze_time(gt_3m_ago):
+            companies = CompanyFactory.create_batch(3)
+
+        archive_count = _automatic_company_archive(limit=10, simulate=False)
+
+        assert archive_count == 3
+        assert Company.objects.filter(archived=True).count() == 3
+        synced_chunks = [call.args for call in mock_sync_objects_async.call_args_list]
+        assert [search_app for search_app, _ in synced_chunks] == [CompanySearchApp] * 2
+        assert [len(company_ids) for _, company_ids in synced_chunks] == [2, 1]
+        assert {company_id for _, company_ids in synced_chunks for company_id in company_ids} == {
+            company.pk for company in companies
+        }
+
+    @freeze_time('2020-01-01-12:00:00')
+    def test_number_of_queries_does_not_depend_on_number_of_candidates(self):
+        """Test that selecting companies to archive doesn't make a query per candidate."""
+        gt_3m_ago = timezone.now() - relativedelta(months=3, days=1)
+        with freeze_time(gt_3m_ago):
+            CompanyFactory(global_ultimate_duns_number='111111111')
+        with CaptureQueriesContext(connection) as single_candidate_queries:
+            _automatic_company_archive(limit=10, simulate=True)
+
+        with freeze_time(gt_3m_ago):
+            CompanyFactory.create_batch(5, global_ultimate_duns_number='222222222')
+        with CaptureQueriesContext(connection) as multiple_candidate_queries:
+            archive_count = _automatic_company_archive(limit=10, simulate=True)
+
+        assert archive_count == 6
+        assert len(multiple_candidate_queries) == len(single_candidate_queries)
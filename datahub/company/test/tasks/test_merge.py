@@ -0,0 +1,136 @@
+from unittest import mock
+
+import pytest
+
+from datahub.company.merge import MergeNotAllowedError
+from datahub.company.models import Company, Contact
+from datahub.company.tasks.merge import (
+    merge_companies_task,
+    merge_contacts_task,
+    schedule_merge_companies,
+    schedule_merge_contacts,
+)
+from datahub.company.test.factories import (
+    AdviserFactory,
+    ArchivedCompanyFactory,
+    ArchivedContactFactory,
+    CompanyFactory,
+    ContactFactory,
+)
+from datahub.interaction.test.factories import CompanyInteractionFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def mock_get_current_job(monkeypatch):
+    """Patches get_current_job() so that the job meta can be checked."""
+    mock_job = mock.Mock(meta={})
+    monkeypatch.setattr(
+        'datahub.company.tasks.merge.get_current_job',
+        mock.Mock(return_value=mock_job),
+    )
+    return mock_job
+
+
+class TestMergeCompaniesTask:
+    """Tests for the company merge task."""
+
+    def test_schedule_merge_companies_merges_companies(self, mock_get_current_job):
+        """Test that the scheduled task merges the companies and records the progress."""
+        source_company = CompanyFactory()
+        target_company = CompanyFactory()
+        contacts = ContactFactory.create_batch(2, company=source_company)
+        user = AdviserFactory()
+
+        schedule_merge_companies(source_company, target_company, user)
+
+        source_company.refresh_from_db()
+        assert source_company.archived
+        assert source_company.transferred_to == target_company
+        assert source_company.transferred_by == user
+        assert set(target_company.contacts.all()) == set(contacts)
+        assert mock_get_current_job.meta['progress'] == {'processed': 2, 'total': 2}
+        mock_get_current_job.save_meta.assert_called()
+
+    def test_schedule_merge_companies_raises_error_if_merge_not_allowed(self, monkeypatch):
+        """Test that the merge is checked before the task is scheduled."""
+        job_scheduler_mock = mock.Mock()
+        monkeypatch.setattr('datahub.company.tasks.merge.job_scheduler', job_scheduler_mock)
+        source_company = CompanyFactory()
+        target_company = ArchivedCompanyFactory()
+
+        with pytest.raises(MergeNotAllowedError):
+            schedule_merge_companies(source_company, target_company, AdviserFactory())
+
+        job_scheduler_mock.assert_not_called()
+
+    def test_task_does_not_retry_if_merge_no_longer_allowed(self, mock_get_current_job):
+        """Test that the job isn't retried if the merge has become disallowed since it was
+        scheduled.
+        """
+        source_company = CompanyFactory()
+        target_company = ArchivedCompanyFactory()
+        mock_get_current_job.retries_left = 3
+
+        with pytest.raises(MergeNotAllowedError):
+            merge_companies_task(
+                str(source_company.pk),
+                str(target_company.pk),
+                str(AdviserFactory().pk),
+            )
+
+        assert mock_get_current_job.retries_left == 0
+
+    @mock.patch('datahub.company.tasks.merge.advisory_lock')
+    def test_task_does_nothing_if_lock_not_acquired(self, mock_advisory_lock):
+        """Test that the company isn't merged if it's already being merged."""
+        mock_advisory_lock.return_value.__enter__.return_value = False
+        source_company = CompanyFactory()
+        target_company = CompanyFactory()
+        CompanyInteractionFactory(company=source_company)
+
+        merge_companies_task(str(source_company.pk), str(target_company.pk), None)
+
+        assert not Company.objects.get(pk=source_company.pk).archived
+        assert source_company.interactions.count() == 1
+
+
+class TestMergeContactsTask:
+    """Tests for the contact merge task."""
+
+    def test_schedule_merge_contacts_merges_contacts(self, mock_get_current_job):
+        """Test that the scheduled task merges the contacts and records the progress."""
+        source_contact = ContactFactory()
+        target_contact = ContactFactory()
+        interactions = CompanyInteractionFactory.create_batch(3, contacts=[source_contact])
+        user = AdviserFactory()
+
+        schedule_merge_contacts(source_contact, target_contact, user)
+
+        source_contact.refresh_from_db()
+        assert source_contact.archived
+        assert source_contact.transferred_to == target_contact
+        assert set(target_contact.interactions.all()) == set(interactions)
+        assert mock_get_current_job.meta['progress'] == {'processed': 3, 'total': 3}
+
+    def test_schedule_merge_contacts_raises_error_if_merge_not_allowed(self, monkeypatch):
+        """Test that the merge is checked before the task is scheduled."""
+        job_scheduler_mock = mock.Mock()
+        monkeypatch.setattr('datahub.company.tasks.merge.job_scheduler', job_scheduler_mock)
+        source_contact = ContactFactory()
+        target_contact = ArchivedContactFactory()
+
+        with pytest.raises(MergeNotAllowedError):
+            schedule_merge_contacts(source_contact, target_contact, AdviserFactory())
+
+        job_scheduler_mock.assert_not_called()
+
+    def test_task_merges_contacts(self):
+        """Test that the task can be run outside of an RQ job."""
+        source_contact = ContactFactory()
+        target_contact = ContactFactory()
+
+        merge_contacts_task(str(source_contact.pk), str(target_contact.pk), None)
+
+        assert Contact.objects.get(pk=source_contact.pk).transferred_to == target_contact
@@ -7,6 +7,7 @@ from django.urls import reverse
 from freezegun import freeze_time
 from rest_framework import status
 
+from datahub.admin_report.models import ReportRun
 from datahub.company.admin_reports import AllAdvisersReport, OneListReport
 from datahub.company.models import OneListTier
 from datahub.company.test.factories import AdviserFactory, CompanyFactory
@@ -21,7 +22,7 @@ class TestReportAdmin(AdminTestMixin):
     """Tests for the download of the report."""
 
     @freeze_time('2018-01-01 00:00:00')
-    def test_adviser_report_download(self):
+    def test_adviser_report_download(self, django_capture_on_commit_callbacks):
         """Test the download of a report."""
         AdviserFactory.create_batch(5)
 
@@ -34,13 +35,18 @@ class TestReportAdmin(AdminTestMixin):
         )
 
         client = self.create_client(user=user)
-        response = client.get(url)
+        with django_capture_on_commit_callbacks(execute=True):
+            client.get(url)
+        run = ReportRun.objects.get()
+        response = client.get(
+            reverse('admin_report:download-report-run', kwargs={'run_id': run.pk}),
+        )
         assert response.status_code == status.HTTP_200_OK
         # 7 = header + test user + the 5 test advisers
-        assert len(response.getvalue().decode('utf-8').splitlines()) == 7
+        assert len(b''.join(response.streaming_content).decode('utf-8').splitlines()) == 7
 
     @freeze_time('2018-01-01 00:00:00')
-    def test_one_list_download(self):
+    def test_one_list_download(self, django_capture_on_commit_callbacks):
         """Test the download of the One List."""
         CompanyFactory.create_batch(
             2,
@@ -76,10 +82,15 @@ class TestReportAdmin(AdminTestMixin):
         )
 
         client = self.create_client(user=user)
-        response = client.get(url)
+        with django_capture_on_commit_callbacks(execute=True):
+            client.get(url)
+        run = ReportRun.objects.get()
+        response = client.get(
+            reverse('admin_report:download-report-run', kwargs={'run_id': run.pk}),
+        )
         assert response.status_code == status.HTTP_200_OK
         # 3 = header + the first 2 companies
-        assert len(response.getvalue().decode('utf-8').splitlines()) == 3
+        assert len(b''.join(response.streaming_content).decode('utf-8').splitlines()) == 3
 
 
 @freeze_time('2018-01-01 00:00:00')
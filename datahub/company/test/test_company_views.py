@@ -3,6 +3,8 @@ from datetime import datetime
 
 import factory
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -17,6 +19,7 @@ from datahub.company.test.factories import (
     AdviserFactory,
     CompanyExportCountryFactory,
     CompanyFactory,
+    ContactFactory,
 )
 from datahub.company.test.utils import address_area_or_none
 from datahub.core.constants import (
@@ -860,6 +863,119 @@ class TestGetCompany(APITestMixin):
         assert response.json()['global_ultimate_country'] is None
 
 
+HEADER_FIELDS = ('name', 'trading_names', 'address', 'archived', 'one_list_group_tier')
+# Fields not returned by the company item view (is_in_adviser_list is only set by autocomplete)
+NOT_RETURNED_FIELDS = {'is_in_adviser_list'}
+
+
+class TestGetCompanyWithRequestedFields(APITestMixin):
+    """Tests for getting a company with the fields query parameter."""
+
+    def _get_company(self, company, fields=None):
+        url = reverse('api-v4:company:item', kwargs={'pk': company.pk})
+        params = {'fields': ','.join(fields)} if fields else {}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.get(url, params)
+        assert response.status_code == status.HTTP_200_OK
+        return response, [query['sql'] for query in queries]
+
+    def _create_company(self, num_related_objects):
+        company = CompanyFactory(
+            global_headquarters=CompanyFactory(one_list_tier=OneListTier.objects.first()),
+            # Use the same sector for all companies as the number of sector queries depends on
+            # the depth of the sector
+            sector_id=Sector.objects.order_by('pk').first().pk,
+        )
+        ContactFactory.create_batch(num_related_objects, company=company)
+        CompanyExportCountryFactory.create_batch(num_related_objects, company=company)
+        return company
+
+    def test_only_returns_requested_fields(self):
+        """Test that only the requested fields (and id) are returned."""
+        company = CompanyFactory()
+
+        response, _ = self._get_company(company, fields=HEADER_FIELDS)
+
+        assert response.json().keys() == {'id', *HEADER_FIELDS}
+        assert response.json()['name'] == company.name
+
+    def test_returns_all_fields_by_default(self):
+        """Test that all fields are returned if the fields parameter is not used."""
+        company = CompanyFactory()
+
+        response, _ = self._get_company(company)
+
+        assert response.json().keys() == set(CompanySerializer.Meta.fields) - NOT_RETURNED_FIELDS
+
+    def test_invalid_field(self):
+        """Test that an error is returned if an unknown field is requested."""
+        company = CompanyFactory()
+        url = reverse('api-v4:company:item', kwargs={'pk': company.pk})
+
+        response = self.api_client.get(url, {'fields': 'name,invalid,another_invalid'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {'fields': ['Invalid field(s): another_invalid, invalid.']}
+
+    def test_header_fields_do_not_load_heavy_relations(self):
+        """Test that contacts and export countries are not queried if they are not requested."""
+        company = self._create_company(num_related_objects=3)
+
+        _, queries = self._get_company(company, fields=HEADER_FIELDS)
+
+        assert not any('"company_contact"' in sql for sql in queries)
+        assert not any('"company_companyexportcountry"' in sql for sql in queries)
+
+    @pytest.mark.parametrize(
+        'fields',
+        [
+            HEADER_FIELDS,
+            (*HEADER_FIELDS, 'contacts'),
+            (*HEADER_FIELDS, 'export_countries', 'sector'),
+            None,
+        ],
+    )
+    def test_query_count_does_not_depend_on_number_of_related_objects(self, fields):
+        """Test that the number of queries is the same regardless of the number of contacts and
+        export countries the company has.
+        """
+        user = create_test_user(
+            permission_codenames=('view_company', 'view_companyexportcountry'),
+        )
+        self._api_client = self.create_api_client(user=user)
+        company_with_few_relations = self._create_company(num_related_objects=1)
+        company_with_many_relations = self._create_company(num_related_objects=10)
+        # Make sure the access token is cached before counting queries
+        self._get_company(company_with_few_relations, fields=fields)
+
+        _, few_relations_queries = self._get_company(company_with_few_relations, fields=fields)
+        _, many_relations_queries = self._get_company(company_with_many_relations, fields=fields)
+
+        assert len(few_relations_queries) == len(many_relations_queries)
+
+    def test_header_fields_use_fewer_queries(self):
+        """Test that requesting only header fields uses fewer queries than requesting all
+        fields.
+        """
+        company = self._create_company(num_related_objects=3)
+        self._get_company(company)
+
+        _, all_field_queries = self._get_company(company)
+        _, header_field_queries = self._get_company(company, fields=HEADER_FIELDS)
+
+        assert len(header_field_queries) < len(all_field_queries)
+
+    def test_fields_parameter_ignored_for_updates(self):
+        """Test that the fields parameter does not affect PATCH responses."""
+        company = CompanyFactory()
+        url = reverse('api-v4:company:item', kwargs={'pk': company.pk})
+
+        response = self.api_client.patch(f'{url}?fields=name', {'description': 'new description'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json().keys() == set(CompanySerializer.Meta.fields) - NOT_RETURNED_FIELDS
+
+
 class TestUpdateCompany(APITestMixin):
     """Tests for updating a single company."""
 
@@ -1,9 +1,12 @@
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 import reversion
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from freezegun import freeze_time
+from reversion.models import Version
 
 from datahub.company.merge import (
     MergeNotAllowedError,
@@ -1125,6 +1128,96 @@ class TestCompanyMerge:
         )
         assert f'{source_planned_changes}' in caplog.text
 
+    def test_merge_uses_a_constant_number_of_queries(self):
+        """Test that related objects are moved using set-based queries, so that the number of
+        queries doesn't depend on the number of related objects.
+        """
+        adviser = AdviserFactory()
+        num_queries = []
+
+        for num_related_objects in (1, 5):
+            source_company = _company_factory(
+                num_interactions=num_related_objects,
+                num_contacts=num_related_objects,
+                num_orders=num_related_objects,
+                num_company_list_items=num_related_objects,
+            )
+            target_company = CompanyFactory()
+
+            with CaptureQueriesContext(connection) as queries:
+                merge_companies(source_company, target_company, adviser)
+
+            assert not source_company.interactions.exists()
+            assert target_company.interactions.count() == num_related_objects
+            num_queries.append(len(queries))
+
+        assert num_queries[0] == num_queries[1]
+
+    def test_merge_moves_objects_in_batches(self, monkeypatch):
+        """Test that objects are moved in batches and that progress is reported."""
+        monkeypatch.setattr('datahub.company.merge.MERGE_BATCH_SIZE', 2)
+        adviser = AdviserFactory()
+        source_company = _company_factory(num_contacts=3, num_company_list_items=2)
+        target_company = CompanyFactory()
+        progress_callback = Mock()
+
+        merge_companies(source_company, target_company, adviser, progress_callback)
+
+        assert target_company.contacts.count() == 3
+        assert target_company.company_list_items.count() == 2
+        assert progress_callback.call_args_list == [
+            call(2, 5),
+            call(3, 5),
+            call(5, 5),
+        ]
+
+    def test_merge_syncs_moved_objects_to_search_in_bulk(
+        self,
+        monkeypatch,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that objects moved to the target company are synced to OpenSearch using one
+        batched task per search app.
+        """
+        sync_objects_async_mock = Mock()
+        monkeypatch.setattr(
+            'datahub.company.merge.sync_objects_async',
+            sync_objects_async_mock,
+        )
+        adviser = AdviserFactory()
+        source_company = _company_factory(num_interactions=2, num_contacts=3)
+        target_company = CompanyFactory()
+        interaction_ids = set(source_company.interactions.values_list('pk', flat=True))
+        contact_ids = set(source_company.contacts.values_list('pk', flat=True))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            merge_companies(source_company, target_company, adviser)
+
+        synced_object_ids = {
+            search_app.name: object_ids
+            for (search_app, object_ids), _ in sync_objects_async_mock.call_args_list
+        }
+        assert synced_object_ids['interaction'] == interaction_ids
+        assert synced_object_ids['contact'] == contact_ids
+
+    def test_merge_records_moved_objects_in_a_single_revision(self):
+        """Test that the moved objects are recorded in the same revision as the source company."""
+        adviser = AdviserFactory()
+        source_company = _company_factory(num_contacts=2, num_company_list_items=1)
+        target_company = CompanyFactory()
+        contacts = list(source_company.contacts.all())
+
+        merge_companies(source_company, target_company, adviser)
+
+        source_company_version = Version.objects.get_for_object(source_company).first()
+        revision = source_company_version.revision
+        assert revision.get_comment() == 'Company merged'
+        assert revision.user == adviser
+        for contact in contacts:
+            contact_version = Version.objects.get_for_object(contact).first()
+            assert contact_version.revision == revision
+            assert contact_version.field_dict['company_id'] == target_company.pk
+
 
 def _company_factory(
     num_interactions=0,
@@ -13,6 +13,7 @@ from django_filters.rest_framework import (
 )
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import IsAuthenticated
@@ -71,7 +72,6 @@ from datahub.core.viewsets import CoreViewSet, SoftDeleteCoreViewSet
 from datahub.export_win.models import Win
 from datahub.export_win.serializers import DataHubLegacyExportWinSerializer
 from datahub.export_win.views import ConfirmedFilterSet
-from datahub.investment.project.queryset import get_slim_investment_project_queryset
 
 
 class CompanyFilterSet(FilterSet):
@@ -92,38 +92,88 @@ class CompanyViewSet(ArchivableViewSetMixin, CoreViewSet):
     filter_backends = (DjangoFilterBackend, OrderingFilter)
     filterset_class = CompanyFilterSet
     ordering_fields = ('name', 'created_on')
-    queryset = Company.objects.select_related(
-        'address_country',
-        'archived_by',
-        'business_type',
-        'employee_range',
-        'export_experience_category',
-        'global_headquarters__one_list_account_owner__dit_team__country',
-        'global_headquarters__one_list_account_owner__dit_team__uk_region',
-        'global_headquarters__one_list_account_owner__dit_team',
-        'global_headquarters__one_list_account_owner',
-        'global_headquarters__one_list_tier',
-        'global_headquarters',
-        'headquarter_type',
-        'one_list_account_owner__dit_team__country',
-        'one_list_account_owner__dit_team__uk_region',
-        'one_list_account_owner__dit_team',
-        'one_list_account_owner',
-        'one_list_tier',
-        'registered_address_country',
-        'transferred_to',
-        'turnover_range',
-        'uk_region',
-    ).prefetch_related(
-        Prefetch('contacts', queryset=get_contact_queryset()),
-        Prefetch('investor_investment_projects', queryset=get_slim_investment_project_queryset()),
-        'export_to_countries',
-        'future_interest_countries',
-        'sector__parent__parent',
-        'sector__parent',
-        'sector',
-        Prefetch('export_countries', queryset=get_export_country_queryset()),
-    )
+    queryset = Company.objects.all()
+    # The related objects used by each serializer field. Only those used by the requested fields
+    # are loaded when the fields query parameter is used.
+    field_select_related = {
+        'address': ('address_country',),
+        'archived_by': ('archived_by',),
+        'business_type': ('business_type',),
+        'employee_range': ('employee_range',),
+        'export_experience_category': ('export_experience_category',),
+        'global_headquarters': ('global_headquarters',),
+        'headquarter_type': ('headquarter_type',),
+        'is_global_headquarters': ('headquarter_type',),
+        'one_list_group_global_account_manager': (
+            'global_headquarters__one_list_account_owner__dit_team__country',
+            'global_headquarters__one_list_account_owner__dit_team__uk_region',
+            'one_list_account_owner__dit_team__country',
+            'one_list_account_owner__dit_team__uk_region',
+        ),
+        'one_list_group_tier': (
+            'global_headquarters__one_list_tier',
+            'one_list_tier',
+        ),
+        'registered_address': ('registered_address_country',),
+        'transferred_to': ('transferred_to',),
+        'turnover_range': ('turnover_range',),
+        'uk_region': ('uk_region',),
+    }
+    field_prefetch_related = {
+        'contacts': (Prefetch('contacts', queryset=get_contact_queryset()),),
+        'export_countries': (
+            Prefetch('export_countries', queryset=get_export_country_queryset()),
+        ),
+        'export_to_countries': ('export_to_countries',),
+        'future_interest_countries': ('future_interest_countries',),
+        'sector': ('sector__parent__parent',),
+    }
+
+    def get_queryset(self):
+        """Gets the queryset, only loading the related objects used by the requested fields."""
+        fields = self.get_requested_fields() or self.serializer_class.Meta.fields
+        select_related = {
+            lookup for field in fields for lookup in self.field_select_related.get(field, ())
+        }
+        prefetch_related = {
+            lookup for field in fields for lookup in self.field_prefetch_related.get(field, ())
+        }
+        return (
+            super()
+            .get_queryset()
+            .select_related(*sorted(select_related))
+            .prefetch_related(*prefetch_related)
+        )
+
+    def get_serializer_context(self):
+        """Extra context provided to the serializer class."""
+        return {
+            **super().get_serializer_context(),
+            'requested_fields': self.get_requested_fields(),
+        }
+
+    def get_requested_fields(self):
+        """Gets the fields requested using the fields query parameter (for GET requests only).
+
+        The id field is always included.
+
+        :returns: a set of field names, or None if all fields should be returned
+        """
+        if not self.request or self.request.method != 'GET':
+            return None
+
+        fields_param = self.request.query_params.get('fields')
+        if not fields_param:
+            return None
+
+        requested_fields = {field.strip() for field in fields_param.split(',') if field.strip()}
+        invalid_fields = requested_fields - set(self.serializer_class.Meta.fields)
+        if invalid_fields:
+            raise ValidationError(
+                {'fields': [f'Invalid field(s): {", ".join(sorted(invalid_fields))}.']},
+            )
+
+        return {'id', *requested_fields}
 
     @action(
         methods=['post'],
@@ -18,11 +18,12 @@ DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
 
 
 def stova_attendee_identification_task() -> None:
-    """Identifies the most recent file to be ingested and schedules a task to ingest it."""
+    """Identifies files that haven't been ingested yet and schedules tasks to ingest them."""
     logger.info('Stova attendee identification task started.')
     identification_task = StovaAttendeeIdentificationTask(
         prefix=STOVA_ATTENDEE_PREFIX,
         job_timeout=THIRTY_MINUTES_IN_SECONDS,
+        catch_up=True,
     )
     identification_task.identify_new_objects(stova_attendee_ingestion_task)
     logger.info('Stova attendee identification task finished.')
@@ -12,9 +12,9 @@ DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
 
 
 def stova_event_identification_task() -> None:
-    """Identifies the most recent file to be ingested and schedules a task to ingest it."""
+    """Identifies files that haven't been ingested yet and schedules tasks to ingest them."""
     logger.info('Stova event identification task started.')
-    identification_task = StovaEventIdentificationTask(prefix=STOVA_EVENT_PREFIX)
+    identification_task = StovaEventIdentificationTask(prefix=STOVA_EVENT_PREFIX, catch_up=True)
     identification_task.identify_new_objects(stova_event_ingestion_task)
     logger.info('Stova event identification task finished.')
 
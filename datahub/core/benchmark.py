@@ -0,0 +1,366 @@
+import json
+import statistics
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from logging import getLogger
+from time import perf_counter
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from django.utils.timezone import now
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from datahub.company.models import Advisor, Company
+from datahub.company_activity.tasks.constants import STOVA_EVENT_PREFIX
+from datahub.company_activity.tasks.ingest_stova_events import StovaEventIngestionTask
+from datahub.ingest.boto3 import S3ObjectProcessor
+from datahub.reminder.models import NoRecentExportInteractionSubscription
+from datahub.reminder.tasks import (
+    generate_no_recent_export_interaction_reminders_for_subscription,
+)
+from datahub.search.apps import get_search_app
+from datahub.search.bulk_sync import sync_app
+
+logger = getLogger(__name__)
+
+DEFAULT_ITERATIONS = 5
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+BENCHMARK_USER_EMAIL = 'benchmark@synthetic.example'
+NUM_INGESTION_RECORDS = 1000
+INGESTION_OBJECT_KEY = f'{STOVA_EVENT_PREFIX}benchmark/stova-events.jsonl'
+# Chosen to not clash with the IDs of real Stova events
+FIRST_INGESTION_STOVA_EVENT_ID = 900_000_000
+
+
+class BenchmarkError(Exception):
+    """Raised when a benchmark can't be run (e.g. as an endpoint returned an error)."""
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A benchmark of an endpoint or task.
+
+    `run` is called with the benchmark context and any keyword arguments returned by `setup`,
+    and returns the number of items (e.g. results or records) processed, or None.
+    """
+
+    name: str
+    run: Callable
+    setup: Callable | None = None
+
+
+@dataclass
+class BenchmarkContext:
+    """Objects shared by all benchmarks in a run."""
+
+    user: Advisor
+    company: Company | None
+    request_factory: APIRequestFactory = field(default_factory=APIRequestFactory)
+
+    @classmethod
+    def create(cls):
+        """Creates the context, using the company with the most interactions."""
+        user, _ = Advisor.objects.get_or_create(
+            email=BENCHMARK_USER_EMAIL,
+            defaults={'first_name': 'Benchmark', 'last_name': 'User', 'is_superuser': True},
+        )
+        company = (
+            Company.objects.annotate(num_interactions=Count('interactions'))
+            .order_by('-num_interactions')
+            .first()
+        )
+        return cls(user=user, company=company)
+
+
+@dataclass
+class BenchmarkResult:
+    """The measurements from running a benchmark."""
+
+    name: str
+    durations: list = field(default_factory=list)
+    query_counts: list = field(default_factory=list)
+    item_counts: list = field(default_factory=list)
+    error: str | None = None
+
+    def summarise(self):
+        """:returns: dict of latency (in milliseconds), throughput and query count statistics"""
+        if self.error or not self.durations:
+            return {'name': self.name, 'error': self.error}
+
+        total_duration = sum(self.durations)
+        total_items = sum(filter(None, self.item_counts))
+        durations_ms = sorted(duration * 1000 for duration in self.durations)
+        return {
+            'name': self.name,
+            'iterations': len(self.durations),
+            'mean_ms': round(statistics.mean(durations_ms), 1),
+            'p50_ms': round(statistics.median(durations_ms), 1),
+            'p95_ms': round(_percentile(durations_ms, 0.95), 1),
+            'max_ms': round(durations_ms[-1], 1),
+            'iterations_per_second': round(len(self.durations) / total_duration, 2),
+            'items_per_second': round(total_items / total_duration, 1) if total_items else None,
+            'queries': max(self.query_counts),
+        }
+
+
+def run_benchmarks(names=None, iterations=DEFAULT_ITERATIONS, warmup_iterations=1):
+    """Runs the benchmarks (optionally only those with names starting with one of `names`).
+
+    Each iteration of a benchmark runs in a transaction that is rolled back, so that the results
+    of repeated runs are comparable. (Changes outside of the database, such as to search
+    indexes, are not rolled back.)
+
+    :returns: list of BenchmarkResult
+    """
+    context = BenchmarkContext.create()
+    benchmarks = [
+        benchmark
+        for benchmark in BENCHMARKS
+        if not names or any(benchmark.name.startswith(name) for name in names)
+    ]
+    return [
+        _run_benchmark(benchmark, context, iterations, warmup_iterations)
+        for benchmark in benchmarks
+    ]
+
+
+def find_regressions(summaries, baseline_summaries, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """Compares summaries of benchmark results against a baseline.
+
+    A benchmark has regressed if its median latency has increased by more than `threshold`
+    (a proportion), or if it makes more queries than before.
+
+    :returns: list of descriptions of regressions
+    """
+    baseline_summaries_by_name = {summary['name']: summary for summary in baseline_summaries}
+    regressions = []
+
+    for summary in summaries:
+        baseline_summary = baseline_summaries_by_name.get(summary['name'])
+        if not baseline_summary or summary.get('error') or baseline_summary.get('error'):
+            continue
+
+        if summary['p50_ms'] > baseline_summary['p50_ms'] * (1 + threshold):
+            regressions.append(
+                f'{summary["name"]}: median latency increased from '
+                f'{baseline_summary["p50_ms"]} ms to {summary["p50_ms"]} ms',
+            )
+        if summary['queries'] > baseline_summary['queries']:
+            regressions.append(
+                f'{summary["name"]}: queries increased from '
+                f'{baseline_summary["queries"]} to {summary["queries"]}',
+            )
+
+    return regressions
+
+
+def load_summaries(path):
+    """Loads summaries of benchmark results saved by save_summaries()."""
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_summaries(summaries, path):
+    """Saves summaries of benchmark results as JSON."""
+    with open(path, 'w') as file:
+        json.dump(summaries, file, indent=2)
+
+
+def _run_benchmark(benchmark, context, iterations, warmup_iterations):
+    logger.info(f'Running benchmark {benchmark.name}')
+    result = BenchmarkResult(benchmark.name)
+
+    try:
+        kwargs = benchmark.setup(context) if benchmark.setup else {}
+
+        for iteration in range(warmup_iterations + iterations):
+            with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+                start_time = perf_counter()
+                num_items = benchmark.run(context, **kwargs)
+                duration = perf_counter() - start_time
+                transaction.set_rollback(True)
+
+            if iteration >= warmup_iterations:
+                result.durations.append(duration)
+                result.query_counts.append(len(queries))
+                result.item_counts.append(num_items)
+    except Exception as exc:
+        logger.exception(f'Benchmark {benchmark.name} failed')
+        result.error = repr(exc)
+
+    return result
+
+
+def _percentile(sorted_values, proportion):
+    index = min(len(sorted_values) - 1, round(proportion * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def _call_view(context, method, path, data=None):
+    """Calls the view for a path as the benchmark user.
+
+    Authentication and permission checks are skipped, as these endpoints use several different
+    authentication schemes (and so the benchmarks don't depend on credentials being set up).
+
+    :returns: the number of results returned
+    """
+    match = resolve(path)
+    view_func = match.func
+    initkwargs = {
+        **view_func.initkwargs,
+        'authentication_classes': (),
+        'permission_classes': (),
+    }
+    actions = getattr(view_func, 'actions', None)
+    view = (
+        view_func.cls.as_view(actions, **initkwargs)
+        if actions
+        else view_func.cls.as_view(**initkwargs)
+    )
+
+    request = getattr(context.request_factory, method)(path, data, format='json')
+    force_authenticate(request, user=context.user)
+    response = view(request, *match.args, **match.kwargs)
+    response.render()
+
+    if response.status_code >= 400:
+        raise BenchmarkError(f'{path} returned status {response.status_code}')
+
+    response_data = response.data
+    if isinstance(response_data, dict):
+        response_data = response_data.get('results', response_data.get('orderedItems'))
+    return len(response_data) if isinstance(response_data, list) else 1
+
+
+def _endpoint_benchmark(name, method, url_name, data=None, url_kwargs=None):
+    def run(context):
+        kwargs = url_kwargs(context) if url_kwargs else {}
+        return _call_view(context, method, reverse(url_name, kwargs=kwargs), data)
+
+    return Benchmark(name=f'endpoint.{name}', run=run)
+
+
+def _company_url_kwargs(context):
+    if not context.company:
+        raise BenchmarkError('There are no companies')
+    return {'pk': context.company.pk}
+
+
+def _sync_companies(context):
+    sync_app(get_search_app('company'))
+    return Company.objects.count()
+
+
+def _generate_reminders(context):
+    current_date = now().date()
+    subscriptions = NoRecentExportInteractionSubscription.objects.select_related('adviser')
+    num_subscriptions = 0
+
+    for subscription in subscriptions.iterator():
+        # Emails aren't sent, as they would be sent via GOV.UK Notify
+        subscription.email_reminders_enabled = False
+        generate_no_recent_export_interaction_reminders_for_subscription(
+            subscription,
+            current_date,
+        )
+        num_subscriptions += 1
+
+    return num_subscriptions
+
+
+def _set_up_ingestion(context):
+    """Uploads a file of synthetic Stova events to S3 to be ingested."""
+    s3_processor = S3ObjectProcessor(prefix=STOVA_EVENT_PREFIX)
+    event_datetime = str(now() + timedelta(days=30))
+    records = (
+        {
+            'id': FIRST_INGESTION_STOVA_EVENT_ID + index,
+            'url': '',
+            'city': 'London',
+            'code': '',
+            'name': f'Synthetic event {index}',
+            'state': '',
+            'country': 'United Kingdom',
+            'max_reg': 100,
+            'end_date': event_datetime,
+            'timezone': 'Europe/London',
+            'folder_id': None,
+            'live_date': event_datetime,
+            'close_date': event_datetime,
+            'created_by': '',
+            'price_type': 'net',
+            'start_date': event_datetime,
+            'description': None,
+            'modified_by': '',
+            'contact_info': '',
+            'created_date': event_datetime,
+            'location_city': 'London',
+            'location_name': 'Synthetic venue',
+            'modified_date': event_datetime,
+            'client_contact': '',
+            'location_state': None,
+            'default_language': 'en-GB',
+            'location_country': 'United Kingdom',
+            'approval_required': False,
+            'location_address1': f'{index} Synthetic Street',
+            'location_address2': None,
+            'location_address3': None,
+            'location_postcode': None,
+            'standard_currency': 'GBP',
+        }
+        for index in range(NUM_INGESTION_RECORDS)
+    )
+    s3_processor.s3_client.put_object(
+        Bucket=s3_processor.bucket,
+        Key=INGESTION_OBJECT_KEY,
+        Body='\n'.join(json.dumps(record) for record in records).encode(),
+    )
+    return {'s3_processor': s3_processor}
+
+
+def _ingest_stova_events(context, s3_processor):
+    StovaEventIngestionTask(
+        object_key=INGESTION_OBJECT_KEY,
+        s3_processor=s3_processor,
+    ).ingest_object()
+    return NUM_INGESTION_RECORDS
+
+
+BENCHMARKS = (
+    _endpoint_benchmark(
+        'search.company',
+        'post',
+        'api-v4:search:company',
+        data={'original_query': 'ltd', 'limit': 100},
+    ),
+    _endpoint_benchmark(
+        'search.interaction',
+        'post',
+        'api-v3:search:interaction',
+        data={'limit': 100},
+    ),
+    _endpoint_benchmark('dataset.companies', 'get', 'api-v4:dataset:companies-dataset'),
+    _endpoint_benchmark('dataset.contacts', 'get', 'api-v4:dataset:contacts-dataset'),
+    _endpoint_benchmark('dataset.interactions', 'get', 'api-v4:dataset:interactions-dataset'),
+    _endpoint_benchmark(
+        'company.detail',
+        'get',
+        'api-v4:company:item',
+        url_kwargs=_company_url_kwargs,
+    ),
+    _endpoint_benchmark(
+        'activity_stream.interactions',
+        'get',
+        'api-v3:activity-stream:interactions',
+    ),
+    Benchmark(name='task.sync_app.company', run=_sync_companies),
+    Benchmark(name='task.reminders.no_recent_export_interaction', run=_generate_reminders),
+    Benchmark(
+        name='task.ingestion.stova_events',
+        setup=_set_up_ingestion,
+        run=_ingest_stova_events,
+    ),
+)
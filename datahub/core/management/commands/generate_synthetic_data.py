@@ -0,0 +1,74 @@
+from logging import getLogger
+from time import perf_counter
+
+from django.core.management import BaseCommand
+
+from datahub.core.synthetic_data import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONTACTS_PER_COMPANY,
+    DEFAULT_INTERACTIONS_PER_COMPANY,
+    DEFAULT_SCALE,
+    SyntheticDataGenerator,
+)
+
+logger = getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Generates a large volume of synthetic data for performance testing."""
+
+    help = (
+        'Generates synthetic advisers, companies, contacts and interactions using PostgreSQL '
+        'COPY. Only intended to be used in local environments, and should not be used in '
+        'production. Run sync_search afterwards to update the search indexes.'
+    )
+
+    def add_arguments(self, parser):
+        """Adds additional command arguments."""
+        parser.add_argument(
+            '--scale',
+            type=float,
+            default=DEFAULT_SCALE,
+            help='Volume to generate relative to production (1 is similar to production).',
+        )
+        parser.add_argument(
+            '--contacts-per-company',
+            type=float,
+            default=DEFAULT_CONTACTS_PER_COMPANY,
+            help='Mean number of contacts per company.',
+        )
+        parser.add_argument(
+            '--interactions-per-company',
+            type=float,
+            default=DEFAULT_INTERACTIONS_PER_COMPANY,
+            help='Mean number of interactions per company.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Number of companies to generate at a time.',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Seed for the random number generators.',
+        )
+
+    def handle(self, *args, **options):
+        """Generates the data."""
+        generator = SyntheticDataGenerator(
+            scale=options['scale'],
+            contacts_per_company=options['contacts_per_company'],
+            interactions_per_company=options['interactions_per_company'],
+            batch_size=options['batch_size'],
+            seed=options['seed'],
+        )
+
+        start_time = perf_counter()
+        counts = generator.generate()
+        duration = perf_counter() - start_time
+
+        for model, count in counts.items():
+            logger.info(f'{model._meta.label}: {count} generated')
+        logger.info(f'Finished in {duration:.1f} seconds')
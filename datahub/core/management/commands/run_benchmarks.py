@@ -0,0 +1,90 @@
+from django.core.management import BaseCommand, CommandError
+
+from datahub.core.benchmark import (
+    BENCHMARKS,
+    DEFAULT_ITERATIONS,
+    DEFAULT_REGRESSION_THRESHOLD,
+    find_regressions,
+    load_summaries,
+    run_benchmarks,
+    save_summaries,
+)
+
+COLUMNS = (
+    'name',
+    'p50_ms',
+    'p95_ms',
+    'max_ms',
+    'iterations_per_second',
+    'items_per_second',
+    'queries',
+)
+
+
+class Command(BaseCommand):
+    """Runs performance benchmarks of hot endpoints and bulk tasks."""
+
+    help = (
+        'Measures the latency, throughput and number of queries of hot endpoints and bulk tasks '
+        'against the local database and OpenSearch (e.g. after running '
+        'generate_synthetic_data). Results can be saved and compared against a baseline to find '
+        'regressions. Should not be used in production.'
+    )
+
+    def add_arguments(self, parser):
+        """Adds additional command arguments."""
+        parser.add_argument(
+            'benchmarks',
+            nargs='*',
+            help=(
+                'Names (or prefixes of names) of the benchmarks to run. All benchmarks are run '
+                f'if not specified. Available benchmarks: '
+                f'{", ".join(benchmark.name for benchmark in BENCHMARKS)}.'
+            ),
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=DEFAULT_ITERATIONS,
+            help='Number of measured iterations of each benchmark.',
+        )
+        parser.add_argument(
+            '--output',
+            help='Path of a JSON file to save the results to.',
+        )
+        parser.add_argument(
+            '--baseline',
+            help='Path of a JSON file of previous results to compare the results against.',
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=DEFAULT_REGRESSION_THRESHOLD,
+            help='Proportional increase in median latency that counts as a regression.',
+        )
+
+    def handle(self, *args, **options):
+        """Runs the benchmarks and reports the results."""
+        results = run_benchmarks(options['benchmarks'], iterations=options['iterations'])
+        summaries = [result.summarise() for result in results]
+
+        for summary in summaries:
+            if summary.get('error'):
+                self.stdout.write(f'{summary["name"]}: failed with {summary["error"]}')
+                continue
+            self.stdout.write(
+                ', '.join(f'{column}={summary[column]}' for column in COLUMNS),
+            )
+
+        if options['output']:
+            save_summaries(summaries, options['output'])
+
+        if options['baseline']:
+            regressions = find_regressions(
+                summaries,
+                load_summaries(options['baseline']),
+                threshold=options['threshold'],
+            )
+            if regressions:
+                raise CommandError('Regressions found:\n' + '\n'.join(regressions))
+            self.stdout.write('No regressions found')
@@ -0,0 +1,227 @@
+import re
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from logging import getLogger
+from time import perf_counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+logger = getLogger(__name__)
+
+INSTRUMENTED_CACHE_METHODS = (
+    'add',
+    'clear',
+    'decr',
+    'delete',
+    'delete_many',
+    'get',
+    'get_many',
+    'get_or_set',
+    'has_key',
+    'incr',
+    'set',
+    'set_many',
+    'touch',
+)
+
+_SAVEPOINT_SQL_PATTERN = re.compile(r'(RELEASE |ROLLBACK TO )?SAVEPOINT ')
+
+_current_metrics = ContextVar('request_metrics', default=None)
+_recorders = []
+
+
+class QueryBudgetExceededError(Exception):
+    """Raised when a view makes more database queries than its query budget allows."""
+
+
+@dataclass
+class RequestMetrics:
+    """The number and total duration (in seconds) of calls to backing services for a request."""
+
+    db_queries: int = 0
+    db_duration: float = 0
+    cache_calls: int = 0
+    cache_duration: float = 0
+    opensearch_requests: int = 0
+    opensearch_duration: float = 0
+    # Used to avoid counting cache calls made by other cache methods (e.g. get_or_set())
+    _in_cache_call: bool = False
+
+    def get_log_fields(self):
+        """:returns: dict of structured log fields (with durations in milliseconds)"""
+        return {
+            'db_query_count': self.db_queries,
+            'db_duration_ms': _to_ms(self.db_duration),
+            'cache_call_count': self.cache_calls,
+            'cache_duration_ms': _to_ms(self.cache_duration),
+            'opensearch_request_count': self.opensearch_requests,
+            'opensearch_duration_ms': _to_ms(self.opensearch_duration),
+        }
+
+    def get_server_timing_header(self):
+        """:returns: the value of a Server-Timing header for the metrics"""
+        timings = (
+            ('db', self.db_duration, self.db_queries, 'queries'),
+            ('cache', self.cache_duration, self.cache_calls, 'calls'),
+            ('opensearch', self.opensearch_duration, self.opensearch_requests, 'requests'),
+        )
+        return ', '.join(
+            f'{name};dur={_to_ms(duration)};desc="{count} {unit}"'
+            for name, duration, count, unit in timings
+        )
+
+
+class RequestMetricsMiddleware:
+    """Counts and times database queries, cache calls and OpenSearch requests for each request.
+
+    If REQUEST_METRICS_ENABLED is True, the metrics are logged and added to the response in a
+    Server-Timing header.
+
+    DRF views can declare the maximum number of database queries a request should make using a
+    `query_budget` attribute. If QUERY_BUDGETS_ENFORCED is True (as it is in tests),
+    QueryBudgetExceededError is raised if a request exceeds it. Otherwise, if
+    REQUEST_METRICS_ENABLED is True, a warning is logged.
+    """
+
+    def __init__(self, get_response):
+        """Initialises the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Collects the metrics while the request is handled."""
+        if not (settings.REQUEST_METRICS_ENABLED or settings.QUERY_BUDGETS_ENFORCED or _recorders):
+            return self.get_response(request)
+
+        with collect_request_metrics() as metrics:
+            response = self.get_response(request)
+
+        for recorder in _recorders:
+            recorder.append(metrics)
+
+        if settings.REQUEST_METRICS_ENABLED:
+            logger.info(
+                f'{request.method} {request.path}: {metrics.db_queries} queries, '
+                f'{metrics.cache_calls} cache calls, '
+                f'{metrics.opensearch_requests} OpenSearch requests',
+                extra=metrics.get_log_fields(),
+            )
+            response['Server-Timing'] = metrics.get_server_timing_header()
+
+        self._check_query_budget(request, metrics)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Stores the query budget of the view (if it has one) for the request."""
+        view_class = getattr(view_func, 'cls', None)
+        request.query_budget = getattr(view_class, 'query_budget', None)
+
+    def _check_query_budget(self, request, metrics):
+        query_budget = getattr(request, 'query_budget', None)
+        if query_budget is None or metrics.db_queries <= query_budget:
+            return
+
+        message = (
+            f'{request.method} {request.path} made {metrics.db_queries} database queries, '
+            f'which exceeds its query budget of {query_budget}'
+        )
+        if settings.QUERY_BUDGETS_ENFORCED:
+            raise QueryBudgetExceededError(message)
+        logger.warning(message)
+
+
+@contextmanager
+def collect_request_metrics():
+    """Collects metrics for the code run in the context.
+
+    :yields: the RequestMetrics being collected
+    """
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_db_execute_wrapper))
+            for cache in caches.all():
+                _instrument_cache(cache)
+
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+@contextmanager
+def record_request_metrics():
+    """Records the metrics of requests handled while in the context.
+
+    This is intended for tests (see the request_metrics pytest fixture).
+
+    :yields: a list that the RequestMetrics of each request are appended to
+    """
+    recorder = []
+    _recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorders.remove(recorder)
+
+
+def record_opensearch_request(duration):
+    """Records an OpenSearch request for the request currently being handled (if there is one)."""
+    metrics = _current_metrics.get()
+    if metrics:
+        metrics.opensearch_requests += 1
+        metrics.opensearch_duration += duration
+
+
+def _db_execute_wrapper(execute, sql, params, many, context):
+    start_time = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics = _current_metrics.get()
+        # Savepoints are excluded, as they depend on whether the request is in a transaction
+        # already (as it is in tests)
+        if metrics and not _SAVEPOINT_SQL_PATTERN.match(sql):
+            metrics.db_queries += 1
+            metrics.db_duration += perf_counter() - start_time
+
+
+def _instrument_cache(cache):
+    """Wraps the methods of a cache instance so that calls are recorded.
+
+    (Cache instances are per thread, so this only needs to happen once per instance.)
+    """
+    if getattr(cache, '_request_metrics_instrumented', False):
+        return
+
+    for method_name in INSTRUMENTED_CACHE_METHODS:
+        setattr(cache, method_name, _record_cache_call(getattr(cache, method_name)))
+    cache._request_metrics_instrumented = True
+
+
+def _record_cache_call(method):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        metrics = _current_metrics.get()
+        if not metrics or metrics._in_cache_call:
+            return method(*args, **kwargs)
+
+        metrics._in_cache_call = True
+        start_time = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics._in_cache_call = False
+            metrics.cache_calls += 1
+            metrics.cache_duration += perf_counter() - start_time
+
+    return wrapper
+
+
+def _to_ms(duration):
+    return round(duration * 1000, 1)
@@ -0,0 +1,427 @@
+import json
+import random
+from datetime import timedelta
+from io import StringIO
+from logging import getLogger
+
+from django.contrib.auth.hashers import make_password
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import AutoField, JSONField
+from django.utils.timezone import now
+from faker import Faker
+
+from datahub.company.models import Advisor, Company, Contact, OneListTier
+from datahub.core import constants
+from datahub.feature_flag.models import UserFeatureFlag
+from datahub.interaction.models import (
+    CommunicationChannel,
+    Interaction,
+    InteractionDITParticipant,
+)
+from datahub.metadata.models import (
+    BusinessType,
+    Country,
+    EmployeeRange,
+    Sector,
+    Service,
+    Team,
+    TurnoverRange,
+    UKRegion,
+)
+from datahub.reminder import EXPORT_NO_RECENT_INTERACTION_REMINDERS_FEATURE_FLAG_NAME
+from datahub.reminder.models import NoRecentExportInteractionSubscription
+
+logger = getLogger(__name__)
+
+# Approximate volumes in production in February 2024, which are generated with a scale of 1
+PRODUCTION_NUM_ADVISERS = 18_000
+PRODUCTION_NUM_COMPANIES = 500_000
+
+DEFAULT_SCALE = 0.01
+DEFAULT_CONTACTS_PER_COMPANY = 2
+DEFAULT_INTERACTIONS_PER_COMPANY = 5
+DEFAULT_BATCH_SIZE = 10_000
+
+GLOBAL_HEADQUARTERS_PROPORTION = 0.05
+SUBSIDIARY_PROPORTION = 0.1
+ARCHIVED_PROPORTION = 0.03
+NON_UK_PROPORTION = 0.15
+REMINDER_DAYS = (30, 60, 90, 180, 365)
+MAX_AGE_IN_DAYS = 10 * 365
+
+# Values are taken from pools of fake values, as generating a new fake value for every field of
+# millions of objects would be slow
+FAKE_VALUE_POOL_SIZE = 1000
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def copy_objects(model, objects, using=DEFAULT_DB_ALIAS):
+    """Inserts unsaved model instances using a single PostgreSQL COPY statement.
+
+    This is considerably faster than bulk_create() for large numbers of objects. However (as
+    with bulk_create()), save() isn't called and signals aren't sent. Also, values of auto fields
+    aren't returned, and values of auto_now and auto_now_add fields are not populated.
+
+    :returns: the number of objects inserted
+    """
+    fields = [
+        field for field in model._meta.local_concrete_fields if not isinstance(field, AutoField)
+    ]
+    connection = connections[using]
+
+    buffer = StringIO()
+    num_objects = 0
+    for obj in objects:
+        values = (
+            _to_copy_value(field, getattr(obj, field.attname), connection) for field in fields
+        )
+        buffer.write('\t'.join(values))
+        buffer.write('\n')
+        num_objects += 1
+
+    if not num_objects:
+        return 0
+
+    buffer.seek(0)
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY {table} ({columns}) FROM STDIN', buffer)
+
+    return num_objects
+
+
+def _to_copy_value(field, value, connection):
+    """Converts a model field value to the PostgreSQL COPY text format."""
+    if value is not None and isinstance(field, JSONField):
+        value = json.dumps(value, cls=field.encoder)
+    elif value is not None:
+        value = field.get_db_prep_save(value, connection)
+
+    if value is None:
+        return r'\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, list | tuple):
+        value = _to_array_literal(value)
+
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _to_array_literal(values):
+    elements = (
+        '"{0}"'.format(str(value).replace('\\', '\\\\').replace('"', '\\"')) for value in values
+    )
+    return '{{{0}}}'.format(','.join(elements))
+
+
+class SyntheticDataGenerator:
+    """Generates large volumes of realistic, referentially consistent synthetic data.
+
+    Advisers, companies (including global headquarters, subsidiaries and archived companies),
+    contacts and interactions (with their contacts and adviser participants) are generated using
+    the metadata already in the database, and are saved using COPY. Account owners of One List
+    companies are also subscribed to no recent export interaction reminders.
+
+    The number of contacts and interactions per company follows a long-tailed distribution (so
+    that, as in production, most companies have a few and some have many).
+
+    Search signals aren't triggered, so the search indexes must be updated afterwards (e.g.
+    using the sync_search management command).
+    """
+
+    def __init__(
+        self,
+        scale=DEFAULT_SCALE,
+        contacts_per_company=DEFAULT_CONTACTS_PER_COMPANY,
+        interactions_per_company=DEFAULT_INTERACTIONS_PER_COMPANY,
+        batch_size=DEFAULT_BATCH_SIZE,
+        seed=None,
+    ):
+        """Initialises the generator.
+
+        :param scale: the volume to generate relative to production (1 generates approximately
+            the same number of advisers and companies as production)
+        :param contacts_per_company: the mean number of contacts per company
+        :param interactions_per_company: the mean number of interactions per company
+        :param batch_size: the number of companies to generate (and save) at a time
+        :param seed: seed for the random number generators, to generate the same values each time
+        """
+        self.num_advisers = max(1, round(PRODUCTION_NUM_ADVISERS * scale))
+        self.num_companies = max(1, round(PRODUCTION_NUM_COMPANIES * scale))
+        self.contacts_per_company = contacts_per_company
+        self.interactions_per_company = interactions_per_company
+        self.batch_size = batch_size
+        self.random = random.Random(seed)
+        self.faker = Faker('en_GB')
+        self.faker.seed_instance(seed)
+        self.now = now()
+
+    def generate(self):
+        """Generates and saves the data in a single transaction.
+
+        :returns: dict of the number of objects saved for each model
+        """
+        counts = {}
+
+        with transaction.atomic():
+            self._load_metadata_ids()
+            self._create_fake_value_pools()
+
+            advisers = self._generate_advisers()
+            counts[Advisor] = copy_objects(Advisor, advisers)
+            self.adviser_ids = [adviser.pk for adviser in advisers]
+            self.team_ids_by_adviser_id = {adviser.pk: adviser.dit_team_id for adviser in advisers}
+            self.global_headquarters_ids = []
+            self.account_owner_ids = set()
+
+            for start in range(0, self.num_companies, self.batch_size):
+                num_companies = min(self.batch_size, self.num_companies - start)
+                for model, batch_count in self._generate_company_batch(num_companies).items():
+                    counts[model] = counts.get(model, 0) + batch_count
+
+                logger.info(f'{counts[Company]} of {self.num_companies} companies generated')
+
+            counts[NoRecentExportInteractionSubscription] = self._generate_subscriptions()
+
+        return counts
+
+    def _load_metadata_ids(self):
+        self.business_type_ids = _get_ids(BusinessType)
+        self.communication_channel_ids = _get_ids(CommunicationChannel)
+        self.employee_range_ids = _get_ids(EmployeeRange)
+        self.sector_ids = _get_ids(Sector)
+        self.service_ids = _get_ids(Service.objects.filter(children__isnull=True))
+        self.team_ids = _get_ids(Team)
+        self.turnover_range_ids = _get_ids(TurnoverRange)
+        self.uk_region_ids = _get_ids(UKRegion)
+        self.one_list_tier_ids = _get_ids(OneListTier)
+        self.themes = [theme for theme in Interaction.Theme.values if theme]
+        self.non_uk_country_ids = _get_ids(
+            Country.objects.exclude(pk=constants.Country.united_kingdom.value.id),
+        )
+
+    def _create_fake_value_pools(self):
+        faker = self.faker
+        self.first_names = [faker.first_name() for _ in range(FAKE_VALUE_POOL_SIZE)]
+        self.last_names = [faker.last_name() for _ in range(FAKE_VALUE_POOL_SIZE)]
+        self.company_names = [faker.company() for _ in range(FAKE_VALUE_POOL_SIZE)]
+        self.street_addresses = [faker.street_address() for _ in range(FAKE_VALUE_POOL_SIZE)]
+        self.towns = [faker.city() for _ in range(FAKE_VALUE_POOL_SIZE)]
+        self.postcodes = [faker.postcode() for _ in range(FAKE_VALUE_POOL_SIZE)]
+        self.job_titles = [faker.job()[:100] for _ in range(FAKE_VALUE_POOL_SIZE)]
+        self.sentences = [faker.sentence(nb_words=8) for _ in range(FAKE_VALUE_POOL_SIZE)]
+        self.paragraphs = [faker.paragraph(nb_sentences=5) for _ in range(FAKE_VALUE_POOL_SIZE)]
+
+    def _generate_advisers(self):
+        password = make_password(None)
+        advisers = []
+        for index in range(self.num_advisers):
+            first_name = self.random.choice(self.first_names)
+            last_name = self.random.choice(self.last_names)
+            email = f'{first_name}.{last_name}.{index}@synthetic.example'.lower()
+            advisers.append(
+                Advisor(
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=email,
+                    contact_email=email,
+                    password=password,
+                    dit_team_id=self.random.choice(self.team_ids),
+                    date_joined=self._random_datetime(),
+                ),
+            )
+        return advisers
+
+    def _generate_company_batch(self, num_companies):
+        companies = [self._generate_company() for _ in range(num_companies)]
+        contacts = []
+        interactions = []
+        interaction_companies = []
+        interaction_contacts = []
+        participants = []
+
+        for company in companies:
+            company_contacts = [
+                self._generate_contact(company, primary=index == 0)
+                for index in range(self._random_count(self.contacts_per_company))
+            ]
+            contacts.extend(company_contacts)
+
+            for _ in range(self._random_count(self.interactions_per_company)):
+                interaction = self._generate_interaction(company)
+                interactions.append(interaction)
+                interaction_companies.append(
+                    Interaction.companies.through(
+                        interaction_id=interaction.pk,
+                        company_id=company.pk,
+                    ),
+                )
+                interaction_contacts.extend(
+                    Interaction.contacts.through(
+                        interaction_id=interaction.pk,
+                        contact_id=contact.pk,
+                    )
+                    for contact in self._random_sample(company_contacts, 2)
+                )
+                participants.append(
+                    InteractionDITParticipant(
+                        interaction_id=interaction.pk,
+                        adviser_id=interaction.created_by_id,
+                        team_id=self.team_ids_by_adviser_id[interaction.created_by_id],
+                    ),
+                )
+
+        # Models are saved in dependency order
+        objects_by_model = {
+            Company: companies,
+            Contact: contacts,
+            Interaction: interactions,
+            Interaction.companies.through: interaction_companies,
+            Interaction.contacts.through: interaction_contacts,
+            InteractionDITParticipant: participants,
+        }
+        return {model: copy_objects(model, objects) for model, objects in objects_by_model.items()}
+
+    def _generate_company(self):
+        created_on = self._random_datetime()
+        adviser_id = self.random.choice(self.adviser_ids)
+        is_uk = self.random.random() >= NON_UK_PROPORTION
+        address = {
+            'address_1': self.random.choice(self.street_addresses),
+            'address_town': self.random.choice(self.towns),
+            'address_postcode': self.random.choice(self.postcodes),
+            'address_country_id': (
+                constants.Country.united_kingdom.value.id
+                if is_uk
+                else self.random.choice(self.non_uk_country_ids)
+            ),
+        }
+        company = Company(
+            name=self.random.choice(self.company_names),
+            business_type_id=self.random.choice(self.business_type_ids),
+            sector_id=self.random.choice(self.sector_ids),
+            employee_range_id=self.random.choice(self.employee_range_ids),
+            turnover_range_id=self.random.choice(self.turnover_range_ids),
+            uk_region_id=self.random.choice(self.uk_region_ids) if is_uk else None,
+            company_number=f'{self.random.randrange(10**8):08}' if is_uk else None,
+            duns_number=f'{self.random.randrange(10**9):09}',
+            description=self.random.choice(self.paragraphs),
+            created_on=created_on,
+            modified_on=created_on,
+            created_by_id=adviser_id,
+            modified_by_id=adviser_id,
+            **address,
+            **{f'registered_{field}': value for field, value in address.items()},
+        )
+
+        company_type = self.random.random()
+        if company_type < GLOBAL_HEADQUARTERS_PROPORTION:
+            company.headquarter_type_id = constants.HeadquarterType.ghq.value.id
+            company.one_list_tier_id = self.random.choice(self.one_list_tier_ids)
+            company.one_list_account_owner_id = self.random.choice(self.adviser_ids)
+            self.global_headquarters_ids.append(company.pk)
+            self.account_owner_ids.add(company.one_list_account_owner_id)
+        elif self.global_headquarters_ids and company_type < (
+            GLOBAL_HEADQUARTERS_PROPORTION + SUBSIDIARY_PROPORTION
+        ):
+            company.global_headquarters_id = self.random.choice(self.global_headquarters_ids)
+
+        if self.random.random() < ARCHIVED_PROPORTION:
+            company.archived = True
+            company.archived_on = self._random_datetime(after=created_on)
+            company.archived_by_id = adviser_id
+            company.archived_reason = 'Company is dissolved'
+
+        return company
+
+    def _generate_contact(self, company, primary):
+        first_name = self.random.choice(self.first_names)
+        last_name = self.random.choice(self.last_names)
+        created_on = self._random_datetime(after=company.created_on)
+        return Contact(
+            company_id=company.pk,
+            first_name=first_name,
+            last_name=last_name,
+            job_title=self.random.choice(self.job_titles),
+            email=f'{first_name}.{last_name}@synthetic.example'.lower(),
+            full_telephone_number=f'+44 7{self.random.randrange(10**9):09}',
+            primary=primary,
+            created_on=created_on,
+            modified_on=created_on,
+            created_by_id=company.created_by_id,
+            modified_by_id=company.created_by_id,
+        )
+
+    def _generate_interaction(self, company):
+        date = self._random_datetime(after=company.created_on)
+        adviser_id = self.random.choice(self.adviser_ids)
+        return Interaction(
+            kind=Interaction.Kind.INTERACTION,
+            status=Interaction.Status.COMPLETE,
+            theme=self.random.choice(self.themes),
+            company_id=company.pk,
+            date=date,
+            subject=self.random.choice(self.sentences),
+            notes=self.random.choice(self.paragraphs),
+            service_id=self.random.choice(self.service_ids),
+            communication_channel_id=self.random.choice(self.communication_channel_ids),
+            was_policy_feedback_provided=False,
+            created_on=date,
+            modified_on=date,
+            created_by_id=adviser_id,
+            modified_by_id=adviser_id,
+        )
+
+    def _generate_subscriptions(self):
+        """Subscribes account owners to no recent export interaction reminders.
+
+        (The reminders are only generated for advisers with the related feature flag.)
+        """
+        feature_flag, _ = UserFeatureFlag.objects.get_or_create(
+            code=EXPORT_NO_RECENT_INTERACTION_REMINDERS_FEATURE_FLAG_NAME,
+            defaults={'is_active': True},
+        )
+        adviser_ids = sorted(self.account_owner_ids)
+        copy_objects(
+            Advisor.features.through,
+            (
+                Advisor.features.through(advisor_id=adviser_id, userfeatureflag_id=feature_flag.pk)
+                for adviser_id in adviser_ids
+            ),
+        )
+        return copy_objects(
+            NoRecentExportInteractionSubscription,
+            (
+                NoRecentExportInteractionSubscription(
+                    adviser_id=adviser_id,
+                    reminder_days=self._random_sample(REMINDER_DAYS, 3),
+                )
+                for adviser_id in adviser_ids
+            ),
+        )
+
+    def _random_count(self, mean):
+        """Returns a random number of related objects from a long-tailed distribution."""
+        if not mean:
+            return 0
+        return round(self.random.expovariate(1 / mean))
+
+    def _random_sample(self, objects, max_size):
+        return self.random.sample(objects, min(len(objects), self.random.randint(1, max_size)))
+
+    def _random_datetime(self, after=None):
+        earliest = after or self.now - timedelta(days=MAX_AGE_IN_DAYS)
+        return earliest + (self.now - earliest) * self.random.random()
+
+
+def _get_ids(model_or_queryset):
+    queryset = (
+        model_or_queryset._default_manager.all()
+        if isinstance(model_or_queryset, type)
+        else model_or_queryset
+    )
+    if 'disabled_on' in {field.name for field in queryset.model._meta.get_fields()}:
+        queryset = queryset.filter(disabled_on__isnull=True)
+    return list(queryset.values_list('pk', flat=True))
@@ -6,6 +6,7 @@ from datahub.core.test.support.views import (
     MultiAddressModelViewset,
     MyDisableableModelViewset,
     PaasIPView,
+    QueryBudgetView,
     max_upload_size_view,
 )
 
@@ -54,6 +55,11 @@ urlpatterns = [
         PaasIPView.as_view(),
         name='test-paas-ip',
     ),
+    path(
+        'test-query-budget/',
+        QueryBudgetView.as_view(),
+        name='test-query-budget',
+    ),
     path(
         'test-max-upload-size/',
         max_upload_size_view,
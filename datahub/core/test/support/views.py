@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.template.response import TemplateResponse
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -45,6 +46,21 @@ class MultiAddressModelViewset(CoreViewSet):
     queryset = MultiAddressModel.objects.all()
 
 
+class QueryBudgetView(APIView):
+    """View with a query budget that makes the number of queries in the query string."""
+
+    authentication_classes = ()
+    permission_classes = ()
+    query_budget = 2
+
+    def get(self, request):
+        """Makes the requested number of queries and a cache call."""
+        for _ in range(int(request.query_params.get('queries', 0))):
+            MyDisableableModel.objects.exists()
+        cache.get('query-budget-view')
+        return Response({})
+
+
 class HawkViewWithoutScope(HawkResponseSigningMixin, APIView):
     """View using Hawk authentication."""
 
@@ -0,0 +1,180 @@
+import json
+
+import boto3
+import pytest
+from django.core.management import CommandError, call_command
+from moto import mock_aws
+
+from datahub.company.models import Advisor
+from datahub.company.test.factories import CompanyFactory
+from datahub.company_activity.models import StovaEvent
+from datahub.core.benchmark import (
+    BENCHMARK_USER_EMAIL,
+    NUM_INGESTION_RECORDS,
+    BenchmarkResult,
+    find_regressions,
+    run_benchmarks,
+)
+from datahub.ingest.constants import AWS_REGION, S3_BUCKET_NAME
+from datahub.interaction.test.factories import CompanyInteractionFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _summary(name='endpoint.example', p50_ms=100, queries=5, **kwargs):
+    return {'name': name, 'p50_ms': p50_ms, 'queries': queries, **kwargs}
+
+
+class TestRunBenchmarks:
+    """Tests for run_benchmarks()."""
+
+    @pytest.mark.parametrize(
+        'name',
+        [
+            'endpoint.company.detail',
+            'endpoint.dataset.companies',
+            'endpoint.activity_stream.interactions',
+            'task.reminders',
+        ],
+    )
+    def test_records_measurements(self, name):
+        """Test that latency, throughput and query counts are recorded for each iteration."""
+        company = CompanyFactory()
+        CompanyInteractionFactory.create_batch(2, company=company)
+
+        (result,) = run_benchmarks([name], iterations=3)
+
+        assert result.error is None
+        assert len(result.durations) == len(result.query_counts) == 3
+        summary = result.summarise()
+        assert summary['iterations'] == 3
+        assert summary['p50_ms'] <= summary['p95_ms'] <= summary['max_ms']
+        assert summary['iterations_per_second'] > 0
+
+        if name.startswith('endpoint.'):
+            assert summary['queries'] > 0
+
+    def test_only_runs_benchmarks_with_matching_names(self):
+        """Test that benchmarks can be selected using prefixes of their names."""
+        CompanyFactory()
+
+        results = run_benchmarks(['endpoint.dataset.'], iterations=1)
+
+        assert [result.name for result in results] == [
+            'endpoint.dataset.companies',
+            'endpoint.dataset.contacts',
+            'endpoint.dataset.interactions',
+        ]
+
+    def test_records_errors(self):
+        """Test that an error is recorded if a benchmark can't be run."""
+        (result,) = run_benchmarks(['endpoint.company.detail'], iterations=1)
+
+        assert result.error == "BenchmarkError('There are no companies')"
+        assert result.summarise() == {
+            'name': 'endpoint.company.detail',
+            'error': result.error,
+        }
+
+    @mock_aws
+    def test_ingestion_is_rolled_back_after_each_iteration(self):
+        """Test that ingested records are rolled back so that each iteration does the same work."""
+        boto3.client('s3', AWS_REGION).create_bucket(
+            Bucket=S3_BUCKET_NAME,
+            CreateBucketConfiguration={'LocationConstraint': AWS_REGION},
+        )
+
+        (result,) = run_benchmarks(['task.ingestion'], iterations=2)
+
+        assert result.error is None
+        assert result.item_counts == [NUM_INGESTION_RECORDS, NUM_INGESTION_RECORDS]
+        assert not StovaEvent.objects.exists()
+
+
+class TestFindRegressions:
+    """Tests for find_regressions()."""
+
+    def test_finds_slower_benchmarks_and_more_queries(self):
+        """Test that increases in latency above the threshold and in queries are regressions."""
+        baseline_summaries = [
+            _summary('endpoint.slower', p50_ms=100),
+            _summary('endpoint.similar', p50_ms=100),
+            _summary('endpoint.more_queries', queries=5),
+        ]
+        summaries = [
+            _summary('endpoint.slower', p50_ms=150),
+            _summary('endpoint.similar', p50_ms=110),
+            _summary('endpoint.more_queries', queries=6),
+            _summary('endpoint.new', p50_ms=1000),
+        ]
+
+        assert find_regressions(summaries, baseline_summaries, threshold=0.2) == [
+            'endpoint.slower: median latency increased from 100 ms to 150 ms',
+            'endpoint.more_queries: queries increased from 5 to 6',
+        ]
+
+    def test_ignores_failed_benchmarks(self):
+        """Test that benchmarks that failed are not compared."""
+        summaries = [{'name': 'endpoint.example', 'error': 'Error'}]
+
+        assert find_regressions(summaries, [_summary()]) == []
+
+
+def test_summarise_uses_items_for_throughput():
+    """Test that the throughput of items is calculated from the total duration."""
+    result = BenchmarkResult(
+        'task.example',
+        durations=[0.5, 1.5],
+        query_counts=[3, 4],
+        item_counts=[100, 100],
+    )
+
+    summary = result.summarise()
+
+    assert summary['mean_ms'] == 1000
+    assert summary['iterations_per_second'] == 1
+    assert summary['items_per_second'] == 100
+    assert summary['queries'] == 4
+
+
+class TestRunBenchmarksCommand:
+    """Tests for the run_benchmarks management command."""
+
+    def test_saves_results(self, tmp_path, capsys):
+        """Test that the results are output and saved."""
+        CompanyFactory()
+        output_path = tmp_path / 'results.json'
+
+        call_command(
+            'run_benchmarks',
+            'endpoint.company.detail',
+            iterations=1,
+            output=str(output_path),
+        )
+
+        (summary,) = json.loads(output_path.read_text())
+        assert summary['name'] == 'endpoint.company.detail'
+        assert 'name=endpoint.company.detail, p50_ms=' in capsys.readouterr().out
+
+    def test_raises_error_if_there_are_regressions(self, tmp_path):
+        """Test that an error is raised if results have regressed compared with the baseline."""
+        CompanyFactory()
+        baseline_path = tmp_path / 'baseline.json'
+        baseline_path.write_text(
+            json.dumps([_summary('endpoint.company.detail', p50_ms=0, queries=0)]),
+        )
+
+        with pytest.raises(CommandError, match='endpoint.company.detail: queries increased'):
+            call_command(
+                'run_benchmarks',
+                'endpoint.company.detail',
+                iterations=1,
+                baseline=str(baseline_path),
+            )
+
+    def test_benchmark_user_is_reused(self):
+        """Test that running the benchmarks again doesn't create another user."""
+        call_command('run_benchmarks', 'endpoint.company.detail', iterations=1)
+        call_command('run_benchmarks', 'endpoint.company.detail', iterations=1)
+
+        assert Advisor.objects.filter(email=BENCHMARK_USER_EMAIL).count() == 1
@@ -0,0 +1,120 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+
+from datahub.core.request_metrics import (
+    QueryBudgetExceededError,
+    RequestMetrics,
+    collect_request_metrics,
+)
+from datahub.core.test.support.models import MyDisableableModel
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.urls('datahub.core.test.support.urls'),
+]
+
+
+class TestRequestMetricsMiddleware:
+    """Tests for RequestMetricsMiddleware."""
+
+    def test_records_metrics(self, client, request_metrics):
+        """Test that the metrics of each request are recorded by the request_metrics fixture."""
+        client.get(reverse('test-query-budget'), {'queries': 1})
+        client.get(reverse('test-query-budget'), {'queries': 2})
+
+        assert [metrics.db_queries for metrics in request_metrics] == [1, 2]
+        assert [metrics.cache_calls for metrics in request_metrics] == [1, 1]
+        assert request_metrics[-1].db_duration > 0
+
+    def test_raises_error_if_query_budget_exceeded(self, client):
+        """Test that an error is raised if a view exceeds its query budget in tests."""
+        with pytest.raises(QueryBudgetExceededError, match='exceeds its query budget of 2'):
+            client.get(reverse('test-query-budget'), {'queries': 3})
+
+    def test_logs_warning_if_query_budget_exceeded_and_not_enforced(
+        self,
+        client,
+        settings,
+        caplog,
+    ):
+        """Test that a warning is logged if budgets aren't enforced and a view exceeds its budget."""
+        caplog.set_level('WARNING')
+        settings.REQUEST_METRICS_ENABLED = True
+        settings.QUERY_BUDGETS_ENFORCED = False
+
+        response = client.get(reverse('test-query-budget'), {'queries': 3})
+
+        assert response.status_code == 200
+        assert 'made 3 database queries, which exceeds its query budget of 2' in caplog.text
+
+    def test_logs_metrics_and_adds_header_if_enabled(self, client, settings, caplog):
+        """Test that the metrics are logged and returned in a header if enabled."""
+        caplog.set_level('INFO', logger='datahub.core.request_metrics')
+        settings.REQUEST_METRICS_ENABLED = True
+
+        response = client.get(reverse('test-query-budget'), {'queries': 2})
+
+        assert response['Server-Timing'].startswith('db;dur=')
+        assert 'desc="2 queries"' in response['Server-Timing']
+        assert 'desc="1 calls"' in response['Server-Timing']
+        (record,) = [
+            record for record in caplog.records if record.name == 'datahub.core.request_metrics'
+        ]
+        assert record.getMessage() == (
+            'GET /test-query-budget/: 2 queries, 1 cache calls, 0 OpenSearch requests'
+        )
+        assert record.db_query_count == 2
+        assert record.cache_call_count == 1
+
+    def test_does_not_collect_metrics_if_disabled(self, client, settings):
+        """Test that no metrics are collected if disabled and budgets aren't enforced."""
+        settings.QUERY_BUDGETS_ENFORCED = False
+
+        with mock.patch('datahub.core.request_metrics.collect_request_metrics') as mock_collect:
+            response = client.get(reverse('test-query-budget'), {'queries': 3})
+
+        assert response.status_code == 200
+        assert 'Server-Timing' not in response
+        mock_collect.assert_not_called()
+
+
+class TestCollectRequestMetrics:
+    """Tests for collect_request_metrics()."""
+
+    def test_counts_nested_cache_calls_once(self):
+        """Test that cache calls made by other cache methods aren't counted separately."""
+        with collect_request_metrics() as metrics:
+            cache.get_or_set('test-key', 'value')
+            cache.get_many(['test-key', 'other-key'])
+
+        assert metrics.cache_calls == 2
+
+    def test_does_not_record_outside_of_context(self):
+        """Test that queries and cache calls outside of the context are not recorded."""
+        with collect_request_metrics() as metrics:
+            MyDisableableModel.objects.exists()
+
+        MyDisableableModel.objects.exists()
+        cache.get('test-key')
+
+        assert metrics.db_queries == 1
+        assert metrics.cache_calls == 0
+        assert not connection.execute_wrappers
+
+
+def test_get_log_fields():
+    """Test that durations are converted to milliseconds."""
+    metrics = RequestMetrics(db_queries=2, db_duration=0.01234, opensearch_requests=1)
+
+    assert metrics.get_log_fields() == {
+        'db_query_count': 2,
+        'db_duration_ms': 12.3,
+        'cache_call_count': 0,
+        'cache_duration_ms': 0,
+        'opensearch_request_count': 1,
+        'opensearch_duration_ms': 0,
+    }
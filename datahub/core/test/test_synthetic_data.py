@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.core.management import call_command
+
+from datahub.company.models import Advisor, Company, Contact
+from datahub.company.test.factories import AdviserFactory
+from datahub.core.synthetic_data import SyntheticDataGenerator, copy_objects
+from datahub.feature_flag.utils import is_user_feature_flag_active
+from datahub.interaction.models import Interaction, InteractionDITParticipant
+from datahub.interaction.test.factories import CompanyInteractionFactory
+from datahub.reminder import EXPORT_NO_RECENT_INTERACTION_REMINDERS_FEATURE_FLAG_NAME
+from datahub.reminder.models import NoRecentExportInteractionSubscription
+
+pytestmark = pytest.mark.django_db
+
+
+class TestCopyObjects:
+    """Tests for copy_objects()."""
+
+    def test_inserts_objects(self):
+        """Test that values of various types (including ones that need escaping) are saved."""
+        adviser = AdviserFactory()
+        created_on = datetime(2020, 1, 2, 3, 4, 5, 678912, tzinfo=timezone.utc)
+        companies = [
+            Company(
+                name='Tab\tnewline\nbackslash\\ Ltd',
+                trading_names=['Quote " Ltd', 'Comma, Ltd'],
+                created_on=created_on,
+                created_by_id=adviser.pk,
+                description=None,
+            ),
+            Company(name='Archived Ltd', archived=True, description=''),
+        ]
+
+        assert copy_objects(Company, companies) == 2
+
+        saved_company = Company.objects.get(pk=companies[0].pk)
+        assert saved_company.name == 'Tab\tnewline\nbackslash\\ Ltd'
+        assert saved_company.trading_names == ['Quote " Ltd', 'Comma, Ltd']
+        assert saved_company.created_on == created_on
+        assert saved_company.created_by == adviser
+        assert saved_company.description is None
+        assert not saved_company.archived
+
+        saved_company = Company.objects.get(pk=companies[1].pk)
+        assert saved_company.archived
+        assert saved_company.description == ''
+
+    def test_saves_json_and_auto_fields(self):
+        """Test that JSON fields are saved, and that auto fields are populated by the database."""
+        contact = Contact(
+            first_name='Jo',
+            last_name='Bloggs',
+            email='jo@example.com',
+            primary=True,
+            consent_data=[{'topic': 'example', 'consent': True}],
+        )
+        copy_objects(Contact, [contact])
+        interaction = CompanyInteractionFactory()
+        participant = InteractionDITParticipant(
+            interaction_id=interaction.pk,
+            adviser_id=AdviserFactory().pk,
+        )
+
+        copy_objects(InteractionDITParticipant, [participant])
+
+        assert Contact.objects.get(pk=contact.pk).consent_data == contact.consent_data
+        assert interaction.dit_participants.count() == 2
+
+    def test_does_nothing_if_there_are_no_objects(self):
+        """Test that nothing is inserted if there are no objects."""
+        assert copy_objects(Company, []) == 0
+
+
+class TestSyntheticDataGenerator:
+    """Tests for SyntheticDataGenerator."""
+
+    def test_generates_consistent_data(self):
+        """Test that the requested volumes of related objects are generated."""
+        num_advisers_before = Advisor.objects.count()
+        generator = SyntheticDataGenerator(
+            scale=0.0002,
+            contacts_per_company=3,
+            interactions_per_company=4,
+            batch_size=30,
+            seed=1,
+        )
+
+        counts = generator.generate()
+
+        assert Advisor.objects.count() - num_advisers_before == counts[Advisor] == 4
+        assert Company.objects.count() == counts[Company] == 100
+        assert Contact.objects.count() == counts[Contact]
+        assert Interaction.objects.count() == counts[Interaction]
+        assert InteractionDITParticipant.objects.count() == counts[Interaction]
+        assert Interaction.companies.through.objects.count() == counts[Interaction]
+        assert 150 < counts[Contact] < 450
+        assert 200 < counts[Interaction] < 600
+
+        interaction = Interaction.objects.filter(contacts__isnull=False).first()
+        assert set(interaction.contacts.values_list('company', flat=True)) == {
+            interaction.company_id,
+        }
+        assert list(interaction.companies.all()) == [interaction.company]
+        assert interaction.dit_participants.get().team == interaction.created_by.dit_team
+        assert Company.objects.filter(global_headquarters__isnull=False).exists()
+
+        subscriptions = NoRecentExportInteractionSubscription.objects.all()
+        assert len(subscriptions) == counts[NoRecentExportInteractionSubscription] > 0
+        assert all(
+            is_user_feature_flag_active(
+                EXPORT_NO_RECENT_INTERACTION_REMINDERS_FEATURE_FLAG_NAME,
+                subscription.adviser,
+            )
+            for subscription in subscriptions
+        )
+
+    def test_generates_no_relations_if_means_are_zero(self):
+        """Test that companies can be generated without contacts and interactions."""
+        counts = SyntheticDataGenerator(
+            scale=0.0001,
+            contacts_per_company=0,
+            interactions_per_company=0,
+        ).generate()
+
+        assert counts[Company] == 50
+        assert counts[Contact] == counts[Interaction] == 0
+
+
+def test_command_generates_data(caplog):
+    """Test that the generate_synthetic_data command generates data and logs the volumes."""
+    caplog.set_level('INFO')
+
+    call_command('generate_synthetic_data', scale=0.0001, seed=1)
+
+    assert Company.objects.count() == 50
+    assert 'company.Company: 50 generated' in caplog.text
@@ -1,7 +1,7 @@
-from dateutil.parser import parse as dateutil_parse
+from datetime import datetime
 
 from datahub.investment.project.proposition.models import PropositionStatus
-from datahub.investment.project.report.spi import SPIReport
+from datahub.investment.project.report.spi import SPIReport, format_date
 
 
 class SPIReportFormatter:
@@ -55,9 +55,9 @@ def proposition_formatter(propositions):
     """Returns a list of propositions with selected fields."""
     return [
         {
-            'deadline': dateutil_parse(proposition['deadline']).strftime('%Y-%m-%d'),
+            'deadline': datetime.fromisoformat(proposition['deadline']).strftime('%Y-%m-%d'),
             'status': proposition['status'],
-            'modified_on': dateutil_parse(proposition['modified_on']).isoformat()
+            'modified_on': format_date(proposition['modified_on'])
             if proposition['status'] != PropositionStatus.ONGOING
             else '',
             'adviser_id': proposition['adviser_id'],
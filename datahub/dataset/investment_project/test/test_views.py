@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import now
 from freezegun import freeze_time
 from rest_framework import status
@@ -409,3 +411,34 @@ class TestInvestmentProjectsActivityDatasetViewSet(BaseDatasetViewTest):
                 'propositions': [],
             },
         ]
+
+    def test_number_of_queries_does_not_depend_on_page_size(
+        self,
+        data_flow_api_client,
+        ist_adviser,
+    ):
+        """Test that SPI data doesn't require additional queries per investment project."""
+        pm_assigned_by = AdviserFactory()
+
+        def _create_won_projects(count):
+            investment_projects = VerifyWinInvestmentProjectFactory.create_batch(
+                count,
+                project_manager=ist_adviser,
+                project_manager_first_assigned_on=now(),
+                project_manager_first_assigned_by=pm_assigned_by,
+            )
+            for investment_project in investment_projects:
+                investment_project.stage_id = InvestmentProjectStageConstant.won.value.id
+                investment_project.save()
+
+        _create_won_projects(1)
+        with CaptureQueriesContext(connection) as single_project_queries:
+            response = data_flow_api_client.get(self.view_url)
+        assert len(response.json()['results']) == 1
+
+        _create_won_projects(5)
+        with CaptureQueriesContext(connection) as multiple_project_queries:
+            response = data_flow_api_client.get(self.view_url)
+        assert len(response.json()['results']) == 6
+
+        assert len(multiple_project_queries) == len(single_project_queries)
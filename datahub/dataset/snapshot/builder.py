@@ -0,0 +1,164 @@
+import gzip
+import json
+from logging import getLogger
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils.timezone import now
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+from datahub.core.boto3_client import get_s3_client
+from datahub.dataset.core.views import BaseFilterDatasetView
+
+logger = getLogger(__name__)
+
+SNAPSHOT_FORMAT = 'ndjson.gz'
+LATEST_MANIFEST_NAME = 'latest.json'
+MANIFEST_NAME = 'manifest.json'
+
+
+def get_snapshot_s3_client():
+    """Get the S3 client used for reading and writing dataset snapshots."""
+    return get_s3_client(settings.DATASET_SNAPSHOT_AWS_REGION)
+
+
+def get_dataset_prefix(dataset_name):
+    """Get the object key prefix under which snapshots of a dataset are stored."""
+    return f'{settings.DATASET_SNAPSHOT_PREFIX}{dataset_name}/'
+
+
+class DatasetSnapshotBuilder:
+    """Builds a snapshot of a dataset and writes it to S3.
+
+    The dataset query of the view is run once using a server-side cursor (via
+    QuerySet.iterator()), instead of page by page as the paginated endpoint is. Rows are
+    written as gzip-compressed newline-delimited JSON partitions of partition_size rows,
+    serialised exactly as the paginated endpoint would serialise them.
+
+    Once all partitions are written, a manifest describing the partitions is written
+    alongside them, and the latest manifest pointer for the dataset is updated.
+    """
+
+    def __init__(
+        self,
+        dataset_name,
+        view_class,
+        s3_client=None,
+        bucket=None,
+        partition_size=None,
+    ):
+        """Initialise the builder."""
+        self.dataset_name = dataset_name
+        self.view_class = view_class
+        self.s3_client = s3_client or get_snapshot_s3_client()
+        self.bucket = bucket or settings.DATASET_SNAPSHOT_BUCKET
+        self.partition_size = partition_size or settings.DATASET_SNAPSHOT_PARTITION_SIZE
+
+    def build(self):
+        """Build the snapshot and return its manifest."""
+        started_on = now()
+        snapshot_id = started_on.strftime('%Y%m%dT%H%M%S')
+        snapshot_prefix = f'{get_dataset_prefix(self.dataset_name)}{snapshot_id}/'
+
+        view = self.view_class()
+        partitions = []
+        for partition_number, rows in enumerate(self._iter_partitions(view)):
+            key = f'{snapshot_prefix}part-{partition_number:05}.{SNAPSHOT_FORMAT}'
+            self._put_partition(key, rows)
+            partitions.append(
+                {
+                    'key': key,
+                    'row_count': len(rows),
+                    'max_modified_on': _get_max_modified_on(rows),
+                },
+            )
+
+        manifest = {
+            'dataset': self.dataset_name,
+            'snapshot_id': snapshot_id,
+            'format': SNAPSHOT_FORMAT,
+            'started_on': started_on.isoformat(),
+            'finished_on': now().isoformat(),
+            'row_count': sum(partition['row_count'] for partition in partitions),
+            'partitions': partitions,
+        }
+        manifest_body = json.dumps(manifest).encode()
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=f'{snapshot_prefix}{MANIFEST_NAME}',
+            Body=manifest_body,
+            ContentType='application/json',
+        )
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=f'{get_dataset_prefix(self.dataset_name)}{LATEST_MANIFEST_NAME}',
+            Body=manifest_body,
+            ContentType='application/json',
+        )
+
+        logger.info(
+            f'Built snapshot {snapshot_id} of {self.dataset_name} with '
+            f'{manifest["row_count"]} rows in {len(partitions)} partitions',
+        )
+        return manifest
+
+    def _get_queryset(self, view):
+        # Snapshots are always of the full dataset, so no query parameters are passed
+        request = Request(HttpRequest())
+        if isinstance(view, BaseFilterDatasetView):
+            queryset = view.get_dataset(request=request)
+        else:
+            view._get_request_params(request)
+            queryset = view.get_dataset()
+        # Use the same ordering as the paginated endpoint so that partitions are stable
+        return queryset.order_by(*view.pagination_class.ordering)
+
+    def _iter_partitions(self, view):
+        rows = []
+        for row in self._get_queryset(view).iterator(chunk_size=self.partition_size):
+            rows.append(row)
+            if len(rows) == self.partition_size:
+                view._enrich_data(rows)
+                yield rows
+                rows = []
+
+        if rows:
+            view._enrich_data(rows)
+            yield rows
+
+    def _put_partition(self, key, rows):
+        body = ''.join(f'{json.dumps(row, cls=JSONEncoder)}\n' for row in rows)
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=gzip.compress(body.encode()),
+            ContentType='application/gzip',
+        )
+
+
+def _get_max_modified_on(rows):
+    modified_on_values = [row['modified_on'] for row in rows if row.get('modified_on')]
+    if not modified_on_values:
+        return None
+    return max(modified_on_values).isoformat()
+
+
+def get_latest_manifest(dataset_name, s3_client=None):
+    """Get the manifest of the most recent snapshot of a dataset.
+
+    Returns None if no snapshot of the dataset has been built yet.
+    """
+    s3_client = s3_client or get_snapshot_s3_client()
+    try:
+        response = s3_client.get_object(
+            Bucket=settings.DATASET_SNAPSHOT_BUCKET,
+            Key=f'{get_dataset_prefix(dataset_name)}{LATEST_MANIFEST_NAME}',
+        )
+    except ClientError as exc:
+        if exc.response['Error']['Code'] == 'NoSuchKey':
+            return None
+        raise
+
+    return json.loads(response['Body'].read())
@@ -0,0 +1,13 @@
+from datahub.dataset.export_wins.views import ExportWinsWinDatasetView
+from datahub.dataset.interaction.views import InteractionsDatasetView
+from datahub.dataset.investment_project.views import InvestmentProjectsDatasetView
+
+# Datasets that are pre-materialised into object storage by the snapshot builder.
+#
+# Keys are used as the dataset name in object keys and in the manifest endpoint URL, so they
+# should match the name of the corresponding paginated dataset endpoint.
+SNAPSHOT_DATASETS = {
+    'interactions-dataset': InteractionsDatasetView,
+    'investment-projects-dataset': InvestmentProjectsDatasetView,
+    'export-wins-win-dataset': ExportWinsWinDatasetView,
+}
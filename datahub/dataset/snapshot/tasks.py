@@ -0,0 +1,29 @@
+from logging import getLogger
+
+from datahub.core.queues.constants import HALF_DAY_IN_SECONDS
+from datahub.core.queues.job_scheduler import job_scheduler
+from datahub.core.queues.scheduler import LONG_RUNNING_QUEUE
+from datahub.dataset.snapshot.builder import DatasetSnapshotBuilder
+from datahub.dataset.snapshot.registry import SNAPSHOT_DATASETS
+
+logger = getLogger(__name__)
+
+
+def schedule_build_dataset_snapshots():
+    """Task that starts sub-tasks to build a snapshot of each registered dataset."""
+    for dataset_name in SNAPSHOT_DATASETS:
+        job = job_scheduler(
+            queue_name=LONG_RUNNING_QUEUE,
+            function=build_dataset_snapshot,
+            function_args=(dataset_name,),
+            job_timeout=HALF_DAY_IN_SECONDS,
+        )
+        logger.info(
+            f'Task {job.id} build_dataset_snapshot scheduled for {dataset_name}',
+        )
+
+
+def build_dataset_snapshot(dataset_name):
+    """Task that builds a snapshot of a single registered dataset."""
+    view_class = SNAPSHOT_DATASETS[dataset_name]
+    return DatasetSnapshotBuilder(dataset_name, view_class).build()
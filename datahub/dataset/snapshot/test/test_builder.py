@@ -0,0 +1,122 @@
+import gzip
+import json
+from datetime import datetime, timezone
+
+import pytest
+from django.conf import settings
+from freezegun import freeze_time
+
+from datahub.dataset.interaction.views import InteractionsDatasetView
+from datahub.dataset.snapshot.builder import DatasetSnapshotBuilder, get_latest_manifest
+from datahub.dataset.snapshot.registry import SNAPSHOT_DATASETS
+from datahub.interaction.test.factories import CompanyInteractionFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def bucket_name():
+    return settings.DATASET_SNAPSHOT_BUCKET
+
+
+def _read_partition(s3_client, key):
+    response = s3_client.get_object(Bucket=settings.DATASET_SNAPSHOT_BUCKET, Key=key)
+    body = gzip.decompress(response['Body'].read()).decode()
+    return [json.loads(line) for line in body.splitlines()]
+
+
+class TestDatasetSnapshotBuilder:
+    """Tests for DatasetSnapshotBuilder."""
+
+    @freeze_time('2025-01-01 02:00:00')
+    def test_writes_partitions_and_manifest(self, s3_client):
+        """Test that rows are written in partitions and a manifest is written for them."""
+        interactions = CompanyInteractionFactory.create_batch(3)
+
+        builder = DatasetSnapshotBuilder(
+            'interactions-dataset',
+            InteractionsDatasetView,
+            s3_client=s3_client,
+            partition_size=2,
+        )
+        manifest = builder.build()
+
+        prefix = f'{settings.DATASET_SNAPSHOT_PREFIX}interactions-dataset/20250101T020000/'
+        assert manifest == {
+            'dataset': 'interactions-dataset',
+            'snapshot_id': '20250101T020000',
+            'format': 'ndjson.gz',
+            'started_on': '2025-01-01T02:00:00+00:00',
+            'finished_on': '2025-01-01T02:00:00+00:00',
+            'row_count': 3,
+            'partitions': [
+                {
+                    'key': f'{prefix}part-00000.ndjson.gz',
+                    'row_count': 2,
+                    'max_modified_on': '2025-01-01T02:00:00+00:00',
+                },
+                {
+                    'key': f'{prefix}part-00001.ndjson.gz',
+                    'row_count': 1,
+                    'max_modified_on': '2025-01-01T02:00:00+00:00',
+                },
+            ],
+        }
+        assert get_latest_manifest('interactions-dataset', s3_client=s3_client) == manifest
+
+        rows = [
+            row
+            for partition in manifest['partitions']
+            for row in _read_partition(s3_client, partition['key'])
+        ]
+        expected_ids = [
+            str(interaction.pk)
+            for interaction in sorted(interactions, key=lambda obj: (obj.created_on, obj.pk))
+        ]
+        assert [row['id'] for row in rows] == expected_ids
+
+    def test_rows_match_paginated_endpoint(self, s3_client, data_flow_api_client):
+        """Test that snapshot rows are serialised in the same way as the dataset endpoint."""
+        with freeze_time(datetime(2025, 1, 1, tzinfo=timezone.utc)):
+            CompanyInteractionFactory()
+
+        builder = DatasetSnapshotBuilder(
+            'interactions-dataset',
+            InteractionsDatasetView,
+            s3_client=s3_client,
+        )
+        manifest = builder.build()
+        rows = _read_partition(s3_client, manifest['partitions'][0]['key'])
+
+        response = data_flow_api_client.get('/v4/dataset/interactions-dataset')
+        assert rows == response.json()['results']
+
+    def test_empty_dataset(self, s3_client):
+        """Test that a manifest without partitions is written for an empty dataset."""
+        builder = DatasetSnapshotBuilder(
+            'interactions-dataset',
+            InteractionsDatasetView,
+            s3_client=s3_client,
+        )
+        manifest = builder.build()
+
+        assert manifest['row_count'] == 0
+        assert manifest['partitions'] == []
+        assert get_latest_manifest('interactions-dataset', s3_client=s3_client) == manifest
+
+    @pytest.mark.parametrize('dataset_name', SNAPSHOT_DATASETS)
+    def test_registered_datasets_can_be_built(self, s3_client, dataset_name):
+        """Test that each registered dataset can be built."""
+        builder = DatasetSnapshotBuilder(
+            dataset_name,
+            SNAPSHOT_DATASETS[dataset_name],
+            s3_client=s3_client,
+        )
+        manifest = builder.build()
+
+        assert manifest['dataset'] == dataset_name
+
+
+def test_get_latest_manifest_without_snapshot(s3_client):
+    """Test that None is returned if a dataset has no snapshot yet."""
+    assert get_latest_manifest('interactions-dataset', s3_client=s3_client) is None
@@ -0,0 +1,46 @@
+from unittest import mock
+
+import pytest
+
+from datahub.dataset.snapshot.registry import SNAPSHOT_DATASETS
+from datahub.dataset.snapshot.tasks import (
+    build_dataset_snapshot,
+    schedule_build_dataset_snapshots,
+)
+
+
+def test_schedule_build_dataset_snapshots(monkeypatch):
+    """Test that a job is scheduled for each registered dataset."""
+    job_scheduler_mock = mock.Mock()
+    monkeypatch.setattr(
+        'datahub.dataset.snapshot.tasks.job_scheduler',
+        job_scheduler_mock,
+    )
+
+    schedule_build_dataset_snapshots()
+
+    assert [call.kwargs['function_args'] for call in job_scheduler_mock.call_args_list] == [
+        (dataset_name,) for dataset_name in SNAPSHOT_DATASETS
+    ]
+    assert all(
+        call.kwargs['function'] is build_dataset_snapshot
+        for call in job_scheduler_mock.call_args_list
+    )
+
+
+@pytest.mark.django_db
+def test_build_dataset_snapshot(monkeypatch):
+    """Test that build_dataset_snapshot builds the snapshot using the registered view."""
+    builder_mock = mock.Mock()
+    monkeypatch.setattr(
+        'datahub.dataset.snapshot.tasks.DatasetSnapshotBuilder',
+        builder_mock,
+    )
+
+    build_dataset_snapshot('interactions-dataset')
+
+    builder_mock.assert_called_once_with(
+        'interactions-dataset',
+        SNAPSHOT_DATASETS['interactions-dataset'],
+    )
+    builder_mock.return_value.build.assert_called_once_with()
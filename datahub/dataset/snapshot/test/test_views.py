@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.conf import settings
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from datahub.dataset.interaction.views import InteractionsDatasetView
+from datahub.dataset.snapshot.builder import DatasetSnapshotBuilder
+from datahub.interaction.test.factories import CompanyInteractionFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def bucket_name():
+    return settings.DATASET_SNAPSHOT_BUCKET
+
+
+@pytest.fixture
+def interactions_snapshot(s3_client):
+    """Builds an interactions snapshot with two partitions modified on different days."""
+    with freeze_time(datetime(2025, 1, 1, tzinfo=timezone.utc)):
+        CompanyInteractionFactory()
+    with freeze_time(datetime(2025, 1, 10, tzinfo=timezone.utc)):
+        CompanyInteractionFactory()
+
+    builder = DatasetSnapshotBuilder(
+        'interactions-dataset',
+        InteractionsDatasetView,
+        s3_client=s3_client,
+        partition_size=1,
+    )
+    return builder.build()
+
+
+def _get_url(dataset_name='interactions-dataset'):
+    return reverse(
+        'api-v4:dataset:dataset-snapshot-manifest',
+        kwargs={'dataset_name': dataset_name},
+    )
+
+
+class TestDatasetSnapshotManifestView:
+    """Tests for DatasetSnapshotManifestView."""
+
+    def test_without_credentials(self, api_client):
+        """Test that making a request without credentials returns an error."""
+        response = api_client.get(_get_url())
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_without_scope(self, hawk_api_client):
+        """Test that making a request without the correct Hawk scope returns an error."""
+        hawk_api_client.set_credentials(
+            'test-id-without-scope',
+            'test-key-without-scope',
+        )
+        response = hawk_api_client.get(_get_url())
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_unknown_dataset(self, data_flow_api_client):
+        """Test that a 404 is returned for a dataset that is not snapshotted."""
+        response = data_flow_api_client.get(_get_url('teams-dataset'))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_without_snapshot(self, data_flow_api_client, s3_client):
+        """Test that a 404 is returned if no snapshot has been built yet."""
+        response = data_flow_api_client.get(_get_url())
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_returns_all_partitions(self, data_flow_api_client, interactions_snapshot):
+        """Test that all partitions of the latest snapshot are returned with download URLs."""
+        response = data_flow_api_client.get(_get_url())
+
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        assert response_data['snapshot_id'] == interactions_snapshot['snapshot_id']
+        assert response_data['row_count'] == 2
+        assert [partition['key'] for partition in response_data['partitions']] == [
+            partition['key'] for partition in interactions_snapshot['partitions']
+        ]
+        assert all(
+            partition['key'] in partition['url'] for partition in response_data['partitions']
+        )
+
+    def test_returns_delta_partitions(self, data_flow_api_client, interactions_snapshot):
+        """Test that only partitions modified after updated_since are returned."""
+        response = data_flow_api_client.get(_get_url(), params={'updated_since': '2025-01-05'})
+
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        assert [partition['max_modified_on'] for partition in response_data['partitions']] == [
+            '2025-01-10T00:00:00+00:00',
+        ]
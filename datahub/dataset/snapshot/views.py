@@ -0,0 +1,68 @@
+from datetime import datetime, time, timezone
+
+from django.conf import settings
+from django.http import Http404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.settings.types import HawkScope
+from datahub.core.auth import PaaSIPAuthentication
+from datahub.core.hawk_receiver import (
+    HawkAuthentication,
+    HawkResponseSigningMixin,
+    HawkScopePermission,
+)
+from datahub.dataset.snapshot.builder import get_latest_manifest, get_snapshot_s3_client
+from datahub.dataset.snapshot.registry import SNAPSHOT_DATASETS
+from datahub.dbmaintenance.utils import parse_date
+
+
+class DatasetSnapshotManifestView(HawkResponseSigningMixin, APIView):
+    """API view that returns the manifest of the latest snapshot of a dataset.
+
+    Each partition in the manifest includes a pre-signed URL it can be downloaded from.
+
+    If the updated_since query parameter is provided, only partitions containing at least
+    one row modified after that date are returned (for datasets that include modified_on).
+    """
+
+    authentication_classes = (PaaSIPAuthentication, HawkAuthentication)
+    permission_classes = (HawkScopePermission,)
+    required_hawk_scope = HawkScope.datasets
+
+    def get(self, request, dataset_name):
+        """Return the manifest of the latest snapshot of the dataset."""
+        if dataset_name not in SNAPSHOT_DATASETS:
+            raise Http404
+
+        s3_client = get_snapshot_s3_client()
+        manifest = get_latest_manifest(dataset_name, s3_client=s3_client)
+        if manifest is None:
+            raise Http404
+
+        partitions = manifest['partitions']
+        updated_since = parse_date(request.GET.get('updated_since'))
+        if updated_since:
+            updated_since_datetime = datetime.combine(updated_since, time.min, tzinfo=timezone.utc)
+            partitions = [
+                partition
+                for partition in partitions
+                if partition['max_modified_on'] is None
+                or datetime.fromisoformat(partition['max_modified_on']) > updated_since_datetime
+            ]
+
+        manifest['partitions'] = [
+            {
+                **partition,
+                'url': s3_client.generate_presigned_url(
+                    ClientMethod='get_object',
+                    Params={
+                        'Bucket': settings.DATASET_SNAPSHOT_BUCKET,
+                        'Key': partition['key'],
+                    },
+                    ExpiresIn=settings.DATASET_SNAPSHOT_URL_EXPIRY_SECONDS,
+                ),
+            }
+            for partition in partitions
+        ]
+        return Response(manifest)
@@ -31,6 +31,7 @@ from datahub.dataset.investment_project.views import (
     InvestmentProjectsDatasetView,
 )
 from datahub.dataset.order.views import OMISDatasetView
+from datahub.dataset.snapshot.views import DatasetSnapshotManifestView
 from datahub.dataset.task.views import TasksDatasetView
 from datahub.dataset.team.views import TeamsDatasetView
 from datahub.dataset.user_event_log.views import UserEventsView
@@ -124,4 +125,9 @@ urlpatterns = [
         HCSATDatasetView.as_view(),
         name='hcsat-dataset',
     ),
+    path(
+        'snapshots/<str:dataset_name>/manifest',
+        DatasetSnapshotManifestView.as_view(),
+        name='dataset-snapshot-manifest',
+    ),
 ]
@@ -1,14 +1,28 @@
 import codecs
 import csv
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import closing
+from itertools import islice
 from logging import getLogger
+from time import perf_counter
 
+import reversion
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
+from django.db import connections
 
+from datahub.core.utils import slice_iterable_into_chunks
 from datahub.documents.utils import get_s3_client_for_bucket
 
 logger = getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 1000
+CHECKPOINT_TIMEOUT_SECS = 7 * 24 * 60 * 60
+
+
+class _ChunkFailedError(Exception):
+    """Raised to roll back a chunk processed with --atomic-chunks."""
+
 
 class CSVBaseCommand(BaseCommand):
     """Base class for db maintenance related commands.
@@ -16,6 +30,16 @@ class CSVBaseCommand(BaseCommand):
     manages basic logging and failures.
     The operation is not atomic and each row is processed individually.
 
+    By default, rows are processed one at a time as the file is streamed. Large files can instead
+    be processed in chunks (using --chunk-size) by passing one or more of:
+
+    - --workers: the number of threads processing chunks concurrently (each thread uses its
+      own database connection)
+    - --atomic-chunks: each chunk is processed in a single transaction and revision, and is
+      rolled back if any of its rows fail
+    - --checkpoint: progress is saved after each chunk so that, if the command is interrupted,
+      running it again with the same arguments resumes from the last completed chunk
+
     Usage:
         class Command(CSVBaseCommand):
             def _process_row(self, row, **options):
@@ -36,6 +60,30 @@ class CSVBaseCommand(BaseCommand):
             default=False,
             help='If True it only simulates the command without saving the changes.',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of threads processing chunks of rows concurrently.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Number of rows in each chunk when processing the file in chunks.',
+        )
+        parser.add_argument(
+            '--atomic-chunks',
+            action='store_true',
+            default=False,
+            help='If True each chunk is processed in a single transaction and revision.',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            action='store_true',
+            default=False,
+            help='If True progress is saved so that an interrupted run can be resumed.',
+        )
 
     def _handle(self, *args, **options):
         """Internal version of the `handle` method.
@@ -54,6 +102,9 @@ class CSVBaseCommand(BaseCommand):
             csvfile = codecs.getreader('utf-8')(response)
             reader = csv.DictReader(csvfile)
 
+            if self._should_process_in_chunks(**options):
+                return self._process_rows_in_chunks(reader, **options)
+
             for row in reader:
                 succeeded = self.process_row(row, **options)
                 result[succeeded] += 1
@@ -67,6 +118,107 @@ class CSVBaseCommand(BaseCommand):
 
         logger.info(f'Finished - succeeded: {result[True]}, failed: {result[False]}')
 
+    def _should_process_in_chunks(self, **options):
+        # options.get() is used as some subclasses don't call super().add_arguments()
+        return (
+            options.get('workers', 1) > 1
+            or options.get('atomic_chunks', False)
+            or options.get('checkpoint', False)
+        )
+
+    def _process_rows_in_chunks(self, reader, **options):
+        """Processes the rows in chunks, using one or more threads.
+
+        :returns: dict with count of records successful and failed updates
+        """
+        result = {True: 0, False: 0}
+        workers = options.get('workers', 1)
+        chunk_size = options.get('chunk_size', DEFAULT_CHUNK_SIZE)
+        checkpoint_key = self._get_checkpoint_key(**options) if options.get('checkpoint') else None
+        start_time = perf_counter()
+
+        start_row = cache.get(checkpoint_key, 0) if checkpoint_key else 0
+        if start_row:
+            logger.info(f'Resuming from row {start_row + 1}')
+
+        chunks = enumerate(
+            slice_iterable_into_chunks(islice(reader, start_row, None), chunk_size),
+        )
+        progress = _ChunkProgress(start_row, checkpoint_key)
+
+        def record_chunk_result(index, num_rows, chunk_result):
+            result[True] += chunk_result[True]
+            result[False] += chunk_result[False]
+            progress.chunk_completed(index, num_rows)
+
+        if workers == 1:
+            for index, chunk in chunks:
+                record_chunk_result(index, len(chunk), self._process_chunk(chunk, **options))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # The number of chunks in memory at once is limited as the file may be large
+                pending = {}
+                for index, chunk in chunks:
+                    if len(pending) >= workers * 2:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            record_chunk_result(*pending.pop(future), future.result())
+
+                    future = executor.submit(self._process_chunk_in_thread, chunk, **options)
+                    pending[future] = (index, len(chunk))
+
+                for future in list(pending):
+                    record_chunk_result(*pending.pop(future), future.result())
+
+        if checkpoint_key:
+            cache.delete(checkpoint_key)
+
+        num_rows = result[True] + result[False]
+        duration = perf_counter() - start_time
+        logger.info(
+            f'Processed {num_rows} rows in {duration:.1f} seconds '
+            f'({num_rows / duration if duration else 0:.1f} rows per second)',
+        )
+        return result
+
+    def _process_chunk_in_thread(self, chunk, **options):
+        try:
+            return self._process_chunk(chunk, **options)
+        finally:
+            # Each thread has its own database connection, which must be closed by that thread
+            connections.close_all()
+
+    def _process_chunk(self, chunk, **options):
+        """Processes a chunk of rows.
+
+        If --atomic-chunks was passed, the whole chunk is rolled back if any of the rows fail
+        (and all rows in the chunk are counted as failed).
+
+        :returns: dict with count of records successful and failed updates
+        """
+        if not options.get('atomic_chunks'):
+            result = {True: 0, False: 0}
+            for row in chunk:
+                result[self.process_row(row, **options)] += 1
+            return result
+
+        try:
+            # Revisions created when processing rows are merged into this one
+            with reversion.create_revision():
+                for row in chunk:
+                    if not self.process_row(row, **options):
+                        raise _ChunkFailedError()
+        except Exception:
+            logger.warning(f'Chunk starting with row {chunk[0]} rolled back')
+            return {True: 0, False: len(chunk)}
+
+        return {True: len(chunk), False: 0}
+
+    def _get_checkpoint_key(self, **options):
+        bucket = options['bucket']
+        object_key = options['object_key']
+        return f'csv-command-checkpoint:{self.__module__}:{bucket}:{object_key}'
+
     def process_row(self, row, **options):
         """Process one single row.
 
@@ -89,3 +241,29 @@ class CSVBaseCommand(BaseCommand):
         :param options: same as the django command options
         """
         raise NotImplementedError()
+
+
+class _ChunkProgress:
+    """Keeps track of the rows processed so that an interrupted run can be resumed.
+
+    As chunks can be completed out of order, the checkpoint is the number of rows up to the
+    first chunk that has not been completed yet.
+    """
+
+    def __init__(self, start_row, checkpoint_key):
+        self.start_row = start_row
+        self.checkpoint_key = checkpoint_key
+        self.next_index = 0
+        self.completed = {}
+
+    def chunk_completed(self, index, num_rows):
+        self.completed[index] = num_rows
+        if index != self.next_index:
+            return
+
+        while self.next_index in self.completed:
+            self.start_row += self.completed.pop(self.next_index)
+            self.next_index += 1
+
+        if self.checkpoint_key:
+            cache.set(self.checkpoint_key, self.start_row, timeout=CHECKPOINT_TIMEOUT_SECS)
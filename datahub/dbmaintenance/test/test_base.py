@@ -0,0 +1,203 @@
+from concurrent.futures import Future
+from io import BytesIO
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from reversion.models import Version
+
+from datahub.company.test.factories import CompanyFactory
+from datahub.core.test_utils import random_obj_for_model
+from datahub.dbmaintenance.management.base import _ChunkProgress
+from datahub.metadata.models import Sector
+
+pytestmark = pytest.mark.django_db
+
+BUCKET = 'test_bucket'
+OBJECT_KEY = 'test_key'
+CHECKPOINT_KEY = (
+    'csv-command-checkpoint:datahub.dbmaintenance.management.commands.update_company_sector:'
+    f'{BUCKET}:{OBJECT_KEY}'
+)
+
+
+class _SynchronousExecutor:
+    """Thread pool executor replacement that runs functions immediately.
+
+    (Threads would not be able to see data created in the test transaction.)
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.fixture
+def synchronous_executor(monkeypatch):
+    """Runs chunks in the current thread without closing the database connection."""
+    monkeypatch.setattr(
+        'datahub.dbmaintenance.management.base.ThreadPoolExecutor',
+        _SynchronousExecutor,
+    )
+    mock_connections = mock.Mock()
+    monkeypatch.setattr('datahub.dbmaintenance.management.base.connections', mock_connections)
+    return mock_connections
+
+
+def _add_csv_response(s3_stubber, csv_content):
+    s3_stubber.add_response(
+        'get_object',
+        {
+            'Body': BytesIO(csv_content.encode(encoding='utf-8')),
+        },
+        expected_params={
+            'Bucket': BUCKET,
+            'Key': OBJECT_KEY,
+        },
+    )
+
+
+@pytest.mark.usefixtures('local_memory_cache')
+class TestCSVBaseCommandInChunks:
+    """Tests for processing CSV files in chunks (using update_company_sector as an example)."""
+
+    @pytest.mark.parametrize(
+        'options',
+        [
+            {'workers': 3},
+            {'workers': 3, 'checkpoint': True},
+            {'atomic_chunks': True},
+        ],
+    )
+    def test_processes_all_rows(self, s3_stubber, synchronous_executor, caplog, options):
+        """Test that all rows are processed and a summary is logged."""
+        caplog.set_level('INFO')
+        sector = random_obj_for_model(Sector)
+        companies = CompanyFactory.create_batch(5, sector_id=None)
+        csv_content = 'id,sector_id\n' + '\n'.join(
+            f'{company.pk},{sector.pk}' for company in companies
+        )
+        _add_csv_response(s3_stubber, csv_content)
+
+        call_command('update_company_sector', BUCKET, OBJECT_KEY, chunk_size=2, **options)
+
+        for company in companies:
+            company.refresh_from_db()
+            assert company.sector == sector
+
+        assert 'Processed 5 rows in ' in caplog.text
+        assert 'Finished - succeeded: 5, failed: 0' in caplog.text
+        assert cache.get(CHECKPOINT_KEY) is None
+
+        if options.get('workers', 1) > 1:
+            synchronous_executor.close_all.assert_called()
+
+    def test_atomic_chunks_are_rolled_back_on_failure(self, s3_stubber, caplog):
+        """Test that a chunk is rolled back if one of its rows fails, and that other chunks
+        are saved with one revision each.
+        """
+        caplog.set_level('INFO')
+        sector = random_obj_for_model(Sector)
+        companies = CompanyFactory.create_batch(4, sector_id=None)
+        csv_content = f"""id,sector_id
+{companies[0].pk},{sector.pk}
+{companies[1].pk},{sector.pk}
+{companies[2].pk},{sector.pk}
+{companies[3].pk},invalid
+"""
+        _add_csv_response(s3_stubber, csv_content)
+
+        call_command(
+            'update_company_sector',
+            BUCKET,
+            OBJECT_KEY,
+            chunk_size=2,
+            atomic_chunks=True,
+        )
+
+        for company in companies:
+            company.refresh_from_db()
+
+        assert [company.sector for company in companies] == [sector, sector, None, None]
+        assert 'rolled back' in caplog.text
+        assert 'Finished - succeeded: 2, failed: 2' in caplog.text
+
+        versions = Version.objects.get_for_object(companies[0])
+        assert versions.count() == 1
+        assert versions[0].revision == Version.objects.get_for_object(companies[1])[0].revision
+        assert not Version.objects.get_for_object(companies[2]).exists()
+
+    def test_resumes_from_checkpoint(self, s3_stubber):
+        """Test that rows before the checkpoint are skipped."""
+        sector = random_obj_for_model(Sector)
+        companies = CompanyFactory.create_batch(4, sector_id=None)
+        csv_content = 'id,sector_id\n' + '\n'.join(
+            f'{company.pk},{sector.pk}' for company in companies
+        )
+        _add_csv_response(s3_stubber, csv_content)
+        cache.set(CHECKPOINT_KEY, 3)
+
+        call_command('update_company_sector', BUCKET, OBJECT_KEY, checkpoint=True)
+
+        for company in companies:
+            company.refresh_from_db()
+
+        assert [company.sector for company in companies] == [None, None, None, sector]
+        assert cache.get(CHECKPOINT_KEY) is None
+
+    def test_saves_checkpoint_after_each_chunk(self, s3_stubber, monkeypatch):
+        """Test that the checkpoint is updated as chunks are completed."""
+        sector = random_obj_for_model(Sector)
+        companies = CompanyFactory.create_batch(5, sector_id=None)
+        csv_content = 'id,sector_id\n' + '\n'.join(
+            f'{company.pk},{sector.pk}' for company in companies
+        )
+        _add_csv_response(s3_stubber, csv_content)
+        mock_cache_set = mock.Mock()
+        monkeypatch.setattr(cache, 'set', mock_cache_set)
+
+        call_command('update_company_sector', BUCKET, OBJECT_KEY, chunk_size=2, checkpoint=True)
+
+        assert [call.args[:2] for call in mock_cache_set.call_args_list] == [
+            (CHECKPOINT_KEY, 2),
+            (CHECKPOINT_KEY, 4),
+            (CHECKPOINT_KEY, 5),
+        ]
+
+    def test_does_not_process_in_chunks_by_default(self, s3_stubber, caplog):
+        """Test that rows are processed one at a time if no chunk options are passed."""
+        caplog.set_level('INFO')
+        company = CompanyFactory(sector_id=None)
+        _add_csv_response(s3_stubber, f'id,sector_id\n{company.pk},\n')
+
+        call_command('update_company_sector', BUCKET, OBJECT_KEY)
+
+        assert 'Processed' not in caplog.text
+        assert 'Finished - succeeded: 1, failed: 0' in caplog.text
+
+
+def test_chunk_progress_only_counts_contiguous_chunks(monkeypatch):
+    """Test that the checkpoint isn't moved past chunks that haven't been completed."""
+    mock_cache_set = mock.Mock()
+    monkeypatch.setattr(cache, 'set', mock_cache_set)
+    progress = _ChunkProgress(10, 'key')
+
+    progress.chunk_completed(1, 5)
+    progress.chunk_completed(2, 5)
+    assert progress.start_row == 10
+    mock_cache_set.assert_not_called()
+
+    progress.chunk_completed(0, 5)
+    assert progress.start_row == 25
+    mock_cache_set.assert_called_once_with('key', 25, timeout=mock.ANY)
@@ -1,11 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
 from logging import getLogger
 
 import mailparser
 import requests
 from django.conf import settings
 from django.utils.timezone import now
+from requests.adapters import HTTPAdapter
 from rest_framework import status
 
+from datahub.core.queues.job_scheduler import job_scheduler
 from datahub.email_ingestion.models import MailboxLogging, MailboxProcessingStatus
 from datahub.interaction.email_processors.processors import InteractionPlainEmailProcessor
 
@@ -20,6 +24,19 @@ def _get_headers(token):
     }
 
 
+@cache
+def _get_session():
+    """Returns the session shared by all requests to Microsoft Graph.
+
+    The connection pool is sized so that each concurrent worker can reuse a connection.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=settings.MAILBOX_INGESTION_MAX_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 def _get_base_url():
     user_email = settings.MAILBOX_INGESTION_EMAIL
     return f'{settings.MAILBOX_INGESTION_GRAPH_URL}users/{user_email}'
@@ -38,22 +55,33 @@ def get_access_token(tenant_id, client_id, client_secret):
 
 
 def read_messages(token):
+    """Yields all messages in the inbox, following @odata.nextLink to read every page."""
     base_url = _get_base_url()
     messages_url = f'{base_url}/mailFolders/Inbox/messages'
+    params = {
+        '$select': 'id',
+        '$top': settings.MAILBOX_INGESTION_PAGE_SIZE,
+    }
 
-    messages_request = requests.get(
-        messages_url,
-        headers=_get_headers(token),
-    )
-    messages = messages_request.json().get('value', [])
-    return messages
+    while messages_url:
+        messages_request = _get_session().get(
+            messages_url,
+            headers=_get_headers(token),
+            params=params,
+        )
+        response_data = messages_request.json()
+        yield from response_data.get('value', [])
+
+        # The next link already includes the query string
+        messages_url = response_data.get('@odata.nextLink')
+        params = None
 
 
 def fetch_message(token, message_id):
     base_url = _get_base_url()
     content_url = f'{base_url}/messages/{message_id}/$value'
 
-    content_request = requests.get(content_url, headers=_get_headers(token))
+    content_request = _get_session().get(content_url, headers=_get_headers(token))
     if content_request.status_code == status.HTTP_200_OK:
         content = content_request.text
         return content
@@ -66,50 +94,90 @@ def delete_message(token, message_id):
     delete_path = '/mailFolders/Inbox/messages/'
     delete_url = f'{base_url}{delete_path}{message_id}'
 
-    delete_request = requests.delete(delete_url, headers=_get_headers(token))
+    delete_request = _get_session().delete(delete_url, headers=_get_headers(token))
     return delete_request.status_code == status.HTTP_204_NO_CONTENT
 
 
 def process_ingestion_emails():
-    """Gets all new mail documents in the bucket and process each message."""
-    processor = InteractionPlainEmailProcessor()
+    """Gets all messages in the mailbox and schedules a task to process each message.
+
+    All pages of the inbox are read before any message is deleted, as deleting messages
+    would otherwise shift the pages that are still to be read.
 
+    Messages are then fetched and deleted concurrently. A log entry is created for each
+    retrieved message, and the message is processed by a separate task so that messages can
+    be processed in parallel by multiple workers.
+    """
     token = get_access_token(
         settings.MAILBOX_INGESTION_TENANT_ID,
         settings.MAILBOX_INGESTION_CLIENT_ID,
         settings.MAILBOX_INGESTION_CLIENT_SECRET,
     )
+    messages = list(read_messages(token))
+    logger.info('Retrieving %d messages from mailbox', len(messages))
+
+    with ThreadPoolExecutor(max_workers=settings.MAILBOX_INGESTION_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_retrieve_message, token, message['id']): message
+            for message in messages
+        }
+        for future in as_completed(futures):
+            message = futures[future]
+            message_id = message['id']
+            try:
+                content = future.result()
+            except Exception as e:
+                logger.exception('Error retrieving message: "%s", error: "%s"', message_id, e)
+                continue
+            if content is None:
+                continue
 
-    for message in read_messages(token):
-        message_id = message['id']
+            log = _create_log_entry(message_id, message, content)
+            job_scheduler(
+                function=process_ingestion_email,
+                function_args=(log.pk,),
+                max_retries=None,
+            )
 
-        content = fetch_message(token, message_id)
-        if not content:
-            logger.error('Error fetching message: "%s"', message_id)
-            continue
-        if not delete_message(token, message_id):
-            logger.error('Error deleting message: "%s"', message_id)
-            continue
 
-        try:
-            log = _create_log_entry(message_id, message, content)
+def process_ingestion_email(log_id):
+    """Processes a message that has been retrieved from the mailbox."""
+    log = MailboxLogging.objects.get(pk=log_id)
+    if log.status != MailboxProcessingStatus.RETRIEVED:
+        logger.info('Message "%s" has already been processed', log.source)
+        return
 
-            email = mailparser.parse_from_string(content)
-            processed, reason, interaction_id = processor.process_email(message=email)
-            if not processed:
-                _update_log_status(log, MailboxProcessingStatus.FAILURE, reason, None)
-                logger.error('Error parsing message: "%s", error: "%s"', message_id, reason)
-            else:
-                _update_log_status(log, MailboxProcessingStatus.PROCESSED, reason, interaction_id)
-                logger.info(reason)
-        except Exception as e:
-            _update_log_status(log, MailboxProcessingStatus.FAILURE, repr(e), None)
-            logger.exception('Error processing message: "%s", error: "%s"', message_id, e)
-
-        logger.info(
-            'Successfully processed message "%s" and deleted it from mailbox.',
-            message_id,
-        )
+    message_id = log.source
+    processor = InteractionPlainEmailProcessor()
+    try:
+        email = mailparser.parse_from_string(log.content)
+        processed, reason, interaction_id = processor.process_email(message=email)
+        if not processed:
+            _update_log_status(log, MailboxProcessingStatus.FAILURE, reason, None)
+            logger.error('Error parsing message: "%s", error: "%s"', message_id, reason)
+        else:
+            _update_log_status(log, MailboxProcessingStatus.PROCESSED, reason, interaction_id)
+            logger.info(reason)
+    except Exception as e:
+        _update_log_status(log, MailboxProcessingStatus.FAILURE, repr(e), None)
+        logger.exception('Error processing message: "%s", error: "%s"', message_id, e)
+
+    logger.info('Finished processing message "%s".', message_id)
+
+
+def _retrieve_message(token, message_id):
+    """Fetches a message and then deletes it from the mailbox.
+
+    Returns the content of the message, or None if it could not be retrieved.
+    """
+    content = fetch_message(token, message_id)
+    if not content:
+        logger.error('Error fetching message: "%s"', message_id)
+        return None
+    if not delete_message(token, message_id):
+        logger.error('Error deleting message: "%s"', message_id)
+        return None
+    return content
 
 
 def _create_log_entry(source, message, content):
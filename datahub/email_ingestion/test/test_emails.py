@@ -3,10 +3,12 @@ from unittest import mock
 import pytest
 from django.conf import settings
 from django.test import override_settings
+from django.utils.timezone import now
 from rest_framework import status
 
 from datahub.email_ingestion import emails
 from datahub.email_ingestion.models import MailboxLogging, MailboxProcessingStatus
+from datahub.email_ingestion.test.utils import GraphStubServer
 from datahub.feature_flag.test.factories import FeatureFlagFactory
 from datahub.interaction import MAILBOX_INGESTION_FEATURE_FLAG_NAME
 from datahub.interaction.test.factories import CompanyInteractionFactory
@@ -250,3 +252,89 @@ class TestMailbox:
         assert not log.exists()
 
         assert f'Error fetching message: "{MESSAGES[0]["id"]}"' in caplog.text
+
+
+@pytest.mark.django_db
+class TestMailboxPagination:
+    """Tests for reading and processing a mailbox with more than one page of messages."""
+
+    @override_settings(
+        MAILBOX_INGESTION_EMAIL='test@email',
+        MAILBOX_INGESTION_PAGE_SIZE=2,
+    )
+    def test_read_messages_follows_next_link(self, requests_mock):
+        """Tests that all pages of messages are read."""
+        email = settings.MAILBOX_INGESTION_EMAIL
+        messages_url = (
+            f'{settings.MAILBOX_INGESTION_GRAPH_URL}users/{email}/mailFolders/Inbox/messages'
+        )
+        next_link = f'{messages_url}?$skip=2'
+        requests_mock.get(
+            messages_url,
+            [
+                {'json': {'value': [{'id': '1'}, {'id': '2'}], '@odata.nextLink': next_link}},
+                {'json': {'value': [{'id': '3'}]}},
+            ],
+        )
+
+        messages = list(emails.read_messages(TOKEN))
+
+        assert [message['id'] for message in messages] == ['1', '2', '3']
+        assert requests_mock.request_history[0].qs == {'$select': ['id'], '$top': ['2']}
+        assert requests_mock.request_history[1].url == next_link
+
+    @override_settings(
+        MAILBOX_INGESTION_EMAIL='test@email',
+        MAILBOX_INGESTION_PAGE_SIZE=10,
+        MAILBOX_INGESTION_MAX_WORKERS=4,
+    )
+    def test_process_ingestion_emails_drains_mailbox(self, monkeypatch):
+        """Tests that every message is retrieved and processed in a single run, and that
+        messages are retrieved concurrently.
+        """
+        monkeypatch.setattr(
+            'datahub.email_ingestion.emails.get_access_token',
+            mock.Mock(return_value=TOKEN),
+        )
+        mock_process = mock.Mock(return_value=(False, 'some error', None))
+        monkeypatch.setattr(
+            'datahub.interaction.email_processors.processors.'
+            'InteractionPlainEmailProcessor.process_email',
+            mock_process,
+        )
+        messages = {f'message-{index}': f'content {index}' for index in range(25)}
+
+        with GraphStubServer(
+            settings.MAILBOX_INGESTION_EMAIL,
+            messages,
+            response_delay=0.01,
+        ) as graph_stub:
+            with override_settings(MAILBOX_INGESTION_GRAPH_URL=graph_stub.graph_url):
+                emails.process_ingestion_emails()
+
+        assert graph_stub.messages == {}
+        assert graph_stub.max_concurrent_requests > 1
+        assert mock_process.call_count == len(messages)
+        assert {(log.source, log.content, log.status) for log in MailboxLogging.objects.all()} == {
+            (message_id, content, MailboxProcessingStatus.FAILURE)
+            for message_id, content in messages.items()
+        }
+
+    def test_process_ingestion_email_skips_processed_message(self, monkeypatch):
+        """Tests that a message that has already been processed is not processed again."""
+        mock_process = mock.Mock()
+        monkeypatch.setattr(
+            'datahub.interaction.email_processors.processors.'
+            'InteractionPlainEmailProcessor.process_email',
+            mock_process,
+        )
+        log = MailboxLogging.objects.create(
+            retrieved_on=now(),
+            source='key',
+            content=CONTENT,
+            status=MailboxProcessingStatus.PROCESSED,
+        )
+
+        emails.process_ingestion_email(log.pk)
+
+        mock_process.assert_not_called()
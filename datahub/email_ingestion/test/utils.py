@@ -0,0 +1,133 @@
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+
+class GraphStubServer:
+    """A local HTTP stand-in for the Microsoft Graph mailbox endpoints.
+
+    It supports listing (with $top/$skip paging and @odata.nextLink), fetching and deleting
+    messages, and records the maximum number of requests it handled concurrently.
+
+    Pages are calculated from the messages remaining in the mailbox when each page is requested,
+    as is the case with Graph.
+    """
+
+    def __init__(self, user_email, messages, response_delay=0):
+        """Initialises the server with a dict of message ID to message content."""
+        self.user_email = user_email
+        self.messages = dict(messages)
+        self.response_delay = response_delay
+        self.max_concurrent_requests = 0
+        self._concurrent_requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def graph_url(self):
+        """The URL to use as MAILBOX_INGESTION_GRAPH_URL."""
+        host, port = self._server.server_address
+        return f'http://{host}:{port}/'
+
+    def __enter__(self):
+        """Starts the server."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stops the server."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                stub._handle(self, stub._get)
+
+            def do_DELETE(self):  # noqa: N802
+                stub._handle(self, stub._delete)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _handle(self, handler, method):
+        with self._lock:
+            self._concurrent_requests += 1
+            self.max_concurrent_requests = max(
+                self.max_concurrent_requests,
+                self._concurrent_requests,
+            )
+        try:
+            time.sleep(self.response_delay)
+            status, body, content_type = method(urlparse(handler.path))
+        finally:
+            with self._lock:
+                self._concurrent_requests -= 1
+
+        handler.send_response(status)
+        if body is not None:
+            encoded_body = body.encode()
+            handler.send_header('Content-Type', content_type)
+            handler.send_header('Content-Length', str(len(encoded_body)))
+            handler.end_headers()
+            handler.wfile.write(encoded_body)
+        else:
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+
+    def _get(self, url):
+        base_path = f'/users/{self.user_email}'
+        if url.path == f'{base_path}/mailFolders/Inbox/messages':
+            return self._list_messages(url)
+
+        prefix = f'{base_path}/messages/'
+        suffix = '/$value'
+        if url.path.startswith(prefix) and url.path.endswith(suffix):
+            message_id = url.path[len(prefix) : -len(suffix)]
+            with self._lock:
+                content = self.messages.get(message_id)
+            if content is None:
+                return HTTPStatus.NOT_FOUND, None, None
+            return HTTPStatus.OK, content, 'text/plain'
+
+        return HTTPStatus.NOT_FOUND, None, None
+
+    def _list_messages(self, url):
+        query = parse_qs(url.query)
+        top = int(query.get('$top', ['10'])[0])
+        skip = int(query.get('$skip', ['0'])[0])
+
+        with self._lock:
+            message_ids = list(self.messages)
+
+        response_data = {
+            'value': [{'id': message_id} for message_id in message_ids[skip : skip + top]],
+        }
+        if skip + top < len(message_ids):
+            next_query = urlencode({'$select': 'id', '$top': top, '$skip': skip + top})
+            response_data['@odata.nextLink'] = (
+                f'{self.graph_url.rstrip("/")}{url.path}?{next_query}'
+            )
+
+        return HTTPStatus.OK, json.dumps(response_data), 'application/json'
+
+    def _delete(self, url):
+        prefix = f'/users/{self.user_email}/mailFolders/Inbox/messages/'
+        if not url.path.startswith(prefix):
+            return HTTPStatus.NOT_FOUND, None, None
+
+        message_id = url.path[len(prefix) :]
+        with self._lock:
+            deleted = self.messages.pop(message_id, None) is not None
+        if not deleted:
+            return HTTPStatus.NOT_FOUND, None, None
+        return HTTPStatus.NO_CONTENT, None, None
@@ -24,6 +24,9 @@ def get_s3_client(region: str):
 class S3ObjectProcessor:
     """Base class for processing objects located at a specified prefix within an S3 bucket."""
 
+    # The maximum number of objects returned per ListObjectsV2 request (1,000 is the S3 limit)
+    list_objects_page_size = 1000
+
     def __init__(
         self,
         prefix: str,
@@ -51,12 +54,17 @@ class S3ObjectProcessor:
         - StorageClass (string) - the class of storage used to store the object
         - Owner (dict) - the owner of the object
         - RestoreStatus (dict) - the restoration status of the the object
+
+        The objects are listed a page at a time (using ListObjectsV2), so that all objects are
+        returned even if there are more than fit in a single response.
         """
-        response = self.s3_client.list_objects(
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
             Bucket=self.bucket,
             Prefix=self.prefix,
+            PaginationConfig={'PageSize': self.list_objects_page_size},
         )
-        return response.get('Contents', [])
+        return [obj for page in pages for obj in page.get('Contents', [])]
 
     def get_most_recent_object_key(self) -> str:
         """Return the most recent object's key in the self.bucket at self.prefix."""
@@ -67,9 +75,12 @@ class S3ObjectProcessor:
         return most_recent_object['Key']
 
     def get_object_last_modified_datetime(self, object_key: str) -> datetime:
-        """Get last modified datetime of a specific object."""
+        """Get last modified datetime of a specific object.
+
+        Only the object's metadata is requested (using HeadObject), not its contents.
+        """
         try:
-            response = self.s3_client.get_object(
+            response = self.s3_client.head_object(
                 Bucket=self.bucket,
                 Key=object_key,
             )
@@ -84,6 +95,14 @@ class S3ObjectProcessor:
         """Determines if the specified object has already been ingested."""
         return IngestedObject.objects.filter(object_key=object_key).exists()
 
+    def get_ingested_object_keys(self) -> set[str]:
+        """Returns the keys of the objects at self.prefix that have already been ingested."""
+        return set(
+            IngestedObject.objects.filter(
+                object_key__startswith=self.prefix,
+            ).values_list('object_key', flat=True),
+        )
+
     def get_last_ingestion_datetime(self) -> datetime | None:
         """Get last ingestion datetime of an object with the same prefix (directory)."""
         try:
@@ -42,6 +42,15 @@ class QueueChecker:
                 return True
         return False
 
+    def get_active_object_keys(self, ingestion_task_function: callable) -> set[str]:
+        """Returns the object keys of the ingestion task's jobs that are queued or running."""
+        jobs = list(self.queue.jobs)
+        jobs.extend(worker.get_current_job() for worker in Worker.all(queue=self.queue))
+        function_name = f'{ingestion_task_function.__module__}.{ingestion_task_function.__name__}'
+        return {
+            job.kwargs.get('object_key') for job in jobs if job and job.func_name == function_name
+        }
+
 
 class BaseObjectIdentificationTask:
     """Base class to identify new objects in S3 and determine if they should be ingested.
@@ -55,15 +64,32 @@ class BaseObjectIdentificationTask:
         identification_task.identify_new_objects(base_ingestion_task)
         logger.info('Base identification task finished.')
     ```
+
+    By default, only the most recent object is ingested. If catch_up is True, every object that
+    hasn't been ingested yet is scheduled for ingestion instead, oldest first, with at most
+    max_concurrent_jobs objects queued or being ingested at a time. (Objects are only ingested
+    in order if max_concurrent_jobs is 1.) Remaining objects are scheduled on later runs.
     """
 
-    def __init__(self, prefix: str, job_timeout=THREE_MINUTES_IN_SECONDS):
+    def __init__(
+        self,
+        prefix: str,
+        job_timeout=THREE_MINUTES_IN_SECONDS,
+        catch_up=False,
+        max_concurrent_jobs=1,
+    ):
         self.long_queue_checker: QueueChecker = QueueChecker(queue_name='long-running')
         self.s3_processor: S3ObjectProcessor = S3ObjectProcessor(prefix=prefix)
         self.job_timeout = job_timeout
+        self.catch_up = catch_up
+        self.max_concurrent_jobs = max_concurrent_jobs
 
     def identify_new_objects(self, ingestion_task_function: callable) -> None:
         """Entry point method to identify new objects and, if valid, schedule their ingestion."""
+        if self.catch_up:
+            self._identify_objects_to_catch_up(ingestion_task_function)
+            return
+
         latest_object_key = self.s3_processor.get_most_recent_object_key()
 
         if not latest_object_key:
@@ -88,16 +114,47 @@ class BaseObjectIdentificationTask:
             logger.info(f'{latest_object_key} has already been ingested')
             return
 
+        self._schedule_ingestion(ingestion_task_function, latest_object_key)
+
+    def _identify_objects_to_catch_up(self, ingestion_task_function: callable) -> None:
+        """Schedules the ingestion of the oldest objects that haven't been ingested yet."""
+        objects = sorted(
+            self.s3_processor.list_objects(),
+            key=lambda obj: (obj['LastModified'], obj['Key']),
+        )
+        ingested_object_keys = self.s3_processor.get_ingested_object_keys()
+        active_object_keys = self.long_queue_checker.get_active_object_keys(
+            ingestion_task_function,
+        )
+        pending_object_keys = [
+            obj['Key']
+            for obj in objects
+            if obj['Key'] not in ingested_object_keys and obj['Key'] not in active_object_keys
+        ]
+
+        if not pending_object_keys:
+            logger.info('No objects found that have not been ingested')
+            return
+
+        num_jobs_to_schedule = max(self.max_concurrent_jobs - len(active_object_keys), 0)
+        for object_key in pending_object_keys[:num_jobs_to_schedule]:
+            self._schedule_ingestion(ingestion_task_function, object_key)
+
+        num_waiting = len(pending_object_keys) - num_jobs_to_schedule
+        if num_waiting > 0:
+            logger.info(f'{num_waiting} objects are waiting to be scheduled for ingestion')
+
+    def _schedule_ingestion(self, ingestion_task_function: callable, object_key: str) -> None:
         job_scheduler(
             function=ingestion_task_function,
             function_kwargs={
-                'object_key': latest_object_key,
+                'object_key': object_key,
             },
             job_timeout=self.job_timeout,
             queue_name=self.long_queue_checker.queue.name,
-            description=f'Ingest {latest_object_key}',
+            description=f'Ingest {object_key}',
         )
-        logger.info(f'Scheduled ingestion of {latest_object_key}')
+        logger.info(f'Scheduled ingestion of {object_key}')
 
 
 def base_ingestion_task(
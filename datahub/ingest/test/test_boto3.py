@@ -57,6 +57,16 @@ class TestS3ObjectProcessor:
         assert all(obj['Key'].startswith(TEST_PREFIX) for obj in objects)
         assert all(obj['Key'].endswith('.jsonl.gz') for obj in objects)
 
+    def test_list_objects_returns_objects_from_all_pages(
+        self,
+        s3_object_processor,
+        test_object_tuples,
+    ):
+        s3_object_processor.list_objects_page_size = 2
+        upload_objects_to_s3(s3_object_processor, test_object_tuples)
+        objects = s3_object_processor.list_objects()
+        assert sorted(obj['Key'] for obj in objects) == [key for key, _ in test_object_tuples]
+
     def test_get_most_recent_object_key(self, s3_object_processor, test_object_tuples):
         object_content = compressed_json_faker([{'test': 'content'}])
         object_definitions = {
@@ -93,11 +103,20 @@ class TestS3ObjectProcessor:
             == last_modified_datetime
         )
 
+    def test_get_object_last_modified_datetime_does_not_get_object(self, s3_object_processor):
+        upload_objects_to_s3(
+            s3_object_processor,
+            [(TEST_OBJECT_KEY, compressed_json_faker([{'test': 'content'}]))],
+        )
+        with mock.patch.object(s3_object_processor.s3_client, 'get_object') as mock_get_object:
+            assert s3_object_processor.get_object_last_modified_datetime(TEST_OBJECT_KEY)
+        mock_get_object.assert_not_called()
+
     def test_get_object_last_modified_datetime_raises_error(self, s3_object_processor, caplog):
         with pytest.raises(ClientError):
             s3_object_processor.get_object_last_modified_datetime(TEST_OBJECT_KEY)
         assert f'Error getting last modified datetime for {TEST_OBJECT_KEY}' in caplog.text
-        assert 'NoSuchKey' in caplog.text
+        assert 'Not Found' in caplog.text
 
     def test_has_object_been_ingested_returns_true(self, s3_object_processor):
         IngestedObjectFactory(object_key=TEST_OBJECT_KEY)
@@ -106,6 +125,11 @@ class TestS3ObjectProcessor:
     def test_has_object_been_ingested_returns_false(self, s3_object_processor):
         assert not s3_object_processor.has_object_been_ingested(TEST_OBJECT_KEY)
 
+    def test_get_ingested_object_keys(self, s3_object_processor):
+        IngestedObjectFactory(object_key=TEST_OBJECT_KEY)
+        IngestedObjectFactory(object_key=f'other/{TEST_OBJECT_KEY}')
+        assert s3_object_processor.get_ingested_object_keys() == {TEST_OBJECT_KEY}
+
     def test_get_last_ingestion_datetime_with_one_record(self, s3_object_processor):
         object_created_datetime = datetime(2024, 11, 24, 10, 00, 00, tzinfo=timezone.utc)
         IngestedObjectFactory(object_key=TEST_OBJECT_KEY, object_created=object_created_datetime)
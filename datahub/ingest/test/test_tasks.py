@@ -135,6 +135,31 @@ class TestQueueChecker:
             object_key=TEST_OBJECT_KEY,
         )
 
+    def test_get_active_object_keys_returns_keys_of_queued_and_running_jobs(
+        self,
+        mock_redis,
+        mock_queue,
+        mock_worker,
+    ):
+        queue_checker = QueueChecker('test-queue')
+        queued_job, running_job, other_job = (
+            Job.create(func=func, kwargs={'object_key': object_key}, connection=mock_redis)
+            for func, object_key in (
+                (base_ingestion_task, 'queued.json'),
+                (base_ingestion_task, 'running.json'),
+                (compressed_json_faker, 'other.json'),
+            )
+        )
+        mock_queue.return_value.jobs = [queued_job, other_job]
+        mock_worker.all.return_value = [
+            mock.Mock(get_current_job=lambda: running_job),
+            mock.Mock(get_current_job=lambda: None),
+        ]
+        assert queue_checker.get_active_object_keys(base_ingestion_task) == {
+            'queued.json',
+            'running.json',
+        }
+
 
 @mock_aws
 class TestBaseObjectIdentificationTask:
@@ -271,6 +296,103 @@ class TestBaseObjectIdentificationTask:
         )
 
 
+@mock_aws
+class TestBaseObjectIdentificationTaskCatchUp:
+    @pytest.fixture
+    def s3_objects(self):
+        """Objects in S3, listed in a different order to when they were last modified."""
+        return [
+            {
+                'Key': f'{TEST_PREFIX}{name}.jsonl.gz',
+                'LastModified': datetime(2024, 12, day, tzinfo=timezone.utc),
+            }
+            for name, day in (('c', 3), ('a', 1), ('d', 4), ('b', 2))
+        ]
+
+    @pytest.fixture
+    def mock_list_objects(self, s3_objects):
+        with mock.patch.object(
+            S3ObjectProcessor,
+            'list_objects',
+            return_value=s3_objects,
+        ) as mock_list_objects:
+            yield mock_list_objects
+
+    def _get_scheduled_object_keys(self, mock_scheduler):
+        return [
+            call.kwargs['function_kwargs']['object_key'] for call in mock_scheduler.call_args_list
+        ]
+
+    def test_schedules_oldest_object_that_has_not_been_ingested(
+        self,
+        mock_list_objects,
+        mock_scheduler,
+        caplog,
+    ):
+        IngestedObject.objects.create(object_key=f'{TEST_PREFIX}a.jsonl.gz')
+        identification_task = BaseObjectIdentificationTask(prefix=TEST_PREFIX, catch_up=True)
+        with (
+            mock.patch.object(QueueChecker, 'get_active_object_keys', return_value=set()),
+            caplog.at_level(logging.INFO),
+        ):
+            identification_task.identify_new_objects(base_ingestion_task)
+            assert '2 objects are waiting to be scheduled for ingestion' in caplog.text
+        assert self._get_scheduled_object_keys(mock_scheduler) == [f'{TEST_PREFIX}b.jsonl.gz']
+
+    def test_schedules_objects_up_to_max_concurrent_jobs(
+        self,
+        mock_list_objects,
+        mock_scheduler,
+    ):
+        identification_task = BaseObjectIdentificationTask(
+            prefix=TEST_PREFIX,
+            catch_up=True,
+            max_concurrent_jobs=3,
+        )
+        with mock.patch.object(
+            QueueChecker,
+            'get_active_object_keys',
+            return_value={f'{TEST_PREFIX}a.jsonl.gz'},
+        ):
+            identification_task.identify_new_objects(base_ingestion_task)
+        assert self._get_scheduled_object_keys(mock_scheduler) == [
+            f'{TEST_PREFIX}b.jsonl.gz',
+            f'{TEST_PREFIX}c.jsonl.gz',
+        ]
+
+    def test_does_not_schedule_objects_if_max_concurrent_jobs_are_active(
+        self,
+        mock_list_objects,
+        mock_scheduler,
+    ):
+        identification_task = BaseObjectIdentificationTask(prefix=TEST_PREFIX, catch_up=True)
+        with mock.patch.object(
+            QueueChecker,
+            'get_active_object_keys',
+            return_value={f'{TEST_PREFIX}a.jsonl.gz'},
+        ):
+            identification_task.identify_new_objects(base_ingestion_task)
+        mock_scheduler.assert_not_called()
+
+    def test_does_nothing_if_all_objects_have_been_ingested(
+        self,
+        s3_objects,
+        mock_list_objects,
+        mock_scheduler,
+        caplog,
+    ):
+        for s3_object in s3_objects:
+            IngestedObject.objects.create(object_key=s3_object['Key'])
+        identification_task = BaseObjectIdentificationTask(prefix=TEST_PREFIX, catch_up=True)
+        with (
+            mock.patch.object(QueueChecker, 'get_active_object_keys', return_value=set()),
+            caplog.at_level(logging.INFO),
+        ):
+            identification_task.identify_new_objects(base_ingestion_task)
+            assert 'No objects found that have not been ingested' in caplog.text
+        mock_scheduler.assert_not_called()
+
+
 @mock_aws
 class TestBaseObjectIngestionTask:
     @pytest.fixture
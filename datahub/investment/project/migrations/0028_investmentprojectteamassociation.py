@@ -0,0 +1,49 @@
+# Generated by Django 5.2.1 on 2026-10-19 10:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Populates the table with the teams of the advisers in
+# InvestmentProject._ASSOCIATED_ADVISER_TO_ONE_FIELDS and _ASSOCIATED_ADVISER_TO_MANY_FIELDS
+POPULATE_TEAM_ASSOCIATIONS_SQL = """
+INSERT INTO investment_investmentprojectteamassociation (investment_project_id, dit_team_id)
+SELECT project.id, adviser.dit_team_id
+FROM investment_investmentproject project
+INNER JOIN company_advisor adviser ON adviser.id IN (
+    project.created_by_id,
+    project.client_relationship_manager_id,
+    project.project_manager_id,
+    project.project_assurance_adviser_id
+)
+WHERE adviser.dit_team_id IS NOT NULL
+UNION
+SELECT team_member.investment_project_id, adviser.dit_team_id
+FROM investment_investmentprojectteammember team_member
+INNER JOIN company_advisor adviser ON adviser.id = team_member.adviser_id
+WHERE adviser.dit_team_id IS NOT NULL
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investment', '0027_investmentproject_actual_average_salary'),
+        ('metadata', '0095_update_service'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InvestmentProjectTeamAssociation',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('dit_team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='metadata.team')),
+                ('investment_project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='team_associations', to='investment.investmentproject')),
+            ],
+            options={
+                'default_permissions': (),
+                'indexes': [models.Index(fields=['dit_team', 'investment_project'], name='investment__dit_tea_735785_idx')],
+                'constraints': [models.UniqueConstraint(fields=('investment_project', 'dit_team'), name='investment_team_association_unique_project_team')],
+            },
+        ),
+        migrations.RunSQL(POPULATE_TEAM_ASSOCIATIONS_SQL, migrations.RunSQL.noop),
+    ]
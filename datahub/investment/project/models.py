@@ -746,6 +746,41 @@ class InvestmentProjectTeamMember(models.Model):
         return f'{self.investment_project} - {self.adviser} - {self.role}'
 
 
+class InvestmentProjectTeamAssociation(models.Model):
+    """A team that an investment project is associated with.
+
+    This is a denormalised copy of the teams of the advisers returned by
+    InvestmentProject.get_associated_advisers(), so that projects can be restricted to those
+    associated with a user's team (for users with only the *_associated_* permissions) using a
+    single indexed lookup. Rows are kept in sync by signal receivers (see
+    datahub.investment.project.team_associations).
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    investment_project = models.ForeignKey(
+        InvestmentProject,
+        on_delete=models.CASCADE,
+        related_name='team_associations',
+    )
+    dit_team = models.ForeignKey('metadata.Team', on_delete=models.CASCADE, related_name='+')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['investment_project', 'dit_team'],
+                name='investment_team_association_unique_project_team',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['dit_team', 'investment_project']),
+        ]
+        default_permissions = ()
+
+    def __str__(self):
+        """Human-readable representation."""
+        return f'{self.investment_project_id} - {self.dit_team_id}'
+
+
 class InvestmentProjectStageLog(models.Model):
     """Investment Project stage log.
 
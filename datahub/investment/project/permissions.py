@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from django.db.models.query_utils import Q
+from django.db.models import Exists, OuterRef
 from rest_framework.filters import BaseFilterBackend
 
 from datahub.core.permissions import (
@@ -9,7 +9,10 @@ from datahub.core.permissions import (
     ViewBasedModelPermissions,
     get_model_action_for_view_action,
 )
-from datahub.investment.project.models import InvestmentProject
+from datahub.investment.project.models import (
+    InvestmentProject,
+    InvestmentProjectTeamAssociation,
+)
 
 
 class _PermissionTemplate(StrEnum):
@@ -64,9 +67,10 @@ class InvestmentProjectAssociationCheckerBase(ObjectAssociationCheckerBase):
         if self.should_exclude_all(request):
             return False
 
-        return any(
-            request.user.dit_team_id == user.dit_team_id for user in obj.get_associated_advisers()
-        )
+        return InvestmentProjectTeamAssociation.objects.filter(
+            investment_project_id=obj.pk,
+            dit_team_id=request.user.dit_team_id,
+        ).exists()
 
     def should_apply_restrictions(self, request, view_action):
         """Check if restrictions should be applied."""
@@ -136,7 +140,11 @@ class IsAssociatedToInvestmentProjectPermissionMixin:
 
 
 class IsAssociatedToInvestmentProjectFilter(BaseFilterBackend):
-    """Filter for LEPs users to see only associated InvestmentProjects."""
+    """Filter for LEPs users to see only associated InvestmentProjects.
+
+    Projects are filtered using InvestmentProjectTeamAssociation, so that a single EXISTS
+    subquery is used rather than a join for each association field.
+    """
 
     actions_to_filter = {'list'}
     model_attribute = None
@@ -157,23 +165,12 @@ class IsAssociatedToInvestmentProjectFilter(BaseFilterBackend):
         if self.checker.should_exclude_all(request):
             return queryset.none()
 
-        to_one_filters, to_many_filters = get_association_filters(request.user.dit_team_id)
-        field_prefix = self._get_filter_field_prefix()
-
-        query = Q()
-        for field, value in to_one_filters:
-            full_field_name = f'{field_prefix}{field}__dit_team_id'
-            query |= Q(**{full_field_name: value})
-
-        for field, value in to_many_filters:
-            full_field_name = (
-                f'{field_prefix}{field.field_name}__{field.subfield_name}__dit_team_id'
-            )
-            query |= Q(**{full_field_name: value})
-        return queryset.filter(query).distinct()
-
-    def _get_filter_field_prefix(self):
-        return f'{self.model_attribute}__' if self.model_attribute else ''
+        project_ref = OuterRef(self.model_attribute or 'pk')
+        team_associations = InvestmentProjectTeamAssociation.objects.filter(
+            investment_project_id=project_ref,
+            dit_team_id=request.user.dit_team_id,
+        )
+        return queryset.filter(Exists(team_associations))
 
 
 class InvestmentProjectTeamMemberModelPermissions(InvestmentProjectModelPermissions):
@@ -12,8 +12,9 @@ SPI5_END    - earliest interaction when aftercare was offered, only for new inve
               only for IST managed projects
 """
 
-from dateutil.parser import parse as dateutil_parse
-from django.db.models import Q
+from datetime import datetime
+
+from django.db.models import OuterRef, Q, Subquery
 
 from datahub.core.constants import InvestmentProjectStage as Stage
 from datahub.core.constants import Service
@@ -25,7 +26,7 @@ from datahub.core.query_utils import (
 )
 from datahub.interaction.models import Interaction
 from datahub.investment.project.constants import InvestorType
-from datahub.investment.project.models import InvestmentProject
+from datahub.investment.project.models import InvestmentProject, InvestmentProjectStageLog
 from datahub.investment.project.proposition.constants import PropositionStatus
 from datahub.investment.project.proposition.models import Proposition
 from datahub.metadata.models import Team
@@ -53,11 +54,18 @@ SPI5_END_SERVICE_IDS = {
 
 ALL_SPI_SERVICE_IDS = SPI1_END_SERVICE_IDS | SPI2_START_SERVICE_IDS | SPI5_END_SERVICE_IDS
 
+# Number of investment projects fetched from the database at a time when generating the report
+SPI_REPORT_CHUNK_SIZE = 2000
+
 
 def format_date(d):
-    """Date format used in the report."""
+    """Date format used in the report.
+
+    Strings are expected to be ISO 8601 dates or datetimes, as produced by PostgreSQL when
+    serialising to JSON.
+    """
     if isinstance(d, str):
-        d = dateutil_parse(d)
+        d = datetime.fromisoformat(d)
     return d.isoformat()
 
 
@@ -127,9 +135,10 @@ class SPIReport:
         (SPI5_END_SERVICE_IDS, SPI5_END),
     )
 
-    def __init__(self, proposition_formatter=None):
+    def __init__(self, proposition_formatter=None, chunk_size=SPI_REPORT_CHUNK_SIZE):
         """Initialise the SPI Report."""
         self.proposition_formatter = proposition_formatter
+        self.chunk_size = chunk_size
 
     def _get_spi_interactions(self, investment_project):
         """Gets SPI interactions for given Investment Project.
@@ -164,17 +173,10 @@ class SPIReport:
     def _find_when_project_moved_to_won(self, investment_project):
         """Finds when project has been moved to Won stage.
 
-        Earliest date counts.
+        Earliest date counts. This is annotated by get_spi_report_queryset() so that no
+        additional query is made per project.
         """
-        stage_log = (
-            investment_project.stage_log.filter(
-                stage_id=Stage.won.value.id,
-            )
-            .order_by('created_on')
-            .first()
-        )
-
-        return stage_log.created_on if stage_log else None
+        return investment_project.spi_moved_to_won_on
 
     def _format_propositions(self, propositions):
         """Formats propositions.
@@ -185,12 +187,12 @@ class SPIReport:
         """
         formatted = []
         for proposition in propositions:
-            formatted.append(dateutil_parse(proposition['deadline']).strftime('%Y-%m-%d'))
+            formatted.append(datetime.fromisoformat(proposition['deadline']).strftime('%Y-%m-%d'))
             formatted.append(proposition['status'])
             if proposition['status'] == PropositionStatus.ONGOING:
                 modified_on = ''
             else:
-                modified_on = dateutil_parse(proposition['modified_on']).isoformat()
+                modified_on = format_date(proposition['modified_on'])
             formatted.append(modified_on)
             formatted.append(proposition['adviser_name'])
 
@@ -286,10 +288,29 @@ class SPIReport:
         spi_data = self._enrich_row(investment_project, spi_data)
         return spi_data
 
+    def row_chunks(self):
+        """Return an iterator of lists of SPI report rows.
+
+        Investment projects are fetched chunk_size at a time using a server-side cursor. As
+        all SPI data is annotated on the queryset, the whole report is generated using a
+        single query regardless of the number of projects.
+        """
+        chunk = []
+        for investment_project in get_spi_report_queryset().iterator(
+            chunk_size=self.chunk_size,
+        ):
+            chunk.append(self.get_row(investment_project))
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
     def rows(self):
         """Return SPI report iterator."""
-        for investment_project in get_spi_report_queryset().iterator():
-            yield self.get_row(investment_project)
+        for chunk in self.row_chunks():
+            yield from chunk
 
 
 def get_spi_report_queryset():
@@ -298,8 +319,17 @@ def get_spi_report_queryset():
         InvestmentProject.objects.select_related(
             'investmentprojectcode',
             'project_manager__dit_team',
+            'project_manager_first_assigned_by',
         )
         .annotate(
+            spi_moved_to_won_on=Subquery(
+                InvestmentProjectStageLog.objects.filter(
+                    investment_project_id=OuterRef('pk'),
+                    stage_id=Stage.won.value.id,
+                )
+                .order_by('created_on')
+                .values('created_on')[:1],
+            ),
             spi_propositions=get_array_agg_subquery(
                 Proposition,
                 'investment_project',
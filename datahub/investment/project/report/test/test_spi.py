@@ -89,6 +89,32 @@ def propositions(ist_adviser):
     return items
 
 
+@pytest.fixture
+def spi_report_benchmark_projects(request, ist_adviser):
+    """Creates a number of investment projects with data for every SPI.
+
+    The number of projects is given by indirect parametrisation (defaulting to 10).
+    """
+    project_count = getattr(request, 'param', 10)
+    investment_projects = VerifyWinInvestmentProjectFactory.create_batch(
+        project_count,
+        project_manager=ist_adviser,
+        project_manager_first_assigned_on=now(),
+        project_manager_first_assigned_by=AdviserFactory(),
+    )
+    for investment_project in investment_projects:
+        for service_id in ALL_SPI_SERVICE_IDS:
+            InvestmentProjectInteractionFactory(
+                investment_project=investment_project,
+                service_id=service_id,
+            )
+        PropositionFactory(investment_project=investment_project, created_by=ist_adviser)
+        investment_project.stage_id = InvestmentProjectStageConstant.won.value.id
+        investment_project.save()
+
+    return investment_projects
+
+
 def test_can_see_spi1_start(spi_report):
     """Checks if creation of Investment Project starts SPI 1."""
     investment_project = InvestmentProjectFactory()
@@ -389,6 +415,34 @@ def test_cannot_get_spi5_start_and_end_for_non_new_investor(
     assert rows[0]['Aftercare offered on'] == ''
 
 
+@pytest.mark.parametrize('spi_report_benchmark_projects', [1, 10], indirect=True)
+def test_rows_use_a_constant_number_of_queries(
+    django_assert_num_queries,
+    spi_report_benchmark_projects,
+):
+    """Test that the whole report is generated using a single query."""
+    spi_report = SPIReport(chunk_size=3)
+
+    with django_assert_num_queries(1):
+        rows = list(spi_report.rows())
+
+    assert len(rows) == len(spi_report_benchmark_projects)
+    assert all(row['Project moved to won'] for row in rows)
+
+
+@pytest.mark.parametrize('spi_report_benchmark_projects', [7], indirect=True)
+def test_row_chunks(spi_report_benchmark_projects):
+    """Test that rows are returned in chunks of the given size."""
+    spi_report = SPIReport(chunk_size=3)
+
+    chunks = list(spi_report.row_chunks())
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert {row['Data Hub ID'] for chunk in chunks for row in chunk} == {
+        str(investment_project.pk) for investment_project in spi_report_benchmark_projects
+    }
+
+
 def test_write_report(ist_adviser):
     """Test that SPI report CSV is generated correctly."""
     pm_assigned_by = AdviserFactory()
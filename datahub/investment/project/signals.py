@@ -1,19 +1,27 @@
 import reversion
+from django.db import transaction
 from django.db.models import Q
-from django.db.models.signals import m2m_changed, post_save, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from datahub.company.models import Company
+from datahub.company.models import Advisor, Company
 from datahub.core.constants import InvestmentProjectStage
 from datahub.investment.project.gva_utils import set_gross_value_added_for_investment_project
 from datahub.investment.project.models import (
     GVAMultiplier,
     InvestmentProject,
     InvestmentProjectCode,
+    InvestmentProjectTeamMember,
 )
 from datahub.investment.project.tasks import (
     schedule_update_investment_projects_for_gva_multiplier_task,
 )
+from datahub.investment.project.team_associations import (
+    get_projects_associated_with_adviser,
+    update_team_associations,
+)
+from datahub.search.investment import InvestmentSearchApp
+from datahub.search.sync_object import sync_objects_async
 
 
 @receiver(
@@ -95,6 +103,32 @@ def update_investment_projects_for_gva_multiplier_post_save(sender, **kwargs):
         )
 
 
+def _add_projects_to_revision(project_ids):
+    """Adds the given investment projects to the active revision.
+
+    Related objects used when serialising the projects are fetched up front so that the
+    number of queries doesn't depend on the number of projects.
+    """
+    investment_projects = (
+        InvestmentProject.objects.filter(pk__in=project_ids)
+        .select_related('investor_company')
+        .prefetch_related(*(field.name for field in InvestmentProject._meta.many_to_many))
+    )
+    for investment_project in investment_projects:
+        reversion.add_to_revision(investment_project)
+
+
+def _sync_projects_to_search(project_ids):
+    """Syncs the given investment projects to OpenSearch once the transaction is committed.
+
+    QuerySet.update() doesn't fire post_save, so the projects are synced using a single
+    batched task.
+    """
+    transaction.on_commit(
+        lambda: sync_objects_async(InvestmentSearchApp, project_ids),
+    )
+
+
 @receiver(
     post_save,
     sender=Company,
@@ -103,22 +137,31 @@ def update_investment_projects_for_gva_multiplier_post_save(sender, **kwargs):
 def update_country_investment_originates_from(sender, **kwargs):
     """Updates investment project's country of origin when investor company address country changes.
     The won investment projects are not updated.
+
+    The projects are updated using a single query, and are then added to the active revision
+    (if there is one) and synced to OpenSearch in bulk.
     """
     instance = kwargs['instance']
     created = kwargs['created']
-    if not created:
-        investment_projects = InvestmentProject.objects.filter(
-            investor_company_id=instance.pk,
-        ).exclude(
-            Q(stage_id=InvestmentProjectStage.won.value.id)
-            | Q(country_investment_originates_from_id=instance.address_country_id),
-        )
-
-        for investment_project in investment_projects:
-            investment_project.country_investment_originates_from_id = instance.address_country_id
-            investment_project.save(
-                update_fields=('country_investment_originates_from',),
-            )
+    if created:
+        return
+
+    investment_projects = InvestmentProject.objects.filter(
+        investor_company_id=instance.pk,
+    ).exclude(
+        Q(stage_id=InvestmentProjectStage.won.value.id)
+        | Q(country_investment_originates_from_id=instance.address_country_id),
+    )
+    project_ids = list(investment_projects.values_list('pk', flat=True))
+    if not project_ids:
+        return
+
+    InvestmentProject.objects.filter(pk__in=project_ids).update(
+        country_investment_originates_from_id=instance.address_country_id,
+    )
+    if reversion.is_active():
+        _add_projects_to_revision(project_ids)
+    _sync_projects_to_search(project_ids)
 
 
 @receiver(
@@ -127,25 +170,84 @@ def update_country_investment_originates_from(sender, **kwargs):
     dispatch_uid='update_project_site_address_fields_when_company_address_changes_from_post_save',
 )
 def update_project_site_address_fields_when_company_address_changes(sender, **kwargs):
-    """Updates site address in applicable projects when the company's address changes."""
+    """Updates site address in applicable projects when the company's address changes.
+
+    The projects are updated using a single query, and are then recorded in a single revision
+    and synced to OpenSearch in bulk.
+    """
     instance = kwargs['instance']
     created = kwargs['created']
-    if not created:
-        investment_projects = InvestmentProject.objects.filter(
-            uk_company_id=instance.pk,
-            site_address_is_company_address=True,
+    if created:
+        return
+
+    investment_projects = InvestmentProject.objects.filter(
+        uk_company_id=instance.pk,
+        site_address_is_company_address=True,
+    )
+    project_ids = list(investment_projects.values_list('pk', flat=True))
+    if not project_ids:
+        return
+
+    with reversion.create_revision():
+        InvestmentProject.objects.filter(pk__in=project_ids).update(
+            address_1=instance.address_1,
+            address_2=instance.address_2,
+            address_town=instance.address_town,
+            address_postcode=instance.address_postcode,
         )
-        for investment_project in investment_projects:
-            with reversion.create_revision():
-                investment_project.address_1 = instance.address_1
-                investment_project.address_2 = instance.address_2
-                investment_project.address_town = instance.address_town
-                investment_project.address_postcode = instance.address_postcode
-                investment_project.save(
-                    update_fields=[
-                        'address_1',
-                        'address_2',
-                        'address_town',
-                        'address_postcode',
-                    ],
-                )
+        _add_projects_to_revision(project_ids)
+    _sync_projects_to_search(project_ids)
+
+
+@receiver(
+    post_save,
+    sender=InvestmentProject,
+    dispatch_uid='update_team_associations_on_project_post_save',
+)
+def update_team_associations_on_project_post_save(sender, instance, update_fields, **kwargs):
+    """Updates the teams an investment project is associated with when it's saved."""
+    to_one_fields, _ = InvestmentProject.get_association_fields()
+    if update_fields is not None and not update_fields & set(to_one_fields):
+        return
+
+    update_team_associations([instance.pk])
+
+
+@receiver(
+    post_save,
+    sender=InvestmentProjectTeamMember,
+    dispatch_uid='update_team_associations_on_team_member_post_save',
+)
+@receiver(
+    post_delete,
+    sender=InvestmentProjectTeamMember,
+    dispatch_uid='update_team_associations_on_team_member_post_delete',
+)
+def update_team_associations_on_team_member_change(sender, instance, **kwargs):
+    """Updates the teams an investment project is associated with when its team members change.
+
+    This is skipped when the team member is being deleted as part of deleting the project.
+    """
+    if isinstance(kwargs.get('origin'), InvestmentProject):
+        return
+
+    update_team_associations([instance.investment_project_id])
+
+
+@receiver(
+    post_save,
+    sender=Advisor,
+    dispatch_uid='update_team_associations_on_adviser_post_save',
+)
+def update_team_associations_on_adviser_post_save(
+    sender, instance, created, update_fields, **kwargs
+):
+    """Updates the teams of the investment projects an adviser is associated with when the
+    adviser's team may have changed.
+    """
+    if created or (update_fields is not None and 'dit_team' not in update_fields):
+        return
+
+    update_team_associations(
+        get_projects_associated_with_adviser(instance.pk).values_list('pk', flat=True),
+    )
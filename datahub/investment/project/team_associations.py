@@ -0,0 +1,68 @@
+from django.db.models import Q
+
+from datahub.investment.project.models import (
+    InvestmentProject,
+    InvestmentProjectTeamAssociation,
+)
+
+
+def get_projects_associated_with_adviser(adviser_id):
+    """Gets a query set of the investment projects that an adviser is associated with."""
+    to_one_fields, to_many_fields = InvestmentProject.get_association_fields()
+    query = Q()
+    for field in to_one_fields:
+        query |= Q(**{f'{field}_id': adviser_id})
+    for field in to_many_fields:
+        query |= Q(**{f'{field.field_name}__{field.subfield_name}_id': adviser_id})
+    return InvestmentProject.objects.filter(query).distinct()
+
+
+def update_team_associations(project_ids):
+    """Updates the InvestmentProjectTeamAssociation rows of investment projects so that they
+    match the teams of the advisers associated with the projects.
+
+    The teams are fetched using one query per association field, regardless of the number of
+    projects.
+    """
+    project_ids = list(project_ids)
+    if not project_ids:
+        return
+
+    expected_associations = _get_expected_associations(project_ids)
+    existing_associations = {
+        (project_id, team_id): association_id
+        for association_id, project_id, team_id in InvestmentProjectTeamAssociation.objects.filter(
+            investment_project_id__in=project_ids,
+        ).values_list('pk', 'investment_project_id', 'dit_team_id')
+    }
+
+    InvestmentProjectTeamAssociation.objects.bulk_create(
+        [
+            InvestmentProjectTeamAssociation(investment_project_id=project_id, dit_team_id=team_id)
+            for project_id, team_id in expected_associations - existing_associations.keys()
+        ],
+        ignore_conflicts=True,
+    )
+    InvestmentProjectTeamAssociation.objects.filter(
+        pk__in=[
+            association_id
+            for key, association_id in existing_associations.items()
+            if key not in expected_associations
+        ],
+    ).delete()
+
+
+def _get_expected_associations(project_ids):
+    to_one_fields, to_many_fields = InvestmentProject.get_association_fields()
+    team_id_lookups = [
+        *(f'{field}__dit_team_id' for field in to_one_fields),
+        *(f'{field.field_name}__{field.subfield_name}__dit_team_id' for field in to_many_fields),
+    ]
+    projects = InvestmentProject.objects.filter(pk__in=project_ids)
+
+    return {
+        (project_id, team_id)
+        for team_id_lookup in team_id_lookups
+        for project_id, team_id in projects.values_list('pk', team_id_lookup)
+        if team_id
+    }
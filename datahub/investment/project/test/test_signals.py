@@ -2,6 +2,8 @@ from unittest.mock import Mock
 
 import pytest
 import reversion
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from reversion.models import Version
 
 from datahub.company.test.factories import CompanyFactory
@@ -16,6 +18,7 @@ from datahub.core.constants import (
 from datahub.core.test_utils import random_obj_for_model
 from datahub.investment.project.test.factories import InvestmentProjectFactory
 from datahub.metadata.models import InvestmentBusinessActivity
+from datahub.search.investment import InvestmentSearchApp
 
 
 @pytest.mark.django_db
@@ -136,6 +139,85 @@ class TestInvestorCompanyUpdate:
                 == CountryConstant.japan.value.id
             )
 
+    def test_update_investor_company_syncs_updated_projects_to_search_in_bulk(
+        self,
+        monkeypatch,
+        synchronous_on_commit,
+    ):
+        """Test that updated projects are synced to OpenSearch using a single task."""
+        sync_objects_async_mock = Mock()
+        monkeypatch.setattr(
+            'datahub.investment.project.signals.sync_objects_async',
+            sync_objects_async_mock,
+        )
+        investor_company = CompanyFactory(
+            address_country_id=CountryConstant.japan.value.id,
+        )
+        projects = InvestmentProjectFactory.create_batch(
+            3,
+            investor_company=investor_company,
+            stage_id=InvestmentProjectStageConstant.prospect.value.id,
+        )
+        InvestmentProjectFactory(
+            investor_company=investor_company,
+            stage_id=InvestmentProjectStageConstant.won.value.id,
+        )
+
+        investor_company.address_country_id = CountryConstant.united_states.value.id
+        investor_company.save()
+
+        sync_objects_async_mock.assert_called_once()
+        search_app, project_ids = sync_objects_async_mock.call_args.args
+        assert search_app is InvestmentSearchApp
+        assert set(project_ids) == {project.pk for project in projects}
+
+    def test_update_investor_company_adds_projects_to_active_revision(self):
+        """Test that updated projects are added to the active revision, if there is one."""
+        investor_company = CompanyFactory(
+            address_country_id=CountryConstant.japan.value.id,
+        )
+        project = InvestmentProjectFactory(
+            investor_company=investor_company,
+            stage_id=InvestmentProjectStageConstant.prospect.value.id,
+        )
+
+        with reversion.create_revision():
+            investor_company.address_country_id = CountryConstant.united_states.value.id
+            investor_company.save()
+
+        versions = Version.objects.get_for_object(project)
+        assert versions.count() == 1
+        assert (
+            str(versions[0].field_dict['country_investment_originates_from_id'])
+            == CountryConstant.united_states.value.id
+        )
+
+    def test_number_of_queries_does_not_depend_on_number_of_projects(self):
+        """Test that the number of queries made when updating an investor company's country
+        doesn't depend on the number of projects it has.
+        """
+        investor_company = CompanyFactory(
+            address_country_id=CountryConstant.japan.value.id,
+        )
+        InvestmentProjectFactory(
+            investor_company=investor_company,
+            stage_id=InvestmentProjectStageConstant.prospect.value.id,
+        )
+        investor_company.address_country_id = CountryConstant.united_states.value.id
+        with CaptureQueriesContext(connection) as single_project_queries:
+            investor_company.save()
+
+        InvestmentProjectFactory.create_batch(
+            9,
+            investor_company=investor_company,
+            stage_id=InvestmentProjectStageConstant.prospect.value.id,
+        )
+        investor_company.address_country_id = CountryConstant.japan.value.id
+        with CaptureQueriesContext(connection) as multiple_project_queries:
+            investor_company.save()
+
+        assert len(multiple_project_queries) == len(single_project_queries)
+
 
 @pytest.mark.django_db
 class TestUpdateProjectSiteAddressFieldsWhenCompanyAddressChanges:
@@ -195,3 +277,53 @@ class TestUpdateProjectSiteAddressFieldsWhenCompanyAddressChanges:
         assert project_to_not_update.address_town == old_address_fields['address_town']
         assert project_to_not_update.address_postcode == old_address_fields['address_postcode']
         assert Version.objects.get_for_object(project_to_not_update).count() == 1
+
+    def test_syncs_updated_projects_to_search_in_bulk(self, monkeypatch, synchronous_on_commit):
+        """Test that updated projects are synced to OpenSearch using a single task."""
+        sync_objects_async_mock = Mock()
+        monkeypatch.setattr(
+            'datahub.investment.project.signals.sync_objects_async',
+            sync_objects_async_mock,
+        )
+        uk_based_company = CompanyFactory(
+            address_country_id=CountryConstant.united_kingdom.value.id,
+        )
+        projects = InvestmentProjectFactory.create_batch(
+            3,
+            uk_company=uk_based_company,
+            site_address_is_company_address=True,
+        )
+
+        uk_based_company.address_1 = '10 Downing Street'
+        uk_based_company.save()
+
+        sync_objects_async_mock.assert_called_once()
+        search_app, project_ids = sync_objects_async_mock.call_args.args
+        assert search_app is InvestmentSearchApp
+        assert set(project_ids) == {project.pk for project in projects}
+
+    def test_number_of_queries_does_not_depend_on_number_of_projects(self):
+        """Test that the number of queries made when updating a company's address doesn't
+        depend on the number of projects using it as their site address.
+        """
+        uk_based_company = CompanyFactory(
+            address_country_id=CountryConstant.united_kingdom.value.id,
+        )
+        InvestmentProjectFactory(
+            uk_company=uk_based_company,
+            site_address_is_company_address=True,
+        )
+        uk_based_company.address_1 = '10 Downing Street'
+        with CaptureQueriesContext(connection) as single_project_queries:
+            uk_based_company.save()
+
+        InvestmentProjectFactory.create_batch(
+            9,
+            uk_company=uk_based_company,
+            site_address_is_company_address=True,
+        )
+        uk_based_company.address_1 = '11 Downing Street'
+        with CaptureQueriesContext(connection) as multiple_project_queries:
+            uk_based_company.save()
+
+        assert len(multiple_project_queries) == len(single_project_queries)
@@ -0,0 +1,104 @@
+import pytest
+
+from datahub.company.test.factories import AdviserFactory
+from datahub.investment.project.models import InvestmentProject, InvestmentProjectTeamAssociation
+from datahub.investment.project.team_associations import update_team_associations
+from datahub.investment.project.test.factories import (
+    InvestmentProjectFactory,
+    InvestmentProjectTeamMemberFactory,
+)
+from datahub.metadata.test.factories import TeamFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _get_team_ids(project):
+    return set(
+        InvestmentProjectTeamAssociation.objects.filter(
+            investment_project=project,
+        ).values_list('dit_team_id', flat=True),
+    )
+
+
+class TestTeamAssociationSignals:
+    """Tests that team associations are kept in sync by the signal receivers."""
+
+    def test_project_save(self):
+        """Test that the teams of the to-one adviser fields are added when a project is saved,
+        and updated when one of those fields changes.
+        """
+        created_by, project_manager, new_project_manager = AdviserFactory.create_batch(3)
+        project = InvestmentProjectFactory(
+            created_by=created_by,
+            client_relationship_manager=AdviserFactory(dit_team=created_by.dit_team),
+            project_manager=project_manager,
+            project_assurance_adviser=AdviserFactory(dit_team=None),
+        )
+
+        assert _get_team_ids(project) == {created_by.dit_team_id, project_manager.dit_team_id}
+
+        project.project_manager = new_project_manager
+        project.save()
+
+        assert _get_team_ids(project) == {
+            created_by.dit_team_id,
+            new_project_manager.dit_team_id,
+        }
+
+    def test_team_member_changes(self):
+        """Test that team associations are updated when team members are added and removed."""
+        project = InvestmentProjectFactory(
+            created_by=None,
+            client_relationship_manager=None,
+            project_manager=None,
+            project_assurance_adviser=None,
+        )
+        assert _get_team_ids(project) == set()
+
+        team_member = InvestmentProjectTeamMemberFactory(investment_project=project)
+        assert _get_team_ids(project) == {team_member.adviser.dit_team_id}
+
+        team_member.delete()
+        assert _get_team_ids(project) == set()
+
+    def test_adviser_team_change(self):
+        """Test that team associations are updated when the team of an adviser changes."""
+        adviser = AdviserFactory()
+        projects = [
+            InvestmentProjectFactory(client_relationship_manager=adviser),
+            InvestmentProjectTeamMemberFactory(adviser=adviser).investment_project,
+        ]
+        old_team_id = adviser.dit_team_id
+
+        adviser.dit_team = TeamFactory()
+        adviser.save()
+
+        for project in projects:
+            team_ids = _get_team_ids(project)
+            assert adviser.dit_team_id in team_ids
+            assert old_team_id not in team_ids
+
+    def test_project_delete(self):
+        """Test that team associations are deleted with the project."""
+        project = InvestmentProjectTeamMemberFactory().investment_project
+
+        project.delete()
+
+        assert not InvestmentProjectTeamAssociation.objects.exists()
+
+
+def test_update_team_associations_fixes_out_of_sync_rows():
+    """Test that update_team_associations() adds missing and removes obsolete rows."""
+    projects = InvestmentProjectFactory.create_batch(2)
+    InvestmentProjectTeamAssociation.objects.all().delete()
+    InvestmentProjectTeamAssociation.objects.create(
+        investment_project=projects[0],
+        dit_team=TeamFactory(),
+    )
+
+    update_team_associations(InvestmentProject.objects.values_list('pk', flat=True))
+
+    for project in projects:
+        assert _get_team_ids(project) == {
+            adviser.dit_team_id for adviser in project.get_associated_advisers()
+        }
@@ -4,9 +4,10 @@ from logging import getLogger
 from unittest import mock
 
 from django.conf import settings
+from django.db import transaction
 from notifications_python_client.notifications import NotificationsAPIClient
+from requests.adapters import HTTPAdapter
 
-from datahub.core.thread_pool import submit_to_thread_pool
 from datahub.feature_flag.utils import is_feature_flag_active
 from datahub.notification.constants import NotifyServiceName
 from datahub.notification.notify import notify_by_email
@@ -15,16 +16,13 @@ from datahub.omis.notification.constants import (
     OMIS_USE_NOTIFICATION_APP_FEATURE_FLAG_NAME,
     Template,
 )
+from datahub.omis.notification.models import NotificationOutboxEntry
+from datahub.omis.notification.tasks import schedule_send_pending_notifications
 from datahub.omis.region.models import UKRegionalSettings
 
 logger = getLogger(__name__)
 
 
-def send_email(client, **kwargs):
-    """Send email and catch potential errors."""
-    client.send_email_notification(**kwargs)
-
-
 class Notify:
     """Used to send notifications when something happens to an order.
 
@@ -42,6 +40,11 @@ class Notify:
             self.client = NotificationsAPIClient(
                 settings.OMIS_NOTIFICATION_API_KEY,
             )
+            # Reuse connections across the threads sending notifications
+            self.client.request_session.mount(
+                'https://',
+                HTTPAdapter(pool_maxsize=settings.OMIS_NOTIFICATION_MAX_CONCURRENCY),
+            )
         else:
             self.client = mock.Mock(spec_set=NotificationsAPIClient)
             warnings.warn(
@@ -54,7 +57,10 @@ class Notify:
             )
 
     def _send_email(self, **data):
-        """Send email in a separate thread."""
+        """Add an email to the notification outbox.
+
+        The email is sent by an RQ task once the current transaction has been committed.
+        """
         # override recipient if needed
         if settings.OMIS_NOTIFICATION_OVERRIDE_RECIPIENT_EMAIL:
             data['email_address'] = settings.OMIS_NOTIFICATION_OVERRIDE_RECIPIENT_EMAIL
@@ -68,7 +74,12 @@ class Notify:
                 NotifyServiceName.omis,
             )
         else:
-            submit_to_thread_pool(send_email, self.client, **data)
+            NotificationOutboxEntry.objects.create(
+                email_address=data['email_address'],
+                template_id=data['template_id'],
+                personalisation=data.get('personalisation'),
+            )
+            transaction.on_commit(schedule_send_pending_notifications)
 
     def _prepare_personalisation(self, order, data=None):
         """Prepare the personalisation data with common values."""
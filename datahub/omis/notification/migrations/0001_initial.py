@@ -0,0 +1,37 @@
+# Generated by Django 5.2.1 on 2026-10-19 10:54
+
+import django.core.serializers.json
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutboxEntry',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('created_on', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('email_address', models.CharField(max_length=255)),
+                ('template_id', models.CharField(max_length=255)),
+                ('personalisation', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=255)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_on', models.DateTimeField(default=django.utils.timezone.now)),
+                ('sent_on', models.DateTimeField(blank=True, null=True)),
+                ('notify_id', models.UUIDField(blank=True, help_text='The ID of the notification in GOV.UK Notify', null=True)),
+                ('error', models.TextField(blank=True)),
+            ],
+            options={
+                'verbose_name_plural': 'notification outbox entries',
+                'indexes': [models.Index(fields=['status', 'next_attempt_on'], name='omis_notifi_status_b4d438_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+import uuid
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.timezone import now
+
+MAX_LENGTH = settings.CHAR_FIELD_MAX_LENGTH
+
+
+class NotificationOutboxEntry(models.Model):
+    """An OMIS email notification waiting to be sent, or that has been sent, via GOV.UK Notify.
+
+    Entries are created in the same transaction as the change that triggered the notification
+    (so that nothing is sent if that transaction is rolled back), and are sent by the
+    send_pending_notifications RQ task (see datahub.omis.notification.tasks).
+    """
+
+    class Status(models.TextChoices):
+        PENDING = ('pending', 'Pending')
+        SENT = ('sent', 'Sent')
+        FAILED = ('failed', 'Failed')
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    created_on = models.DateTimeField(default=now, editable=False)
+    email_address = models.CharField(max_length=MAX_LENGTH)
+    template_id = models.CharField(max_length=MAX_LENGTH)
+    personalisation = models.JSONField(encoder=DjangoJSONEncoder, null=True, blank=True)
+    status = models.CharField(max_length=MAX_LENGTH, choices=Status, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_on = models.DateTimeField(default=now)
+    sent_on = models.DateTimeField(null=True, blank=True)
+    notify_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text='The ID of the notification in GOV.UK Notify',
+    )
+    error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_on']),
+        ]
+        verbose_name_plural = 'notification outbox entries'
+
+    def __str__(self):
+        """Human-friendly string representation."""
+        return f'{self.template_id} - {self.created_on} - {self.get_status_display()}'
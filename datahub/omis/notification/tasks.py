@@ -0,0 +1,157 @@
+import logging
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from time import sleep
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+from notifications_python_client.errors import APIError
+from redis import Redis
+from redis_rate_limit import RateLimit, TooManyRequests
+
+from datahub.core.queues.job_scheduler import job_scheduler
+from datahub.omis.notification.models import NotificationOutboxEntry
+
+logger = logging.getLogger(__name__)
+
+SEND_BATCH_SIZE = 50
+# The delay before the first retry of a notification, which doubles for each further attempt
+RETRY_BACKOFF = timedelta(minutes=1)
+# How long to wait before trying again when the rate limit has been reached
+RATE_LIMIT_WAIT = 0.1  # seconds
+
+
+def schedule_send_pending_notifications():
+    job = job_scheduler(
+        function=send_pending_notifications,
+        max_retries=None,
+    )
+    logger.info(f'Task {job.id} send_pending_notifications scheduled')
+    return job
+
+
+def send_pending_notifications(batch_size=SEND_BATCH_SIZE):
+    """Sends the OMIS notifications in the outbox that are due to be sent.
+
+    Notifications are sent by up to settings.OMIS_NOTIFICATION_MAX_CONCURRENCY threads using the
+    shared Notify client, and are rate limited across all workers to
+    settings.OMIS_NOTIFICATION_RATE_LIMIT per second.
+
+    Entries are locked using SELECT ... FOR UPDATE SKIP LOCKED, so concurrent runs of this task
+    send different notifications. Notifications that fail with a retryable error are retried with
+    exponential backoff, up to settings.OMIS_NOTIFICATION_MAX_ATTEMPTS attempts (retries are
+    picked up by the run of this task scheduled every minute).
+
+    :returns: the number of notifications sent
+    """
+    num_sent = 0
+
+    with ThreadPoolExecutor(max_workers=settings.OMIS_NOTIFICATION_MAX_CONCURRENCY) as executor:
+        while True:
+            with transaction.atomic():
+                entries = list(
+                    NotificationOutboxEntry.objects.select_for_update(skip_locked=True)
+                    .filter(
+                        status=NotificationOutboxEntry.Status.PENDING,
+                        next_attempt_on__lte=now(),
+                    )
+                    .order_by('created_on')[:batch_size],
+                )
+                if not entries:
+                    break
+
+                for entry, (notify_id, error) in zip(
+                    entries,
+                    executor.map(_send_notification, entries),
+                    strict=False,
+                ):
+                    _record_attempt(entry, notify_id, error)
+
+                NotificationOutboxEntry.objects.bulk_update(
+                    entries,
+                    fields=(
+                        'status',
+                        'attempts',
+                        'next_attempt_on',
+                        'sent_on',
+                        'notify_id',
+                        'error',
+                    ),
+                )
+
+            num_sent += sum(
+                entry.status == NotificationOutboxEntry.Status.SENT for entry in entries
+            )
+
+    logger.info(f'{num_sent} OMIS notifications sent')
+    return num_sent
+
+
+def _send_notification(entry):
+    """Sends a notification (in a worker thread).
+
+    :returns: tuple of (Notify notification ID, exception raised if the notification wasn't sent)
+    """
+    # Imported here to avoid a circular import
+    from datahub.omis.notification.client import notify
+
+    try:
+        _wait_for_rate_limit()
+        response = notify.client.send_email_notification(
+            email_address=entry.email_address,
+            template_id=entry.template_id,
+            personalisation=entry.personalisation,
+        )
+    except Exception as exc:
+        return None, exc
+
+    # (The mocked client used when no API key is configured doesn't return a response)
+    return (response['id'] if isinstance(response, dict) else None), None
+
+
+def _wait_for_rate_limit():
+    while True:
+        try:
+            with RateLimit(
+                resource='omis_notification',
+                client=socket.gethostname(),
+                max_requests=settings.OMIS_NOTIFICATION_RATE_LIMIT,
+                expire=1,
+                redis_pool=Redis.from_url(settings.REDIS_BASE_URL).connection_pool,
+            ):
+                return
+        except TooManyRequests:
+            sleep(RATE_LIMIT_WAIT)
+
+
+def _record_attempt(entry, notify_id, error):
+    entry.attempts += 1
+
+    if not error:
+        entry.status = NotificationOutboxEntry.Status.SENT
+        entry.sent_on = now()
+        entry.notify_id = notify_id
+        entry.error = ''
+        return
+
+    entry.error = f'{error.__class__.__name__}: {error}'
+    if _is_retryable(error) and entry.attempts < settings.OMIS_NOTIFICATION_MAX_ATTEMPTS:
+        entry.next_attempt_on = now() + RETRY_BACKOFF * 2 ** (entry.attempts - 1)
+        logger.warning(
+            f'OMIS notification {entry.pk} could not be sent (attempt {entry.attempts}), '
+            f'retrying at {entry.next_attempt_on}',
+            exc_info=error,
+        )
+        return
+
+    entry.status = NotificationOutboxEntry.Status.FAILED
+    logger.error(f'OMIS notification {entry.pk} could not be sent', exc_info=error)
+
+
+def _is_retryable(error):
+    """Whether an error could be temporary (a server error, rate limiting or a network error)."""
+    if isinstance(error, APIError):
+        return error.status_code >= 500 or error.status_code == 429
+    return True
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -40,3 +41,16 @@ def mocked_notify_client(use_notification_app):
         )
     client.reset_mock()
     return client
+
+
+@pytest.fixture
+def synchronous_outbox(monkeypatch):
+    """Send the notifications added to the outbox by the OMIS notify client straight away.
+
+    (Transactions are never committed during a test run, and unlike synchronous_on_commit this
+    does not run on-commit callbacks registered elsewhere, such as by the signal receivers.)
+    """
+    monkeypatch.setattr(
+        'datahub.omis.notification.client.transaction',
+        SimpleNamespace(on_commit=lambda fn, **kwargs: fn()),
+    )
@@ -23,7 +23,7 @@ from datahub.omis.region.models import UKRegionalSettings
 pytestmark = pytest.mark.django_db
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestSendEmail:
     """Tests for errors with the internal send_email function."""
 
@@ -64,7 +64,7 @@ class TestSendEmail:
         )
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyOrderInfo:
     """Tests for generic notifications related to an order."""
 
@@ -139,7 +139,7 @@ class TestNotifyOrderInfo:
         assert call_args['personalisation']['recipient name'] == 'example name'
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyOrderCreated:
     """Tests for notifications sent when an order is created."""
 
@@ -258,7 +258,7 @@ class TestNotifyOrderCreated:
         assert call_args['template_id'] != Template.order_created_for_regional_manager.value
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyAdviserAdded:
     """Tests for the adviser_added logic."""
 
@@ -287,7 +287,7 @@ class TestNotifyAdviserAdded:
         assert call_args['personalisation']['creation date'] == '18/05/2017'
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyAdviserRemoved:
     """Tests for the adviser_removed logic."""
 
@@ -308,7 +308,7 @@ class TestNotifyAdviserRemoved:
         assert call_args['personalisation']['recipient name'] == adviser.name
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyOrderPaid:
     """Tests for the order_paid logic."""
 
@@ -355,7 +355,7 @@ class TestNotifyOrderPaid:
             assert call['personalisation']['embedded link'] == order.get_datahub_frontend_url()
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyOrderCompleted:
     """Tests for the order_completed logic."""
 
@@ -387,7 +387,7 @@ class TestNotifyOrderCompleted:
             assert call['personalisation']['embedded link'] == order.get_datahub_frontend_url()
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyOrderCancelled:
     """Tests for the order_cancelled logic."""
 
@@ -434,7 +434,7 @@ class TestNotifyOrderCancelled:
             assert call['personalisation']['embedded link'] == order.get_datahub_frontend_url()
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyQuoteGenerated:
     """Tests for the quote_generated logic."""
 
@@ -481,7 +481,7 @@ class TestNotifyQuoteGenerated:
             assert call['personalisation']['embedded link'] == order.get_datahub_frontend_url()
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyQuoteAccepted:
     """Tests for the quote_accepted logic."""
 
@@ -528,7 +528,7 @@ class TestNotifyQuoteAccepted:
             assert call['personalisation']['embedded link'] == order.get_datahub_frontend_url()
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool')
+@pytest.mark.usefixtures('synchronous_outbox')
 class TestNotifyQuoteCancelled:
     """Tests for the quote_cancelled logic."""
 
@@ -17,7 +17,7 @@ from datahub.omis.order.test.factories import (
 pytestmark = pytest.mark.django_db
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNotifyPostSaveOrder:
     """Tests for notifications sent when an order is saved/updated."""
 
@@ -39,7 +39,7 @@ class TestNotifyPostSaveOrder:
         assert not mocked_notify_client.send_email_notification.called
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNofityPostSaveOrderAdviser:
     """Tests for notifications sent when an adviser is added to an order."""
 
@@ -68,7 +68,7 @@ class TestNofityPostSaveOrderAdviser:
         assert call_args['template_id'] == Template.you_have_been_added_for_adviser.value
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNofityPostDeleteOrderAdviser:
     """Tests for notifications sent when an adviser is removed from an order."""
 
@@ -101,7 +101,7 @@ class TestNofityPostDeleteOrderAdviser:
         assert call_args['template_id'] == Template.you_have_been_removed_for_adviser.value
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNofityPostOrderPaid:
     """Tests for notifications sent when an order is marked as paid."""
 
@@ -138,7 +138,7 @@ class TestNofityPostOrderPaid:
         ]
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNotifyPostOrderCompleted:
     """Tests for notifications sent when an order marked as completed."""
 
@@ -166,7 +166,7 @@ class TestNotifyPostOrderCompleted:
         ]
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNofityPostOrderCancelled:
     """Tests for notifications sent when an order is cancelled."""
 
@@ -195,7 +195,7 @@ class TestNofityPostOrderCancelled:
         ]
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNotifyPostQuoteGenerated:
     """Tests for notifications sent when a quote is generated."""
 
@@ -224,7 +224,7 @@ class TestNotifyPostQuoteGenerated:
         ]
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNotifyPostQuoteAccepted:
     """Tests for notifications sent when a quote is accepted."""
 
@@ -253,7 +253,7 @@ class TestNotifyPostQuoteAccepted:
         ]
 
 
-@pytest.mark.usefixtures('synchronous_thread_pool', 'synchronous_on_commit')
+@pytest.mark.usefixtures('synchronous_on_commit')
 class TestNotifyPostQuoteCancelled:
     """Tests for notifications sent when a quote is cancelled."""
 
@@ -0,0 +1,159 @@
+from contextlib import suppress
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from django.db import transaction
+from django.utils.timezone import now
+from freezegun import freeze_time
+
+from datahub.omis.notification.client import Notify
+from datahub.omis.notification.models import NotificationOutboxEntry
+from datahub.omis.notification.tasks import send_pending_notifications
+
+pytestmark = pytest.mark.django_db
+
+NOTIFY_EMAIL_URL = 'https://api.notifications.service.gov.uk/v2/notifications/email'
+FROZEN_TIME = '2024-01-01T12:00:00Z'
+
+
+@pytest.fixture(autouse=True)
+def frozen_time():
+    with freeze_time(FROZEN_TIME):
+        yield
+
+
+@pytest.fixture
+def notify_client(monkeypatch, settings):
+    """A real GOV.UK Notify client (with a fake API key) for use with requests_mock."""
+    settings.OMIS_NOTIFICATION_API_KEY = f'test-{uuid4()}-{uuid4()}'
+    monkeypatch.setattr('datahub.omis.notification.client.notify', Notify())
+
+
+@pytest.fixture
+def outbox_entry():
+    return NotificationOutboxEntry.objects.create(
+        email_address='test@example.com',
+        template_id=str(uuid4()),
+        personalisation={'order ref': 'ABC123/24'},
+    )
+
+
+@pytest.mark.usefixtures('notify_client')
+class TestSendPendingNotifications:
+    """Tests for send_pending_notifications()."""
+
+    def test_records_sent_notifications(self, requests_mock, outbox_entry):
+        """Test that sent notifications are recorded with the ID returned by Notify."""
+        notify_id = uuid4()
+        requests_mock.post(NOTIFY_EMAIL_URL, status_code=201, json={'id': str(notify_id)})
+
+        assert send_pending_notifications() == 1
+
+        outbox_entry.refresh_from_db()
+        assert outbox_entry.status == NotificationOutboxEntry.Status.SENT
+        assert outbox_entry.sent_on == now()
+        assert outbox_entry.notify_id == notify_id
+        assert outbox_entry.attempts == 1
+        assert requests_mock.last_request.json() == {
+            'email_address': 'test@example.com',
+            'template_id': outbox_entry.template_id,
+            'personalisation': {'order ref': 'ABC123/24'},
+        }
+
+    def test_retries_server_errors_with_backoff(self, requests_mock, outbox_entry):
+        """Test that notifications are retried with exponential backoff following server
+        errors.
+        """
+        requests_mock.post(NOTIFY_EMAIL_URL, status_code=500, json={'errors': []})
+
+        send_pending_notifications()
+        outbox_entry.refresh_from_db()
+        assert outbox_entry.status == NotificationOutboxEntry.Status.PENDING
+        assert outbox_entry.next_attempt_on == now() + timedelta(minutes=1)
+
+        # Not due yet
+        send_pending_notifications()
+        assert requests_mock.call_count == 1
+
+        outbox_entry.next_attempt_on = now()
+        outbox_entry.save()
+        send_pending_notifications()
+        outbox_entry.refresh_from_db()
+        assert requests_mock.call_count == 2
+        assert outbox_entry.attempts == 2
+        assert outbox_entry.next_attempt_on == now() + timedelta(minutes=2)
+
+    def test_fails_after_max_attempts(self, requests_mock, outbox_entry, settings):
+        """Test that a notification is marked as failed after the maximum number of attempts."""
+        settings.OMIS_NOTIFICATION_MAX_ATTEMPTS = 1
+        requests_mock.post(NOTIFY_EMAIL_URL, status_code=503, json={'errors': []})
+
+        send_pending_notifications()
+
+        outbox_entry.refresh_from_db()
+        assert outbox_entry.status == NotificationOutboxEntry.Status.FAILED
+        assert outbox_entry.attempts == 1
+
+    def test_does_not_retry_client_errors(self, requests_mock, outbox_entry):
+        """Test that notifications rejected by Notify are marked as failed without retrying."""
+        requests_mock.post(
+            NOTIFY_EMAIL_URL,
+            status_code=400,
+            json={'errors': [{'error': 'BadRequestError', 'message': 'Invalid template'}]},
+        )
+
+        send_pending_notifications()
+
+        outbox_entry.refresh_from_db()
+        assert outbox_entry.status == NotificationOutboxEntry.Status.FAILED
+        assert 'Invalid template' in outbox_entry.error
+
+    def test_sends_in_batches(self, requests_mock):
+        """Test that all pending notifications are sent when there are several batches."""
+        requests_mock.post(NOTIFY_EMAIL_URL, status_code=201, json={'id': str(uuid4())})
+        NotificationOutboxEntry.objects.bulk_create(
+            NotificationOutboxEntry(email_address='test@example.com', template_id='template')
+            for _ in range(5)
+        )
+
+        assert send_pending_notifications(batch_size=2) == 5
+
+        assert requests_mock.call_count == 5
+        assert not NotificationOutboxEntry.objects.filter(
+            status=NotificationOutboxEntry.Status.PENDING,
+        ).exists()
+
+
+@pytest.mark.usefixtures('notify_client')
+class TestNotifyOutbox:
+    """Tests for adding notifications to the outbox using the notify client."""
+
+    def test_nothing_sent_if_transaction_rolled_back(self, requests_mock):
+        """Test that a notification is neither stored nor sent if the transaction that added it
+        to the outbox is rolled back.
+        """
+        from datahub.omis.notification.client import notify
+
+        requests_mock.post(NOTIFY_EMAIL_URL, status_code=201, json={'id': str(uuid4())})
+
+        with suppress(ValueError), transaction.atomic():
+            notify._send_email(email_address='test@example.com', template_id='template')
+            raise ValueError
+
+        send_pending_notifications()
+
+        assert not NotificationOutboxEntry.objects.exists()
+        assert not requests_mock.called
+
+    def test_sent_on_commit(self, django_capture_on_commit_callbacks, requests_mock):
+        """Test that a notification is sent once the transaction that added it is committed."""
+        from datahub.omis.notification.client import notify
+
+        requests_mock.post(NOTIFY_EMAIL_URL, status_code=201, json={'id': str(uuid4())})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            notify._send_email(email_address='test@example.com', template_id='template')
+
+        assert requests_mock.call_count == 1
+        assert NotificationOutboxEntry.objects.get().status == NotificationOutboxEntry.Status.SENT
@@ -29,6 +29,12 @@ def govuk_url(path):
 class PayClient:
     """Client used to interface with GOV.UK Pay."""
 
+    def __init__(self, session=None):
+        """:param session: optional requests.Session used to make the requests
+        (e.g. to reuse connections when making many calls).
+        """
+        self.session = session
+
     @cached_property
     def _headers(self):
         """GOV.UK common headers including the Authorization one."""
@@ -66,7 +72,7 @@ class PayClient:
         url = govuk_url(path)
 
         logger.info(f'GOV.UK Pay - {method} call for url {url} - Preparing')
-        response = requests.request(method, url, **request_kwargs)
+        response = (self.session or requests).request(method, url, **request_kwargs)
         logger.info(
             f'GOV.UK Pay - {method} call for url {url} '
             f'- DONE - status code {response.status_code}',
@@ -42,12 +42,14 @@ class PaymentGatewaySession(BaseModel):
         """Human-readable representation."""
         return f'Payment gateway session {self.id} for order {self.order}'
 
-    def _get_payment_from_govuk_pay(self):
+    def _get_payment_from_govuk_pay(self, client=None):
         """:returns: the GOV.UK payment data for this payment gateway session
 
         :raises GOVUKPayAPIException: if there is a problem with GOV.UK Pay
+
+        :param client: optional PayClient instance to use
         """
-        return PayClient().get_payment_by_id(self.govuk_payment_id)
+        return (client or PayClient()).get_payment_by_id(self.govuk_payment_id)
 
     def get_payment_url(self):
         """:returns: the GOV.UK Pay payment url to redirect the users to complete the payment
@@ -70,7 +72,7 @@ class PaymentGatewaySession(BaseModel):
         )
 
     @transaction.atomic
-    def refresh_from_govuk_payment(self):
+    def refresh_from_govuk_payment(self, client=None):
         """Refreshes this record with the data from the related GOV.UK payment.
         If, during the update, the GOV.UK response says that the payment happened
         successfully, the related order gets marked as `paid` and an
@@ -80,12 +82,14 @@ class PaymentGatewaySession(BaseModel):
 
         :raises GOVUKPayAPIException: if there is a problem with GOV.UK Pay
 
+        :param client: optional PayClient instance to use
+
         Note: this should be the only method changing the status of this session object.
         """
         if self.is_finished():  # no need to refresh
             return False
 
-        govuk_payment = self._get_payment_from_govuk_pay()
+        govuk_payment = self._get_payment_from_govuk_pay(client=client)
         new_status = govuk_payment['state']['status']
         if new_status == self.status:  # no changes made
             return False
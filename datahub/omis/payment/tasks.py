@@ -1,70 +1,114 @@
 import logging
+from collections import Counter
 from datetime import timedelta
+from time import monotonic, sleep
 
+import requests
 from django.db import transaction
 from django.utils.timezone import now
 
-from datahub.core.queues.job_scheduler import job_scheduler
+from datahub.omis.payment.govukpay import GOVUKPayAPIException, PayClient
 from datahub.omis.payment.models import PaymentGatewaySession
 
 logger = logging.getLogger(__name__)
 
+REFRESH_CHUNK_SIZE = 25
+# GOV.UK Pay allows 15 requests per second per service, which also covers the user journey
+REFRESH_RATE_LIMIT = 5  # requests per second
 
-def schedule_refresh_payment_gateway_session(session_id, time_delta):
-    """Note: there's no retry setting as we don't want to retry in case of
-    exceptions. This is because the next periodic run of
-    `refresh_pending_payment_gateway_sessions` will trigger this task
-    again and in the meantime sentry errors can be analysed.
 
-    :param session_id: id of the payment gateway session to refresh.
-    :param time_delta: Schedules the job to run at X seconds/minutes/hours/days/weeks later.
-    """
-    job = job_scheduler(
-        time_delta=time_delta,
-        function=refresh_payment_gateway_session,
-        function_args=(session_id,),
-        max_retries=None,
-    )
-    logger.info(
-        f'Task {job.id} with {session_id} schedule_refresh_payment_gateway_session '
-        f'in {time_delta.seconds} seconds',
-    )
-    return job
-
-
-def refresh_payment_gateway_session(session_id):
-    """RQ task that refreshes the session with id `session_id`.
-
-    :param session_id: id of the payment gateway session to refresh.
-    """
-    with transaction.atomic():
-        qs = PaymentGatewaySession.objects.filter(pk=session_id)
-        session = qs.select_for_update().first()
-        session.refresh_from_govuk_payment()
+class TokenBucket:
+    """Token bucket rate limiter for calls made by the current process."""
+
+    def __init__(self, rate, capacity=1):
+        """:param rate: number of tokens added per second
+        :param capacity: maximum number of tokens that can be accumulated (i.e. the burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = monotonic()
+
+    def consume(self):
+        """Takes a token, waiting until one is available if necessary."""
+        while True:
+            current_time = monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (current_time - self.last_refill) * self.rate,
+            )
+            self.last_refill = current_time
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
 
-    logger.info(
-        f'Task session_id {session_id} refresh_payment_gateway_session completed',
-    )
+            sleep((1 - self.tokens) / self.rate)
 
 
-def refresh_pending_payment_gateway_sessions(age_check=60, refresh_rate=0.5):
+def refresh_pending_payment_gateway_sessions(
+    age_check=60,
+    chunk_size=REFRESH_CHUNK_SIZE,
+    rate_limit=REFRESH_RATE_LIMIT,
+):
     """RQ task that refreshes old ongoing payments in case something
     happens during the payment journey or the user abandons the payment
     session.
 
+    Sessions are processed in chunks, each in its own transaction. Rows are locked using
+    SELECT ... FOR UPDATE SKIP LOCKED so that several runs of this task (or a user completing
+    their payment) can proceed in parallel without refreshing the same session twice.
+
     :param age_check: minutes since the session was last modified to be
         included in the query. E.g. age_check=60 means that only ongoing
         sessions 1-hour old are refreshed.
         This is to give time to the user to complete the journey normally.
-    :param refresh_rate: delay in seconds between each refresh subtasks
+    :param chunk_size: number of sessions locked and refreshed in each transaction
+    :param rate_limit: maximum number of GOV.UK Pay calls per second
         to avoid hitting GOV.UK Pay too hard.
+
+    :returns: dict with the number of sessions refreshed by outcome (the new status of
+        sessions that changed status, 'unchanged' or 'error')
     """
     dt_check = now() - timedelta(minutes=age_check)
-    qs = PaymentGatewaySession.objects.ongoing()
-    session_ids = qs.filter(modified_on__lte=dt_check).values_list('id', flat=True)
-
-    for index, session_id in enumerate(session_ids):
-        schedule_refresh_payment_gateway_session(
-            session_id=session_id,
-            time_delta=(timedelta(seconds=refresh_rate * index)),
-        )
+    token_bucket = TokenBucket(rate_limit)
+    counts = Counter()
+    last_session_id = None
+
+    with requests.Session() as http_session:
+        client = PayClient(session=http_session)
+
+        while True:
+            with transaction.atomic():
+                qs = PaymentGatewaySession.objects.ongoing().filter(modified_on__lte=dt_check)
+                if last_session_id:
+                    qs = qs.filter(pk__gt=last_session_id)
+                sessions = list(
+                    qs.select_for_update(skip_locked=True).order_by('pk')[:chunk_size],
+                )
+                if not sessions:
+                    break
+
+                for session in sessions:
+                    token_bucket.consume()
+                    counts[_refresh_session(session, client)] += 1
+
+            last_session_id = sessions[-1].pk
+
+    logger.info(f'Pending payment gateway sessions refreshed: {dict(counts)}')
+    return dict(counts)
+
+
+def _refresh_session(session, client):
+    """Refreshes a locked session, logging (rather than raising) any GOV.UK Pay errors so that
+    the rest of the chunk can still be processed.
+
+    :returns: the outcome to include in the counts
+    """
+    try:
+        changed = session.refresh_from_govuk_payment(client=client)
+    except (GOVUKPayAPIException, requests.RequestException):
+        logger.exception(f'Payment gateway session {session.pk} could not be refreshed')
+        return 'error'
+
+    return session.status if changed else 'unchanged'
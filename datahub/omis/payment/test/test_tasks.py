@@ -1,4 +1,3 @@
-import logging
 import re
 from unittest.mock import Mock
 
@@ -8,7 +7,7 @@ from freezegun import freeze_time
 from datahub.omis.payment.constants import PaymentGatewaySessionStatus
 from datahub.omis.payment.govukpay import govuk_url
 from datahub.omis.payment.tasks import (
-    refresh_payment_gateway_session,
+    TokenBucket,
     refresh_pending_payment_gateway_sessions,
 )
 from datahub.omis.payment.test.factories import PaymentGatewaySessionFactory
@@ -17,19 +16,31 @@ from datahub.omis.payment.test.factories import PaymentGatewaySessionFactory
 pytestmark = pytest.mark.django_db
 
 
-class TestRefreshPendingPaymentGatewaySessions:
-    """Tests for the `refresh_pending_payment_gateway_sessions` and related
-    `refresh_payment_gateway_session` tasks.
-    """
+class FakeGOVUKPay:
+    """Local fake of the GOV.UK Pay get payment endpoint."""
 
-    def mock_sessions(self, requests_mock):
-        # mock call to GOV.UK Pay
-        requests_mock.register_uri(
+    def __init__(self, requests_mock, default_status='failed'):
+        self.statuses = {}
+        self.errors = set()
+        self.default_status = default_status
+        self.adapter = requests_mock.register_uri(
             'GET',
             re.compile(govuk_url('payments/*')),
-            json={'state': {'status': 'failed'}},
+            json=self._get_payment,
         )
 
+    def _get_payment(self, request, context):
+        payment_id = request.path.rsplit('/', 1)[-1]
+        if payment_id in self.errors:
+            context.status_code = 500
+            return {}
+        return {'state': {'status': self.statuses.get(payment_id, self.default_status)}}
+
+
+class TestRefreshPendingPaymentGatewaySessions:
+    """Tests for the `refresh_pending_payment_gateway_sessions` task."""
+
+    def mock_sessions(self):
         # populate db
         data = (
             # shouldn't be included because modified_on == 59 mins ago
@@ -51,58 +62,83 @@ class TestRefreshPendingPaymentGatewaySessions:
 
         return sessions
 
-    def test_schedule_refresh_payment_gateway_session(self, monkeypatch, requests_mock):
-        """Test that only ongoing sessions older than 60 minutes are refreshed against GOV.UK Pay.
+    @pytest.mark.parametrize('chunk_size', (1, 2, 25))
+    def test_refresh(self, requests_mock, chunk_size):
+        """Test that only ongoing sessions older than 60 minutes are refreshed against GOV.UK Pay,
+        whatever the chunk size.
         Note that the value '60 minutes' is a parameter initialised in the test
         and not part of the logic of the task.
         """
-        self.mock_sessions(requests_mock)
-
-        mock_schedule_refresh_payment_gateway_session = Mock()
-        monkeypatch.setattr(
-            'datahub.omis.payment.tasks.schedule_refresh_payment_gateway_session',
-            mock_schedule_refresh_payment_gateway_session,
-        )
+        fake_govuk_pay = FakeGOVUKPay(requests_mock)
+        sessions = self.mock_sessions()
 
         # make call
         with freeze_time('2017-04-18 20:00'):  # mocking now
-            refresh_pending_payment_gateway_sessions(age_check=60)
+            counts = refresh_pending_payment_gateway_sessions(
+                age_check=60,
+                chunk_size=chunk_size,
+                rate_limit=1000,
+            )
 
         # check result
-        assert mock_schedule_refresh_payment_gateway_session.call_count == 3
+        assert counts == {PaymentGatewaySessionStatus.FAILED: 3}
+        assert fake_govuk_pay.adapter.call_count == 3
+        for session in sessions[-3:]:
+            session.refresh_from_db()
+            assert session.status == PaymentGatewaySessionStatus.FAILED
 
-    def test_job_scheduler_schedule_refresh_payment_gateway_session(
-        self,
-        caplog,
-        monkeypatch,
-        requests_mock,
-    ):
-        self.mock_sessions(requests_mock)
-        caplog.set_level(logging.INFO)
+    def test_reports_state_changes(self, requests_mock):
+        """Test that the counts of sessions by outcome are returned."""
+        fake_govuk_pay = FakeGOVUKPay(requests_mock)
+        sessions = self.mock_sessions()
+        created_session, started_session, submitted_session = sessions[-3:]
+        fake_govuk_pay.statuses[created_session.govuk_payment_id] = 'created'
+        fake_govuk_pay.statuses[started_session.govuk_payment_id] = 'submitted'
+
+        with freeze_time('2017-04-18 20:00'):
+            counts = refresh_pending_payment_gateway_sessions(age_check=60, rate_limit=1000)
+
+        assert counts == {
+            'unchanged': 1,
+            PaymentGatewaySessionStatus.SUBMITTED: 1,
+            PaymentGatewaySessionStatus.FAILED: 1,
+        }
+
+    def test_continues_after_errors(self, requests_mock):
+        """Test that a GOV.UK Pay error for one session does not stop the other sessions in the
+        same chunk being refreshed.
+        """
+        fake_govuk_pay = FakeGOVUKPay(requests_mock)
+        sessions = self.mock_sessions()
+        failing_session = sessions[-3]
+        fake_govuk_pay.errors.add(failing_session.govuk_payment_id)
 
-        # make call
-        with freeze_time('2017-04-18 20:00'):  # mocking now
-            refresh_pending_payment_gateway_sessions(age_check=60)
+        with freeze_time('2017-04-18 20:00'):
+            counts = refresh_pending_payment_gateway_sessions(age_check=60, rate_limit=1000)
 
-        # check result
-        assert any(
-            'schedule_refresh_payment_gateway_session' in message for message in caplog.messages
-        )
-        # assert mock_payment_tasks_job_scheduler.call_count == 3
+        assert counts == {'error': 1, PaymentGatewaySessionStatus.FAILED: 2}
+        failing_session.refresh_from_db()
+        assert failing_session.status == PaymentGatewaySessionStatus.CREATED
 
-    def test_refresh(self, monkeypatch, requests_mock):
-        """Test that only ongoing sessions older than 60 minutes are refreshed against GOV.UK Pay.
-        Note that the value '60 minutes' is a parameter initialised in the test
-        and not part of the logic of the task.
-        """
-        sessions = self.mock_sessions(requests_mock)
 
-        # make call
-        with freeze_time('2017-04-18 20:00'):  # mocking now
-            for session in sessions:
-                refresh_payment_gateway_session(session_id=session.id)
+class TestTokenBucket:
+    """Tests for TokenBucket."""
 
-        # check result
-        for session in sessions[-3:]:
-            session.refresh_from_db()
-            assert session.status == PaymentGatewaySessionStatus.FAILED
+    def test_waits_for_tokens(self, monkeypatch):
+        """Test that consume() waits until a token is available once the capacity is used."""
+        current_time = 100.0
+        mock_sleep = Mock()
+
+        def _sleep(seconds):
+            nonlocal current_time
+            mock_sleep(seconds)
+            current_time += seconds
+
+        monkeypatch.setattr('datahub.omis.payment.tasks.monotonic', lambda: current_time)
+        monkeypatch.setattr('datahub.omis.payment.tasks.sleep', _sleep)
+
+        token_bucket = TokenBucket(rate=4, capacity=2)
+        for _ in range(4):
+            token_bucket.consume()
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.25, 0.25]
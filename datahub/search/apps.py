@@ -5,6 +5,7 @@ from django.apps import AppConfig
 from django.conf import settings
 
 from datahub.search.opensearch import configure_connection, index_exists
+from datahub.search.utils import db_model_has_field, get_mapping_source_fields
 
 EXCLUDE_ALL = object()
 
@@ -57,6 +58,22 @@ class SearchApp:
         """
         return None
 
+    @classmethod
+    def is_migration_copy_compatible(cls, current_mapping, target_mapping):
+        """Returns whether a migration between two mappings can be completed by copying the
+        existing documents to the new index (instead of resyncing them from the database).
+
+        By default, this is the case if the DB model has a modified_on field (so that objects
+        modified during the copy can be resynced afterwards) and only analyzers, sub-fields or
+        string field types have changed (so that the existing document source is still valid).
+
+        Apps should override this if a change to how documents are built accompanies an
+        otherwise copy-compatible mapping change.
+        """
+        return db_model_has_field(cls.queryset.model, 'modified_on') and (
+            get_mapping_source_fields(current_mapping) == get_mapping_source_fields(target_mapping)
+        )
+
     @classmethod
     def _load_submodule(cls, name):
         package, _, _ = cls.__module__.rpartition('.')
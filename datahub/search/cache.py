@@ -0,0 +1,49 @@
+import json
+from hashlib import blake2b
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+SEARCH_CACHE_HEADER = 'X-Search-Cache'
+
+
+def get_cached_search_response(search_app_name, cache_scope):
+    """Retrieve a cached search response for a search app and cache scope.
+
+    :returns: the cached response data, or None if there is no cached response
+    """
+    return cache.get(_cache_key(search_app_name, cache_scope))
+
+
+def cache_search_response(search_app_name, cache_scope, response_data):
+    """Add a search response for a search app and cache scope to the cache."""
+    cache.set(
+        _cache_key(search_app_name, cache_scope),
+        response_data,
+        timeout=settings.SEARCH_RESULT_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_search_cache(search_app_name):
+    """Invalidate all cached search responses for a search app.
+
+    This starts a new cache generation for the search app, so that previously cached responses
+    are no longer used (they then expire normally).
+    """
+    cache.set(_generation_cache_key(search_app_name), uuid4().hex, timeout=None)
+
+
+def _cache_key(search_app_name, cache_scope):
+    generation = cache.get_or_set(
+        _generation_cache_key(search_app_name),
+        lambda: uuid4().hex,
+        timeout=None,
+    )
+    serialised_scope = json.dumps(cache_scope, sort_keys=True, default=str).encode('utf-8')
+    scope_hash = blake2b(serialised_scope, digest_size=16).hexdigest()
+    return f'search_response:{search_app_name}:{generation}:{scope_hash}'
+
+
+def _generation_cache_key(search_app_name):
+    return f'search_response_generation:{search_app_name}'
@@ -113,6 +113,13 @@ class Company(BaseSearchModel):
         'is_global_ultimate': bool,
     }
 
+    # Fields of a global headquarters that are copied into the documents of its subsidiaries by
+    # MAPPINGS and COMPUTED_MAPPINGS, keyed by model label. When a company is saved, its
+    # subsidiaries are only resynced if one of these fields has changed.
+    DENORMALISED_FIELDS = {
+        'company.Company': ('name', 'one_list_account_owner'),
+    }
+
     SEARCH_FIELDS = (
         'id',
         'name',  # to find 2-letter words
@@ -8,6 +8,7 @@ from datahub.search.company.models import (
     Company as SearchCompany,
 )
 from datahub.search.deletion import delete_document
+from datahub.search.investment.models import InvestmentProject as SearchInvestmentProject
 from datahub.search.signals import SignalReceiver
 from datahub.search.sync_object import sync_object_async, sync_related_objects_async
 
@@ -49,8 +50,18 @@ def remove_company_from_opensearch(instance):
 
 receivers = (
     SignalReceiver(post_save, DBCompany, company_sync_search),
-    SignalReceiver(post_save, DBCompany, company_subsidiaries_sync_search),
-    SignalReceiver(post_save, DBCompany, company_investment_projects_sync_search),
+    SignalReceiver(
+        post_save,
+        DBCompany,
+        company_subsidiaries_sync_search,
+        denormalised_fields=SearchCompany.DENORMALISED_FIELDS[DBCompany._meta.label],
+    ),
+    SignalReceiver(
+        post_save,
+        DBCompany,
+        company_investment_projects_sync_search,
+        denormalised_fields=SearchInvestmentProject.DENORMALISED_FIELDS[DBCompany._meta.label],
+    ),
     SignalReceiver(post_save, DBInteraction, sync_related_company_to_opensearch),
     SignalReceiver(post_delete, DBCompany, remove_company_from_opensearch),
 )
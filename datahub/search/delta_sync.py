@@ -0,0 +1,82 @@
+from datetime import timedelta
+from logging import getLogger
+
+from django.conf import settings
+from django.db.models import Q
+
+from datahub.search.bulk_sync import sync_objects
+from datahub.search.migrate_utils import delete_from_secondary_indices_callback
+from datahub.search.models import SearchSyncWatermark
+from datahub.search.utils import db_model_has_field
+
+logger = getLogger(__name__)
+
+
+def delta_sync_app(search_app, batch_size=None):
+    """Syncs objects for an app that have been modified since the app's watermark.
+
+    Objects are synced in batches in modified_on and primary key order, and the watermark is
+    saved after each batch so that an interrupted sync resumes where it left off.
+
+    As modified_on is set before a transaction is committed, objects may be committed with a
+    modified_on value that is earlier than the watermark. To catch these, objects modified up to
+    OPENSEARCH_DELTA_SYNC_OVERLAP_SECONDS before the watermark are synced again.
+
+    Objects with no modified_on value are not picked up; reconcile_app() can be used for those.
+
+    :returns: the number of objects synced
+    """
+    model = search_app.queryset.model
+    if not db_model_has_field(model, 'modified_on'):
+        logger.info(f'Skipping delta sync for {search_app.name} as it has no modified_on field')
+        return 0
+
+    batch_size = batch_size or search_app.bulk_batch_size
+    watermark, _ = SearchSyncWatermark.objects.get_or_create(search_app_name=search_app.name)
+    read_indices, write_index = search_app.search_model.get_read_and_write_indices()
+
+    changed_rows = (
+        search_app.queryset.filter(modified_on__isnull=False)
+        .order_by('modified_on', 'pk')
+        .values_list('modified_on', 'pk')
+    )
+    position = None
+    if watermark.last_modified_on:
+        overlap = timedelta(seconds=settings.OPENSEARCH_DELTA_SYNC_OVERLAP_SECONDS)
+        if overlap:
+            changed_rows = changed_rows.filter(
+                modified_on__gte=watermark.last_modified_on - overlap,
+            )
+        else:
+            position = (watermark.last_modified_on, watermark.last_pk)
+
+    num_objects_synced = 0
+    while True:
+        batch_rows = changed_rows
+        if position:
+            last_modified_on, last_pk = position
+            batch_rows = batch_rows.filter(
+                Q(modified_on__gt=last_modified_on)
+                | Q(modified_on=last_modified_on, pk__gt=last_pk),
+            )
+        batch = list(batch_rows[:batch_size])
+        if not batch:
+            break
+
+        num_objects_synced += sync_objects(
+            search_app.search_model,
+            search_app.queryset.filter(pk__in=[pk for _, pk in batch]),
+            read_indices,
+            write_index,
+            post_batch_callback=delete_from_secondary_indices_callback,
+        )
+
+        position = batch[-1]
+        watermark.last_modified_on, watermark.last_pk = position[0], str(position[1])
+        watermark.save()
+
+    logger.info(
+        f'{search_app.name} delta sync complete: {num_objects_synced} objects synced, '
+        f'watermark {watermark.last_modified_on}',
+    )
+    return num_objects_synced
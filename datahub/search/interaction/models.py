@@ -120,6 +120,21 @@ class Interaction(BaseSearchModel):
         'is_event': attrgetter('is_event'),
     }
 
+    # Fields of related models that are copied into interaction documents by MAPPINGS and
+    # COMPUTED_MAPPINGS, keyed by model label. When a related object is saved, its interactions
+    # are only resynced if one of these fields has changed.
+    DENORMALISED_FIELDS = {
+        'company.Company': (
+            'name',
+            'trading_names',
+            'sector',
+            'global_headquarters',
+            'one_list_tier',
+        ),
+        'company.Contact': ('first_name', 'last_name'),
+        'investment.InvestmentProject': ('name', 'sector'),
+    }
+
     SEARCH_FIELDS = (
         'id',
         'company.name',
@@ -48,8 +48,14 @@ def sync_related_interactions_to_opensearch(instance):
 receivers = (
     SignalReceiver(post_save, DBInteraction, sync_interaction_to_opensearch),
     SignalReceiver(post_save, DBInteractionDITParticipant, sync_participant_to_opensearch),
-    SignalReceiver(post_save, DBCompany, sync_related_interactions_to_opensearch),
-    SignalReceiver(post_save, DBContact, sync_related_interactions_to_opensearch),
-    SignalReceiver(post_save, DBInvestmentProject, sync_related_interactions_to_opensearch),
+    *(
+        SignalReceiver(
+            post_save,
+            db_model,
+            sync_related_interactions_to_opensearch,
+            denormalised_fields=SearchInteraction.DENORMALISED_FIELDS[db_model._meta.label],
+        )
+        for db_model in (DBCompany, DBContact, DBInvestmentProject)
+    ),
     SignalReceiver(post_delete, DBInteraction, remove_interaction_from_opensearch),
 )
@@ -1,6 +1,9 @@
+from unittest.mock import Mock
+
 import pytest
 from opensearchpy.exceptions import NotFoundError
 
+from datahub.company.models import Company
 from datahub.interaction.test.factories import (
     CompanyInteractionFactory,
     InteractionDITParticipantFactory,
@@ -142,3 +145,24 @@ def test_updating_project_name_updates_interaction(opensearch_with_signals):
         id=interaction.pk,
     )
     assert result['_source']['investment_project']['name'] == new_project_name
+
+
+def test_saving_company_without_changing_denormalised_fields_does_not_sync_interactions(
+    opensearch_with_signals,
+    monkeypatch,
+):
+    """Test that when a company is saved without changing any of the fields copied into
+    interaction documents, the company's interactions are not resynced.
+    """
+    interaction = CompanyInteractionFactory()
+    sync_related_objects_async_mock = Mock()
+    monkeypatch.setattr(
+        'datahub.search.interaction.signals.sync_related_objects_async',
+        sync_related_objects_async_mock,
+    )
+
+    company = Company.objects.get(pk=interaction.company.pk)
+    company.description = 'new description'
+    company.save()
+
+    sync_related_objects_async_mock.assert_not_called()
@@ -73,6 +73,7 @@ class InvestmentSearchApp(SearchApp):
         'uk_region_locations',
         'interactions',
         'specific_programmes',
+        'team_associations',
         Prefetch(
             'team_members',
             queryset=InvestmentProjectTeamMember.objects.select_related('adviser__dit_team'),
@@ -97,7 +98,11 @@ class InvestmentSearchApp(SearchApp):
         dit_team_id = request.user.dit_team_id
         to_one_filters, to_many_filters = get_association_filters(dit_team_id)
 
+        # TODO: Remove the filters on the adviser fields once associated_team_ids has been
+        #  populated in all environments (they are only needed while documents indexed before
+        #  associated_team_ids was added still exist)
         return [
+            ('associated_team_ids', dit_team_id),
             *[(f'{field}.dit_team.id', value) for field, value in to_one_filters],
             *[(f'{field.es_field_name}.dit_team.id', value) for field, value in to_many_filters],
         ]
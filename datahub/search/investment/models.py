@@ -41,6 +41,7 @@ class InvestmentProject(BaseSearchModel):
     archived_on = Date()
     archived_reason = Text()
     associated_non_fdi_r_and_d_project = _related_investment_project_field()
+    associated_team_ids = Keyword()
     average_salary = fields.id_name_field()
     business_activities = fields.id_name_field()
     client_cannot_provide_foreign_investment = Boolean()
@@ -134,6 +135,9 @@ class InvestmentProject(BaseSearchModel):
     one_list_group_global_account_manager = fields.contact_or_adviser_field()
 
     COMPUTED_MAPPINGS = {
+        'associated_team_ids': lambda obj: [
+            str(association.dit_team_id) for association in obj.team_associations.all()
+        ],
         'one_list_group_global_account_manager': partial(
             dict_utils.nested_company_global_account_manager,
             company_prop_name='investor_company',
@@ -179,6 +183,18 @@ class InvestmentProject(BaseSearchModel):
         'uk_region_locations': lambda col: [dict_utils.id_name_dict(c) for c in col.all()],
     }
 
+    # Fields of an investor company that are copied into investment project documents by
+    # MAPPINGS and COMPUTED_MAPPINGS, keyed by model label. When a company is saved, its
+    # investment projects are only resynced if one of these fields has changed.
+    DENORMALISED_FIELDS = {
+        'company.Company': (
+            'name',
+            'address_country',
+            'global_headquarters',
+            'one_list_account_owner',
+        ),
+    }
+
     SEARCH_FIELDS = (
         'id',
         'name',
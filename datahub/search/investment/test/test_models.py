@@ -116,6 +116,7 @@ def test_investment_project_to_dict(opensearch):
         'r_and_d_budget',
         'non_fdi_r_and_d_budget',
         'associated_non_fdi_r_and_d_project',
+        'associated_team_ids',
         'new_tech_to_uk',
         'export_revenue',
         'client_requirements',
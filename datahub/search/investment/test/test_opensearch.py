@@ -102,6 +102,7 @@ def test_mapping(opensearch):
                 },
                 'type': 'object',
             },
+            'associated_team_ids': {'type': 'keyword'},
             'average_salary': {
                 'properties': {
                     'id': {'type': 'keyword'},
@@ -5,6 +5,7 @@ from csv import DictReader
 from decimal import Decimal
 from io import StringIO
 from unittest import mock
+from unittest.mock import MagicMock
 from uuid import UUID
 
 import factory
@@ -44,6 +45,7 @@ from datahub.investment.project.test.factories import (
 )
 from datahub.metadata.models import Sector
 from datahub.metadata.test.factories import TeamFactory
+from datahub.search.cache import SEARCH_CACHE_HEADER, invalidate_search_cache
 from datahub.search.investment import InvestmentSearchApp
 from datahub.search.investment.views import SearchInvestmentExportAPIView
 
@@ -2149,3 +2151,88 @@ class TestRelatedSearch(APITestMixin):
             },
         )
         assert response.status_code == 502
+
+
+class TestSearchResultCache(APITestMixin):
+    """Tests for caching of investment project search responses."""
+
+    @pytest.fixture
+    def execute_search_query_mock(self, monkeypatch, settings):
+        """Enables the cache and patches execute_search_query() to return no results."""
+        settings.SEARCH_RESULT_CACHE_TIMEOUT = 30
+        invalidate_search_cache(InvestmentSearchApp.name)
+        results = MagicMock()
+        results.hits.total.value = 0
+        execute_search_query_mock = mock.Mock(return_value=results)
+        monkeypatch.setattr(
+            'datahub.search.views.execute_search_query',
+            execute_search_query_mock,
+        )
+        return execute_search_query_mock
+
+    def test_repeated_search_is_cached(self, execute_search_query_mock):
+        """Test that an identical search is served from the cache."""
+        url = reverse('api-v3:search:investment_project')
+
+        first_response = self.api_client.post(url, {'original_query': 'test'})
+        second_response = self.api_client.post(url, {'original_query': 'test'})
+
+        assert first_response.status_code == status.HTTP_200_OK
+        assert first_response[SEARCH_CACHE_HEADER] == 'miss'
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response[SEARCH_CACHE_HEADER] == 'hit'
+        assert second_response.json() == first_response.json()
+        assert execute_search_query_mock.call_count == 1
+
+    def test_different_search_is_not_cached(self, execute_search_query_mock):
+        """Test that a search with different parameters is not served from the cache."""
+        url = reverse('api-v3:search:investment_project')
+
+        self.api_client.post(url, {'original_query': 'test'})
+        response = self.api_client.post(url, {'original_query': 'test', 'offset': 10})
+
+        assert response[SEARCH_CACHE_HEADER] == 'miss'
+        assert execute_search_query_mock.call_count == 2
+
+    def test_different_permission_scope_is_not_cached(self, execute_search_query_mock):
+        """Test that a user restricted to their team's projects does not get a response that was
+        cached for a user who can view all projects.
+        """
+        url = reverse('api-v3:search:investment_project')
+        restricted_user = create_test_user(
+            permission_codenames=[InvestmentProjectPermission.view_associated],
+            dit_team=TeamFactory(),
+        )
+
+        self.api_client.post(url, {'original_query': 'test'})
+        response = self.create_api_client(user=restricted_user).post(
+            url,
+            {'original_query': 'test'},
+        )
+
+        assert response[SEARCH_CACHE_HEADER] == 'miss'
+        assert execute_search_query_mock.call_count == 2
+
+    def test_alias_switch_invalidates_cache(self, execute_search_query_mock):
+        """Test that responses are no longer served from the cache once the cache is invalidated
+        (as happens when aliases are switched).
+        """
+        url = reverse('api-v3:search:investment_project')
+
+        self.api_client.post(url, {'original_query': 'test'})
+        invalidate_search_cache(InvestmentSearchApp.name)
+        response = self.api_client.post(url, {'original_query': 'test'})
+
+        assert response[SEARCH_CACHE_HEADER] == 'miss'
+        assert execute_search_query_mock.call_count == 2
+
+    def test_not_cached_when_disabled(self, execute_search_query_mock, settings):
+        """Test that responses are not cached if SEARCH_RESULT_CACHE_TIMEOUT is 0."""
+        settings.SEARCH_RESULT_CACHE_TIMEOUT = 0
+        url = reverse('api-v3:search:investment_project')
+
+        self.api_client.post(url, {'original_query': 'test'})
+        response = self.api_client.post(url, {'original_query': 'test'})
+
+        assert SEARCH_CACHE_HEADER not in response
+        assert execute_search_query_mock.call_count == 2
@@ -205,6 +205,8 @@ class SearchInvestmentProjectAPIViewMixin:
 class SearchInvestmentProjectAPIView(SearchInvestmentProjectAPIViewMixin, SearchAPIView):
     """Filtered investment project search view."""
 
+    cache_results = True
+
     def get_base_query(self, request, validated_data):
         """Add aggregations to show the number of projects at each stage."""
         investor_company_ids = validated_data.get('investor_company')
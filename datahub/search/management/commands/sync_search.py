@@ -2,8 +2,11 @@ from logging import WARNING, getLogger
 
 from django.core.management.base import BaseCommand, CommandError
 
+from datahub.core.queues.constants import HALF_DAY_IN_SECONDS
+from datahub.core.queues.job_scheduler import job_scheduler
+from datahub.core.queues.scheduler import LONG_RUNNING_QUEUE
 from datahub.search.apps import are_apps_initialised, get_search_apps, get_search_apps_by_name
-from datahub.search.tasks import schedule_model_sync
+from datahub.search.tasks import delta_sync_model, reconcile_model, schedule_model_sync
 
 logger = getLogger(__name__)
 
@@ -21,6 +24,18 @@ class Command(BaseCommand):
             choices=[search_app.name for search_app in get_search_apps()],
             help='Search model to import. If empty, it imports all',
         )
+        mode_group = parser.add_mutually_exclusive_group()
+        mode_group.add_argument(
+            '--delta',
+            action='store_true',
+            help='If specified, only objects modified since the last delta sync are synced.',
+        )
+        mode_group.add_argument(
+            '--reconcile',
+            action='store_true',
+            help='If specified, the index is compared with the database, and missing, stale '
+            'and orphaned documents are fixed.',
+        )
         parser.add_argument(
             '--foreground',
             action='store_true',
@@ -42,6 +57,14 @@ class Command(BaseCommand):
         for app in apps:
             task_args = (app.name,)
 
-            schedule_model_sync(task_args)
+            if options['delta'] or options['reconcile']:
+                job_scheduler(
+                    queue_name=LONG_RUNNING_QUEUE,
+                    function=delta_sync_model if options['delta'] else reconcile_model,
+                    function_args=task_args,
+                    job_timeout=HALF_DAY_IN_SECONDS,
+                )
+            else:
+                schedule_model_sync(task_args)
 
         logger.info('OpenSearch sync complete!')
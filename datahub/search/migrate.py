@@ -4,7 +4,8 @@ from datahub.core.exceptions import DataHubError
 from datahub.core.queues.constants import HALF_DAY_IN_SECONDS
 from datahub.core.queues.job_scheduler import job_scheduler
 from datahub.core.queues.scheduler import LONG_RUNNING_QUEUE
-from datahub.search.opensearch import create_index, start_alias_transaction
+from datahub.search.cache import invalidate_search_cache
+from datahub.search.opensearch import create_index, get_index_mapping, start_alias_transaction
 from datahub.search.tasks import complete_model_migration, sync_model
 
 logger = getLogger(__name__)
@@ -57,6 +58,11 @@ def _perform_migration(search_app):
             'a different index to the write alias',
         )
 
+    copy_documents = search_app.is_migration_copy_compatible(
+        get_index_mapping(current_write_index),
+        search_model._doc_type.mapping.to_dict(),
+    )
+
     logger.info(f'Updating aliases for the {app_name} search app')
 
     create_index(new_index_name, search_model._doc_type.mapping)
@@ -66,15 +72,18 @@ def _perform_migration(search_app):
         alias_transaction.associate_indices_with_alias(write_alias_name, [new_index_name])
         alias_transaction.dissociate_indices_from_alias(write_alias_name, [current_write_index])
 
-    _schedule_resync(search_app)
+    invalidate_search_cache(app_name)
+    _schedule_resync(search_app, copy_documents=copy_documents)
 
 
-def _schedule_resync(search_app):
-    logger.info(f'Scheduling resync and clean-up for the {search_app.name} search app')
+def _schedule_resync(search_app, copy_documents=False):
+    resync_type = 'copy' if copy_documents else 'resync'
+    logger.info(f'Scheduling {resync_type} and clean-up for the {search_app.name} search app')
     job = job_scheduler(
         queue_name=LONG_RUNNING_QUEUE,
         function=complete_model_migration,
         function_args=(search_app.name, search_app.search_model.get_target_mapping_hash()),
+        function_kwargs={'copy_documents': copy_documents},
         max_retries=5,
         retry_intervals=60,
         job_timeout=HALF_DAY_IN_SECONDS,
@@ -1,11 +1,18 @@
+from datetime import timedelta
 from logging import getLogger
 
+from django.conf import settings
+
 from datahub.core.exceptions import DataHubError
-from datahub.search.bulk_sync import sync_app
+from datahub.core.utils import slice_iterable_into_chunks
+from datahub.search.bulk_sync import sync_app, sync_objects
+from datahub.search.cache import invalidate_search_cache
 from datahub.search.deletion import delete_documents
 from datahub.search.opensearch import (
     delete_index,
     get_aliases_for_index,
+    get_index_creation_time,
+    reindex,
     start_alias_transaction,
 )
 
@@ -26,6 +33,63 @@ def resync_after_migrate(search_app):
     _clean_up_aliases_and_indices(search_app)
 
 
+def copy_after_migrate(search_app):
+    """Completes a copy-compatible migration by copying documents from the old indices, resyncing
+    objects modified since the migration started, updating aliases and removing old indices.
+
+    Documents written to the new index since it was created are not overwritten by the copy.
+    Objects modified or deleted around the time the copy ran are then fixed by resyncing the
+    objects modified since the new index was created (less the delta sync overlap) and
+    reconciling the new index with the database.
+    """
+    # Avoid a circular import, as reconciliation uses delete_from_secondary_indices_callback()
+    from datahub.search.reconciliation import reconcile_app
+
+    search_model = search_app.search_model
+    if not search_model.was_migration_started():
+        logger.warning(
+            f'No pending migration detected for the {search_app.name} search app, aborting '
+            f'copy...',
+        )
+        return
+
+    read_indices, write_index = search_model.get_read_and_write_indices()
+    modified_since = get_index_creation_time(write_index) - timedelta(
+        seconds=settings.OPENSEARCH_DELTA_SYNC_OVERLAP_SECONDS,
+    )
+
+    for index in read_indices - {write_index}:
+        num_copied = reindex(index, write_index)
+        logger.info(f'{num_copied} {search_app.name} documents copied from the {index} index')
+
+    _resync_objects_modified_since(search_app, modified_since)
+    reconcile_app(search_app)
+    _clean_up_aliases_and_indices(search_app)
+
+
+def _resync_objects_modified_since(search_app, modified_since):
+    read_indices, write_index = search_app.search_model.get_read_and_write_indices()
+    pks = (
+        search_app.queryset.filter(modified_on__gte=modified_since)
+        .values_list('pk', flat=True)
+        .iterator(chunk_size=search_app.bulk_batch_size)
+    )
+
+    num_objects_synced = 0
+    for batch in slice_iterable_into_chunks(pks, search_app.bulk_batch_size):
+        num_objects_synced += sync_objects(
+            search_app.search_model,
+            search_app.queryset.filter(pk__in=batch),
+            read_indices,
+            write_index,
+            post_batch_callback=delete_from_secondary_indices_callback,
+        )
+
+    logger.info(
+        f'{num_objects_synced} {search_app.name} objects modified since {modified_since} resynced',
+    )
+
+
 def _clean_up_aliases_and_indices(search_app):
     search_model = search_app.search_model
     read_alias = search_model.get_read_alias()
@@ -39,6 +103,7 @@ def _clean_up_aliases_and_indices(search_app):
     if indices_to_remove:
         with start_alias_transaction() as alias_transaction:
             alias_transaction.dissociate_indices_from_alias(read_alias, indices_to_remove)
+        invalidate_search_cache(search_app.name)
     else:
         logger.warning(f'No indices to remove for the {read_alias} alias')
 
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchSyncWatermark',
+            fields=[
+                ('search_app_name', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('last_modified_on', models.DateTimeField(blank=True, null=True)),
+                ('last_pk', models.CharField(blank=True, max_length=255)),
+                ('updated_on', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -2,6 +2,7 @@ from hashlib import blake2b
 from logging import getLogger
 
 from django.conf import settings
+from django.db import models
 from opensearch_dsl import Document, Keyword, MetaField
 
 from datahub.core.exceptions import DataHubError
@@ -17,6 +18,23 @@ from datahub.search.utils import get_model_non_mapped_field_names, serialise_map
 logger = getLogger(__name__)
 
 
+class SearchSyncWatermark(models.Model):
+    """The position up to which the objects of a search app have been synced by the delta sync.
+
+    The position is the modified_on value and primary key of the last object synced (in
+    modified_on and primary key order).
+    """
+
+    search_app_name = models.CharField(max_length=255, primary_key=True)
+    last_modified_on = models.DateTimeField(null=True, blank=True)
+    last_pk = models.CharField(max_length=255, blank=True)
+    updated_on = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """Human-readable representation."""
+        return f'{self.search_app_name} – {self.last_modified_on} – {self.last_pk}'
+
+
 class BaseSearchModel(Document):
     """Helps convert Django models to dictionaries."""
 
@@ -1,13 +1,21 @@
 from contextlib import contextmanager
+from datetime import datetime, timezone
 from logging import getLogger
+from time import perf_counter, sleep
 
 from django.conf import settings
 from opensearch_dsl import Index, analysis
 from opensearch_dsl.connections import connections
+from opensearchpy import Urllib3HttpConnection
 from opensearchpy.helpers import bulk as opensearch_bulk
 
+from datahub.core.exceptions import DataHubError
+from datahub.core.request_metrics import record_opensearch_request
+
 logger = getLogger(__name__)
 
+REINDEX_POLL_INTERVAL_SECS = 10
+
 # Normalises values to improve sorting (by keeping e, E, è, ê etc. together)
 lowercase_asciifolding_normalizer = analysis.normalizer(
     'lowercase_asciifolding_normalizer',
@@ -128,12 +136,25 @@ ANALYZERS = (
 )
 
 
+class InstrumentedConnection(Urllib3HttpConnection):
+    """OpenSearch connection that records requests in the metrics of the current API request."""
+
+    def perform_request(self, *args, **kwargs):
+        """Performs the request, recording its duration."""
+        start_time = perf_counter()
+        try:
+            return super().perform_request(*args, **kwargs)
+        finally:
+            record_opensearch_request(perf_counter() - start_time)
+
+
 def configure_connection():
     """Configure OpenSearch default connection."""
     connections_default = {
         'hosts': [settings.OPENSEARCH_URL],
         'verify_certs': settings.OPENSEARCH_VERIFY_CERTS,
         'pool_maxsize': settings.OPENSEARCH_POOL_MAXSIZE,
+        'connection_class': InstrumentedConnection,
     }
     connections.configure(default=connections_default)
 
@@ -177,6 +198,60 @@ def delete_index(index_name):
     client.indices.delete(index_name)
 
 
+def get_index_mapping(index_name):
+    """Gets the mapping of an existing index as a dict."""
+    client = get_client()
+    return client.indices.get_mapping(index=index_name)[index_name]['mappings']
+
+
+def get_index_creation_time(index_name):
+    """Gets the time an index was created as an aware datetime."""
+    client = get_client()
+    response = client.indices.get_settings(index=index_name, name='index.creation_date')
+    creation_timestamp_ms = int(response[index_name]['settings']['index']['creation_date'])
+    return datetime.fromtimestamp(creation_timestamp_ms / 1000, tz=timezone.utc)
+
+
+def reindex(source_index, dest_index, poll_interval=REINDEX_POLL_INTERVAL_SECS):
+    """Copies all documents from one index to another using a sliced server-side _reindex.
+
+    Documents that already exist in the destination index are left unchanged, so that documents
+    written to the destination index while the copy is running are not overwritten.
+
+    The copy is run as an OpenSearch task, which is polled until it has completed.
+
+    :returns: the number of documents copied
+    :raises DataHubError: if the task failed or any documents could not be copied
+    """
+    logger.info(f'Copying documents from the {source_index} index to the {dest_index} index...')
+    client = get_client()
+    response = client.reindex(
+        body={
+            'conflicts': 'proceed',
+            'source': {'index': source_index},
+            'dest': {'index': dest_index, 'op_type': 'create'},
+        },
+        slices='auto',
+        refresh=True,
+        wait_for_completion=False,
+    )
+    task_id = response['task']
+
+    task = client.tasks.get(task_id=task_id)
+    while not task['completed']:
+        sleep(poll_interval)
+        task = client.tasks.get(task_id=task_id)
+
+    task_response = task.get('response', {})
+    if task.get('error') or task_response.get('failures'):
+        raise DataHubError(
+            f'Errors copying documents from the {source_index} index to the {dest_index} '
+            f'index: {task.get("error") or task_response["failures"]!r}',
+        )
+
+    return task_response['created']
+
+
 def get_indices_for_aliases(*alias_names):
     """Gets the indices referenced by one or more aliases."""
     client = get_client()
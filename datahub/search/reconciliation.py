@@ -0,0 +1,123 @@
+from datetime import datetime
+from logging import getLogger
+
+from opensearch_dsl import Search
+
+from datahub.search.bulk_sync import sync_objects
+from datahub.search.deletion import delete_documents
+from datahub.search.migrate_utils import delete_from_secondary_indices_callback
+from datahub.search.utils import db_model_has_field, get_model_field_names
+
+logger = getLogger(__name__)
+
+
+def reconcile_app(search_app, chunk_size=None):
+    """Compares the objects for an app with the documents in its index, and fixes any drift.
+
+    Objects are compared with documents in primary key ranges of chunk_size objects.
+    Within each range:
+
+    - objects without a document are synced (missing)
+    - objects whose document has a different modified_on value are synced (stale)
+    - documents without an object are deleted (orphaned)
+
+    Stale documents are only detected for apps whose model and search model both have a
+    modified_on field.
+
+    This relies on the primary keys being UUIDs, as the primary key ranges are applied to the
+    id field of documents, and UUIDs sort in the same order in PostgreSQL as their string
+    representations do in OpenSearch.
+
+    :returns: a dict containing the number of missing, stale and orphaned documents found
+    """
+    chunk_size = chunk_size or search_app.bulk_batch_size
+    search_model = search_app.search_model
+    read_indices, write_index = search_model.get_read_and_write_indices()
+    compare_modified_on = db_model_has_field(
+        search_app.queryset.model,
+        'modified_on',
+    ) and 'modified_on' in get_model_field_names(search_model)
+
+    fields = ('pk', 'modified_on') if compare_modified_on else ('pk',)
+    rows = search_app.queryset.order_by('pk').values_list(*fields)
+    drift = {'missing': 0, 'stale': 0, 'orphaned': 0}
+    lower_pk = None
+    while True:
+        chunk_rows = rows.filter(pk__gt=lower_pk) if lower_pk else rows
+        chunk = list(chunk_rows[:chunk_size])
+        # The last range is left open so that orphaned documents after the last object are found
+        is_last_chunk = len(chunk) < chunk_size
+        upper_pk = None if is_last_chunk else str(chunk[-1][0])
+
+        db_modified_on = {str(row[0]): row[1] if compare_modified_on else None for row in chunk}
+        document_modified_on = _get_documents_in_range(
+            write_index,
+            lower_pk,
+            upper_pk,
+            compare_modified_on,
+        )
+
+        missing = db_modified_on.keys() - document_modified_on.keys()
+        stale = {
+            pk
+            for pk in db_modified_on.keys() & document_modified_on.keys()
+            if compare_modified_on and db_modified_on[pk] != document_modified_on[pk]
+        }
+        orphaned = document_modified_on.keys() - db_modified_on.keys()
+
+        if missing or stale:
+            sync_objects(
+                search_model,
+                search_app.queryset.filter(pk__in=missing | stale),
+                read_indices,
+                write_index,
+                post_batch_callback=delete_from_secondary_indices_callback,
+            )
+        if orphaned:
+            for index in {write_index, *read_indices}:
+                delete_documents(index, [{'_id': pk} for pk in orphaned])
+
+        drift['missing'] += len(missing)
+        drift['stale'] += len(stale)
+        drift['orphaned'] += len(orphaned)
+
+        if is_last_chunk:
+            break
+        lower_pk = upper_pk
+
+    log_message = (
+        f'{search_app.name} reconciliation complete: {drift["missing"]} missing, '
+        f'{drift["stale"]} stale and {drift["orphaned"]} orphaned documents found'
+    )
+    if any(drift.values()):
+        logger.warning(log_message)
+    else:
+        logger.info(log_message)
+    return drift
+
+
+def _get_documents_in_range(index, lower_pk, upper_pk, include_modified_on):
+    """Gets the documents with an id greater than lower_pk and less than or equal to upper_pk.
+
+    :returns: a dict of document id to modified_on value (or None if include_modified_on is
+        False)
+    """
+    id_range = {}
+    if lower_pk:
+        id_range['gt'] = lower_pk
+    if upper_pk:
+        id_range['lte'] = upper_pk
+
+    search = Search(index=index).source(['modified_on'] if include_modified_on else False)
+    if id_range:
+        search = search.filter('range', id=id_range)
+
+    return {
+        hit.meta.id: _parse_modified_on(hit) if include_modified_on else None
+        for hit in search.scan()
+    }
+
+
+def _parse_modified_on(hit):
+    modified_on = getattr(hit, 'modified_on', None)
+    return datetime.fromisoformat(modified_on) if modified_on else None
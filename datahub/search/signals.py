@@ -1,11 +1,17 @@
 from contextlib import contextmanager
+from copy import copy
+from functools import cached_property
 from logging import getLogger
 from threading import local
 
+from django.db.models.signals import post_init
+
 from datahub.search.apps import get_search_apps
 
 logger = getLogger(__name__)
 
+_NOT_LOADED = object()
+
 
 class SignalReceiver:
     """Helper class for managing signal receivers in search apps.
@@ -18,15 +24,28 @@ class SignalReceiver:
 
     The receivers attribute of that module should be a sequence of SignalReceiver instances which
     are automatically connected and disconnected as needed.
+
+    For post_save receivers that sync related documents, denormalised_fields can be set to the
+    names of the sender's fields that are copied into those documents. The values of those
+    fields are recorded when an object is loaded, and the receiver is then only called for a
+    saved object if it was created or one of those fields has changed.
     """
 
-    def __init__(self, signal, sender, receiver_func, forward_kwargs=False):
+    def __init__(
+        self,
+        signal,
+        sender,
+        receiver_func,
+        forward_kwargs=False,
+        denormalised_fields=None,
+    ):
         """Initialises the instance."""
         self.is_connected = False
         self.search_app = None
         self.signal = signal
         self.sender = sender
         self.forward_kwargs = forward_kwargs
+        self.denormalised_fields = denormalised_fields
         self._receiver_func = receiver_func
         self._thread_locals = local()
 
@@ -38,8 +57,21 @@ class SignalReceiver:
             f'__{self.sender.__name__}'
         )
 
+    @cached_property
+    def _denormalised_attnames(self):
+        return tuple(
+            self.sender._meta.get_field(field_name).attname
+            for field_name in self.denormalised_fields
+        )
+
     def connect(self):
         """Connects the signal receiver (for all threads)."""
+        if self.denormalised_fields is not None:
+            post_init.connect(
+                self._record_denormalised_field_values,
+                sender=self.sender,
+                dispatch_uid=self._dispatch_uid,
+            )
         self.signal.connect(
             self.on_signal_received,
             sender=self.sender,
@@ -49,6 +81,12 @@ class SignalReceiver:
 
     def disconnect(self):
         """Disconnects the signal receiver (for all threads)."""
+        if self.denormalised_fields is not None:
+            post_init.disconnect(
+                self._record_denormalised_field_values,
+                sender=self.sender,
+                dispatch_uid=self._dispatch_uid,
+            )
         self.signal.disconnect(
             self.on_signal_received,
             sender=self.sender,
@@ -81,11 +119,57 @@ class SignalReceiver:
 
     def on_signal_received(self, sender, instance, **kwargs):
         """Callback function passed to the signal."""
-        if self.is_enabled:
-            if self.forward_kwargs:
-                self._receiver_func(instance, **kwargs)
-            else:
-                self._receiver_func(instance)
+        if not self.is_enabled:
+            return
+
+        if self.denormalised_fields is not None:
+            has_changed = self._have_denormalised_fields_changed(instance, **kwargs)
+            self._record_denormalised_field_values(instance)
+            if not has_changed:
+                return
+
+        if self.forward_kwargs:
+            self._receiver_func(instance, **kwargs)
+        else:
+            self._receiver_func(instance)
+
+    def _get_denormalised_field_values(self, instance):
+        # Deferred fields are skipped, so that recording values doesn't make extra queries
+        return tuple(
+            instance.__dict__.get(attname, _NOT_LOADED) for attname in self._denormalised_attnames
+        )
+
+    def _record_denormalised_field_values(self, instance, **kwargs):
+        # Mutable values (e.g. from array fields) are copied so that in-place changes are seen
+        values = tuple(
+            copy(value) if isinstance(value, (list, dict)) else value
+            for value in self._get_denormalised_field_values(instance)
+        )
+        snapshots = instance.__dict__.setdefault('_search_denormalised_field_values', {})
+        snapshots[self._dispatch_uid] = values
+
+    def _have_denormalised_fields_changed(
+        self,
+        instance,
+        created=False,
+        update_fields=None,
+        **kwargs,
+    ):
+        if created:
+            return True
+
+        if update_fields is not None and not set(update_fields) & {
+            *self.denormalised_fields,
+            *self._denormalised_attnames,
+        }:
+            return False
+
+        snapshots = instance.__dict__.get('_search_denormalised_field_values', {})
+        previous_values = snapshots.get(self._dispatch_uid)
+        if previous_values is None or _NOT_LOADED in previous_values:
+            return True
+
+        return previous_values != self._get_denormalised_field_values(instance)
 
 
 @contextmanager
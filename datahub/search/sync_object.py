@@ -6,7 +6,7 @@ from datahub.core.models import BaseModel
 from datahub.core.queues.job_scheduler import job_scheduler
 from datahub.search.bulk_sync import sync_objects
 from datahub.search.migrate_utils import delete_from_secondary_indices_callback
-from datahub.search.tasks import sync_object_task, sync_related_objects_task
+from datahub.search.tasks import sync_object_task, sync_objects_task, sync_related_objects_task
 
 logger = getLogger(__name__)
 
@@ -37,6 +37,31 @@ def sync_object(search_app, pk):
     )
 
 
+def sync_objects_by_pk(search_app, pks):
+    """Syncs a batch of objects to OpenSearch.
+
+    Objects that no longer exist are skipped. Like sync_object(), this function is
+    migration-safe.
+    """
+    search_model = search_app.search_model
+    read_indices, write_index = search_model.get_read_and_write_indices()
+
+    objs = list(search_app.queryset.filter(pk__in=pks))
+    if objs:
+        sync_objects(
+            search_model,
+            objs,
+            read_indices,
+            write_index,
+            post_batch_callback=delete_from_secondary_indices_callback,
+        )
+    if len(objs) != len(pks):
+        logger.warning(
+            f'{len(pks) - len(objs)} {search_app.name} objects were not synced as they '
+            'no longer exist',
+        )
+
+
 def sync_object_async(search_app, pk):
     """Syncs a single object to OpenSearch asynchronously (by scheduling a RQ task).
 
@@ -77,6 +102,31 @@ def sync_object_async(search_app, pk):
     )
 
 
+def sync_objects_async(search_app, pks):
+    """Syncs a batch of objects to OpenSearch asynchronously (by scheduling a single RQ task).
+
+    This should be used instead of calling sync_object_async() for each object when objects
+    have been updated in bulk.
+    """
+    pks = [str(pk) for pk in pks]
+    if not pks:
+        return
+
+    job = job_scheduler(
+        function=sync_objects_task,
+        function_args=(
+            search_app.name,
+            pks,
+        ),
+        max_retries=15,
+        retry_backoff=True,
+    )
+    logger.info(
+        f'Task {job.id} sync_objects_task {search_app.name} '
+        f'scheduled to synchronise {len(pks)} objects',
+    )
+
+
 def sync_related_objects_async(
     related_obj,
     related_obj_field_name,
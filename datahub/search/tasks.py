@@ -9,7 +9,9 @@ from datahub.core.queues.job_scheduler import job_scheduler
 from datahub.core.queues.scheduler import LONG_RUNNING_QUEUE
 from datahub.search.apps import get_search_app, get_search_app_by_model, get_search_apps
 from datahub.search.bulk_sync import sync_app
-from datahub.search.migrate_utils import resync_after_migrate
+from datahub.search.delta_sync import delta_sync_app
+from datahub.search.migrate_utils import copy_after_migrate, resync_after_migrate
+from datahub.search.reconciliation import reconcile_app
 
 logger = getLogger(__name__)
 
@@ -38,6 +40,55 @@ def sync_model(search_app_name):
     sync_app(search_app)
 
 
+def delta_sync_all_models():
+    """Task that starts sub-tasks to sync objects modified since the last delta sync for all
+    models.
+    """
+    for search_app in get_search_apps():
+        job = job_scheduler(
+            queue_name=LONG_RUNNING_QUEUE,
+            function=delta_sync_model,
+            function_args=(search_app.name,),
+            job_timeout=HALF_DAY_IN_SECONDS,
+        )
+        logger.info(f'Task {job.id} delta_sync_model scheduled for {search_app.name}')
+
+
+def delta_sync_model(search_app_name):
+    """Task that syncs objects modified since the last delta sync for a single model."""
+    with advisory_lock(f'leeloo-delta_sync_model-{search_app_name}', wait=False) as lock_held:
+        if not lock_held:
+            logger.info(
+                f'Another delta_sync_model task is in progress for the {search_app_name} '
+                f'search app. Skipping...',
+            )
+            return
+
+        search_app = get_search_app(search_app_name)
+        delta_sync_app(search_app)
+
+
+def reconcile_all_models():
+    """Task that starts sub-tasks to reconcile OpenSearch with the database for all models."""
+    for search_app in get_search_apps():
+        job = job_scheduler(
+            queue_name=LONG_RUNNING_QUEUE,
+            function=reconcile_model,
+            function_args=(search_app.name,),
+            job_timeout=HALF_DAY_IN_SECONDS,
+        )
+        logger.info(f'Task {job.id} reconcile_model scheduled for {search_app.name}')
+
+
+def reconcile_model(search_app_name):
+    """Task that reconciles OpenSearch with the database for a single model.
+
+    :returns: the drift counts found
+    """
+    search_app = get_search_app(search_app_name)
+    return reconcile_app(search_app)
+
+
 def sync_object_task(search_app_name, pk):
     """Syncs a single object to OpenSearch.
 
@@ -54,6 +105,21 @@ def sync_object_task(search_app_name, pk):
     sync_object(search_app, pk)
 
 
+def sync_objects_task(search_app_name, pks):
+    """Syncs a batch of objects to OpenSearch.
+
+    This is used in place of sync_object_task when many objects have been updated at once
+    (for example, using QuerySet.update()), so that they are indexed using a single bulk request.
+    """
+    from datahub.search.sync_object import sync_objects_by_pk
+
+    logger.info(
+        f"Running sync_objects_task search_app_name '{search_app_name}' for {len(pks)} objects",
+    )
+    search_app = get_search_app(search_app_name)
+    sync_objects_by_pk(search_app, pks)
+
+
 def sync_related_objects_task(
     related_model_label,
     related_obj_pk,
@@ -109,8 +175,12 @@ def sync_related_objects_task(
         )
 
 
-def complete_model_migration(search_app_name, new_mapping_hash):
-    """Completes a migration by performing a full resync, updating aliases and removing old indices."""
+def complete_model_migration(search_app_name, new_mapping_hash, copy_documents=False):
+    """Completes a migration by performing a full resync, updating aliases and removing old indices.
+
+    If copy_documents is True, documents are copied from the old indices using _reindex and only
+    objects modified during the migration are resynced instead.
+    """
     search_app = get_search_app(search_app_name)
     if search_app.search_model.get_target_mapping_hash() != new_mapping_hash:
         warning_message = f"""Unexpected target mapping hash. This indicates that the task was \
@@ -130,4 +200,7 @@ Rescheduling the {search_app_name} search app migration to attempt to resolve th
             )
             return
 
-        resync_after_migrate(search_app)
+        if copy_documents:
+            copy_after_migrate(search_app)
+        else:
+            resync_after_migrate(search_app)
@@ -59,3 +59,27 @@ def test_sync_invalid_model(sync_model_mock):
     management.call_command(sync_search.Command(), model='invalid')
 
     assert sync_model_mock.call_count == 0
+
+
+@pytest.mark.parametrize(
+    ('option', 'expected_task'),
+    [
+        ('delta', 'delta_sync_model'),
+        ('reconcile', 'reconcile_model'),
+    ],
+)
+@mock.patch('datahub.search.management.commands.sync_search.job_scheduler')
+@mock.patch('datahub.search.management.commands.sync_search.schedule_model_sync')
+@mock.patch(
+    'datahub.search.apps.index_exists',
+    mock.Mock(return_value=True),
+)
+def test_sync_with_mode(sync_model_mock, job_scheduler_mock, option, expected_task):
+    """Test that --delta and --reconcile schedule the corresponding task instead of a full sync."""
+    search_app = next(iter(get_search_apps()))
+    management.call_command(sync_search.Command(), model=[search_app.name], **{option: True})
+
+    sync_model_mock.assert_not_called()
+    job_scheduler_mock.assert_called_once()
+    assert job_scheduler_mock.call_args.kwargs['function'] is getattr(sync_search, expected_task)
+    assert job_scheduler_mock.call_args.kwargs['function_args'] == (search_app.name,)
@@ -2,6 +2,7 @@ from unittest import mock
 
 import pytest
 
+from datahub.metadata.models import Country
 from datahub.search.apps import (
     get_search_app,
     get_search_app_by_model,
@@ -77,3 +78,99 @@ class TestGetSearchAppBySearchModel:
         """
         with pytest.raises(LookupError):
             get_search_app_by_model(mock.Mock())
+
+
+CURRENT_MAPPING = {
+    'dynamic': 'false',
+    'properties': {
+        'id': {'type': 'keyword'},
+        'name': {'type': 'text', 'analyzer': 'english_analyzer'},
+        'address': {
+            'type': 'object',
+            'properties': {
+                'line_1': {'type': 'text'},
+            },
+        },
+    },
+}
+
+
+class TestIsMigrationCopyCompatible:
+    """Tests for `SearchApp.is_migration_copy_compatible`."""
+
+    @pytest.mark.parametrize(
+        'target_properties',
+        [
+            # Changing an analyzer
+            {'name': {'type': 'text', 'analyzer': 'trigram_analyzer'}},
+            # Adding a sub-field
+            {
+                'name': {
+                    'type': 'text',
+                    'analyzer': 'english_analyzer',
+                    'fields': {'keyword': {'type': 'keyword'}},
+                },
+            },
+            # Changing a string field type
+            {'name': {'type': 'keyword'}},
+        ],
+    )
+    def test_compatible(self, target_properties):
+        """Test that mapping changes that don't affect the document source are copy-compatible."""
+        target_mapping = {
+            **CURRENT_MAPPING,
+            'properties': {**CURRENT_MAPPING['properties'], **target_properties},
+        }
+
+        assert SimpleModelSearchApp.is_migration_copy_compatible(CURRENT_MAPPING, target_mapping)
+
+    @pytest.mark.parametrize(
+        'target_properties',
+        [
+            # Adding a field
+            {'country': {'type': 'text'}},
+            # Adding a nested field
+            {
+                'address': {
+                    'type': 'object',
+                    'properties': {
+                        'line_1': {'type': 'text'},
+                        'line_2': {'type': 'text'},
+                    },
+                },
+            },
+            # Changing a field type
+            {'name': {'type': 'date'}},
+        ],
+    )
+    def test_incompatible(self, target_properties):
+        """Test that mapping changes that affect the document source are not copy-compatible."""
+        target_mapping = {
+            **CURRENT_MAPPING,
+            'properties': {**CURRENT_MAPPING['properties'], **target_properties},
+        }
+
+        assert not SimpleModelSearchApp.is_migration_copy_compatible(
+            CURRENT_MAPPING,
+            target_mapping,
+        )
+
+    def test_removed_field_is_incompatible(self):
+        """Test that removing a field is not copy-compatible."""
+        target_properties = dict(CURRENT_MAPPING['properties'])
+        del target_properties['address']
+        target_mapping = {**CURRENT_MAPPING, 'properties': target_properties}
+
+        assert not SimpleModelSearchApp.is_migration_copy_compatible(
+            CURRENT_MAPPING,
+            target_mapping,
+        )
+
+    def test_model_without_modified_on_is_incompatible(self, monkeypatch):
+        """Test that apps whose DB model has no modified_on field are never copy-compatible."""
+        monkeypatch.setattr(SimpleModelSearchApp, 'queryset', Country.objects.all())
+
+        assert not SimpleModelSearchApp.is_migration_copy_compatible(
+            CURRENT_MAPPING,
+            CURRENT_MAPPING,
+        )
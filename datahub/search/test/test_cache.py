@@ -0,0 +1,52 @@
+import pytest
+
+from datahub.search.cache import (
+    cache_search_response,
+    get_cached_search_response,
+    invalidate_search_cache,
+)
+
+SCOPE = {
+    'view': 'test-view',
+    'validated_data': {'original_query': 'test', 'offset': 0, 'limit': 10},
+    'permission_filters': None,
+}
+
+
+@pytest.fixture(autouse=True)
+def _enable_cache(settings):
+    settings.SEARCH_RESULT_CACHE_TIMEOUT = 30
+
+
+def test_cached_response_is_returned():
+    """Test that a cached response is returned for the same app and scope."""
+    response = {'count': 1, 'results': [{'id': '1'}]}
+    cache_search_response('test-app', SCOPE, response)
+
+    assert get_cached_search_response('test-app', dict(SCOPE)) == response
+
+
+@pytest.mark.parametrize(
+    ('search_app_name', 'scope'),
+    [
+        ('another-app', SCOPE),
+        ('test-app', {**SCOPE, 'permission_filters': [('dit_team.id', '1')]}),
+        ('test-app', {**SCOPE, 'validated_data': {**SCOPE['validated_data'], 'offset': 10}}),
+    ],
+)
+def test_different_app_or_scope_is_not_returned(search_app_name, scope):
+    """Test that a cached response is not returned for a different app or scope."""
+    cache_search_response('test-app', SCOPE, {'count': 0, 'results': []})
+
+    assert get_cached_search_response(search_app_name, scope) is None
+
+
+def test_invalidate_search_cache():
+    """Test that cached responses are not returned after the cache is invalidated for the app."""
+    cache_search_response('test-app', SCOPE, {'count': 0, 'results': []})
+    cache_search_response('another-app', SCOPE, {'count': 0, 'results': []})
+
+    invalidate_search_cache('test-app')
+
+    assert get_cached_search_response('test-app', SCOPE) is None
+    assert get_cached_search_response('another-app', SCOPE) is not None
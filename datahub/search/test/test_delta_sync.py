@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from freezegun import freeze_time
+
+from datahub.metadata.models import Country
+from datahub.search.delta_sync import delta_sync_app
+from datahub.search.models import SearchSyncWatermark
+from datahub.search.test.search_support.models import SimpleModel
+from datahub.search.test.utils import create_mock_search_app
+
+pytestmark = pytest.mark.django_db
+
+FROZEN_DATETIME = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def sync_objects_mock(monkeypatch):
+    """Patches sync_objects() so that the IDs of the synced objects are recorded."""
+    mock = Mock(side_effect=lambda search_model, objs, *args, **kwargs: len(objs))
+    monkeypatch.setattr('datahub.search.delta_sync.sync_objects', mock)
+    return mock
+
+
+def _create_objects_modified_at(*minutes):
+    objs = []
+    for minute in minutes:
+        with freeze_time(FROZEN_DATETIME + timedelta(minutes=minute)):
+            objs.append(SimpleModel.objects.create())
+    return objs
+
+
+def _get_synced_pks(sync_objects_mock):
+    return [{obj.pk for obj in call.args[1]} for call in sync_objects_mock.call_args_list]
+
+
+@pytest.fixture(autouse=True)
+def _no_overlap(settings):
+    settings.OPENSEARCH_DELTA_SYNC_OVERLAP_SECONDS = 0
+
+
+class TestDeltaSyncApp:
+    """Tests for delta_sync_app()."""
+
+    def test_syncs_all_objects_without_watermark(self, sync_objects_mock):
+        """Test that all objects are synced, in batches, if the app has no watermark yet."""
+        objs = _create_objects_modified_at(2, 0, 1)
+        search_app = create_mock_search_app(queryset=SimpleModel.objects.all())
+
+        num_synced = delta_sync_app(search_app, batch_size=2)
+
+        assert num_synced == 3
+        assert _get_synced_pks(sync_objects_mock) == [{objs[1].pk, objs[2].pk}, {objs[0].pk}]
+        watermark = SearchSyncWatermark.objects.get(search_app_name=search_app.name)
+        assert watermark.last_modified_on == objs[0].modified_on
+        assert watermark.last_pk == str(objs[0].pk)
+
+    def test_syncs_only_objects_modified_after_watermark(self, sync_objects_mock):
+        """Test that only objects modified after the watermark are synced."""
+        objs = _create_objects_modified_at(0, 1)
+        search_app = create_mock_search_app(queryset=SimpleModel.objects.all())
+        delta_sync_app(search_app)
+        sync_objects_mock.reset_mock()
+
+        with freeze_time(FROZEN_DATETIME + timedelta(minutes=5)):
+            objs[0].save()
+        new_obj = _create_objects_modified_at(6)[0]
+        num_synced = delta_sync_app(search_app)
+
+        assert num_synced == 2
+        assert _get_synced_pks(sync_objects_mock) == [{objs[0].pk, new_obj.pk}]
+
+    def test_does_nothing_if_nothing_modified(self, sync_objects_mock):
+        """Test that nothing is synced if no objects have been modified since the watermark."""
+        _create_objects_modified_at(0, 1)
+        search_app = create_mock_search_app(queryset=SimpleModel.objects.all())
+        delta_sync_app(search_app)
+        sync_objects_mock.reset_mock()
+
+        assert delta_sync_app(search_app) == 0
+        sync_objects_mock.assert_not_called()
+
+    def test_resumes_after_last_synced_batch(self, sync_objects_mock):
+        """Test that if a sync is interrupted, the next sync resumes after the last batch that
+        was synced.
+        """
+        objs = _create_objects_modified_at(0, 1, 2)
+        search_app = create_mock_search_app(queryset=SimpleModel.objects.all())
+        sync_objects_mock.side_effect = [1, ValueError('sync failed')]
+
+        with pytest.raises(ValueError, match='sync failed'):
+            delta_sync_app(search_app, batch_size=1)
+
+        sync_objects_mock.reset_mock(side_effect=True)
+        sync_objects_mock.side_effect = lambda search_model, objs, *args, **kwargs: len(objs)
+        delta_sync_app(search_app, batch_size=1)
+
+        assert _get_synced_pks(sync_objects_mock) == [{objs[1].pk}, {objs[2].pk}]
+
+    def test_resyncs_objects_within_overlap(self, sync_objects_mock, settings):
+        """Test that objects modified shortly before the watermark are synced again."""
+        settings.OPENSEARCH_DELTA_SYNC_OVERLAP_SECONDS = 120
+        objs = _create_objects_modified_at(0, 5, 6)
+        search_app = create_mock_search_app(queryset=SimpleModel.objects.all())
+        delta_sync_app(search_app)
+        sync_objects_mock.reset_mock()
+
+        delta_sync_app(search_app)
+
+        assert _get_synced_pks(sync_objects_mock) == [{objs[1].pk, objs[2].pk}]
+
+    def test_skips_models_without_modified_on(self, sync_objects_mock):
+        """Test that apps whose model has no modified_on field are skipped."""
+        search_app = create_mock_search_app(queryset=Country.objects.all())
+
+        assert delta_sync_app(search_app) == 0
+        sync_objects_mock.assert_not_called()
+        assert not SearchSyncWatermark.objects.exists()
@@ -82,6 +82,7 @@ def test_migrate_app_with_app_needing_migration(monkeypatch, mock_opensearch_cli
     mock_client = mock_opensearch_client.return_value
     old_index = 'test-index'
     new_index = 'test-index-target-hash'
+    mock_client.indices.get_mapping.return_value = {old_index: {'mappings': {}}}
     current_hash = 'current-hash'
     target_hash = 'target-hash'
     mock_app = create_mock_search_app(
@@ -122,6 +123,47 @@ def test_migrate_app_with_app_needing_migration(monkeypatch, mock_opensearch_cli
     assert migrate_model_task_mock.params == [
         (mock_app.name, target_hash),
     ]
+    assert migrate_model_task_mock.keywords == [{'copy_documents': False}]
+
+
+def test_migrate_app_with_copy_compatible_migration(monkeypatch, mock_opensearch_client):
+    """Test that migrate_app() schedules a copy instead of a full resync when the migration is
+    copy-compatible.
+    """
+    migrate_model_task_mock = PickleableMock()
+    monkeypatch.setattr(
+        'datahub.search.migrate.complete_model_migration',
+        migrate_model_task_mock.queue_handler,
+    )
+    monkeypatch.setattr('datahub.search.migrate.create_index', Mock())
+    invalidate_search_cache_mock = Mock()
+    monkeypatch.setattr(
+        'datahub.search.migrate.invalidate_search_cache',
+        invalidate_search_cache_mock,
+    )
+
+    current_mapping = {'properties': {'id': {'type': 'keyword'}}}
+    mock_client = mock_opensearch_client.return_value
+    mock_client.indices.get_mapping.return_value = {'test-index': {'mappings': current_mapping}}
+    target_hash = 'target-hash'
+    mock_app = create_mock_search_app(
+        current_mapping_hash='current-hash',
+        target_mapping_hash=target_hash,
+        write_index='test-index',
+    )
+    mock_app.is_migration_copy_compatible.return_value = True
+
+    migrate_app(mock_app)
+
+    mock_app.is_migration_copy_compatible.assert_called_once_with(
+        current_mapping,
+        mock_app.search_model._doc_type.mapping.to_dict.return_value,
+    )
+    assert migrate_model_task_mock.params == [
+        (mock_app.name, target_hash),
+    ]
+    assert migrate_model_task_mock.keywords == [{'copy_documents': True}]
+    invalidate_search_cache_mock.assert_called_once_with(mock_app.name)
 
 
 def test_migrate_app_with_app_not_needing_migration(
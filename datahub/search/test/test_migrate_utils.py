@@ -1,13 +1,17 @@
+from datetime import datetime, timezone
 from unittest.mock import ANY, Mock
 
 import pytest
+from freezegun import freeze_time
 
 from datahub.core.exceptions import DataHubError
 from datahub.core.test_utils import MockQuerySet
 from datahub.search.migrate_utils import (
+    copy_after_migrate,
     delete_from_secondary_indices_callback,
     resync_after_migrate,
 )
+from datahub.search.test.search_support.models import SimpleModel
 from datahub.search.test.utils import create_mock_search_app
 
 
@@ -213,3 +217,107 @@ class TestResyncAfterMigrate:
             mock_app,
             post_batch_callback=delete_from_secondary_indices_callback,
         )
+
+
+@pytest.mark.django_db
+class TestCopyAfterMigrate:
+    """Tests for copy_after_migrate()."""
+
+    @pytest.fixture
+    def copy_mocks(self, monkeypatch, settings):
+        """Patches the functions called by copy_after_migrate()."""
+        settings.OPENSEARCH_DELTA_SYNC_OVERLAP_SECONDS = 60
+        mocks = {
+            'reindex': Mock(return_value=2),
+            'get_index_creation_time': Mock(
+                return_value=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+            ),
+            'sync_objects': Mock(
+                side_effect=lambda search_model, objs, *args, **kwargs: len(objs),
+            ),
+            'get_aliases_for_index': Mock(return_value=set()),
+        }
+        for name, mock in mocks.items():
+            monkeypatch.setattr(f'datahub.search.migrate_utils.{name}', mock)
+        mocks['reconcile_app'] = Mock()
+        monkeypatch.setattr('datahub.search.reconciliation.reconcile_app', mocks['reconcile_app'])
+        return mocks
+
+    def test_copies_documents_and_resyncs_modified_objects(
+        self,
+        copy_mocks,
+        mock_opensearch_client,
+    ):
+        """Test that copy_after_migrate() copies documents from the old index, resyncs objects
+        modified since the new index was created (less the overlap), reconciles the new index
+        and updates the read alias and deletes the old index.
+        """
+        with freeze_time(datetime(2025, 1, 1, 11, 58, tzinfo=timezone.utc)):
+            SimpleModel.objects.create()
+        with freeze_time(datetime(2025, 1, 1, 11, 59, 30, tzinfo=timezone.utc)):
+            modified_obj = SimpleModel.objects.create()
+
+        mock_client = mock_opensearch_client.return_value
+        mock_app = create_mock_search_app(
+            read_indices={'index1', 'index2'},
+            write_index='index1',
+            queryset=SimpleModel.objects.all(),
+        )
+
+        copy_after_migrate(mock_app)
+
+        copy_mocks['get_index_creation_time'].assert_called_once_with('index1')
+        copy_mocks['reindex'].assert_called_once_with('index2', 'index1')
+        assert copy_mocks['sync_objects'].call_count == 1
+        sync_objects_call = copy_mocks['sync_objects'].call_args
+        assert [obj.pk for obj in sync_objects_call.args[1]] == [modified_obj.pk]
+        assert sync_objects_call.kwargs == {
+            'post_batch_callback': delete_from_secondary_indices_callback,
+        }
+        copy_mocks['reconcile_app'].assert_called_once_with(mock_app)
+        mock_client.indices.update_aliases.assert_called_once_with(
+            body={
+                'actions': [
+                    {
+                        'remove': {
+                            'alias': 'test-read-alias',
+                            'indices': ['index2'],
+                        },
+                    },
+                ],
+            },
+        )
+        mock_client.indices.delete.assert_called_once_with('index2')
+
+    def test_does_nothing_without_migration(self, copy_mocks, mock_opensearch_client):
+        """Test that copy_after_migrate() aborts if there is only a single read index."""
+        mock_client = mock_opensearch_client.return_value
+        mock_app = create_mock_search_app(
+            read_indices={'index1'},
+            write_index='index1',
+            queryset=SimpleModel.objects.all(),
+        )
+
+        copy_after_migrate(mock_app)
+
+        copy_mocks['reindex'].assert_not_called()
+        copy_mocks['sync_objects'].assert_not_called()
+        copy_mocks['reconcile_app'].assert_not_called()
+        mock_client.indices.update_aliases.assert_not_called()
+        mock_client.indices.delete.assert_not_called()
+
+    def test_does_not_clean_up_on_copy_error(self, copy_mocks, mock_opensearch_client):
+        """Test that the old index is kept if the copy fails."""
+        copy_mocks['reindex'].side_effect = DataHubError('copy failed')
+        mock_client = mock_opensearch_client.return_value
+        mock_app = create_mock_search_app(
+            read_indices={'index1', 'index2'},
+            write_index='index1',
+            queryset=SimpleModel.objects.all(),
+        )
+
+        with pytest.raises(DataHubError):
+            copy_after_migrate(mock_app)
+
+        mock_client.indices.update_aliases.assert_not_called()
+        mock_client.indices.delete.assert_not_called()
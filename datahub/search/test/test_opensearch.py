@@ -1,9 +1,12 @@
+from datetime import datetime, timezone
 from unittest import mock
 
 import pytest
 from django.conf import settings
 from opensearch_dsl import Keyword, Mapping
 
+from datahub.core.exceptions import DataHubError
+from datahub.core.request_metrics import collect_request_metrics
 from datahub.search import opensearch as opensearch_client
 
 
@@ -48,10 +51,24 @@ def test_configure_connection(connections, settings):
             'hosts': [settings.OPENSEARCH_URL],
             'verify_certs': settings.OPENSEARCH_VERIFY_CERTS,
             'pool_maxsize': settings.OPENSEARCH_POOL_MAXSIZE,
+            'connection_class': opensearch_client.InstrumentedConnection,
         },
     )
 
 
+@mock.patch('opensearchpy.Urllib3HttpConnection.perform_request')
+def test_instrumented_connection_records_requests(perform_request):
+    """Test that OpenSearch requests are recorded in the metrics for the current request."""
+    perform_request.return_value = (200, {}, '{}')
+    connection = opensearch_client.InstrumentedConnection()
+
+    with collect_request_metrics() as metrics:
+        assert connection.perform_request('GET', '/') == (200, {}, '{}')
+
+    assert metrics.opensearch_requests == 1
+    assert metrics.opensearch_duration > 0
+
+
 def test_creates_index(monkeypatch, mock_connection_for_create_index):
     """Test creates_index()."""
     monkeypatch.setattr(
@@ -281,3 +298,80 @@ def test_create_alias(mock_opensearch_client):
 
     opensearch_client.associate_index_with_alias(alias_name, index_name)
     client.indices.put_alias.assert_called_with(index_name, alias_name)
+
+
+def test_get_index_mapping(mock_opensearch_client):
+    """Test get_index_mapping()."""
+    index = 'test-index'
+    mapping = {'properties': {'id': {'type': 'keyword'}}}
+    client = mock_opensearch_client.return_value
+    client.indices.get_mapping.return_value = {index: {'mappings': mapping}}
+
+    assert opensearch_client.get_index_mapping(index) == mapping
+    client.indices.get_mapping.assert_called_once_with(index=index)
+
+
+def test_get_index_creation_time(mock_opensearch_client):
+    """Test get_index_creation_time()."""
+    index = 'test-index'
+    client = mock_opensearch_client.return_value
+    client.indices.get_settings.return_value = {
+        index: {'settings': {'index': {'creation_date': '1735732800123'}}},
+    }
+
+    assert opensearch_client.get_index_creation_time(index) == datetime(
+        2025,
+        1,
+        1,
+        12,
+        0,
+        0,
+        123000,
+        tzinfo=timezone.utc,
+    )
+
+
+class TestReindex:
+    """Tests for reindex()."""
+
+    def test_copies_documents(self, mock_opensearch_client):
+        """Test that a sliced _reindex task is started and polled until it has completed."""
+        client = mock_opensearch_client.return_value
+        client.reindex.return_value = {'task': 'node:1'}
+        client.tasks.get.side_effect = [
+            {'completed': False},
+            {'completed': True, 'response': {'created': 10, 'failures': []}},
+        ]
+
+        assert opensearch_client.reindex('old-index', 'new-index', poll_interval=0) == 10
+
+        client.reindex.assert_called_once_with(
+            body={
+                'conflicts': 'proceed',
+                'source': {'index': 'old-index'},
+                'dest': {'index': 'new-index', 'op_type': 'create'},
+            },
+            slices='auto',
+            refresh=True,
+            wait_for_completion=False,
+        )
+        assert client.tasks.get.call_args_list == [
+            mock.call(task_id='node:1'),
+            mock.call(task_id='node:1'),
+        ]
+
+    @pytest.mark.parametrize(
+        'task',
+        [
+            {'completed': True, 'error': {'type': 'index_not_found_exception'}},
+            {'completed': True, 'response': {'created': 1, 'failures': [{'id': '1'}]}},
+        ],
+    )
+    def test_raises_on_failure(self, mock_opensearch_client, task):
+        """Test that an error is raised if the task failed or documents could not be copied."""
+        client = mock_opensearch_client.return_value
+        client.reindex.return_value = {'task': 'node:1'}
+        client.tasks.get.return_value = task
+
+        with pytest.raises(DataHubError):
+            opensearch_client.reindex('old-index', 'new-index', poll_interval=0)
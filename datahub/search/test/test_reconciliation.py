@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+
+from datahub.company.models import Company
+from datahub.company.test.factories import CompanyFactory
+from datahub.search.company import CompanySearchApp
+from datahub.search.reconciliation import reconcile_app
+from datahub.search.sync_object import sync_object
+from datahub.search.test.search_support.models import SimpleModel
+from datahub.search.test.search_support.simplemodel import SimpleModelSearchApp
+from datahub.search.test.utils import doc_exists
+
+pytestmark = pytest.mark.django_db
+
+
+def test_reconcile_app_fixes_missing_and_orphaned_documents(opensearch):
+    """Test that objects without a document are synced and documents without an object are
+    deleted, across multiple chunks.
+    """
+    synced_objs = SimpleModel.objects.bulk_create([SimpleModel() for _ in range(3)])
+    for obj in synced_objs:
+        sync_object(SimpleModelSearchApp, obj.pk)
+    missing_objs = SimpleModel.objects.bulk_create([SimpleModel() for _ in range(2)])
+
+    orphaned_obj = SimpleModel.objects.create()
+    sync_object(SimpleModelSearchApp, orphaned_obj.pk)
+    orphaned_obj_id = orphaned_obj.pk
+    orphaned_obj.delete()
+    opensearch.indices.refresh()
+
+    drift = reconcile_app(SimpleModelSearchApp, chunk_size=2)
+    opensearch.indices.refresh()
+
+    assert drift == {'missing': 2, 'stale': 0, 'orphaned': 1}
+    for obj in [*synced_objs, *missing_objs]:
+        assert doc_exists(opensearch, SimpleModelSearchApp, obj.pk)
+    assert not doc_exists(opensearch, SimpleModelSearchApp, orphaned_obj_id)
+
+
+def test_reconcile_app_fixes_stale_documents(opensearch):
+    """Test that objects whose document has a different modified_on value are synced."""
+    stale_company, up_to_date_company = CompanyFactory.create_batch(2)
+    sync_object(CompanySearchApp, stale_company.pk)
+    sync_object(CompanySearchApp, up_to_date_company.pk)
+    Company.objects.filter(pk=stale_company.pk).update(
+        name='new name',
+        modified_on=now() + timedelta(minutes=1),
+    )
+    opensearch.indices.refresh()
+
+    drift = reconcile_app(CompanySearchApp)
+    opensearch.indices.refresh()
+
+    assert drift == {'missing': 0, 'stale': 1, 'orphaned': 0}
+    doc = opensearch.get(
+        index=CompanySearchApp.search_model.get_read_alias(),
+        id=stale_company.pk,
+    )
+    assert doc['_source']['name'] == 'new name'
+
+
+def test_reconcile_app_does_nothing_if_in_sync(opensearch):
+    """Test that nothing is changed if the index matches the database."""
+    company = CompanyFactory()
+    sync_object(CompanySearchApp, company.pk)
+    opensearch.indices.refresh()
+
+    assert reconcile_app(CompanySearchApp) == {'missing': 0, 'stale': 0, 'orphaned': 0}
@@ -3,9 +3,10 @@ from unittest.mock import Mock
 
 import pytest
 from django.db import close_old_connections, transaction
+from django.db.models.signals import post_save
 
 from datahub.search.apps import get_search_apps
-from datahub.search.signals import disable_search_signal_receivers
+from datahub.search.signals import SignalReceiver, disable_search_signal_receivers
 from datahub.search.test.search_support.models import RelatedModel, SimpleModel
 
 
@@ -146,3 +147,90 @@ class TestDisableSignalsForModel:
             for receiver in search_app.get_signal_receivers()
             if receiver.sender is SimpleModel
         )
+
+
+@pytest.fixture
+def denormalised_fields_receiver():
+    """A connected post_save receiver for SimpleModel that declares denormalised fields."""
+    receiver = SignalReceiver(
+        post_save,
+        SimpleModel,
+        Mock(__name__='callback', __module__=__name__),
+        denormalised_fields=('name', 'address'),
+    )
+    receiver.connect()
+    yield receiver
+    receiver.disconnect()
+
+
+@pytest.mark.django_db
+class TestSignalReceiverDenormalisedFields:
+    """Tests for SignalReceiver with denormalised_fields set."""
+
+    def test_called_on_create(self, denormalised_fields_receiver):
+        """Test that the receiver is called when an object is created."""
+        obj = SimpleModel.objects.create(name='name')
+
+        denormalised_fields_receiver._receiver_func.assert_called_once_with(obj)
+
+    @pytest.mark.parametrize(
+        ('field', 'value', 'expected_call_count'),
+        [
+            ('name', 'new name', 1),
+            ('address', 'new address', 1),
+            ('country', 'new country', 0),
+            ('name', 'name', 0),
+        ],
+    )
+    def test_called_only_if_denormalised_field_changed(
+        self,
+        denormalised_fields_receiver,
+        field,
+        value,
+        expected_call_count,
+    ):
+        """Test that the receiver is only called if a denormalised field has changed."""
+        SimpleModel.objects.create(name='name')
+        obj = SimpleModel.objects.get()
+        denormalised_fields_receiver._receiver_func.reset_mock()
+
+        setattr(obj, field, value)
+        obj.save()
+
+        assert denormalised_fields_receiver._receiver_func.call_count == expected_call_count
+
+    def test_compares_with_last_saved_values(self, denormalised_fields_receiver):
+        """Test that changes are detected relative to the last time the object was saved."""
+        obj = SimpleModel.objects.create(name='name')
+        obj.name = 'new name'
+        obj.save()
+        denormalised_fields_receiver._receiver_func.reset_mock()
+
+        obj.save()
+
+        denormalised_fields_receiver._receiver_func.assert_not_called()
+
+    def test_not_called_if_update_fields_excludes_denormalised_fields(
+        self,
+        denormalised_fields_receiver,
+    ):
+        """Test that the receiver isn't called if only other fields are being saved."""
+        obj = SimpleModel.objects.create(name='name')
+        denormalised_fields_receiver._receiver_func.reset_mock()
+
+        obj.name = 'new name'
+        obj.save(update_fields=('country',))
+
+        denormalised_fields_receiver._receiver_func.assert_not_called()
+
+    def test_called_if_field_was_deferred(self, denormalised_fields_receiver):
+        """Test that the receiver is called if a denormalised field wasn't loaded, as whether
+        it has changed isn't known.
+        """
+        SimpleModel.objects.create(name='name')
+        obj = SimpleModel.objects.only('pk').get()
+        denormalised_fields_receiver._receiver_func.reset_mock()
+
+        obj.save()
+
+        denormalised_fields_receiver._receiver_func.assert_called_once_with(obj)
@@ -1,6 +1,11 @@
 import pytest
 
-from datahub.search.sync_object import sync_object, sync_object_async, sync_related_objects_async
+from datahub.search.sync_object import (
+    sync_object,
+    sync_object_async,
+    sync_objects_async,
+    sync_related_objects_async,
+)
 from datahub.search.test.search_support.models import RelatedModel, SimpleModel
 from datahub.search.test.search_support.relatedmodel import RelatedModelSearchApp
 from datahub.search.test.search_support.simplemodel import SimpleModelSearchApp
@@ -64,3 +69,34 @@ def test_sync_object_task_handles_obj_no_longer_in_db(opensearch, caplog):
         f'Object {SimpleModelSearchApp.name} may have been deleted before being synced'
         in caplog.text
     )
+
+
+@pytest.mark.django_db
+def test_sync_objects_task_syncs_using_rq(opensearch):
+    """Test that a batch of objects can be synced to OpenSearch using a single RQ task."""
+    objs = [SimpleModel.objects.create() for _ in range(3)]
+    sync_objects_async(SimpleModelSearchApp, [obj.pk for obj in objs])
+    opensearch.indices.refresh()
+
+    for obj in objs:
+        assert doc_exists(opensearch, SimpleModelSearchApp, obj.pk)
+
+
+@pytest.mark.django_db
+def test_sync_objects_task_handles_objs_no_longer_in_db(opensearch, caplog):
+    """Test that syncing a batch of objects skips objects that have been deleted."""
+    caplog.set_level('WARNING')
+    obj = SimpleModel.objects.create()
+    deleted_obj = SimpleModel.objects.create()
+    deleted_obj_id = deleted_obj.pk
+    deleted_obj.delete()
+
+    sync_objects_async(SimpleModelSearchApp, [obj.pk, deleted_obj_id])
+    opensearch.indices.refresh()
+
+    assert doc_exists(opensearch, SimpleModelSearchApp, obj.pk)
+    assert not doc_exists(opensearch, SimpleModelSearchApp, deleted_obj_id)
+    assert (
+        f'1 {SimpleModelSearchApp.name} objects were not synced as they no longer exist'
+        in caplog.text
+    )
@@ -8,6 +8,10 @@ from datahub.search.apps import get_search_apps
 from datahub.search.sync_object import sync_object_async, sync_related_objects_async
 from datahub.search.tasks import (
     complete_model_migration,
+    delta_sync_all_models,
+    delta_sync_model,
+    reconcile_all_models,
+    reconcile_model,
     sync_all_models,
     sync_model,
 )
@@ -46,6 +50,74 @@ def test_sync_all_models(monkeypatch):
     assert sync_model_mock.times == len(get_search_apps())
 
 
+def test_delta_sync_all_models(monkeypatch):
+    """Test that the delta_sync_all_models task starts sub-tasks to delta sync all models."""
+    delta_sync_model_mock = PickleableMock()
+    monkeypatch.setattr(
+        'datahub.search.tasks.delta_sync_model',
+        delta_sync_model_mock.queue_handler,
+    )
+
+    delta_sync_all_models()
+
+    assert delta_sync_model_mock.called is True
+    assert delta_sync_model_mock.times == len(get_search_apps())
+
+
+@pytest.mark.django_db
+def test_delta_sync_model(monkeypatch):
+    """Test that the delta_sync_model task starts a delta sync for that model."""
+    get_search_app_mock = Mock()
+    monkeypatch.setattr('datahub.search.tasks.get_search_app', get_search_app_mock)
+    delta_sync_app_mock = Mock()
+    monkeypatch.setattr('datahub.search.tasks.delta_sync_app', delta_sync_app_mock)
+
+    delta_sync_model('test-app')
+
+    get_search_app_mock.assert_called_once_with('test-app')
+    delta_sync_app_mock.assert_called_once_with(get_search_app_mock.return_value)
+
+
+@pytest.mark.django_db
+def test_delta_sync_model_aborts_when_already_in_progress(monkeypatch):
+    """Test that the delta_sync_model task aborts when the lock for the same search app is
+    already held.
+    """
+    delta_sync_app_mock = Mock()
+    monkeypatch.setattr('datahub.search.tasks.delta_sync_app', delta_sync_app_mock)
+    advisory_lock_mock = MagicMock()
+    advisory_lock_mock.return_value.__enter__.return_value = False
+    monkeypatch.setattr('datahub.search.tasks.advisory_lock', advisory_lock_mock)
+
+    delta_sync_model('test-app')
+
+    delta_sync_app_mock.assert_not_called()
+
+
+def test_reconcile_all_models(monkeypatch):
+    """Test that the reconcile_all_models task starts sub-tasks to reconcile all models."""
+    reconcile_model_mock = PickleableMock()
+    monkeypatch.setattr('datahub.search.tasks.reconcile_model', reconcile_model_mock.queue_handler)
+
+    reconcile_all_models()
+
+    assert reconcile_model_mock.called is True
+    assert reconcile_model_mock.times == len(get_search_apps())
+
+
+@pytest.mark.django_db
+def test_reconcile_model(monkeypatch):
+    """Test that the reconcile_model task reconciles that model and returns the drift found."""
+    get_search_app_mock = Mock()
+    monkeypatch.setattr('datahub.search.tasks.get_search_app', get_search_app_mock)
+    drift = {'missing': 1, 'stale': 2, 'orphaned': 3}
+    reconcile_app_mock = Mock(return_value=drift)
+    monkeypatch.setattr('datahub.search.tasks.reconcile_app', reconcile_app_mock)
+
+    assert reconcile_model('test-app') == drift
+    reconcile_app_mock.assert_called_once_with(get_search_app_mock.return_value)
+
+
 @pytest.mark.django_db
 def test_sync_object_task_syncs(opensearch):
     """Test that the object task syncs an object to OpenSearch."""
@@ -132,6 +204,31 @@ def test_complete_model_migration(monkeypatch):
     resync_after_migrate_mock.assert_called_once_with(mock_app)
 
 
+@pytest.mark.django_db
+def test_complete_model_migration_with_copy_documents(monkeypatch):
+    """Test that the complete_model_migration task calls copy_after_migrate() when
+    copy_documents is True.
+    """
+    resync_after_migrate_mock = Mock()
+    monkeypatch.setattr('datahub.search.tasks.resync_after_migrate', resync_after_migrate_mock)
+    copy_after_migrate_mock = Mock()
+    monkeypatch.setattr('datahub.search.tasks.copy_after_migrate', copy_after_migrate_mock)
+    mock_app = create_mock_search_app(
+        current_mapping_hash='current-hash',
+        target_mapping_hash='target-hash',
+    )
+    get_search_app_mock = Mock(return_value=mock_app)
+    monkeypatch.setattr('datahub.search.tasks.get_search_app', get_search_app_mock)
+
+    complete_model_migration(
+        search_app_name='test-app',
+        new_mapping_hash='target-hash',
+        copy_documents=True,
+    )
+    copy_after_migrate_mock.assert_called_once_with(mock_app)
+    resync_after_migrate_mock.assert_not_called()
+
+
 @pytest.mark.django_db
 def test_complete_model_migration_aborts_when_already_in_progress(monkeypatch):
     """Test that the complete_model_migration task aborts when the lock for the same search app is
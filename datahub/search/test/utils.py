@@ -21,6 +21,7 @@ def create_mock_search_app(
         ),
         bulk_batch_size=bulk_batch_size,
         queryset=queryset,
+        is_migration_copy_compatible=Mock(return_value=False),
     )
     return mock
 
@@ -2,6 +2,10 @@ import json
 from enum import StrEnum
 from typing import NamedTuple
 
+from django.core.exceptions import FieldDoesNotExist
+
+STRING_FIELD_TYPES = {'keyword', 'text'}
+
 
 class SortDirection(StrEnum):
     """A direction for sorting."""
@@ -42,6 +46,32 @@ def get_model_non_mapped_field_names(search_model):
     )
 
 
+def db_model_has_field(model, field_name):
+    """Returns whether a Django model has a field with the given name."""
+    try:
+        model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def get_mapping_source_fields(mapping_dict, prefix=''):
+    """Gets the fields in a mapping dict that are populated from the document source.
+
+    Multi-fields (sub-fields) are excluded as they are derived from their parent field, and text
+    and keyword fields are treated as the same type as both are populated from strings.
+
+    :returns: a dict of field path to field type
+    """
+    fields = {}
+    for name, field in mapping_dict.get('properties', {}).items():
+        path = f'{prefix}{name}'
+        field_type = field.get('type', 'object')
+        fields[path] = 'string' if field_type in STRING_FIELD_TYPES else field_type
+        fields.update(get_mapping_source_fields(field, prefix=f'{path}.'))
+    return fields
+
+
 def serialise_mapping(mapping_dict):
     """Serialises a mapping as JSON."""
     return json.dumps(mapping_dict, sort_keys=True, separators=(',', ':')).encode('utf-8')
@@ -15,7 +15,12 @@ from rest_framework.views import APIView
 
 from datahub.core.csv import create_csv_response
 from datahub.metadata.models import Sector
-from datahub.search.apps import get_global_search_apps_as_mapping
+from datahub.search.apps import EXCLUDE_ALL, get_global_search_apps_as_mapping
+from datahub.search.cache import (
+    SEARCH_CACHE_HEADER,
+    cache_search_response,
+    get_cached_search_response,
+)
 from datahub.search.execute_query import execute_search_query
 from datahub.search.permissions import (
     SearchAndExportPermissions,
@@ -194,6 +199,9 @@ class SearchAPIView(APIView):
     serializer_class = EntitySearchQuerySerializer
     fields_to_include = None
     fields_to_exclude = None
+    # Whether responses are cached for settings.SEARCH_RESULT_CACHE_TIMEOUT seconds (for users
+    # with the same permission filters)
+    cache_results = False
 
     http_method_names = ('post',)
 
@@ -285,6 +293,14 @@ class SearchAPIView(APIView):
                 data[legacy_query_param] = request.query_params[legacy_query_param]
 
         validated_data = self.validate_data(data)
+
+        cache_scope = None
+        if self.cache_results and settings.SEARCH_RESULT_CACHE_TIMEOUT:
+            cache_scope = self.get_cache_scope(request, validated_data)
+            cached_response = get_cached_search_response(self.search_app.name, cache_scope)
+            if cached_response is not None:
+                return Response(data=cached_response, headers={SEARCH_CACHE_HEADER: 'hit'})
+
         query = self.get_base_query(request, validated_data)
 
         limited_query = limit_search_query(
@@ -301,7 +317,27 @@ class SearchAPIView(APIView):
 
         response = self.enhance_response(results, response, validated_data)
 
-        return Response(data=response)
+        if cache_scope is None:
+            return Response(data=response)
+
+        cache_search_response(self.search_app.name, cache_scope, response)
+        return Response(data=response, headers={SEARCH_CACHE_HEADER: 'miss'})
+
+    def get_cache_scope(self, request, validated_data):
+        """Gets the values that identify a cached response for this view.
+
+        This is the view, the validated request data and the permission filters of the user
+        (rather than the user themselves, so that users with the same access share responses).
+        """
+        permission_filters = self.search_app.get_permission_filters(request)
+        if permission_filters is EXCLUDE_ALL:
+            permission_filters = 'EXCLUDE_ALL'
+
+        return {
+            'view': f'{type(self).__module__}.{type(self).__qualname__}',
+            'validated_data': validated_data,
+            'permission_filters': permission_filters,
+        }
 
     def enhance_response(self, results, response, validated_data):
         """Placeholder for a method to enhance the response with custom data."""
@@ -0,0 +1,82 @@
+import logging
+
+from django_pglocks import advisory_lock
+
+from datahub.company.models import Advisor
+from datahub.core.queues.job_scheduler import job_scheduler
+from datahub.user_event_log.models import UserEvent
+from datahub.user_event_log.utils import (
+    USER_EVENT_BUFFER_KEY,
+    deserialise_user_event,
+    get_redis_client,
+)
+
+logger = logging.getLogger(__name__)
+
+SAVE_BATCH_SIZE = 1000
+
+
+def schedule_save_buffered_user_events():
+    job = job_scheduler(
+        function=save_buffered_user_events,
+        max_retries=5,
+        retry_backoff=True,
+    )
+    logger.info(f'Task {job.id} save_buffered_user_events scheduled')
+    return job
+
+
+def save_buffered_user_events(batch_size=SAVE_BATCH_SIZE):
+    """Saves the user events in the buffer using bulk inserts.
+
+    Events are only removed from the buffer after they have been saved, so an event is saved
+    at least once. (If this task is interrupted between saving a batch and removing it from
+    the buffer, that batch will be saved again by the next run.)
+
+    :returns: the number of user events saved
+    """
+    with advisory_lock('save_buffered_user_events', wait=False) as acquired:
+        if not acquired:
+            logger.info('Another instance of this task is already running.')
+            return 0
+
+        redis = get_redis_client()
+        num_saved = 0
+        while True:
+            serialised_user_events = redis.lrange(USER_EVENT_BUFFER_KEY, 0, batch_size - 1)
+            if not serialised_user_events:
+                break
+
+            user_events = [
+                deserialise_user_event(serialised_user_event)
+                for serialised_user_event in serialised_user_events
+            ]
+            num_saved += _save_user_events(user_events)
+            redis.ltrim(USER_EVENT_BUFFER_KEY, len(serialised_user_events), -1)
+
+    logger.info(f'{num_saved} buffered user events saved')
+    return num_saved
+
+
+def _save_user_events(user_events):
+    """Saves a batch of user events using a single INSERT.
+
+    Events for advisers that no longer exist are skipped (as they would have been deleted
+    along with the adviser).
+    """
+    existing_adviser_ids = set(
+        Advisor.objects.filter(
+            pk__in={user_event.adviser_id for user_event in user_events},
+        ).values_list('pk', flat=True),
+    )
+    user_events_to_save = [
+        user_event for user_event in user_events if user_event.adviser_id in existing_adviser_ids
+    ]
+    if len(user_events_to_save) != len(user_events):
+        logger.warning(
+            f'{len(user_events) - len(user_events_to_save)} buffered user events were skipped '
+            'as their advisers no longer exist',
+        )
+
+    UserEvent.objects.bulk_create(user_events_to_save)
+    return len(user_events_to_save)
@@ -0,0 +1,19 @@
+from uuid import uuid4
+
+import pytest
+
+from datahub.user_event_log.utils import get_redis_client
+
+
+@pytest.fixture
+def user_event_buffer(monkeypatch, settings):
+    """Enables user event buffering using a Redis key specific to the test.
+
+    :returns: the Redis key of the buffer
+    """
+    settings.USER_EVENT_LOG_BUFFERING_ENABLED = True
+    key = f'test-user-event-buffer:{uuid4()}'
+    monkeypatch.setattr('datahub.user_event_log.utils.USER_EVENT_BUFFER_KEY', key)
+    monkeypatch.setattr('datahub.user_event_log.tasks.USER_EVENT_BUFFER_KEY', key)
+    yield key
+    get_redis_client().delete(key)
@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from datahub.company.test.factories import AdviserFactory
+from datahub.user_event_log.constants import UserEventType
+from datahub.user_event_log.models import UserEvent
+from datahub.user_event_log.tasks import save_buffered_user_events
+from datahub.user_event_log.utils import get_redis_client, serialise_user_event
+
+pytestmark = pytest.mark.django_db
+
+
+def _buffer_events(key, user_events):
+    get_redis_client().rpush(key, *(serialise_user_event(event) for event in user_events))
+
+
+class TestSaveBufferedUserEvents:
+    """Tests for save_buffered_user_events()."""
+
+    def test_saves_buffered_events_in_batches(self, user_event_buffer, monkeypatch):
+        """Test that buffered events are saved in batches and removed from the buffer."""
+        bulk_create_spy = Mock(wraps=UserEvent.objects.bulk_create)
+        monkeypatch.setattr(UserEvent.objects, 'bulk_create', bulk_create_spy)
+        adviser = AdviserFactory()
+        timestamp = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        _buffer_events(
+            user_event_buffer,
+            [
+                UserEvent(
+                    adviser=adviser,
+                    type=UserEventType.SEARCH_EXPORT,
+                    api_url_path=f'path-{index}',
+                    data={'index': index},
+                    timestamp=timestamp,
+                )
+                for index in range(5)
+            ],
+        )
+
+        assert save_buffered_user_events(batch_size=2) == 5
+
+        assert bulk_create_spy.call_count == 3
+        assert get_redis_client().llen(user_event_buffer) == 0
+        user_events = UserEvent.objects.order_by('api_url_path')
+        assert [event.api_url_path for event in user_events] == [
+            f'path-{index}' for index in range(5)
+        ]
+        assert all(event.adviser == adviser for event in user_events)
+        assert all(event.timestamp == timestamp for event in user_events)
+        assert [event.data for event in user_events] == [{'index': index} for index in range(5)]
+
+    def test_keeps_events_in_buffer_if_save_fails(self, user_event_buffer, monkeypatch):
+        """Test that events stay in the buffer if they couldn't be saved, so that they are
+        saved by the next run.
+        """
+        _buffer_events(
+            user_event_buffer,
+            [UserEvent(adviser=AdviserFactory(), type=UserEventType.SEARCH_EXPORT)],
+        )
+        monkeypatch.setattr(
+            'datahub.user_event_log.tasks._save_user_events',
+            Mock(side_effect=ConnectionError),
+        )
+
+        with pytest.raises(ConnectionError):
+            save_buffered_user_events()
+
+        assert get_redis_client().llen(user_event_buffer) == 1
+
+    def test_skips_events_that_cannot_be_saved(self, user_event_buffer):
+        """Test that an event for an adviser that no longer exists doesn't stop other events
+        from being saved.
+        """
+        adviser = AdviserFactory()
+        deleted_adviser = AdviserFactory()
+        _buffer_events(
+            user_event_buffer,
+            [
+                UserEvent(adviser=adviser, type=UserEventType.SEARCH_EXPORT),
+                UserEvent(adviser=deleted_adviser, type=UserEventType.SEARCH_EXPORT),
+            ],
+        )
+        deleted_adviser.delete()
+
+        assert save_buffered_user_events() == 1
+
+        assert UserEvent.objects.get().adviser == adviser
+        assert get_redis_client().llen(user_event_buffer) == 0
+
+    @patch('datahub.user_event_log.tasks.advisory_lock')
+    def test_does_nothing_if_lock_not_acquired(self, mock_advisory_lock, user_event_buffer):
+        """Test that nothing is saved if another instance of the task is running."""
+        mock_advisory_lock.return_value.__enter__.return_value = False
+        _buffer_events(
+            user_event_buffer,
+            [UserEvent(adviser=AdviserFactory(), type=UserEventType.SEARCH_EXPORT)],
+        )
+
+        assert save_buffered_user_events() == 0
+
+        assert not UserEvent.objects.exists()
+        assert get_redis_client().llen(user_event_buffer) == 1
@@ -3,10 +3,16 @@ from unittest.mock import Mock
 from uuid import UUID
 
 import pytest
+from redis.exceptions import RedisError
 
 from datahub.company.test.factories import AdviserFactory
 from datahub.user_event_log.constants import UserEventType
-from datahub.user_event_log.utils import record_user_event
+from datahub.user_event_log.models import UserEvent
+from datahub.user_event_log.utils import (
+    deserialise_user_event,
+    get_redis_client,
+    record_user_event,
+)
 
 
 @pytest.mark.django_db
@@ -53,3 +59,77 @@ class TestRecordUserEvent:
         event.refresh_from_db()
 
         assert event.adviser == adviser
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('user_event_buffer')
+class TestRecordUserEventWithBuffering:
+    """Test record_user_event() when user event buffering is enabled."""
+
+    def test_buffers_event_on_commit(self, user_event_buffer, django_capture_on_commit_callbacks):
+        """Test that the event is added to the buffer once the transaction is committed, rather
+        than being saved.
+        """
+        adviser = AdviserFactory()
+        request = Mock(user=adviser, path='test-path')
+        redis = get_redis_client()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            event = record_user_event(request, UserEventType.SEARCH_EXPORT, data={'a': 'b'})
+            assert redis.llen(user_event_buffer) == 0
+
+        for callback in callbacks:
+            callback()
+
+        assert event.pk is None
+        assert not UserEvent.objects.exists()
+        buffered_events = [
+            deserialise_user_event(serialised_event)
+            for serialised_event in redis.lrange(user_event_buffer, 0, -1)
+        ]
+        assert len(buffered_events) == 1
+        assert buffered_events[0].adviser_id == adviser.pk
+        assert buffered_events[0].type == UserEventType.SEARCH_EXPORT
+        assert buffered_events[0].api_url_path == 'test-path'
+        assert buffered_events[0].data == {'a': 'b'}
+        assert buffered_events[0].timestamp == event.timestamp
+
+    def test_saves_event_if_buffer_unavailable(
+        self,
+        monkeypatch,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that the event is saved immediately if it can't be added to the buffer."""
+        redis_mock = Mock()
+        redis_mock.return_value.rpush.side_effect = RedisError()
+        monkeypatch.setattr('datahub.user_event_log.utils.get_redis_client', redis_mock)
+        adviser = AdviserFactory()
+        request = Mock(user=adviser, path='test-path')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            record_user_event(request, UserEventType.SEARCH_EXPORT)
+
+        assert UserEvent.objects.get().adviser == adviser
+
+    def test_schedules_save_when_buffer_is_full(
+        self,
+        monkeypatch,
+        settings,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that the buffered events are saved when the buffer reaches the flush size."""
+        settings.USER_EVENT_LOG_BUFFER_FLUSH_SIZE = 2
+        schedule_mock = Mock()
+        monkeypatch.setattr(
+            'datahub.user_event_log.tasks.schedule_save_buffered_user_events',
+            schedule_mock,
+        )
+        request = Mock(user=AdviserFactory(), path='test-path')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            record_user_event(request, UserEventType.SEARCH_EXPORT)
+        schedule_mock.assert_not_called()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            record_user_event(request, UserEventType.SEARCH_EXPORT)
+        schedule_mock.assert_called_once()
@@ -1,11 +1,89 @@
+import json
+import logging
+from functools import lru_cache, partial
+from uuid import UUID
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from redis import Redis
+from redis.exceptions import RedisError
+
 from datahub.user_event_log.models import UserEvent
 
+logger = logging.getLogger(__name__)
+
+USER_EVENT_BUFFER_KEY = 'user_event_log:buffer'
+
 
 def record_user_event(request, type_, adviser=None, data=None):
-    """Records a user event in the database."""
-    return UserEvent.objects.create(
+    """Records a user event.
+
+    If USER_EVENT_LOG_BUFFERING_ENABLED is True, the event is added to a buffer in Redis once
+    the current transaction has been committed, and is saved along with other buffered events
+    by save_buffered_user_events(). Otherwise, or if the event can't be added to the buffer,
+    the event is saved immediately.
+
+    :returns: the user event (which is not saved yet, if it is being buffered)
+    """
+    user_event = UserEvent(
         adviser=adviser or request.user,
         type=type_,
         api_url_path=request.path,
         data=data,
     )
+
+    if not (settings.USER_EVENT_LOG_BUFFERING_ENABLED and settings.REDIS_BASE_URL):
+        user_event.save()
+        return user_event
+
+    transaction.on_commit(partial(_buffer_user_event, user_event))
+    return user_event
+
+
+def serialise_user_event(user_event):
+    """Serialises an unsaved user event for storing in the buffer."""
+    return json.dumps(
+        {
+            # isoformat() is used as DjangoJSONEncoder truncates times to milliseconds
+            'timestamp': user_event.timestamp.isoformat(),
+            'adviser_id': user_event.adviser_id,
+            'type': user_event.type,
+            'api_url_path': user_event.api_url_path,
+            'data': user_event.data,
+        },
+        cls=DjangoJSONEncoder,
+    )
+
+
+def deserialise_user_event(serialised_user_event):
+    """Creates an unsaved user event from a buffered user event."""
+    fields = json.loads(serialised_user_event)
+    fields['timestamp'] = parse_datetime(fields['timestamp'])
+    fields['adviser_id'] = UUID(fields['adviser_id'])
+    return UserEvent(**fields)
+
+
+@lru_cache(maxsize=None)
+def get_redis_client():
+    """Gets the Redis client used for the user event buffer."""
+    return Redis.from_url(settings.REDIS_BASE_URL)
+
+
+def _buffer_user_event(user_event):
+    # Imported here to avoid a circular import
+    from datahub.user_event_log.tasks import schedule_save_buffered_user_events
+
+    try:
+        buffer_size = get_redis_client().rpush(
+            USER_EVENT_BUFFER_KEY,
+            serialise_user_event(user_event),
+        )
+    except RedisError:
+        logger.exception('Could not add user event to the buffer, saving it immediately')
+        user_event.save()
+        return
+
+    if buffer_size % settings.USER_EVENT_LOG_BUFFER_FLUSH_SIZE == 0:
+        schedule_save_buffered_user_events()